@@ -1,128 +1,73 @@
 # SimplerLLM - Simplified interface for LLMs and Voice APIs
+#
+# Public names are exported lazily: each subpackage (and the provider SDKs
+# it needs) is imported on first access, so `import SimplerLLM` stays fast.
 
-# Language module exports
-from .language import (
-    LLM,
-    LLMProvider,
-    ReliableLLM,
-    OpenAILLM,
-    GeminiLLM,
-    AnthropicLLM,
-    OllamaLLM,
-    DeepSeekLLM,
-    LLMJudge,
-    JudgeMode,
-    JudgeResult,
-    ProviderResponse,
-    ProviderEvaluation,
-    EvaluationReport,
-    LLMFeedbackLoop,
-    FeedbackResult,
-    IterationResult,
-    Critique,
-    EmbeddingsLLM,
-    EmbeddingsProvider,
-    OpenAIEmbeddings,
-    VoyageEmbeddings,
-    CohereEmbeddings,
-)
+from .utils.env_loader import autoload_env, load_env
+from .utils.lazy_imports import lazy_exports
 
-# Voice module exports
-from .voice import (
-    # TTS
-    TTS,
-    TTSBase,
-    TTSProvider,
-    TTSResponse,
-    Voice,
-    TTSError,
-    TTSValidationError,
-    TTSProviderError,
-    TTSVoiceNotFoundError,
-    OpenAITTS,
-    OPENAI_VOICES,
-    OPENAI_MODELS,
-    OPENAI_FORMATS,
-    ELEVENLABS_MODELS,
-    ELEVENLABS_FORMATS,
-    # STT
-    STT,
-    STTProvider,
-    OpenAISTT,
-    STTFullResponse,
-)
+# Load .env once for the whole package (SIMPLERLLM_AUTOLOAD_DOTENV=0 disables)
+autoload_env()
 
-# Optional ElevenLabs TTS
-try:
-    from .voice import ElevenLabsTTS
-except (ImportError, TypeError):
-    ElevenLabsTTS = None
-
-# Image module exports
-from .image import (
-    ImageGenerator,
-    ImageProvider,
-    ImageSize,
-    OpenAIImageGenerator,
-    StabilityImageGenerator,
-    GoogleImageGenerator,
-    ImageGenerationResponse,
-)
-
-__all__ = [
+_EXPORTS = {
     # Language module
-    'LLM',
-    'LLMProvider',
-    'ReliableLLM',
-    'OpenAILLM',
-    'GeminiLLM',
-    'AnthropicLLM',
-    'OllamaLLM',
-    'DeepSeekLLM',
-    'LLMJudge',
-    'JudgeMode',
-    'JudgeResult',
-    'ProviderResponse',
-    'ProviderEvaluation',
-    'EvaluationReport',
-    'LLMFeedbackLoop',
-    'FeedbackResult',
-    'IterationResult',
-    'Critique',
+    'LLM': '.language',
+    'LLMProvider': '.language',
+    'ReliableLLM': '.language',
+    'OpenAILLM': '.language',
+    'GeminiLLM': '.language',
+    'AnthropicLLM': '.language',
+    'OllamaLLM': '.language',
+    'DeepSeekLLM': '.language',
+    'LLMJudge': '.language',
+    'JudgeMode': '.language',
+    'JudgeResult': '.language',
+    'ProviderResponse': '.language',
+    'ProviderEvaluation': '.language',
+    'EvaluationReport': '.language',
+    'LLMFeedbackLoop': '.language',
+    'FeedbackResult': '.language',
+    'IterationResult': '.language',
+    'Critique': '.language',
     # Embeddings
-    'EmbeddingsLLM',
-    'EmbeddingsProvider',
-    'OpenAIEmbeddings',
-    'VoyageEmbeddings',
-    'CohereEmbeddings',
+    'EmbeddingsLLM': '.language',
+    'EmbeddingsProvider': '.language',
+    'OpenAIEmbeddings': '.language',
+    'VoyageEmbeddings': '.language',
+    'CohereEmbeddings': '.language',
     # Voice module - TTS
-    'TTS',
-    'TTSBase',
-    'TTSProvider',
-    'TTSResponse',
-    'Voice',
-    'TTSError',
-    'TTSValidationError',
-    'TTSProviderError',
-    'TTSVoiceNotFoundError',
-    'OpenAITTS',
-    'ElevenLabsTTS',
-    'OPENAI_VOICES',
-    'OPENAI_MODELS',
-    'OPENAI_FORMATS',
-    'ELEVENLABS_MODELS',
-    'ELEVENLABS_FORMATS',
+    'TTS': '.voice',
+    'TTSBase': '.voice',
+    'TTSProvider': '.voice',
+    'TTSResponse': '.voice',
+    'Voice': '.voice',
+    'TTSError': '.voice',
+    'TTSValidationError': '.voice',
+    'TTSProviderError': '.voice',
+    'TTSVoiceNotFoundError': '.voice',
+    'OpenAITTS': '.voice',
+    'ElevenLabsTTS': '.voice',
+    'OPENAI_VOICES': '.voice',
+    'OPENAI_MODELS': '.voice',
+    'OPENAI_FORMATS': '.voice',
+    'ELEVENLABS_MODELS': '.voice',
+    'ELEVENLABS_FORMATS': '.voice',
     # Voice module - STT
-    'STT',
-    'STTProvider',
-    'OpenAISTT',
-    'STTFullResponse',
+    'STT': '.voice',
+    'STTProvider': '.voice',
+    'OpenAISTT': '.voice',
+    'STTFullResponse': '.voice',
     # Image module
-    'ImageGenerator',
-    'ImageProvider',
-    'ImageSize',
-    'OpenAIImageGenerator',
-    'StabilityImageGenerator',
-    'GoogleImageGenerator',
-    'ImageGenerationResponse',
-]
+    'ImageGenerator': '.image',
+    'ImageProvider': '.image',
+    'ImageSize': '.image',
+    'OpenAIImageGenerator': '.image',
+    'StabilityImageGenerator': '.image',
+    'GoogleImageGenerator': '.image',
+    'ImageGenerationResponse': '.image',
+}
+
+# ElevenLabsTTS is None when the elevenlabs package is not installed
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, optional=['ElevenLabsTTS'])
+
+__all__ = list(_EXPORTS) + ['load_env']
@@ -3,22 +3,18 @@ Image module for SimplerLLM.
 Provides image generation and manipulation capabilities across multiple providers.
 """
 
-from .generation import (
-    ImageGenerator,
-    ImageProvider,
-    ImageSize,
-    OpenAIImageGenerator,
-    StabilityImageGenerator,
-    GoogleImageGenerator,
-    ImageGenerationResponse,
-)
+from SimplerLLM.utils.lazy_imports import lazy_exports
 
-__all__ = [
-    'ImageGenerator',
-    'ImageProvider',
-    'ImageSize',
-    'OpenAIImageGenerator',
-    'StabilityImageGenerator',
-    'GoogleImageGenerator',
-    'ImageGenerationResponse',
-]
+_EXPORTS = {
+    'ImageGenerator': '.generation',
+    'ImageProvider': '.generation',
+    'ImageSize': '.generation',
+    'OpenAIImageGenerator': '.generation',
+    'StabilityImageGenerator': '.generation',
+    'GoogleImageGenerator': '.generation',
+    'ImageGenerationResponse': '.generation',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
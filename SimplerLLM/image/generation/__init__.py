@@ -2,22 +2,22 @@
 Image generation module.
 Provides unified interface for generating images from text prompts
 across multiple providers (OpenAI DALL-E, Stability AI, Google Gemini, etc.).
+Provider wrappers are imported on first access.
 """
 
-from .base import ImageGenerator, ImageProvider, ImageSize
-from .wrappers.openai_wrapper import OpenAIImageGenerator
-from .wrappers.stability_wrapper import StabilityImageGenerator
-from .wrappers.google_wrapper import GoogleImageGenerator
-from .wrappers.seedream_wrapper import SeedreamImageGenerator
-from .providers.image_response_models import ImageGenerationResponse
+from SimplerLLM.utils.lazy_imports import lazy_exports
 
-__all__ = [
-    'ImageGenerator',
-    'ImageProvider',
-    'ImageSize',
-    'OpenAIImageGenerator',
-    'StabilityImageGenerator',
-    'GoogleImageGenerator',
-    'SeedreamImageGenerator',
-    'ImageGenerationResponse',
-]
+_EXPORTS = {
+    'ImageGenerator': '.base',
+    'ImageProvider': '.base',
+    'ImageSize': '.base',
+    'OpenAIImageGenerator': '.wrappers.openai_wrapper',
+    'StabilityImageGenerator': '.wrappers.stability_wrapper',
+    'GoogleImageGenerator': '.wrappers.google_wrapper',
+    'SeedreamImageGenerator': '.wrappers.seedream_wrapper',
+    'ImageGenerationResponse': '.providers.image_response_models',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
@@ -1,5 +1,7 @@
+import asyncio
 from enum import Enum
 from SimplerLLM.utils.custom_verbose import verbose_print
+from SimplerLLM.instrumentation.core import instrument_class
 
 
 class ImageProvider(Enum):
@@ -40,6 +42,15 @@ class ImageGenerator:
     Provides a unified interface across different image generation providers.
     """
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        instrument_class(cls, "image", {
+            "generate_image": "image_generation",
+            "generate_image_async": "image_generation",
+            "edit_image": "image_edit",
+            "edit_image_async": "image_edit",
+        })
+
     def __init__(
         self,
         provider=ImageProvider.OPENAI_DALL_E,
@@ -125,6 +136,123 @@ class ImageGenerator:
         else:
             raise ValueError(f"Unsupported provider: {provider}")
 
+    async def generate_images_batch_async(
+        self,
+        prompts,
+        max_concurrency=4,
+        output_paths=None,
+        return_exceptions=False,
+        **kwargs,
+    ):
+        """
+        Asynchronously generate one image per prompt, running up to
+        max_concurrency requests at a time.
+
+        Args:
+            prompts: List of text prompts
+            max_concurrency: Maximum number of requests in flight (default: 4)
+            output_paths: Optional list of file paths, one per prompt. When
+                          given, each image is streamed to its file and the
+                          result is the file path.
+            return_exceptions: If True, a failed prompt returns its exception
+                               instead of cancelling the batch
+            **kwargs: Arguments forwarded to generate_image_async()
+                      (size, model, full_response, ...)
+
+        Returns:
+            List of results in prompt order, as returned by generate_image_async()
+
+        Raises:
+            ValueError: If output_paths does not match prompts or
+                        max_concurrency is below 1
+
+        Example:
+            >>> img_gen = ImageGenerator.create(provider=ImageProvider.OPENAI_DALL_E)
+            >>> paths = await img_gen.generate_images_batch_async(
+            ...     ["A red fox", "A blue whale"],
+            ...     output_paths=["fox.png", "whale.png"],
+            ... )
+        """
+        prompts = list(prompts)
+        if output_paths is not None and len(output_paths) != len(prompts):
+            raise ValueError("output_paths must have one path per prompt")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+
+        if self.verbose:
+            verbose_print(
+                f"Generating {len(prompts)} images with max_concurrency={max_concurrency}",
+                "info"
+            )
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def generate(index, prompt):
+            params = dict(kwargs)
+            if output_paths is not None:
+                params["output_format"] = "file"
+                params["output_path"] = output_paths[index]
+            async with semaphore:
+                return await self.generate_image_async(prompt, **params)
+
+        return await asyncio.gather(
+            *(generate(index, prompt) for index, prompt in enumerate(prompts)),
+            return_exceptions=return_exceptions,
+        )
+
+    def generate_images_batch(
+        self,
+        prompts,
+        max_concurrency=4,
+        output_paths=None,
+        return_exceptions=False,
+        **kwargs,
+    ):
+        """
+        Generate one image per prompt with up to max_concurrency requests
+        in flight.
+
+        Variants run concurrently over pooled connections, so a batch takes
+        about as long as its slowest images rather than the sum of all.
+        See generate_images_batch_async() for parameter documentation.
+
+        Returns:
+            List of results in prompt order
+
+        Raises:
+            RuntimeError: If called from a running event loop. Use
+                generate_images_batch_async() there instead.
+
+        Example:
+            >>> img_gen = ImageGenerator.create(provider=ImageProvider.STABILITY_AI)
+            >>> images = img_gen.generate_images_batch(
+            ...     [f"Thumbnail variant {i}" for i in range(8)],
+            ...     max_concurrency=8,
+            ... )
+        """
+        async def run_batch():
+            try:
+                return await self.generate_images_batch_async(
+                    prompts,
+                    max_concurrency=max_concurrency,
+                    output_paths=output_paths,
+                    return_exceptions=return_exceptions,
+                    **kwargs,
+                )
+            finally:
+                # The loop ends with this call, so release its pooled connections
+                from .providers.image_http import aclose_http_clients
+                await aclose_http_clients()
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(run_batch())
+        raise RuntimeError(
+            "generate_images_batch() cannot be called from a running event loop. "
+            "Use 'await generate_images_batch_async(...)' instead."
+        )
+
     def prepare_params(self, size=None, model=None, **kwargs):
         """
         Prepare parameters for image generation, using instance defaults
@@ -249,3 +377,9 @@ class ImageGenerator:
         if not isinstance(provider, ImageProvider):
             raise ValueError("Provider must be an instance of ImageProvider Enum")
         self.provider = provider
+
+
+instrument_class(ImageGenerator, "image", {
+    "generate_images_batch": "image_batch",
+    "generate_images_batch_async": "image_batch",
+})
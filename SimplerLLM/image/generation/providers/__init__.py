@@ -1,13 +1,16 @@
 """
 Image generation provider implementations.
 Contains the actual API calls to different image generation services.
+Provider modules are imported on first use.
 """
 
-from .image_response_models import ImageGenerationResponse
-from . import openai_image
-from . import stability_image
-from . import google_image
-from . import seedream_image
+from SimplerLLM.utils.lazy_imports import lazy_exports
+
+_EXPORTS = {
+    'ImageGenerationResponse': '.image_response_models',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     'ImageGenerationResponse',
@@ -1,13 +1,11 @@
-from dotenv import load_dotenv
 import os
 import time
 import mimetypes
 import google.genai as genai
 from google.genai import types
 from .image_response_models import ImageGenerationResponse
+from SimplerLLM.instrumentation.core import record_retry
 
-# Load environment variables
-load_dotenv(override=True)
 
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", 3))
 RETRY_DELAY = int(os.getenv("RETRY_DELAY", 2))
@@ -303,6 +301,7 @@ def generate_image(
                 if attempt < MAX_RETRIES - 1:
                     if verbose:
                         print(f"[Google Gemini] Retrying in {retry_delay} seconds...")
+                    record_retry()
                     time.sleep(retry_delay)
                     retry_delay *= 2  # Exponential backoff
                     continue
@@ -565,6 +564,7 @@ def edit_image(
                 if attempt < MAX_RETRIES - 1:
                     if verbose:
                         print(f"[Google Gemini] Retrying in {retry_delay} seconds...")
+                    record_retry()
                     time.sleep(retry_delay)
                     retry_delay *= 2  # Exponential backoff
                     continue
@@ -0,0 +1,168 @@
+"""
+Shared async HTTP plumbing for image providers.
+
+Async provider calls reuse one pooled httpx.AsyncClient (and one SDK
+client per API key) for each running event loop instead of opening new
+connections on every request. Downloads are streamed straight to disk,
+and file writes run in a worker thread so they never block the loop.
+"""
+
+import asyncio
+import os
+import threading
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+import httpx
+
+# Connection pool limits of the shared async client
+IMAGE_HTTP_MAX_CONNECTIONS = int(os.getenv("IMAGE_HTTP_MAX_CONNECTIONS", 20))
+IMAGE_HTTP_TIMEOUT = 120.0
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+_lock = threading.Lock()
+# (id(loop), key) -> (loop, resource)
+_loop_resources: Dict[Tuple[int, Hashable], Tuple[asyncio.AbstractEventLoop, Any]] = {}
+
+
+def loop_resource(key: Hashable, factory: Callable[[], Any]) -> Any:
+    """
+    Get a resource bound to the running event loop, creating it on first use.
+
+    Pooled async clients cannot be shared across event loops, so each loop
+    gets its own instance. Resources of closed loops are dropped.
+
+    Args:
+        key: Identifies the resource within a loop
+        factory: Creates the resource
+
+    Returns:
+        The resource for the running loop
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        for stale in [k for k, (owner, _) in _loop_resources.items() if owner.is_closed()]:
+            del _loop_resources[stale]
+
+        entry = _loop_resources.get((id(loop), key))
+        if entry is None or entry[0] is not loop:
+            entry = (loop, factory())
+            _loop_resources[(id(loop), key)] = entry
+        return entry[1]
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared httpx.AsyncClient of the running event loop.
+
+    Returns:
+        Pooled client with IMAGE_HTTP_MAX_CONNECTIONS connections
+    """
+    return loop_resource("httpx", lambda: httpx.AsyncClient(
+        timeout=IMAGE_HTTP_TIMEOUT,
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_connections=IMAGE_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=IMAGE_HTTP_MAX_CONNECTIONS,
+        ),
+    ))
+
+
+async def aclose_http_clients() -> None:
+    """
+    Close the shared clients of the running event loop.
+
+    Optional: call it before the loop shuts down to release connections
+    early. A later request simply opens a new client.
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        keys = [k for k, (owner, _) in _loop_resources.items() if owner is loop]
+        resources = [_loop_resources.pop(k)[1] for k in keys]
+
+    for resource in resources:
+        close = getattr(resource, "aclose", None) or getattr(resource, "close", None)
+        if close is not None:
+            result = close()
+            if asyncio.iscoroutine(result):
+                await result
+
+
+def _make_parent_dir(output_path: str) -> None:
+    directory = os.path.dirname(output_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+
+def _write_file(output_path: str, data: bytes) -> None:
+    _make_parent_dir(output_path)
+    with open(output_path, "wb") as f:
+        f.write(data)
+
+
+async def write_file_async(output_path: str, data: bytes) -> int:
+    """
+    Write bytes to a file without blocking the event loop.
+
+    Args:
+        output_path: Destination file (parent folders are created)
+        data: Bytes to write
+
+    Returns:
+        Number of bytes written
+    """
+    await asyncio.to_thread(_write_file, output_path, data)
+    return len(data)
+
+
+async def stream_to_file(response: httpx.Response, output_path: str) -> int:
+    """
+    Stream an httpx response body to a file chunk by chunk.
+
+    The body is written to a temporary file that replaces output_path
+    only once complete, so a failed download never leaves a partial image.
+
+    Args:
+        response: Response opened with client.stream()
+        output_path: Destination file (parent folders are created)
+
+    Returns:
+        Number of bytes written
+    """
+    temp_path = f"{output_path}.part"
+    await asyncio.to_thread(_make_parent_dir, output_path)
+    f = await asyncio.to_thread(open, temp_path, "wb")
+    written = 0
+    try:
+        async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+            await asyncio.to_thread(f.write, chunk)
+            written += len(chunk)
+        await asyncio.to_thread(f.close)
+        await asyncio.to_thread(os.replace, temp_path, output_path)
+    except BaseException:
+        f.close()
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    return written
+
+
+async def download_to_file(url: str, output_path: str) -> int:
+    """
+    Download a URL straight to a file using the shared client.
+
+    Args:
+        url: Image URL
+        output_path: Destination file
+
+    Returns:
+        Number of bytes written
+
+    Raises:
+        httpx.HTTPStatusError: If the server returns an error status
+    """
+    client = get_async_http_client()
+    async with client.stream("GET", url) as response:
+        response.raise_for_status()
+        return await stream_to_file(response, output_path)
@@ -1,19 +1,24 @@
 from openai import OpenAI, AsyncOpenAI
-from dotenv import load_dotenv
 import asyncio
 import os
 import time
 import base64
 import requests
 from .image_response_models import ImageGenerationResponse
+from .image_http import loop_resource, write_file_async, download_to_file
+from SimplerLLM.instrumentation.core import record_retry
 
-# Load environment variables
-load_dotenv(override=True)
 
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", 3))
 RETRY_DELAY = int(os.getenv("RETRY_DELAY", 2))
 
 
+def _get_async_client(api_key=None):
+    """Get the pooled AsyncOpenAI client of the running event loop."""
+    api_key = api_key or os.getenv("OPENAI_API_KEY")
+    return loop_resource(("openai", api_key), lambda: AsyncOpenAI(api_key=api_key))
+
+
 def _is_gpt_image_model(model_name):
     """Check if the model is a GPT image model (not DALL-E)."""
     return model_name.startswith("gpt-image")
@@ -267,6 +272,7 @@ def generate_image(
             if attempt < MAX_RETRIES - 1:
                 if verbose:
                     print(f"[OpenAI Image] Attempt {attempt + 1} failed: {e}. Retrying...")
+                record_retry()
                 time.sleep(RETRY_DELAY * (2**attempt))
             else:
                 error_msg = f"Failed to generate image after {MAX_RETRIES} attempts due to: {e}"
@@ -321,7 +327,7 @@ async def generate_image_async(
         Otherwise: URL string (DALL-E) or image bytes (GPT Image)
     """
     start_time = time.time() if full_response else None
-    async_openai_client = AsyncOpenAI(api_key=api_key)
+    async_openai_client = _get_async_client(api_key)
     is_gpt_image = _is_gpt_image_model(model_name)
 
     if verbose:
@@ -374,11 +380,8 @@ async def generate_image_async(
 
                 if output_path:
                     # Save to file
-                    os.makedirs(os.path.dirname(output_path), exist_ok=True) if os.path.dirname(output_path) else None
-                    with open(output_path, 'wb') as f:
-                        f.write(image_bytes)
+                    file_size = await write_file_async(output_path, image_bytes)
                     image_data = output_path
-                    file_size = len(image_bytes)
                     if verbose:
                         print(f"[OpenAI Image] Image saved to: {output_path} ({file_size} bytes)")
                 else:
@@ -391,17 +394,9 @@ async def generate_image_async(
                 image_url = image_response.url
 
                 if output_path:
-                    # Download and save image from URL (using requests in sync mode)
-                    # Note: For production, consider using aiohttp for async downloads
-                    img_response = requests.get(image_url)
-                    img_response.raise_for_status()
-                    image_bytes = img_response.content
-
-                    os.makedirs(os.path.dirname(output_path), exist_ok=True) if os.path.dirname(output_path) else None
-                    with open(output_path, 'wb') as f:
-                        f.write(image_bytes)
+                    # Stream the image from the URL straight to disk
+                    file_size = await download_to_file(image_url, output_path)
                     image_data = output_path
-                    file_size = len(image_bytes)
                     if verbose:
                         print(f"[OpenAI Image] Image downloaded and saved to: {output_path} ({file_size} bytes)")
                 else:
@@ -435,6 +430,7 @@ async def generate_image_async(
             if attempt < MAX_RETRIES - 1:
                 if verbose:
                     print(f"[OpenAI Image] Attempt {attempt + 1} failed: {e}. Retrying...")
+                record_retry()
                 await asyncio.sleep(RETRY_DELAY * (2**attempt))
             else:
                 error_msg = f"Failed to generate image after {MAX_RETRIES} attempts due to: {e}"
@@ -646,6 +642,7 @@ def edit_image(
             if attempt < MAX_RETRIES - 1:
                 if verbose:
                     print(f"[OpenAI Image] Edit attempt {attempt + 1} failed: {e}. Retrying...")
+                record_retry()
                 time.sleep(RETRY_DELAY * (2**attempt))
             else:
                 error_msg = f"Failed to edit image after {MAX_RETRIES} attempts due to: {e}"
@@ -709,7 +706,7 @@ async def edit_image_async(
         raise ValueError(f"Image editing is only supported by dall-e-2 and gpt-image models. Model '{model_name}' does not support editing.")
 
     start_time = time.time() if full_response else None
-    async_openai_client = AsyncOpenAI(api_key=api_key)
+    async_openai_client = _get_async_client(api_key)
 
     if verbose:
         if is_gpt_image:
@@ -724,17 +721,17 @@ async def edit_image_async(
 
             # Prepare image file
             # For DALL-E 2, convert JPEG to PNG (required format)
+            # Files are read and converted in a worker thread
             if not is_gpt_image and _is_jpeg(image_source):
                 if verbose:
                     print("[OpenAI Image] Converting JPEG to PNG for DALL-E 2 compatibility...")
-                png_data = _convert_to_png(image_source, verbose=verbose)
+                png_data = await asyncio.to_thread(_convert_to_png, image_source, verbose)
                 image_file = io.BytesIO(png_data)
                 image_file.name = "image.png"
-            elif isinstance(image_source, str):
-                image_file = open(image_source, "rb")
             else:
-                image_file = io.BytesIO(image_source)
-                image_file.name = "image.png"
+                source_data, filename = await asyncio.to_thread(_load_image_data, image_source)
+                image_file = io.BytesIO(source_data)
+                image_file.name = filename
 
             # Build API parameters based on model type
             if is_gpt_image:
@@ -768,25 +765,18 @@ async def edit_image_async(
                 mask_file = None
                 if mask_source:
                     if _is_jpeg(mask_source):
-                        png_mask = _convert_to_png(mask_source, verbose=verbose)
+                        png_mask = await asyncio.to_thread(_convert_to_png, mask_source, verbose)
                         mask_file = io.BytesIO(png_mask)
                         mask_file.name = "mask.png"
-                    elif isinstance(mask_source, str):
-                        mask_file = open(mask_source, "rb")
                     else:
-                        mask_file = io.BytesIO(mask_source)
-                        mask_file.name = "mask.png"
+                        mask_data, mask_name = await asyncio.to_thread(_load_image_data, mask_source)
+                        mask_file = io.BytesIO(mask_data)
+                        mask_file.name = mask_name if isinstance(mask_source, str) else "mask.png"
                     params["mask"] = mask_file
 
             # Call edit API
             response = await async_openai_client.images.edit(**params)
 
-            # Close files
-            if isinstance(image_source, str) and not _is_jpeg(image_source):
-                image_file.close()
-            if not is_gpt_image and mask_source and isinstance(mask_source, str) and not _is_jpeg(mask_source):
-                mask_file.close()
-
             # Extract image data from response
             image_response = response.data[0]
 
@@ -796,11 +786,8 @@ async def edit_image_async(
                 image_bytes = base64.b64decode(image_response.b64_json)
 
                 if output_path:
-                    os.makedirs(os.path.dirname(output_path), exist_ok=True) if os.path.dirname(output_path) else None
-                    with open(output_path, 'wb') as f:
-                        f.write(image_bytes)
+                    file_size = await write_file_async(output_path, image_bytes)
                     image_data = output_path
-                    file_size = len(image_bytes)
                     if verbose:
                         print(f"[OpenAI Image] Edited image saved to: {output_path} ({file_size} bytes)")
                 else:
@@ -812,15 +799,8 @@ async def edit_image_async(
                 image_url = image_response.url
 
                 if output_path:
-                    img_response = requests.get(image_url)
-                    img_response.raise_for_status()
-                    image_bytes = img_response.content
-
-                    os.makedirs(os.path.dirname(output_path), exist_ok=True) if os.path.dirname(output_path) else None
-                    with open(output_path, 'wb') as f:
-                        f.write(image_bytes)
+                    file_size = await download_to_file(image_url, output_path)
                     image_data = output_path
-                    file_size = len(image_bytes)
                     if verbose:
                         print(f"[OpenAI Image] Edited image downloaded and saved to: {output_path} ({file_size} bytes)")
                 else:
@@ -853,6 +833,7 @@ async def edit_image_async(
             if attempt < MAX_RETRIES - 1:
                 if verbose:
                     print(f"[OpenAI Image] Edit attempt {attempt + 1} failed: {e}. Retrying...")
+                record_retry()
                 await asyncio.sleep(RETRY_DELAY * (2**attempt))
             else:
                 error_msg = f"Failed to edit image after {MAX_RETRIES} attempts due to: {e}"
@@ -1,11 +1,9 @@
-from dotenv import load_dotenv
 import os
 import time
 import requests
 from .image_response_models import ImageGenerationResponse
+from SimplerLLM.instrumentation.core import record_retry
 
-# Load environment variables
-load_dotenv(override=True)
 
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", 3))
 RETRY_DELAY = int(os.getenv("RETRY_DELAY", 2))
@@ -188,6 +186,7 @@ def generate_image(
             if attempt < MAX_RETRIES - 1:
                 if verbose:
                     print(f"[Seedream] Attempt {attempt + 1} failed: {e}. Retrying...")
+                record_retry()
                 time.sleep(RETRY_DELAY * (2**attempt))
             else:
                 error_msg = f"Failed to generate image after {MAX_RETRIES} attempts due to: {e}"
@@ -1,12 +1,12 @@
-from dotenv import load_dotenv
 import os
 import time
 import requests
 import base64
+import asyncio
 from .image_response_models import ImageGenerationResponse
+from .image_http import get_async_http_client, stream_to_file
+from SimplerLLM.instrumentation.core import record_retry
 
-# Load environment variables
-load_dotenv(override=True)
 
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", 3))
 RETRY_DELAY = int(os.getenv("RETRY_DELAY", 2))
@@ -89,6 +89,168 @@ def _get_endpoint(model_name):
         return f"{STABILITY_API_BASE}/v2beta/stable-image/generate/core"
 
 
+def _headers(api_key):
+    """Build request headers that ask for image bytes directly."""
+    return {
+        "authorization": f"Bearer {api_key}",
+        "accept": "image/*"
+    }
+
+
+def _generate_data(prompt, model_name, aspect_ratio, negative_prompt, style_preset,
+                   seed, cfg_scale, output_format):
+    """Build the form fields of a text-to-image request."""
+    data = {
+        "prompt": prompt,
+        "output_format": output_format,
+    }
+
+    # Add aspect_ratio (for text-to-image)
+    if aspect_ratio:
+        data["aspect_ratio"] = aspect_ratio
+
+    # Add optional parameters
+    if negative_prompt:
+        data["negative_prompt"] = negative_prompt
+
+    if style_preset:
+        data["style_preset"] = style_preset
+
+    if seed and seed != 0:
+        data["seed"] = seed
+
+    if cfg_scale is not None:
+        data["cfg_scale"] = cfg_scale
+
+    # For SD3.5 models, add model parameter
+    if "sd3" in model_name.lower():
+        data["model"] = model_name
+
+    return data
+
+
+def _edit_endpoint(mask, search_prompt):
+    """
+    Choose the edit endpoint based on whether a mask is provided.
+
+    Returns:
+        tuple: (endpoint, edit_mode, search_prompt)
+    """
+    if mask is not None:
+        # Use Inpaint when mask is explicitly provided
+        return f"{STABILITY_API_BASE}/v2beta/stable-image/edit/inpaint", "inpaint", search_prompt
+
+    # Use Search and Replace for mask-free editing (works with JPEG)
+    # Default search_prompt if not provided
+    endpoint = f"{STABILITY_API_BASE}/v2beta/stable-image/edit/search-and-replace"
+    return endpoint, "search-and-replace", search_prompt or "the subject"
+
+
+def _edit_data(edit_mode, edit_prompt, search_prompt, negative_prompt, style_preset,
+               seed, grow_mask, output_format):
+    """Build the form fields of an edit request."""
+    if edit_mode == "search-and-replace":
+        data = {
+            "prompt": edit_prompt,
+            "search_prompt": search_prompt,
+            "output_format": output_format,
+        }
+    else:
+        # Inpaint mode
+        data = {
+            "prompt": edit_prompt,
+            "output_format": output_format,
+        }
+        if grow_mask != 5:
+            data["grow_mask"] = grow_mask
+
+    # Add optional parameters (common to both)
+    if negative_prompt:
+        data["negative_prompt"] = negative_prompt
+
+    if style_preset:
+        data["style_preset"] = style_preset
+
+    if seed and seed != 0:
+        data["seed"] = seed
+
+    return data
+
+
+def _edit_files(image_source, mask):
+    """Load the source image and optional mask as multipart file tuples."""
+    if isinstance(image_source, str) and os.path.exists(image_source):
+        # File path - open and read
+        mime_type = _get_image_mime_type(image_source)
+        with open(image_source, 'rb') as f:
+            image_data = f.read()
+        files = {"image": (os.path.basename(image_source), image_data, mime_type)}
+    elif isinstance(image_source, bytes):
+        # Raw bytes
+        files = {"image": ("image.png", image_source, "image/png")}
+    else:
+        # Assume base64 - decode first
+        image_data = base64.b64decode(image_source)
+        files = {"image": ("image.png", image_data, "image/png")}
+
+    # Add mask if provided (Inpaint mode only)
+    if mask is not None:
+        if isinstance(mask, str) and os.path.exists(mask):
+            mask_mime = _get_image_mime_type(mask)
+            with open(mask, 'rb') as f:
+                mask_data = f.read()
+            files["mask"] = (os.path.basename(mask), mask_data, mask_mime)
+        elif isinstance(mask, bytes):
+            files["mask"] = ("mask.png", mask, "image/png")
+        else:
+            # Assume base64
+            mask_data = base64.b64decode(mask)
+            files["mask"] = ("mask.png", mask_data, "image/png")
+
+    return files
+
+
+def _api_error(response):
+    """Build the exception for a failed requests or httpx response."""
+    error_msg = f"Stability AI API error (status {response.status_code})"
+    try:
+        error_data = response.json()
+        error_msg += f": {error_data}"
+    except Exception:
+        error_msg += f": {response.text}"
+    return Exception(error_msg)
+
+
+async def _post_async(endpoint, api_key, data, files, output_path):
+    """
+    Send a multipart request with the shared async client.
+
+    With output_path the image is streamed straight to disk.
+
+    Returns:
+        tuple: (response, image_bytes or None, file_size)
+    """
+    client = get_async_http_client()
+    async with client.stream(
+        "POST",
+        endpoint,
+        headers=_headers(api_key),
+        data=data,
+        files=files,
+        timeout=120
+    ) as response:
+        if response.status_code != 200:
+            await response.aread()
+            raise _api_error(response)
+
+        if output_path:
+            file_size = await stream_to_file(response, output_path)
+            return response, None, file_size
+
+        image_bytes = await response.aread()
+        return response, image_bytes, len(image_bytes)
+
+
 def generate_image(
     prompt,
     model_name="stable-image-core",
@@ -145,38 +307,11 @@ def generate_image(
 
     for attempt in range(MAX_RETRIES):
         try:
-            # Build request headers
-            headers = {
-                "authorization": f"Bearer {api_key}",
-                "accept": "image/*"  # Get image bytes directly
-            }
-
             # Build request data
-            data = {
-                "prompt": prompt,
-                "output_format": output_format,
-            }
-
-            # Add aspect_ratio (for text-to-image)
-            if aspect_ratio:
-                data["aspect_ratio"] = aspect_ratio
-
-            # Add optional parameters
-            if negative_prompt:
-                data["negative_prompt"] = negative_prompt
-
-            if style_preset:
-                data["style_preset"] = style_preset
-
-            if seed and seed != 0:
-                data["seed"] = seed
-
-            if cfg_scale is not None:
-                data["cfg_scale"] = cfg_scale
-
-            # For SD3.5 models, add model parameter
-            if "sd3" in model_name.lower():
-                data["model"] = model_name
+            data = _generate_data(
+                prompt, model_name, aspect_ratio, negative_prompt, style_preset,
+                seed, cfg_scale, output_format
+            )
 
             # Empty files dict required for multipart/form-data
             files = {"none": ''}
@@ -184,7 +319,7 @@ def generate_image(
             # Make API request
             response = requests.post(
                 endpoint,
-                headers=headers,
+                headers=_headers(api_key),
                 files=files,
                 data=data,
                 timeout=120
@@ -192,13 +327,7 @@ def generate_image(
 
             # Check for errors
             if response.status_code != 200:
-                error_msg = f"Stability AI API error (status {response.status_code})"
-                try:
-                    error_data = response.json()
-                    error_msg += f": {error_data}"
-                except:
-                    error_msg += f": {response.text}"
-                raise Exception(error_msg)
+                raise _api_error(response)
 
             # Get image bytes
             image_bytes = response.content
@@ -244,6 +373,7 @@ def generate_image(
             if attempt < MAX_RETRIES - 1:
                 if verbose:
                     print(f"[Stability AI] Attempt {attempt + 1} failed: {e}. Retrying...")
+                record_retry()
                 time.sleep(RETRY_DELAY * (2**attempt))
             else:
                 error_msg = f"Failed to generate image after {MAX_RETRIES} attempts due to: {e}"
@@ -290,28 +420,73 @@ async def generate_image_async(
         If output_path provided: file path string
         Otherwise: image bytes
     """
-    import asyncio
-
-    # Note: For a truly async implementation, you would use aiohttp instead of requests
-    # For now, we'll run the sync version in an executor
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(
-        None,
-        lambda: generate_image(
-            prompt=prompt,
-            model_name=model_name,
-            aspect_ratio=aspect_ratio,
-            negative_prompt=negative_prompt,
-            style_preset=style_preset,
-            seed=seed,
-            cfg_scale=cfg_scale,
-            output_format=output_format,
-            output_path=output_path,
-            full_response=full_response,
-            api_key=api_key,
-            verbose=verbose,
-        )
+    start_time = time.time() if full_response else None
+
+    # Get API key from parameter or environment
+    api_key = api_key or os.getenv("STABILITY_API_KEY", "")
+    if not api_key:
+        raise ValueError("STABILITY_API_KEY not found in environment variables or parameters")
+
+    # Determine endpoint
+    endpoint = _get_endpoint(model_name)
+
+    if verbose:
+        print(f"[Stability AI] Generating image (async) with model={model_name}, aspect_ratio={aspect_ratio}")
+        print(f"[Stability AI] Using endpoint: {endpoint}")
+
+    data = _generate_data(
+        prompt, model_name, aspect_ratio, negative_prompt, style_preset,
+        seed, cfg_scale, output_format
     )
+    # httpx form fields must be strings
+    data = {key: str(value) for key, value in data.items()}
+
+    for attempt in range(MAX_RETRIES):
+        try:
+            # Empty file part forces multipart/form-data
+            response, image_bytes, file_size = await _post_async(
+                endpoint, api_key, data, {"none": ("none", b"")}, output_path
+            )
+
+            if output_path:
+                image_data = output_path
+                if verbose:
+                    print(f"[Stability AI] Image saved to: {output_path} ({file_size} bytes)")
+            else:
+                image_data = image_bytes
+                if verbose:
+                    print(f"[Stability AI] Image generated in memory ({file_size} bytes)")
+
+            # Return full response with metadata if requested
+            if full_response:
+                end_time = time.time()
+                process_time = end_time - start_time
+                return ImageGenerationResponse(
+                    image_data=image_data,
+                    model=model_name,
+                    prompt=prompt,
+                    revised_prompt=None,
+                    size=aspect_ratio,
+                    quality=None,
+                    style=style_preset,
+                    process_time=process_time,
+                    provider="STABILITY_AI",
+                    file_size=file_size,
+                    output_path=output_path,
+                    llm_provider_response=response,
+                )
+
+            return image_data
+
+        except Exception as e:
+            if attempt < MAX_RETRIES - 1:
+                if verbose:
+                    print(f"[Stability AI] Attempt {attempt + 1} failed: {e}. Retrying...")
+                record_retry()
+                await asyncio.sleep(RETRY_DELAY * (2**attempt))
+            else:
+                error_msg = f"Failed to generate image after {MAX_RETRIES} attempts due to: {e}"
+                raise Exception(error_msg)
 
 
 def edit_image(
@@ -374,17 +549,7 @@ def edit_image(
         raise ValueError("STABILITY_API_KEY not found in environment variables or parameters")
 
     # Choose endpoint based on whether mask is provided
-    if mask is not None:
-        # Use Inpaint when mask is explicitly provided
-        endpoint = f"{STABILITY_API_BASE}/v2beta/stable-image/edit/inpaint"
-        edit_mode = "inpaint"
-    else:
-        # Use Search and Replace for mask-free editing (works with JPEG)
-        endpoint = f"{STABILITY_API_BASE}/v2beta/stable-image/edit/search-and-replace"
-        edit_mode = "search-and-replace"
-        # Default search_prompt if not provided
-        if not search_prompt:
-            search_prompt = "the subject"
+    endpoint, edit_mode, search_prompt = _edit_endpoint(mask, search_prompt)
 
     if verbose:
         print(f"[Stability AI] Editing image with {edit_mode}")
@@ -394,72 +559,19 @@ def edit_image(
 
     for attempt in range(MAX_RETRIES):
         try:
-            # Build request headers
-            headers = {
-                "authorization": f"Bearer {api_key}",
-                "accept": "image/*"  # Get image bytes directly
-            }
-
             # Build request data based on endpoint
-            if edit_mode == "search-and-replace":
-                data = {
-                    "prompt": edit_prompt,
-                    "search_prompt": search_prompt,
-                    "output_format": output_format,
-                }
-            else:
-                # Inpaint mode
-                data = {
-                    "prompt": edit_prompt,
-                    "output_format": output_format,
-                }
-                if grow_mask != 5:
-                    data["grow_mask"] = grow_mask
-
-            # Add optional parameters (common to both)
-            if negative_prompt:
-                data["negative_prompt"] = negative_prompt
-
-            if style_preset:
-                data["style_preset"] = style_preset
-
-            if seed and seed != 0:
-                data["seed"] = seed
+            data = _edit_data(
+                edit_mode, edit_prompt, search_prompt, negative_prompt, style_preset,
+                seed, grow_mask, output_format
+            )
 
             # Prepare files for multipart upload
-            # Load the source image
-            if isinstance(image_source, str) and os.path.exists(image_source):
-                # File path - open and read
-                mime_type = _get_image_mime_type(image_source)
-                with open(image_source, 'rb') as f:
-                    image_data = f.read()
-                files = {"image": (os.path.basename(image_source), image_data, mime_type)}
-            elif isinstance(image_source, bytes):
-                # Raw bytes
-                files = {"image": ("image.png", image_source, "image/png")}
-            else:
-                # Assume base64 - decode first
-                image_data = base64.b64decode(image_source)
-                files = {"image": ("image.png", image_data, "image/png")}
-
-            # Add mask if provided (Inpaint mode only)
-            if mask is not None:
-                if isinstance(mask, str) and os.path.exists(mask):
-                    mask_mime = _get_image_mime_type(mask)
-                    with open(mask, 'rb') as f:
-                        mask_data = f.read()
-                    files["mask"] = (os.path.basename(mask), mask_data, mask_mime)
-                elif isinstance(mask, bytes):
-                    files["mask"] = ("mask.png", mask, "image/png")
-                else:
-                    # Assume base64
-                    mask_data = base64.b64decode(mask)
-                    files["mask"] = ("mask.png", mask_data, "image/png")
+            files = _edit_files(image_source, mask)
 
             # Make API request
             response = requests.post(
                 endpoint,
-                headers=headers,
+                headers=_headers(api_key),
                 files=files,
                 data=data,
                 timeout=120
@@ -467,13 +579,7 @@ def edit_image(
 
             # Check for errors
             if response.status_code != 200:
-                error_msg = f"Stability AI API error (status {response.status_code})"
-                try:
-                    error_data = response.json()
-                    error_msg += f": {error_data}"
-                except:
-                    error_msg += f": {response.text}"
-                raise Exception(error_msg)
+                raise _api_error(response)
 
             # Get image bytes
             image_bytes = response.content
@@ -519,6 +625,7 @@ def edit_image(
             if attempt < MAX_RETRIES - 1:
                 if verbose:
                     print(f"[Stability AI] Attempt {attempt + 1} failed: {e}. Retrying...")
+                record_retry()
                 time.sleep(RETRY_DELAY * (2**attempt))
             else:
                 error_msg = f"Failed to edit image after {MAX_RETRIES} attempts due to: {e}"
@@ -569,24 +676,70 @@ async def edit_image_async(
         If output_path provided: file path string
         Otherwise: image bytes
     """
-    import asyncio
-
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(
-        None,
-        lambda: edit_image(
-            image_source=image_source,
-            edit_prompt=edit_prompt,
-            search_prompt=search_prompt,
-            mask=mask,
-            style_preset=style_preset,
-            negative_prompt=negative_prompt,
-            seed=seed,
-            grow_mask=grow_mask,
-            output_format=output_format,
-            output_path=output_path,
-            full_response=full_response,
-            api_key=api_key,
-            verbose=verbose,
-        )
+    start_time = time.time() if full_response else None
+
+    # Get API key from parameter or environment
+    api_key = api_key or os.getenv("STABILITY_API_KEY", "")
+    if not api_key:
+        raise ValueError("STABILITY_API_KEY not found in environment variables or parameters")
+
+    endpoint, edit_mode, search_prompt = _edit_endpoint(mask, search_prompt)
+
+    if verbose:
+        print(f"[Stability AI] Editing image (async) with {edit_mode}")
+        print(f"[Stability AI] Using endpoint: {endpoint}")
+        if edit_mode == "search-and-replace":
+            print(f"[Stability AI] Search: '{search_prompt}' -> Replace: '{edit_prompt[:50]}...'")
+
+    data = _edit_data(
+        edit_mode, edit_prompt, search_prompt, negative_prompt, style_preset,
+        seed, grow_mask, output_format
     )
+    data = {key: str(value) for key, value in data.items()}
+    # Read the source image and mask in a worker thread
+    files = await asyncio.to_thread(_edit_files, image_source, mask)
+
+    for attempt in range(MAX_RETRIES):
+        try:
+            response, image_bytes, file_size = await _post_async(
+                endpoint, api_key, data, files, output_path
+            )
+
+            if output_path:
+                image_data = output_path
+                if verbose:
+                    print(f"[Stability AI] Edited image saved to: {output_path} ({file_size} bytes)")
+            else:
+                image_data = image_bytes
+                if verbose:
+                    print(f"[Stability AI] Edited image generated in memory ({file_size} bytes)")
+
+            if full_response:
+                end_time = time.time()
+                process_time = end_time - start_time
+                return ImageGenerationResponse(
+                    image_data=image_data,
+                    model=edit_mode,
+                    prompt=edit_prompt,
+                    revised_prompt=search_prompt if edit_mode == "search-and-replace" else None,
+                    size="original",
+                    quality=None,
+                    style=style_preset,
+                    process_time=process_time,
+                    provider="STABILITY_AI",
+                    file_size=file_size,
+                    output_path=output_path,
+                    llm_provider_response=response,
+                )
+
+            return image_data
+
+        except Exception as e:
+            if attempt < MAX_RETRIES - 1:
+                if verbose:
+                    print(f"[Stability AI] Attempt {attempt + 1} failed: {e}. Retrying...")
+                record_retry()
+                await asyncio.sleep(RETRY_DELAY * (2**attempt))
+            else:
+                error_msg = f"Failed to edit image after {MAX_RETRIES} attempts due to: {e}"
+                raise Exception(error_msg)
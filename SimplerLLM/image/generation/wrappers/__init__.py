@@ -1,16 +1,18 @@
 """
 Image generation wrapper classes.
 Provides unified interfaces for different image generation providers.
+Each wrapper is imported on first access.
 """
 
-from .openai_wrapper import OpenAIImageGenerator
-from .stability_wrapper import StabilityImageGenerator
-from .google_wrapper import GoogleImageGenerator
-from .seedream_wrapper import SeedreamImageGenerator
+from SimplerLLM.utils.lazy_imports import lazy_exports
 
-__all__ = [
-    'OpenAIImageGenerator',
-    'StabilityImageGenerator',
-    'GoogleImageGenerator',
-    'SeedreamImageGenerator',
-]
+_EXPORTS = {
+    'OpenAIImageGenerator': '.openai_wrapper',
+    'StabilityImageGenerator': '.stability_wrapper',
+    'GoogleImageGenerator': '.google_wrapper',
+    'SeedreamImageGenerator': '.seedream_wrapper',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
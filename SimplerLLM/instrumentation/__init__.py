@@ -0,0 +1,57 @@
+"""
+Instrumentation - hooks, spans and metrics for every SimplerLLM call.
+
+LLM generation, embeddings, vector database operations, text-to-speech,
+speech-to-text and image generation run inside spans when at least one
+hook is registered. Spans carry latency, time to first byte, token
+counts, retries, cache hits and bytes sent/received. With no hook
+registered, instrumented methods call straight through.
+
+Quick Start:
+    >>> from SimplerLLM.instrumentation import add_hook, MetricsCollector
+    >>> metrics = add_hook(MetricsCollector())
+    >>> llm.generate_response(prompt="Hello")
+    >>> for row in metrics.snapshot():
+    ...     print(row["provider"], row["model"], row["latency"]["p50"])
+
+Custom Hooks:
+    >>> from SimplerLLM.instrumentation import InstrumentationHook, add_hook
+    >>> class SlowCallLogger(InstrumentationHook):
+    ...     def on_end(self, span):
+    ...         if span.duration > 5:
+    ...             print(f"slow {span.name}: {span.duration:.1f}s")
+    ...     def on_error(self, span, error):
+    ...         print(f"{span.name} failed after {span.retries} retries: {error}")
+    >>> add_hook(SlowCallLogger())
+
+OpenTelemetry:
+    >>> from SimplerLLM.instrumentation import OpenTelemetryHook
+    >>> add_hook(OpenTelemetryHook())  # requires opentelemetry-api
+"""
+
+from SimplerLLM.utils.lazy_imports import lazy_exports
+
+_EXPORTS = {
+    'Span': '.core',
+    'InstrumentationHook': '.core',
+    'add_hook': '.core',
+    'remove_hook': '.core',
+    'clear_hooks': '.core',
+    'get_hooks': '.core',
+    'is_enabled': '.core',
+    'current_span': '.core',
+    'record_retry': '.core',
+    'record_usage': '.core',
+    'record_cache': '.core',
+    'record_bytes': '.core',
+    'record_first_byte': '.core',
+    'instrument_class': '.core',
+    'instrumented': '.core',
+    'MetricsCollector': '.metrics',
+    'Histogram': '.metrics',
+    'OpenTelemetryHook': '.otel',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
@@ -0,0 +1,503 @@
+"""
+Instrumentation core: hooks, spans and the helpers providers call.
+
+Every instrumented call (LLM generation, embeddings, vector operations,
+speech and image generation) runs inside a Span. Registered hooks are
+told when a span starts, ends or fails. With no hook registered the
+instrumented methods call straight through, so the cost of being
+disabled is one tuple check per call.
+"""
+
+import functools
+import inspect
+import itertools
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_hooks: Tuple["InstrumentationHook", ...] = ()
+_current_span: ContextVar[Optional["Span"]] = ContextVar("simplerllm_span", default=None)
+_span_ids = itertools.count(1)
+
+# Argument names whose text or bytes count towards Span.bytes_sent
+_PAYLOAD_ARGS = (
+    "prompt", "messages", "system_prompt", "user_input", "text", "texts",
+    "audio_file", "image_source", "mask_source", "vector", "vectors",
+)
+
+
+class Span:
+    """
+    One instrumented operation.
+
+    Attributes:
+        span_id: Unique id within the process
+        parent_id: span_id of the enclosing span, if any
+        name: Method that was called (e.g. "llm.generate_response")
+        component: llm, embeddings, vectors, voice or image
+        operation: Kind of work (chat, embeddings, speech, transcription, ...)
+        provider: Provider name (e.g. "openai"), if known
+        model: Model name, if known
+        start_time: Wall-clock start (seconds since the epoch)
+        end_time: Wall-clock end, set when the span finishes
+        duration: Elapsed seconds, set when the span finishes
+        time_to_first_byte: Seconds until the first streamed chunk or response
+        input_tokens / output_tokens: Token usage reported by the provider
+        retries: Number of retried attempts
+        cache_hits / cache_misses: Cache lookups made during the span
+        bytes_sent / bytes_received: Approximate payload sizes
+        error: Exception that ended the span, if any
+        attributes: Extra key/value data
+        hook_data: Per-hook storage (e.g. the OpenTelemetry span)
+    """
+
+    __slots__ = (
+        "span_id", "parent_id", "name", "component", "operation", "provider", "model",
+        "start_time", "end_time", "duration", "time_to_first_byte",
+        "input_tokens", "output_tokens", "retries", "cache_hits", "cache_misses",
+        "bytes_sent", "bytes_received", "error", "attributes", "hook_data",
+        "_owner", "_start_perf",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        component: str,
+        operation: str,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        parent: Optional["Span"] = None,
+    ):
+        self.span_id = next(_span_ids)
+        self.parent_id = parent.span_id if parent is not None else None
+        self.name = name
+        self.component = component
+        self.operation = operation
+        self.provider = provider
+        self.model = model
+        self.start_time = time.time()
+        self._start_perf = time.perf_counter()
+        self.end_time: Optional[float] = None
+        self.duration: Optional[float] = None
+        self.time_to_first_byte: Optional[float] = None
+        self.input_tokens: Optional[int] = None
+        self.output_tokens: Optional[int] = None
+        self.retries = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.error: Optional[BaseException] = None
+        self.attributes: Dict[str, Any] = {}
+        self.hook_data: Dict[str, Any] = {}
+        self._owner = None
+
+    def elapsed(self) -> float:
+        """Seconds since the span started."""
+        return time.perf_counter() - self._start_perf
+
+    def mark_first_byte(self) -> None:
+        """Record the time to first byte, once."""
+        if self.time_to_first_byte is None:
+            self.time_to_first_byte = self.elapsed()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def _finish(self) -> None:
+        self.duration = self.elapsed()
+        self.end_time = self.start_time + self.duration
+
+    def __repr__(self) -> str:
+        return (
+            f"Span({self.name!r}, provider={self.provider!r}, model={self.model!r}, "
+            f"duration={self.duration!r}, error={type(self.error).__name__ if self.error else None})"
+        )
+
+
+class InstrumentationHook:
+    """
+    Base class for instrumentation hooks. Override any of the methods.
+
+    Hooks run synchronously on the calling thread, so they should be fast.
+    Exceptions raised by a hook are logged and never reach the caller.
+
+    Example:
+        >>> class PrintHook(InstrumentationHook):
+        ...     def on_end(self, span):
+        ...         print(f"{span.name} took {span.duration:.2f}s")
+        >>> add_hook(PrintHook())
+    """
+
+    def on_start(self, span: Span) -> None:
+        """Called when an instrumented operation starts."""
+
+    def on_end(self, span: Span) -> None:
+        """Called when an instrumented operation succeeds."""
+
+    def on_error(self, span: Span, error: BaseException) -> None:
+        """Called when an instrumented operation raises."""
+
+
+def add_hook(hook: InstrumentationHook) -> InstrumentationHook:
+    """
+    Register a hook. Instrumentation is enabled while at least one hook is registered.
+
+    Returns:
+        The hook, so it can be created and registered in one line
+    """
+    global _hooks
+    with _lock:
+        if hook not in _hooks:
+            _hooks = _hooks + (hook,)
+    return hook
+
+
+def remove_hook(hook: InstrumentationHook) -> None:
+    """Unregister a hook (no error if it is not registered)."""
+    global _hooks
+    with _lock:
+        _hooks = tuple(h for h in _hooks if h is not hook)
+
+
+def clear_hooks() -> None:
+    """Unregister all hooks, disabling instrumentation."""
+    global _hooks
+    with _lock:
+        _hooks = ()
+
+
+def get_hooks() -> List[InstrumentationHook]:
+    """Return the registered hooks."""
+    return list(_hooks)
+
+
+def is_enabled() -> bool:
+    """True when at least one hook is registered."""
+    return bool(_hooks)
+
+
+def current_span() -> Optional[Span]:
+    """Return the span of the operation running in this context, if any."""
+    return _current_span.get()
+
+
+def _notify(method: str, span: Span, *args) -> None:
+    for hook in _hooks:
+        try:
+            getattr(hook, method)(span, *args)
+        except Exception:
+            logger.warning("Instrumentation hook %r failed in %s", hook, method, exc_info=True)
+
+
+# ---------------------------------------------------------------------------
+# Helpers called by providers. Each is a no-op outside an instrumented call.
+# ---------------------------------------------------------------------------
+
+def record_retry() -> None:
+    """Count a retried attempt on the current span."""
+    span = _current_span.get()
+    if span is not None:
+        span.retries += 1
+
+
+def record_usage(input_tokens: Optional[int], output_tokens: Optional[int]) -> None:
+    """Record token usage reported by the provider on the current span."""
+    span = _current_span.get()
+    if span is not None:
+        span.input_tokens = input_tokens
+        span.output_tokens = output_tokens
+
+
+def record_cache(hit: bool) -> None:
+    """Count a cache hit or miss on the current span."""
+    span = _current_span.get()
+    if span is not None:
+        if hit:
+            span.cache_hits += 1
+        else:
+            span.cache_misses += 1
+
+
+def record_bytes(sent: int = 0, received: int = 0) -> None:
+    """Add to the bytes sent/received of the current span."""
+    span = _current_span.get()
+    if span is not None:
+        span.bytes_sent += sent
+        span.bytes_received += received
+
+
+def record_first_byte() -> None:
+    """Mark the time to first byte of the current span."""
+    span = _current_span.get()
+    if span is not None:
+        span.mark_first_byte()
+
+
+# ---------------------------------------------------------------------------
+# Method instrumentation
+# ---------------------------------------------------------------------------
+
+def _name_of(value) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, Enum):
+        return value.name.lower()
+    return str(value).lower()
+
+
+def _payload_size(value) -> int:
+    if isinstance(value, str):
+        return len(value.encode("utf-8", "ignore"))
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    if isinstance(value, float):
+        return 8
+    if isinstance(value, dict):
+        return _payload_size(value.get("content"))
+    if isinstance(value, (list, tuple)):
+        return sum(_payload_size(item) for item in value)
+    nbytes = getattr(value, "nbytes", None)  # NumPy arrays
+    return nbytes if isinstance(nbytes, int) else 0
+
+
+def _begin(owner, name: str, component: str, operation: str, args, kwargs) -> Optional[Span]:
+    parent = _current_span.get()
+    if parent is not None and parent._owner is owner and parent.operation == operation:
+        # A sync method delegating to its async twin, or a subclass calling
+        # super(): already inside this operation's span
+        return None
+
+    model = (
+        kwargs.get("model_name") or kwargs.get("model")
+        or getattr(owner, "model_name", None) or getattr(owner, "model", None)
+        or getattr(owner, "default_model", None)
+    )
+    span = Span(
+        name,
+        component,
+        operation,
+        provider=_name_of(getattr(owner, "provider", None)),
+        model=model if isinstance(model, str) else None,
+        parent=parent,
+    )
+    span._owner = owner
+
+    sent = sum(_payload_size(kwargs.get(arg)) for arg in _PAYLOAD_ARGS)
+    if args:
+        sent += _payload_size(args[0])
+    span.bytes_sent = sent
+
+    _notify("on_start", span)
+    return span
+
+
+def _absorb_result(span: Span, result) -> None:
+    """Read token counts, TTFB and sizes from known response objects."""
+    if result is None:
+        return
+    if span.input_tokens is None:
+        input_tokens = getattr(result, "input_token_count", None)
+        if input_tokens is not None:
+            span.input_tokens = input_tokens
+            span.output_tokens = getattr(result, "output_token_count", None)
+    ttfb = getattr(result, "time_to_first_byte", None)
+    if ttfb is not None and span.time_to_first_byte is None:
+        span.time_to_first_byte = ttfb
+    if not span.bytes_received:
+        size = getattr(result, "file_size", None)
+        if isinstance(size, int):
+            span.bytes_received = size
+            return
+        for field in ("audio_data", "image_data"):
+            data = getattr(result, field, None)
+            if isinstance(data, (bytes, bytearray)):
+                span.bytes_received = len(data)
+                return
+        text = getattr(result, "generated_text", result)
+        if isinstance(text, (str, bytes, bytearray)):
+            span.bytes_received = _payload_size(text)
+
+
+def _end(span: Span, result) -> None:
+    span._finish()
+    try:
+        _absorb_result(span, result)
+    except Exception:
+        logger.debug("Could not read metrics from %r", type(result), exc_info=True)
+    _notify("on_end", span)
+
+
+def _fail(span: Span, error: BaseException) -> None:
+    span._finish()
+    span.error = error
+    _notify("on_error", span, error)
+
+
+def _wrap(func: Callable, component: str, operation: str) -> Callable:
+    name = f"{component}.{func.__name__}"
+
+    if inspect.isasyncgenfunction(func):
+        async def traced_async_gen(self, args, kwargs):
+            span = _begin(self, name, component, operation, args, kwargs)
+            gen = func(self, *args, **kwargs)
+            if span is None:
+                async for item in gen:
+                    yield item
+                return
+            try:
+                while True:
+                    token = _current_span.set(span)
+                    try:
+                        item = await gen.__anext__()
+                    except StopAsyncIteration:
+                        break
+                    finally:
+                        _current_span.reset(token)
+                    span.mark_first_byte()
+                    span.bytes_received += _payload_size(item)
+                    yield item
+            except GeneratorExit:
+                await gen.aclose()
+                _end(span, None)
+                raise
+            except BaseException as e:
+                _fail(span, e)
+                raise
+            _end(span, None)
+
+        @functools.wraps(func)
+        def async_gen_wrapper(self, *args, **kwargs):
+            if not _hooks:
+                return func(self, *args, **kwargs)
+            return traced_async_gen(self, args, kwargs)
+
+        wrapper = async_gen_wrapper
+
+    elif inspect.isgeneratorfunction(func):
+        def traced_gen(self, args, kwargs):
+            span = _begin(self, name, component, operation, args, kwargs)
+            gen = func(self, *args, **kwargs)
+            if span is None:
+                yield from gen
+                return
+            try:
+                while True:
+                    token = _current_span.set(span)
+                    try:
+                        item = next(gen)
+                    except StopIteration:
+                        break
+                    finally:
+                        _current_span.reset(token)
+                    span.mark_first_byte()
+                    span.bytes_received += _payload_size(item)
+                    yield item
+            except GeneratorExit:
+                gen.close()
+                _end(span, None)
+                raise
+            except BaseException as e:
+                _fail(span, e)
+                raise
+            _end(span, None)
+
+        @functools.wraps(func)
+        def gen_wrapper(self, *args, **kwargs):
+            if not _hooks:
+                return func(self, *args, **kwargs)
+            return traced_gen(self, args, kwargs)
+
+        wrapper = gen_wrapper
+
+    elif inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            if not _hooks:
+                return await func(self, *args, **kwargs)
+            span = _begin(self, name, component, operation, args, kwargs)
+            if span is None:
+                return await func(self, *args, **kwargs)
+            token = _current_span.set(span)
+            try:
+                result = await func(self, *args, **kwargs)
+            except BaseException as e:
+                _fail(span, e)
+                raise
+            finally:
+                _current_span.reset(token)
+            _end(span, result)
+            return result
+
+        wrapper = async_wrapper
+
+    else:
+        @functools.wraps(func)
+        def sync_wrapper(self, *args, **kwargs):
+            if not _hooks:
+                return func(self, *args, **kwargs)
+            span = _begin(self, name, component, operation, args, kwargs)
+            if span is None:
+                return func(self, *args, **kwargs)
+            token = _current_span.set(span)
+            try:
+                result = func(self, *args, **kwargs)
+            except BaseException as e:
+                _fail(span, e)
+                raise
+            finally:
+                _current_span.reset(token)
+            _end(span, result)
+            return result
+
+        wrapper = sync_wrapper
+
+    wrapper.__instrumented__ = True
+    return wrapper
+
+
+def instrument_class(cls: type, component: str, operations: Dict[str, str]) -> type:
+    """
+    Wrap the methods of cls listed in operations so they run inside spans.
+
+    Only methods defined on cls itself are wrapped; inherited ones were
+    wrapped on the class that defines them. Call it from a base class's
+    __init_subclass__ to cover every provider, or use it as a decorator
+    via instrumented().
+
+    Args:
+        cls: Class to instrument
+        component: llm, embeddings, vectors, voice or image
+        operations: Method name -> operation name (e.g. {"generate_response": "chat"})
+
+    Returns:
+        cls
+    """
+    for method_name, operation in operations.items():
+        func = cls.__dict__.get(method_name)
+        if func is None or not callable(func) or getattr(func, "__instrumented__", False):
+            continue
+        if getattr(func, "__isabstractmethod__", False):
+            continue
+        setattr(cls, method_name, _wrap(func, component, operation))
+    return cls
+
+
+def instrumented(component: str, operations: Dict[str, str]) -> Callable[[type], type]:
+    """
+    Class decorator form of instrument_class().
+
+    Example:
+        >>> @instrumented("vectors", {"top_cosine_similarity": "search"})
+        ... class MyVectorDB:
+        ...     ...
+    """
+    def decorator(cls: type) -> type:
+        return instrument_class(cls, component, operations)
+    return decorator
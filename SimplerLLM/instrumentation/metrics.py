@@ -0,0 +1,195 @@
+"""
+In-memory metrics built from instrumentation spans.
+
+MetricsCollector is a hook that aggregates finished spans into latency
+and time-to-first-byte histograms and counters for calls, errors,
+tokens, retries, cache hits and bytes, grouped by component, operation,
+provider and model. Use it directly, or as a reference for exporting to
+your own metrics system.
+"""
+
+import bisect
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from .core import InstrumentationHook, Span
+
+# Bucket upper bounds in seconds (OpenTelemetry GenAI duration buckets)
+DEFAULT_BUCKETS = (
+    0.01, 0.02, 0.04, 0.08, 0.16, 0.32, 0.64, 1.28, 2.56, 5.12, 10.24, 20.48, 40.96, 81.92,
+)
+
+MetricKey = Tuple[str, str, Optional[str], Optional[str]]
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram.
+
+    Args:
+        buckets: Sorted bucket upper bounds; values above the last bound
+            go to an overflow bucket
+    """
+
+    __slots__ = ("buckets", "counts", "count", "total", "min", "max")
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def record(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Estimate the q-th percentile (0-100) by interpolating within buckets.
+
+        Returns:
+            Estimated value, or None if nothing was recorded
+        """
+        if not self.count:
+            return None
+        rank = q / 100 * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                low = self.buckets[i - 1] if i > 0 else 0.0
+                high = self.buckets[i] if i < len(self.buckets) else self.max
+                fraction = (rank - seen) / bucket_count
+                value = low + (high - low) * fraction
+                return min(max(value, self.min), self.max)
+            seen += bucket_count
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.total / self.count if self.count else None,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "buckets": dict(zip([*map(str, self.buckets), "+Inf"], self.counts)),
+        }
+
+
+class _Series:
+    __slots__ = (
+        "latency", "ttfb", "calls", "errors", "input_tokens", "output_tokens",
+        "retries", "cache_hits", "cache_misses", "bytes_sent", "bytes_received",
+    )
+
+    def __init__(self, buckets):
+        self.latency = Histogram(buckets)
+        self.ttfb = Histogram(buckets)
+        self.calls = 0
+        self.errors = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.retries = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+
+class MetricsCollector(InstrumentationHook):
+    """
+    Hook that aggregates spans into histograms and counters.
+
+    Batch operations (embed_many, generate_long_speech, ...) have their
+    own operation name, so their series and those of the provider calls
+    they make are kept apart. Pass top_level_only=True to ignore spans
+    that run inside another span.
+
+    Args:
+        buckets: Histogram bucket upper bounds in seconds
+        top_level_only: Count only spans without a parent
+
+    Example:
+        >>> from SimplerLLM.instrumentation import add_hook, MetricsCollector
+        >>> metrics = add_hook(MetricsCollector())
+        >>> llm.generate_response(prompt="Hi")
+        >>> stats = metrics.snapshot()
+        >>> print(stats[0]["latency"]["p50"], stats[0]["input_tokens"])
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, top_level_only: bool = False):
+        self.buckets = tuple(buckets)
+        self.top_level_only = top_level_only
+        self._lock = threading.Lock()
+        self._series: Dict[MetricKey, _Series] = {}
+
+    def _record(self, span: Span, failed: bool) -> None:
+        if span.parent_id is not None and self.top_level_only:
+            return
+        key = (span.component, span.operation, span.provider, span.model)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series(self.buckets)
+            series.calls += 1
+            series.latency.record(span.duration)
+            if span.time_to_first_byte is not None:
+                series.ttfb.record(span.time_to_first_byte)
+            if failed:
+                series.errors += 1
+            series.input_tokens += span.input_tokens or 0
+            series.output_tokens += span.output_tokens or 0
+            series.retries += span.retries
+            series.cache_hits += span.cache_hits
+            series.cache_misses += span.cache_misses
+            series.bytes_sent += span.bytes_sent
+            series.bytes_received += span.bytes_received
+
+    def on_end(self, span: Span) -> None:
+        self._record(span, failed=False)
+
+    def on_error(self, span: Span, error: BaseException) -> None:
+        self._record(span, failed=True)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """
+        Return the current metrics, one entry per component/operation/provider/model.
+
+        Returns:
+            List of dicts with the series labels, counters and
+            latency/ttfb histogram summaries (count, sum, min, max, mean,
+            p50, p90, p99, buckets)
+        """
+        with self._lock:
+            rows = []
+            for (component, operation, provider, model), s in self._series.items():
+                rows.append({
+                    "component": component,
+                    "operation": operation,
+                    "provider": provider,
+                    "model": model,
+                    "calls": s.calls,
+                    "errors": s.errors,
+                    "latency": s.latency.to_dict(),
+                    "ttfb": s.ttfb.to_dict(),
+                    "input_tokens": s.input_tokens,
+                    "output_tokens": s.output_tokens,
+                    "retries": s.retries,
+                    "cache_hits": s.cache_hits,
+                    "cache_misses": s.cache_misses,
+                    "bytes_sent": s.bytes_sent,
+                    "bytes_received": s.bytes_received,
+                })
+            return rows
+
+    def reset(self) -> None:
+        """Drop all recorded metrics."""
+        with self._lock:
+            self._series.clear()
@@ -0,0 +1,159 @@
+"""
+OpenTelemetry export for instrumentation spans.
+
+OpenTelemetryHook turns each span into an OpenTelemetry span and records
+duration, time-to-first-byte, token and byte metrics. Attribute and
+metric names follow the OpenTelemetry GenAI semantic conventions where
+one exists (gen_ai.*), with simplerllm.* for the rest.
+
+Requires the opentelemetry-api package (pip install opentelemetry-api);
+configure exporters with the OpenTelemetry SDK as usual.
+"""
+
+from typing import Any, Dict, Optional
+
+from .core import InstrumentationHook, Span, current_span
+
+try:
+    from opentelemetry import metrics as otel_metrics
+    from opentelemetry import trace as otel_trace
+    OTEL_AVAILABLE = True
+except ImportError:
+    OTEL_AVAILABLE = False
+    otel_metrics = None
+    otel_trace = None
+
+# Bucket upper bounds in seconds recommended for gen_ai.client.operation.duration
+_DURATION_BUCKETS = [
+    0.01, 0.02, 0.04, 0.08, 0.16, 0.32, 0.64, 1.28, 2.56, 5.12, 10.24, 20.48, 40.96, 81.92,
+]
+
+
+def _span_attributes(span: Span) -> Dict[str, Any]:
+    attributes = {
+        "gen_ai.operation.name": span.operation,
+        "simplerllm.component": span.component,
+    }
+    if span.provider:
+        attributes["gen_ai.system"] = span.provider
+    if span.model:
+        attributes["gen_ai.request.model"] = span.model
+    for key, value in span.attributes.items():
+        if isinstance(value, (str, bool, int, float)):
+            attributes[key] = value
+    return attributes
+
+
+class OpenTelemetryHook(InstrumentationHook):
+    """
+    Export spans and metrics through the OpenTelemetry API.
+
+    Args:
+        tracer_provider: TracerProvider to use (default: the global one)
+        meter_provider: MeterProvider to use (default: the global one)
+
+    Raises:
+        ImportError: If opentelemetry-api is not installed
+
+    Example:
+        >>> from SimplerLLM.instrumentation import add_hook, OpenTelemetryHook
+        >>> add_hook(OpenTelemetryHook())
+    """
+
+    def __init__(self, tracer_provider=None, meter_provider=None):
+        if not OTEL_AVAILABLE:
+            raise ImportError(
+                "OpenTelemetryHook requires the opentelemetry-api package. "
+                "Install it with: pip install opentelemetry-api"
+            )
+
+        self.tracer = otel_trace.get_tracer("SimplerLLM", tracer_provider=tracer_provider)
+        meter = otel_metrics.get_meter("SimplerLLM", meter_provider=meter_provider)
+
+        self.duration = meter.create_histogram(
+            "gen_ai.client.operation.duration",
+            unit="s",
+            description="Duration of SimplerLLM client operations",
+            explicit_bucket_boundaries_advisory=_DURATION_BUCKETS,
+        )
+        self.ttfb = meter.create_histogram(
+            "simplerllm.client.time_to_first_byte",
+            unit="s",
+            description="Time until the first streamed chunk or response",
+            explicit_bucket_boundaries_advisory=_DURATION_BUCKETS,
+        )
+        self.tokens = meter.create_histogram(
+            "gen_ai.client.token.usage",
+            unit="{token}",
+            description="Tokens used per operation",
+        )
+        self.retries = meter.create_counter(
+            "simplerllm.client.retries", unit="{retry}", description="Retried attempts"
+        )
+        self.cache = meter.create_counter(
+            "simplerllm.client.cache.lookups", unit="{lookup}", description="Cache lookups"
+        )
+        self.bytes = meter.create_counter(
+            "simplerllm.client.bytes", unit="By", description="Approximate payload bytes"
+        )
+
+    def on_start(self, span: Span) -> None:
+        # The enclosing span is still current while on_start runs
+        parent = current_span()
+        otel_parent = parent.hook_data.get("otel_span") if parent is not None else None
+        name = f"{span.operation} {span.model}" if span.model else span.operation
+
+        span.hook_data["otel_span"] = self.tracer.start_span(
+            name,
+            context=otel_trace.set_span_in_context(otel_parent) if otel_parent is not None else None,
+            kind=otel_trace.SpanKind.CLIENT,
+            attributes=_span_attributes(span),
+            start_time=int(span.start_time * 1e9),
+        )
+
+    def _finish(self, span: Span, error: Optional[BaseException]) -> None:
+        otel_span = span.hook_data.pop("otel_span", None)
+        attributes = _span_attributes(span)
+        if error is not None:
+            attributes["error.type"] = type(error).__qualname__
+
+        if otel_span is not None:
+            if span.input_tokens is not None:
+                otel_span.set_attribute("gen_ai.usage.input_tokens", span.input_tokens)
+            if span.output_tokens is not None:
+                otel_span.set_attribute("gen_ai.usage.output_tokens", span.output_tokens)
+            if span.time_to_first_byte is not None:
+                otel_span.set_attribute("simplerllm.time_to_first_byte", span.time_to_first_byte)
+            otel_span.set_attribute("simplerllm.retries", span.retries)
+            otel_span.set_attribute("simplerllm.cache_hits", span.cache_hits)
+            otel_span.set_attribute("simplerllm.bytes_sent", span.bytes_sent)
+            otel_span.set_attribute("simplerllm.bytes_received", span.bytes_received)
+            if error is not None:
+                otel_span.record_exception(error)
+                otel_span.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR, str(error)))
+                otel_span.set_attribute("error.type", type(error).__qualname__)
+            otel_span.end(end_time=int(span.end_time * 1e9))
+
+        self.duration.record(span.duration, attributes)
+        if span.time_to_first_byte is not None:
+            self.ttfb.record(span.time_to_first_byte, attributes)
+        if span.input_tokens is not None:
+            self.tokens.record(span.input_tokens, {**attributes, "gen_ai.token.type": "input"})
+        if span.output_tokens is not None:
+            self.tokens.record(span.output_tokens, {**attributes, "gen_ai.token.type": "output"})
+        if span.retries:
+            self.retries.add(span.retries, attributes)
+        if span.cache_hits:
+            self.cache.add(span.cache_hits, {**attributes, "simplerllm.cache.result": "hit"})
+        if span.cache_misses:
+            self.cache.add(span.cache_misses, {**attributes, "simplerllm.cache.result": "miss"})
+        if span.bytes_sent:
+            self.bytes.add(span.bytes_sent, {**attributes, "simplerllm.direction": "sent"})
+        if span.bytes_received:
+            self.bytes.add(span.bytes_received, {**attributes, "simplerllm.direction": "received"})
+
+    def on_end(self, span: Span) -> None:
+        self._finish(span, None)
+
+    def on_error(self, span: Span, error: BaseException) -> None:
+        self._finish(span, error)
@@ -1,81 +1,57 @@
-from .llm.base import LLM, LLMProvider
-from .llm.reliable import ReliableLLM
-from .llm.wrappers import OpenAILLM, GeminiLLM, AnthropicLLM, OllamaLLM, DeepSeekLLM
-from .llm_judge import LLMJudge, JudgeMode, JudgeResult, ProviderResponse, ProviderEvaluation, EvaluationReport
-from .llm_brainstorm import (
-    RecursiveBrainstorm,
-    BrainstormMode,
-    BrainstormResult,
-    BrainstormIdea,
-    BrainstormLevel,
-    BrainstormIteration,
-)
-from .llm_feedback import LLMFeedbackLoop, FeedbackResult, IterationResult, Critique
-from .embeddings import (
-    EmbeddingsLLM,
-    EmbeddingsProvider,
-    OpenAIEmbeddings,
-    VoyageEmbeddings,
-    CohereEmbeddings,
-    OpenRouterEmbeddings,
-    CometAPIEmbeddings,
-)
-from .llm_addons import (
-    create_optimized_prompt,
-    generate_pydantic_json_model,
-    generate_pydantic_json_model_reliable,
-    generate_pydantic_json_model_async,
-    generate_pydantic_json_model_reliable_async,
-    generate_structured_pattern,
-    generate_structured_pattern_async,
-    generate_structured_pattern_reliable,
-    generate_structured_pattern_reliable_async,
-    calculate_text_generation_costs,
-)
+from SimplerLLM.utils.lazy_imports import lazy_exports
 
-__all__ = [
-    'LLM',
-    'LLMProvider',
-    'ReliableLLM',
-    'OpenAILLM',
-    'GeminiLLM',
-    'AnthropicLLM',
-    'OllamaLLM',
-    'DeepSeekLLM',
-    'LLMJudge',
-    'JudgeMode',
-    'JudgeResult',
-    'ProviderResponse',
-    'ProviderEvaluation',
-    'EvaluationReport',
+# Public names are imported from their submodule on first access
+_EXPORTS = {
+    'LLM': '.llm.base',
+    'LLMProvider': '.llm.base',
+    'ReliableLLM': '.llm.reliable',
+    'OpenAILLM': '.llm.wrappers.openai_wrapper',
+    'GeminiLLM': '.llm.wrappers.gemini_wrapper',
+    'AnthropicLLM': '.llm.wrappers.anthropic_wrapper',
+    'OllamaLLM': '.llm.wrappers.ollama_wrapper',
+    'DeepSeekLLM': '.llm.wrappers.deepseek_wrapper',
+    'LLMJudge': '.llm_judge',
+    'JudgeMode': '.llm_judge',
+    'JudgeResult': '.llm_judge',
+    'ProviderResponse': '.llm_judge',
+    'ProviderEvaluation': '.llm_judge',
+    'EvaluationReport': '.llm_judge',
     # LLM Brainstorm
-    'RecursiveBrainstorm',
-    'BrainstormMode',
-    'BrainstormResult',
-    'BrainstormIdea',
-    'BrainstormLevel',
-    'BrainstormIteration',
-    'LLMFeedbackLoop',
-    'FeedbackResult',
-    'IterationResult',
-    'Critique',
+    'RecursiveBrainstorm': '.llm_brainstorm',
+    'BrainstormMode': '.llm_brainstorm',
+    'BrainstormResult': '.llm_brainstorm',
+    'BrainstormIdea': '.llm_brainstorm',
+    'BrainstormLevel': '.llm_brainstorm',
+    'BrainstormIteration': '.llm_brainstorm',
+    'LLMFeedbackLoop': '.llm_feedback',
+    'FeedbackResult': '.llm_feedback',
+    'IterationResult': '.llm_feedback',
+    'Critique': '.llm_feedback',
     # Embeddings
-    'EmbeddingsLLM',
-    'EmbeddingsProvider',
-    'OpenAIEmbeddings',
-    'VoyageEmbeddings',
-    'CohereEmbeddings',
-    'OpenRouterEmbeddings',
-    'CometAPIEmbeddings',
+    'EmbeddingsLLM': '.embeddings',
+    'EmbeddingsProvider': '.embeddings',
+    'OpenAIEmbeddings': '.embeddings',
+    'VoyageEmbeddings': '.embeddings',
+    'CohereEmbeddings': '.embeddings',
+    'OpenRouterEmbeddings': '.embeddings',
+    'CometAPIEmbeddings': '.embeddings',
     # LLM Addons
-    'create_optimized_prompt',
-    'generate_pydantic_json_model',
-    'generate_pydantic_json_model_reliable',
-    'generate_pydantic_json_model_async',
-    'generate_pydantic_json_model_reliable_async',
-    'generate_structured_pattern',
-    'generate_structured_pattern_async',
-    'generate_structured_pattern_reliable',
-    'generate_structured_pattern_reliable_async',
-    'calculate_text_generation_costs',
-]
+    'create_optimized_prompt': '.llm_addons',
+    'generate_pydantic_json_model': '.llm_addons',
+    'generate_pydantic_json_model_reliable': '.llm_addons',
+    'generate_pydantic_json_model_async': '.llm_addons',
+    'generate_pydantic_json_model_reliable_async': '.llm_addons',
+    'generate_structured_pattern': '.llm_addons',
+    'generate_structured_pattern_async': '.llm_addons',
+    'generate_structured_pattern_reliable': '.llm_addons',
+    'generate_structured_pattern_reliable_async': '.llm_addons',
+    'calculate_text_generation_costs': '.llm_addons',
+    # LLM Batch
+    'BatchJob': '.llm_batch',
+    'BatchRequest': '.llm_batch',
+    'BatchResult': '.llm_batch',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
@@ -80,26 +80,22 @@ See Also:
     - SimplerLLM.vectors for vector database integration
 """
 
-from .models import EmbeddingsProvider
-from .base import EmbeddingsLLM
-from .providers import (
-    BaseEmbeddings,
-    OpenAIEmbeddings,
-    VoyageEmbeddings,
-    CohereEmbeddings,
-    OpenRouterEmbeddings,
-    CometAPIEmbeddings,
-)
+from SimplerLLM.utils.lazy_imports import lazy_exports
 
-__all__ = [
+# Provider implementations are imported on first access
+_EXPORTS = {
     # Main factory and enum
-    "EmbeddingsLLM",
-    "EmbeddingsProvider",
+    "EmbeddingsLLM": ".base",
+    "EmbeddingsProvider": ".models",
     # Provider implementations
-    "BaseEmbeddings",
-    "OpenAIEmbeddings",
-    "VoyageEmbeddings",
-    "CohereEmbeddings",
-    "OpenRouterEmbeddings",
-    "CometAPIEmbeddings",
-]
+    "BaseEmbeddings": ".providers",
+    "OpenAIEmbeddings": ".providers",
+    "VoyageEmbeddings": ".providers",
+    "CohereEmbeddings": ".providers",
+    "OpenRouterEmbeddings": ".providers",
+    "CometAPIEmbeddings": ".providers",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
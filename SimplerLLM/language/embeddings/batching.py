@@ -0,0 +1,160 @@
+"""
+Auto-batching helpers for bulk embedding generation.
+
+This module splits large lists of texts into provider-sized batches and
+runs them concurrently through a provider's generate_embeddings_async()
+method, yielding NumPy arrays in input order.
+
+Batches are bounded by two limits:
+    - batch_size: Maximum number of texts per request
+    - max_tokens_per_batch: Maximum estimated tokens per request
+
+Example:
+    >>> from SimplerLLM.language.embeddings.batching import plan_batches
+    >>> plan_batches(["a", "b", "c"], batch_size=2)
+    [(0, 2), (2, 3)]
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, AsyncIterator, Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in a text.
+
+    Uses the cached cl100k_base encoder from llm_addons.cost_utils, so the
+    tokenizer is built once per process.
+
+    Args:
+        text: The text to measure.
+
+    Returns:
+        Estimated token count (at least 1).
+    """
+    from SimplerLLM.language.llm_addons.cost_utils import count_tokens
+
+    return max(1, count_tokens(text))
+
+
+def plan_batches(
+    texts: Sequence[str],
+    batch_size: int,
+    max_tokens_per_batch: Optional[int] = None,
+    token_counter: Optional[Callable[[str], int]] = None,
+) -> List[Tuple[int, int]]:
+    """
+    Split a list of texts into contiguous batches.
+
+    A text that on its own exceeds max_tokens_per_batch is placed in its own
+    batch, leaving truncation to the provider.
+
+    Args:
+        texts: Texts to split.
+        batch_size: Maximum number of texts per batch.
+        max_tokens_per_batch: Maximum estimated tokens per batch. None
+            disables the token budget.
+        token_counter: Function returning the token count of a text.
+            Defaults to estimate_tokens().
+
+    Returns:
+        List of (start, end) index ranges into texts.
+
+    Raises:
+        ValueError: If batch_size is less than 1.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+    if max_tokens_per_batch is None:
+        return [
+            (start, min(start + batch_size, len(texts)))
+            for start in range(0, len(texts), batch_size)
+        ]
+
+    token_counter = token_counter or estimate_tokens
+    batches = []
+    start = 0
+    batch_tokens = 0
+
+    for i, text in enumerate(texts):
+        tokens = token_counter(text)
+        batch_full = (i - start) >= batch_size
+        over_budget = (i > start) and (batch_tokens + tokens > max_tokens_per_batch)
+
+        if batch_full or over_budget:
+            batches.append((start, i))
+            start = i
+            batch_tokens = 0
+
+        batch_tokens += tokens
+
+    if start < len(texts):
+        batches.append((start, len(texts)))
+
+    return batches
+
+
+async def iter_embedding_batches(
+    embed_async: Callable[..., Any],
+    texts: Sequence[str],
+    batches: List[Tuple[int, int]],
+    max_concurrency: int = 4,
+    dtype: Any = np.float32,
+    **kwargs,
+) -> AsyncIterator[Tuple[int, np.ndarray]]:
+    """
+    Embed planned batches concurrently and yield them in input order.
+
+    At most max_concurrency requests are in flight at any time. Results are
+    yielded as soon as the next batch in order has completed.
+
+    Args:
+        embed_async: Coroutine function accepting user_input (list of texts),
+            as_numpy and dtype plus **kwargs, typically a provider's
+            generate_embeddings_async.
+        texts: All texts to embed.
+        batches: (start, end) ranges from plan_batches().
+        max_concurrency: Maximum number of concurrent requests.
+        dtype: NumPy dtype of the yielded arrays.
+        **kwargs: Extra keyword arguments forwarded to embed_async.
+
+    Yields:
+        Tuples of (start_index, array) where array has shape
+        (end - start, dimension).
+
+    Raises:
+        ValueError: If max_concurrency is less than 1.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+    async def run_batch(start: int, end: int) -> np.ndarray:
+        result = await embed_async(
+            user_input=list(texts[start:end]),
+            as_numpy=True,
+            dtype=dtype,
+            **kwargs,
+        )
+        array = np.asarray(result, dtype=dtype)
+        if array.ndim == 1:
+            array = array.reshape(1, -1)
+        return array
+
+    pending = deque()
+    next_batch = 0
+
+    try:
+        while next_batch < len(batches) or pending:
+            while next_batch < len(batches) and len(pending) < max_concurrency:
+                start, end = batches[next_batch]
+                pending.append((start, asyncio.ensure_future(run_batch(start, end))))
+                next_batch += 1
+
+            start, task = pending.popleft()
+            yield start, await task
+    finally:
+        for _, task in pending:
+            task.cancel()
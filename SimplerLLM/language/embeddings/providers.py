@@ -9,8 +9,11 @@ This module contains the concrete implementations for each embedding provider:
 - CometAPIEmbeddings: Embedding models via the CometAPI aggregator
 """
 
+import asyncio
 import os
-from typing import List, Optional, Union, Any
+from typing import List, Optional, Union, Any, AsyncIterator, Sequence, Tuple
+
+import numpy as np
 
 import SimplerLLM.language.llm_providers.openai_llm as openai_llm
 import SimplerLLM.language.llm_providers.voyage_llm as voyage_llm
@@ -19,7 +22,11 @@ import SimplerLLM.language.llm_providers.openrouter_llm as openrouter_llm
 import SimplerLLM.language.llm_providers.cometapi_llm as cometapi_llm
 from SimplerLLM.language.llm_providers.llm_response_models import LLMEmbeddingsResponse
 
+from SimplerLLM.instrumentation.core import instrument_class
+from SimplerLLM.utils.single_flight import coalesce_class
+
 from .models import EmbeddingsProvider
+from .batching import plan_batches, iter_embedding_batches
 
 
 class BaseEmbeddings:
@@ -34,8 +41,28 @@ class BaseEmbeddings:
         model_name: The model identifier for the provider.
         api_key: API key for authentication.
         user_id: Optional user identifier for tracking/billing.
+
+    Class Attributes:
+        MAX_BATCH_SIZE: Maximum number of texts the provider accepts per request.
+        MAX_TOKENS_PER_BATCH: Maximum total tokens per request (None if the
+            provider has no per-request token cap).
+        single_flight: When True, identical concurrent generate_embeddings
+            calls share one provider request (see
+            SimplerLLM.utils.single_flight). Can be set per instance.
     """
 
+    MAX_BATCH_SIZE: int = 2048
+    MAX_TOKENS_PER_BATCH: Optional[int] = 300_000
+    single_flight: bool = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        coalesce_class(cls, ("generate_embeddings", "generate_embeddings_async"))
+        instrument_class(cls, "embeddings", {
+            "generate_embeddings": "embeddings",
+            "generate_embeddings_async": "embeddings",
+        })
+
     def __init__(
         self,
         provider: EmbeddingsProvider,
@@ -62,6 +89,162 @@ class BaseEmbeddings:
             raise ValueError("Provider must be an instance of EmbeddingsProvider Enum")
         self.provider = provider
 
+    async def iter_embed_many_async(
+        self,
+        texts: Sequence[str],
+        batch_size: Optional[int] = None,
+        max_tokens_per_batch: Optional[int] = None,
+        max_concurrency: int = 4,
+        dtype: Any = np.float32,
+        **kwargs,
+    ) -> AsyncIterator[Tuple[int, np.ndarray]]:
+        """
+        Embed a large list of texts in batches, streaming results in order.
+
+        Texts are split so that each request stays under the provider's
+        item and token limits, and batches run concurrently through
+        generate_embeddings_async().
+
+        Args:
+            texts: Texts to embed.
+            batch_size: Maximum texts per request. Defaults to (and is capped
+                at) the provider's MAX_BATCH_SIZE.
+            max_tokens_per_batch: Maximum estimated tokens per request.
+                Defaults to the provider's MAX_TOKENS_PER_BATCH.
+            max_concurrency: Maximum number of requests in flight.
+            dtype: NumPy dtype of the yielded arrays (default: float32).
+            **kwargs: Extra arguments forwarded to generate_embeddings_async()
+                (e.g., model_name, input_type).
+
+        Yields:
+            Tuples of (start_index, array) where array has shape
+            (batch_length, dimension) and covers texts[start_index:].
+
+        Raises:
+            ValueError: If texts is empty or limits are invalid.
+
+        Example:
+            >>> async for start, vectors in embeddings.iter_embed_many_async(chunks):
+            ...     db.add_vectors_batch(
+            ...         list(zip(vectors, metas[start:start + len(vectors)]))
+            ...     )
+        """
+        if not texts:
+            raise ValueError("texts must be a non-empty list of strings.")
+
+        batch_size = min(batch_size or self.MAX_BATCH_SIZE, self.MAX_BATCH_SIZE)
+        if max_tokens_per_batch is None:
+            max_tokens_per_batch = self.MAX_TOKENS_PER_BATCH
+
+        batches = plan_batches(texts, batch_size, max_tokens_per_batch)
+
+        async for start, array in iter_embedding_batches(
+            self.generate_embeddings_async,
+            texts,
+            batches,
+            max_concurrency=max_concurrency,
+            dtype=dtype,
+            **kwargs,
+        ):
+            yield start, array
+
+    async def embed_many_async(
+        self,
+        texts: Sequence[str],
+        batch_size: Optional[int] = None,
+        max_tokens_per_batch: Optional[int] = None,
+        max_concurrency: int = 4,
+        dtype: Any = np.float32,
+        **kwargs,
+    ) -> np.ndarray:
+        """
+        Asynchronously embed a large list of texts in concurrent batches.
+
+        See iter_embed_many_async() for parameter documentation.
+
+        Returns:
+            Array of shape (len(texts), dimension), in input order.
+
+        Example:
+            >>> vectors = await embeddings.embed_many_async(chunks, max_concurrency=8)
+            >>> print(vectors.shape)  # (len(chunks), 1536)
+        """
+        parts = []
+        async for _, array in self.iter_embed_many_async(
+            texts,
+            batch_size=batch_size,
+            max_tokens_per_batch=max_tokens_per_batch,
+            max_concurrency=max_concurrency,
+            dtype=dtype,
+            **kwargs,
+        ):
+            parts.append(array)
+
+        return np.concatenate(parts, axis=0)
+
+    def embed_many(
+        self,
+        texts: Sequence[str],
+        batch_size: Optional[int] = None,
+        max_tokens_per_batch: Optional[int] = None,
+        max_concurrency: int = 4,
+        dtype: Any = np.float32,
+        **kwargs,
+    ) -> np.ndarray:
+        """
+        Embed a large list of texts in concurrent, provider-sized batches.
+
+        Unlike generate_embeddings(), which sends its whole input as one
+        request, this splits texts by item count and token budget so bulk
+        ingestion never exceeds the provider's per-request limits.
+
+        Args:
+            texts: Texts to embed.
+            batch_size: Maximum texts per request (capped at MAX_BATCH_SIZE).
+            max_tokens_per_batch: Maximum estimated tokens per request.
+            max_concurrency: Maximum number of requests in flight.
+            dtype: NumPy dtype of the result (default: float32).
+            **kwargs: Extra arguments forwarded to generate_embeddings_async().
+
+        Returns:
+            Array of shape (len(texts), dimension), in input order.
+
+        Raises:
+            RuntimeError: If called from a running event loop. Use
+                embed_many_async() there instead.
+
+        Example:
+            >>> vectors = embeddings.embed_many(
+            ...     chunks,
+            ...     batch_size=512,
+            ...     max_concurrency=8
+            ... )
+            >>> print(vectors.shape)  # (len(chunks), 1536)
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.embed_many_async(
+                texts,
+                batch_size=batch_size,
+                max_tokens_per_batch=max_tokens_per_batch,
+                max_concurrency=max_concurrency,
+                dtype=dtype,
+                **kwargs,
+            ))
+
+        raise RuntimeError(
+            "embed_many() cannot be called from a running event loop. "
+            "Use 'await embed_many_async(...)' instead."
+        )
+
+
+instrument_class(BaseEmbeddings, "embeddings", {
+    "iter_embed_many_async": "embeddings_batch",
+    "embed_many_async": "embeddings_batch",
+    "embed_many": "embeddings_batch",
+})
+
 
 class OpenAIEmbeddings(BaseEmbeddings):
     """
@@ -84,6 +267,10 @@ class OpenAIEmbeddings(BaseEmbeddings):
         >>> print(len(vector))  # 1536
     """
 
+    # OpenAI accepts up to 2048 inputs and 300k tokens per request
+    MAX_BATCH_SIZE = 2048
+    MAX_TOKENS_PER_BATCH = 300_000
+
     def __init__(
         self,
         provider: EmbeddingsProvider,
@@ -99,7 +286,9 @@ class OpenAIEmbeddings(BaseEmbeddings):
         user_input: Union[str, List[str]],
         model_name: Optional[str] = None,
         full_response: bool = False,
-    ) -> Union[List[float], List[List[float]], LLMEmbeddingsResponse]:
+        as_numpy: bool = False,
+        dtype: Any = np.float32,
+    ) -> Union[List[float], List[List[float]], np.ndarray, LLMEmbeddingsResponse]:
         """
         Generate embeddings using OpenAI's embedding API.
 
@@ -110,6 +299,11 @@ class OpenAIEmbeddings(BaseEmbeddings):
                 instance's model_name.
             full_response: If True, returns LLMEmbeddingsResponse with metadata.
                 If False, returns just the embedding vector(s).
+            as_numpy: If True, decodes the provider response straight into a
+                contiguous NumPy array (1-D for a single text, 2-D for a list)
+                instead of Python lists of floats.
+            dtype: NumPy dtype used when as_numpy=True (e.g., np.float32,
+                np.float16).
 
         Returns:
             If full_response=False:
@@ -145,7 +339,9 @@ class OpenAIEmbeddings(BaseEmbeddings):
             user_input=user_input,
             model_name=model_name,
             full_response=full_response,
-            api_key=self.api_key
+            api_key=self.api_key,
+            as_numpy=as_numpy,
+            dtype=dtype
         )
 
     async def generate_embeddings_async(
@@ -153,7 +349,9 @@ class OpenAIEmbeddings(BaseEmbeddings):
         user_input: Union[str, List[str]],
         model_name: Optional[str] = None,
         full_response: bool = False,
-    ) -> Union[List[float], List[List[float]], LLMEmbeddingsResponse]:
+        as_numpy: bool = False,
+        dtype: Any = np.float32,
+    ) -> Union[List[float], List[List[float]], np.ndarray, LLMEmbeddingsResponse]:
         """
         Asynchronously generate embeddings using OpenAI's embedding API.
 
@@ -164,6 +362,8 @@ class OpenAIEmbeddings(BaseEmbeddings):
             user_input: Text or list of texts to embed.
             model_name: Model name override.
             full_response: If True, returns LLMEmbeddingsResponse.
+            as_numpy: If True, returns a contiguous NumPy array.
+            dtype: NumPy dtype used when as_numpy=True.
 
         Returns:
             Embedding vector(s) or LLMEmbeddingsResponse.
@@ -184,7 +384,9 @@ class OpenAIEmbeddings(BaseEmbeddings):
             user_input=user_input,
             model_name=model_name,
             full_response=full_response,
-            api_key=self.api_key
+            api_key=self.api_key,
+            as_numpy=as_numpy,
+            dtype=dtype
         )
 
 
@@ -226,7 +428,9 @@ class OpenRouterEmbeddings(BaseEmbeddings):
         user_input: Union[str, List[str]],
         model_name: Optional[str] = None,
         full_response: bool = False,
-    ) -> Union[List[float], List[List[float]], LLMEmbeddingsResponse]:
+        as_numpy: bool = False,
+        dtype: Any = np.float32,
+    ) -> Union[List[float], List[List[float]], np.ndarray, LLMEmbeddingsResponse]:
         """
         Generate embeddings using any model through OpenRouter.
 
@@ -238,6 +442,11 @@ class OpenRouterEmbeddings(BaseEmbeddings):
                 uses the instance's model_name.
             full_response: If True, returns LLMEmbeddingsResponse with metadata.
                 If False, returns just the embedding vector(s).
+            as_numpy: If True, decodes the provider response straight into a
+                contiguous NumPy array (1-D for a single text, 2-D for a list)
+                instead of Python lists of floats.
+            dtype: NumPy dtype used when as_numpy=True (e.g., np.float32,
+                np.float16).
 
         Returns:
             If full_response=False:
@@ -272,7 +481,9 @@ class OpenRouterEmbeddings(BaseEmbeddings):
             user_input=user_input,
             model_name=model_name,
             full_response=full_response,
-            api_key=self.api_key
+            api_key=self.api_key,
+            as_numpy=as_numpy,
+            dtype=dtype
         )
 
     async def generate_embeddings_async(
@@ -280,7 +491,9 @@ class OpenRouterEmbeddings(BaseEmbeddings):
         user_input: Union[str, List[str]],
         model_name: Optional[str] = None,
         full_response: bool = False,
-    ) -> Union[List[float], List[List[float]], LLMEmbeddingsResponse]:
+        as_numpy: bool = False,
+        dtype: Any = np.float32,
+    ) -> Union[List[float], List[List[float]], np.ndarray, LLMEmbeddingsResponse]:
         """
         Asynchronously generate embeddings through OpenRouter.
 
@@ -291,6 +504,8 @@ class OpenRouterEmbeddings(BaseEmbeddings):
             user_input: Text or list of texts to embed.
             model_name: Model name override in 'provider/model' format.
             full_response: If True, returns LLMEmbeddingsResponse.
+            as_numpy: If True, returns a contiguous NumPy array.
+            dtype: NumPy dtype used when as_numpy=True.
 
         Returns:
             Embedding vector(s) or LLMEmbeddingsResponse.
@@ -311,7 +526,9 @@ class OpenRouterEmbeddings(BaseEmbeddings):
             user_input=user_input,
             model_name=model_name,
             full_response=full_response,
-            api_key=self.api_key
+            api_key=self.api_key,
+            as_numpy=as_numpy,
+            dtype=dtype
         )
 
 
@@ -354,7 +571,9 @@ class CometAPIEmbeddings(BaseEmbeddings):
         user_input: Union[str, List[str]],
         model_name: Optional[str] = None,
         full_response: bool = False,
-    ) -> Union[List[float], List[List[float]], LLMEmbeddingsResponse]:
+        as_numpy: bool = False,
+        dtype: Any = np.float32,
+    ) -> Union[List[float], List[List[float]], np.ndarray, LLMEmbeddingsResponse]:
         """
         Generate embeddings using an embedding model through CometAPI.
 
@@ -365,6 +584,11 @@ class CometAPIEmbeddings(BaseEmbeddings):
                 If not provided, uses the instance's model_name.
             full_response: If True, returns LLMEmbeddingsResponse with metadata.
                 If False, returns just the embedding vector(s).
+            as_numpy: If True, decodes the provider response straight into a
+                contiguous NumPy array (1-D for a single text, 2-D for a list)
+                instead of Python lists of floats.
+            dtype: NumPy dtype used when as_numpy=True (e.g., np.float32,
+                np.float16).
 
         Returns:
             If full_response=False:
@@ -399,7 +623,9 @@ class CometAPIEmbeddings(BaseEmbeddings):
             user_input=user_input,
             model_name=model_name,
             full_response=full_response,
-            api_key=self.api_key
+            api_key=self.api_key,
+            as_numpy=as_numpy,
+            dtype=dtype
         )
 
     async def generate_embeddings_async(
@@ -407,7 +633,9 @@ class CometAPIEmbeddings(BaseEmbeddings):
         user_input: Union[str, List[str]],
         model_name: Optional[str] = None,
         full_response: bool = False,
-    ) -> Union[List[float], List[List[float]], LLMEmbeddingsResponse]:
+        as_numpy: bool = False,
+        dtype: Any = np.float32,
+    ) -> Union[List[float], List[List[float]], np.ndarray, LLMEmbeddingsResponse]:
         """
         Asynchronously generate embeddings through CometAPI.
 
@@ -418,6 +646,8 @@ class CometAPIEmbeddings(BaseEmbeddings):
             user_input: Text or list of texts to embed.
             model_name: Model name override.
             full_response: If True, returns LLMEmbeddingsResponse.
+            as_numpy: If True, returns a contiguous NumPy array.
+            dtype: NumPy dtype used when as_numpy=True.
 
         Returns:
             Embedding vector(s) or LLMEmbeddingsResponse.
@@ -438,7 +668,9 @@ class CometAPIEmbeddings(BaseEmbeddings):
             user_input=user_input,
             model_name=model_name,
             full_response=full_response,
-            api_key=self.api_key
+            api_key=self.api_key,
+            as_numpy=as_numpy,
+            dtype=dtype
         )
 
 
@@ -472,6 +704,10 @@ class VoyageEmbeddings(BaseEmbeddings):
         ... )
     """
 
+    # Voyage accepts up to 1000 texts and 120k tokens (voyage-3) per request
+    MAX_BATCH_SIZE = 1000
+    MAX_TOKENS_PER_BATCH = 120_000
+
     def __init__(
         self,
         provider: EmbeddingsProvider,
@@ -490,7 +726,9 @@ class VoyageEmbeddings(BaseEmbeddings):
         input_type: Optional[str] = None,
         output_dimension: Optional[int] = None,
         output_dtype: str = "float",
-    ) -> Union[List[float], List[List[float]], LLMEmbeddingsResponse]:
+        as_numpy: bool = False,
+        dtype: Any = np.float32,
+    ) -> Union[List[float], List[List[float]], np.ndarray, LLMEmbeddingsResponse]:
         """
         Generate embeddings using Voyage AI.
 
@@ -510,6 +748,11 @@ class VoyageEmbeddings(BaseEmbeddings):
                 - "uint8": Unsigned 8-bit integers
                 - "binary": Binary embeddings
                 - "ubinary": Unsigned binary embeddings
+            as_numpy: If True, decodes the provider response straight into a
+                contiguous NumPy array (1-D for a single text, 2-D for a list)
+                instead of Python lists of floats.
+            dtype: NumPy dtype used when as_numpy=True (e.g., np.float32,
+                np.float16).
 
         Returns:
             If full_response=False:
@@ -548,7 +791,9 @@ class VoyageEmbeddings(BaseEmbeddings):
             api_key=self.api_key,
             input_type=input_type,
             output_dimension=output_dimension,
-            output_dtype=output_dtype
+            output_dtype=output_dtype,
+            as_numpy=as_numpy,
+            dtype=dtype
         )
 
     async def generate_embeddings_async(
@@ -559,7 +804,9 @@ class VoyageEmbeddings(BaseEmbeddings):
         input_type: Optional[str] = None,
         output_dimension: Optional[int] = None,
         output_dtype: str = "float",
-    ) -> Union[List[float], List[List[float]], LLMEmbeddingsResponse]:
+        as_numpy: bool = False,
+        dtype: Any = np.float32,
+    ) -> Union[List[float], List[List[float]], np.ndarray, LLMEmbeddingsResponse]:
         """
         Asynchronously generate embeddings using Voyage AI.
 
@@ -573,6 +820,8 @@ class VoyageEmbeddings(BaseEmbeddings):
             input_type: "query" or "document" for retrieval optimization.
             output_dimension: Embedding dimension (256, 512, 1024, 2048).
             output_dtype: Data type ("float", "int8", "uint8", "binary", "ubinary").
+            as_numpy: If True, returns a contiguous NumPy array.
+            dtype: NumPy dtype used when as_numpy=True.
 
         Returns:
             Embedding vector(s) or LLMEmbeddingsResponse.
@@ -599,7 +848,9 @@ class VoyageEmbeddings(BaseEmbeddings):
             api_key=self.api_key,
             input_type=input_type,
             output_dimension=output_dimension,
-            output_dtype=output_dtype
+            output_dtype=output_dtype,
+            as_numpy=as_numpy,
+            dtype=dtype
         )
 
 
@@ -628,6 +879,10 @@ class CohereEmbeddings(BaseEmbeddings):
         ... ])
     """
 
+    # Cohere accepts up to 96 texts per request and truncates each text itself
+    MAX_BATCH_SIZE = 96
+    MAX_TOKENS_PER_BATCH = None
+
     def __init__(
         self,
         provider: EmbeddingsProvider,
@@ -646,7 +901,9 @@ class CohereEmbeddings(BaseEmbeddings):
         input_type: str = "search_document",
         embedding_types: Optional[List[str]] = None,
         truncate: str = "END",
-    ) -> Union[List[float], List[List[float]], LLMEmbeddingsResponse]:
+        as_numpy: bool = False,
+        dtype: Any = np.float32,
+    ) -> Union[List[float], List[List[float]], np.ndarray, LLMEmbeddingsResponse]:
         """
         Generate embeddings using Cohere.
 
@@ -665,6 +922,11 @@ class CohereEmbeddings(BaseEmbeddings):
                 - "END": Truncate from end (default)
                 - "START": Truncate from beginning
                 - "NONE": Raise error if text exceeds limit
+            as_numpy: If True, decodes the provider response straight into a
+                contiguous NumPy array (1-D for a single text, 2-D for a list)
+                instead of Python lists of floats.
+            dtype: NumPy dtype used when as_numpy=True (e.g., np.float32,
+                np.float16).
 
         Returns:
             If full_response=False:
@@ -703,7 +965,9 @@ class CohereEmbeddings(BaseEmbeddings):
             api_key=self.api_key,
             input_type=input_type,
             embedding_types=embedding_types,
-            truncate=truncate
+            truncate=truncate,
+            as_numpy=as_numpy,
+            dtype=dtype
         )
 
     async def generate_embeddings_async(
@@ -714,7 +978,9 @@ class CohereEmbeddings(BaseEmbeddings):
         input_type: str = "search_document",
         embedding_types: Optional[List[str]] = None,
         truncate: str = "END",
-    ) -> Union[List[float], List[List[float]], LLMEmbeddingsResponse]:
+        as_numpy: bool = False,
+        dtype: Any = np.float32,
+    ) -> Union[List[float], List[List[float]], np.ndarray, LLMEmbeddingsResponse]:
         """
         Asynchronously generate embeddings using Cohere.
 
@@ -728,6 +994,8 @@ class CohereEmbeddings(BaseEmbeddings):
             input_type: "search_document", "search_query", "classification", "clustering".
             embedding_types: List of specific embedding types to return.
             truncate: "START", "END", or "NONE".
+            as_numpy: If True, returns a contiguous NumPy array.
+            dtype: NumPy dtype used when as_numpy=True.
 
         Returns:
             Embedding vector(s) or LLMEmbeddingsResponse.
@@ -754,5 +1022,7 @@ class CohereEmbeddings(BaseEmbeddings):
             api_key=self.api_key,
             input_type=input_type,
             embedding_types=embedding_types,
-            truncate=truncate
+            truncate=truncate,
+            as_numpy=as_numpy,
+            dtype=dtype
         )
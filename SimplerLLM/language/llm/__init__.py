@@ -1,23 +1,19 @@
-from .base import LLM, LLMProvider
-from .reliable import ReliableLLM
-from .wrappers.openai_wrapper import OpenAILLM
-from .wrappers.gemini_wrapper import GeminiLLM
-from .wrappers.anthropic_wrapper import AnthropicLLM
-from .wrappers.ollama_wrapper import OllamaLLM
-from .wrappers.deepseek_wrapper import DeepSeekLLM
-from .wrappers.perplexity_wrapper import PerplexityLLM
-from .wrappers.hf_local_wrapper import HuggingFaceLocalLLM
+from SimplerLLM.utils.lazy_imports import lazy_exports
 
-__all__ = [
-    'LLM',
-    'LLMProvider',
-    'ReliableLLM',
-    'Message',
-    'OpenAILLM',
-    'GeminiLLM',
-    'AnthropicLLM',
-    'OllamaLLM',
-    'DeepSeekLLM',
-    'PerplexityLLM',
-    'HuggingFaceLocalLLM',
-]
+# Provider wrappers (and their SDKs) are imported on first access
+_EXPORTS = {
+    'LLM': '.base',
+    'LLMProvider': '.base',
+    'ReliableLLM': '.reliable',
+    'OpenAILLM': '.wrappers.openai_wrapper',
+    'GeminiLLM': '.wrappers.gemini_wrapper',
+    'AnthropicLLM': '.wrappers.anthropic_wrapper',
+    'OllamaLLM': '.wrappers.ollama_wrapper',
+    'DeepSeekLLM': '.wrappers.deepseek_wrapper',
+    'PerplexityLLM': '.wrappers.perplexity_wrapper',
+    'HuggingFaceLocalLLM': '.wrappers.hf_local_wrapper',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
@@ -6,6 +6,8 @@ from typing import Type
 from pydantic import BaseModel
 
 from SimplerLLM.utils.custom_verbose import verbose_print
+from SimplerLLM.instrumentation.core import instrument_class
+from SimplerLLM.utils.single_flight import coalesce_class
 from SimplerLLM.tools.json_helpers import (
     extract_json_from_text,
     convert_json_to_pydantic_model,
@@ -28,6 +30,19 @@ class LLMProvider(Enum):
     COMETAPI = 12
 
 class LLM:
+    # Share one provider call between identical concurrent requests
+    # (see SimplerLLM.utils.single_flight). Set per instance or on LLM.
+    single_flight = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        coalesce_class(cls, ("generate_response", "generate_response_async"))
+        # Run every provider's generate_response inside an instrumentation span
+        instrument_class(cls, "llm", {
+            "generate_response": "chat",
+            "generate_response_async": "chat",
+        })
+
     def __init__(
         self,
         provider=LLMProvider.OPENAI,
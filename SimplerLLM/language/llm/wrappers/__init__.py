@@ -1,19 +1,16 @@
-from .openai_wrapper import OpenAILLM
-from .gemini_wrapper import GeminiLLM
-from .anthropic_wrapper import AnthropicLLM
-from .ollama_wrapper import OllamaLLM
-from .deepseek_wrapper import DeepSeekLLM
-from .cohere_wrapper import CohereLLM
-from .perplexity_wrapper import PerplexityLLM
-from .hf_local_wrapper import HuggingFaceLocalLLM
+from SimplerLLM.utils.lazy_imports import lazy_exports
 
-__all__ = [
-    'OpenAILLM',
-    'GeminiLLM',
-    'AnthropicLLM',
-    'OllamaLLM',
-    'DeepSeekLLM',
-    'CohereLLM',
-    'PerplexityLLM',
-    'HuggingFaceLocalLLM',
-]
+_EXPORTS = {
+    'OpenAILLM': '.openai_wrapper',
+    'GeminiLLM': '.gemini_wrapper',
+    'AnthropicLLM': '.anthropic_wrapper',
+    'OllamaLLM': '.ollama_wrapper',
+    'DeepSeekLLM': '.deepseek_wrapper',
+    'CohereLLM': '.cohere_wrapper',
+    'PerplexityLLM': '.perplexity_wrapper',
+    'HuggingFaceLocalLLM': '.hf_local_wrapper',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
@@ -184,7 +184,7 @@ class GeminiLLM(LLM):
         model = model_name or self.model_name
 
         encoded_content = base64.b64encode(cached_input.encode()).decode()
-        cache_url = f"https://generativelanguage.googleapis.com/v1beta/cachedContents?key={self.api_key}"
+        cache_url = f"{gemini_llm.GEMINI_BASE_URL}v1beta/cachedContents?key={self.api_key}"
         headers = {"Content-Type": "application/json"}
 
         cache_payload = {
@@ -9,7 +9,8 @@ This module provides high-level utilities for structured LLM output generation:
 - **Pattern Extraction**: Extract structured patterns (emails, phones, URLs, etc.) from LLM
   responses with validation and normalization.
 
-- **Cost Utilities**: Calculate token counts and API costs.
+- **Cost Utilities**: Calculate token counts and API costs, look up model pricing,
+  and check prompts against context limits before sending.
 
 Quick Start:
     >>> from SimplerLLM.language import LLM, LLMProvider
@@ -56,6 +57,11 @@ Available Functions:
 
     Utilities:
         - calculate_text_generation_costs: Calculate API costs
+        - count_tokens: Count tokens with a cached per-model encoder
+        - count_tokens_batch: Count tokens for many texts at once
+        - get_model_pricing: Look up pricing and context window for a model
+        - estimate_cost: Estimate cost from token counts
+        - check_context_limit: Check a prompt against a model's context window
 """
 
 from .json_generation import (
@@ -73,7 +79,16 @@ from .pattern_extraction import (
     generate_structured_pattern_reliable_async,
 )
 
-from .cost_utils import calculate_text_generation_costs
+from .cost_utils import (
+    calculate_text_generation_costs,
+    count_tokens,
+    count_tokens_batch,
+    calibrate_approximation,
+    get_model_pricing,
+    register_model_pricing,
+    estimate_cost,
+    check_context_limit,
+)
 
 __all__ = [
     # JSON Generation
@@ -89,4 +104,11 @@ __all__ = [
     "generate_structured_pattern_reliable_async",
     # Utilities
     "calculate_text_generation_costs",
+    "count_tokens",
+    "count_tokens_batch",
+    "calibrate_approximation",
+    "get_model_pricing",
+    "register_model_pricing",
+    "estimate_cost",
+    "check_context_limit",
 ]
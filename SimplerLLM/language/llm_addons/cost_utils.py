@@ -1,19 +1,408 @@
 """
-Cost calculation utilities for LLM text generation.
+Cost calculation and token accounting utilities for LLM text generation.
 
-This module provides utilities for calculating the cost of LLM API calls
-based on token counts and pricing.
+This module provides utilities for counting tokens and calculating the cost
+of LLM API calls:
+
+- **Token counting**: Exact counts via cached tiktoken encoders (one per
+  model, built once), batched counting over many strings, and a fast
+  approximate mode calibrated per model family.
+
+- **Pricing table**: Per-million-token prices and context windows keyed by
+  model name. Dated or aliased versions (e.g., "gpt-4o-2024-08-06",
+  "claude-3-5-haiku-latest") resolve to their base entry; other variants
+  (e.g., "o1-mini") need their own entry.
+
+- **Pre-flight checks**: Compare a prompt's size against a model's context
+  window before sending it.
+
+Example:
+    >>> from SimplerLLM.language.llm_addons.cost_utils import count_tokens, check_context_limit
+    >>> count_tokens("Hello, how are you?", model_name="gpt-4o")
+    6
+    >>> check_context_limit(long_prompt, model_name="gpt-4o", max_output_tokens=4096)["fits"]
+    True
+
+Prices are in USD per million tokens and change over time. Use
+register_model_pricing() to add or override entries.
 """
 
-import tiktoken
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Any
+
+if TYPE_CHECKING:
+    import tiktoken
+
+
+# ==============================================================================
+# PRICING TABLE
+# ==============================================================================
+
+# model name -> (input cost per 1M tokens, output cost per 1M tokens, context window)
+# Entries also match their dated or aliased versions (see _VERSION_SUFFIX).
+MODEL_PRICING = {
+    # OpenAI
+    "gpt-5": (1.25, 10.00, 400_000),
+    "gpt-5-pro": (15.00, 120.00, 400_000),
+    "gpt-5-mini": (0.25, 2.00, 400_000),
+    "gpt-5-nano": (0.05, 0.40, 400_000),
+    "gpt-4.1": (2.00, 8.00, 1_047_576),
+    "gpt-4.1-mini": (0.40, 1.60, 1_047_576),
+    "gpt-4.1-nano": (0.10, 0.40, 1_047_576),
+    "gpt-4o": (2.50, 10.00, 128_000),
+    "gpt-4o-mini": (0.15, 0.60, 128_000),
+    "gpt-4-turbo": (10.00, 30.00, 128_000),
+    "gpt-4": (30.00, 60.00, 8_192),
+    "gpt-3.5-turbo": (0.50, 1.50, 16_385),
+    "o1": (15.00, 60.00, 200_000),
+    "o1-pro": (150.00, 600.00, 200_000),
+    "o1-preview": (15.00, 60.00, 128_000),
+    "o1-mini": (1.10, 4.40, 128_000),
+    "o3": (2.00, 8.00, 200_000),
+    "o3-pro": (20.00, 80.00, 200_000),
+    "o3-mini": (1.10, 4.40, 200_000),
+    "o4-mini": (1.10, 4.40, 200_000),
+
+    # Anthropic
+    "claude-opus-4": (15.00, 75.00, 200_000),
+    "claude-opus-4-1": (15.00, 75.00, 200_000),
+    "claude-opus-4-5": (5.00, 25.00, 200_000),
+    "claude-sonnet-4": (3.00, 15.00, 200_000),
+    "claude-sonnet-4-5": (3.00, 15.00, 200_000),
+    "claude-3-7-sonnet": (3.00, 15.00, 200_000),
+    "claude-3-5-sonnet": (3.00, 15.00, 200_000),
+    "claude-haiku-4-5": (1.00, 5.00, 200_000),
+    "claude-3-5-haiku": (0.80, 4.00, 200_000),
+
+    # Google Gemini
+    "gemini-2.5-pro": (1.25, 10.00, 1_048_576),
+    "gemini-2.5-flash": (0.30, 2.50, 1_048_576),
+    "gemini-2.5-flash-lite": (0.10, 0.40, 1_048_576),
+    "gemini-2.0-flash": (0.10, 0.40, 1_048_576),
+    "gemini-1.5-pro": (1.25, 5.00, 2_097_152),
+    "gemini-1.5-flash": (0.075, 0.30, 1_048_576),
+
+    # DeepSeek
+    "deepseek-chat": (0.27, 1.10, 128_000),
+    "deepseek-reasoner": (0.55, 2.19, 128_000),
+}
 
+# Suffixes that name a version of the same model rather than a different
+# model: dates ("-2024-08-06", "-20241022"), snapshot numbers ("-0125",
+# "-002"), aliases ("-latest") and previews ("-preview-05-20")
+_VERSION_SUFFIX = re.compile(
+    r"(?:-(?:\d{4}-\d{2}-\d{2}|\d{8}|\d{3,4}|latest|(?:preview|exp)(?:-\d{2}-\d{2})?))+"
+)
+
+# Average characters per token by model family, used by approximate counting.
+# calibrate_approximation() refines these from sample text.
+FAMILY_CHARS_PER_TOKEN = {
+    "openai": 4.0,
+    "anthropic": 3.5,
+    "gemini": 4.0,
+    "deepseek": 3.8,
+    "llama": 3.8,
+    "default": 4.0,
+}
+
+# model name prefix -> family
+_FAMILY_PREFIXES = [
+    ("gpt", "openai"),
+    ("o1", "openai"),
+    ("o3", "openai"),
+    ("o4", "openai"),
+    ("text-embedding", "openai"),
+    ("claude", "anthropic"),
+    ("gemini", "gemini"),
+    ("deepseek", "deepseek"),
+    ("llama", "llama"),
+    ("mistral", "llama"),
+    ("qwen", "llama"),
+]
+
+
+def register_model_pricing(
+    model_name: str,
+    cost_per_million_input_tokens: float,
+    cost_per_million_output_tokens: float,
+    context_window: Optional[int] = None,
+) -> None:
+    """
+    Add or override a pricing table entry.
+
+    :param model_name: Model name (e.g., "gpt-4o" also matches "gpt-4o-2024-08-06").
+    :param cost_per_million_input_tokens: Cost per million input tokens.
+    :param cost_per_million_output_tokens: Cost per million output tokens.
+    :param context_window: Maximum context length in tokens, if known.
+    """
+    MODEL_PRICING[model_name.lower()] = (
+        cost_per_million_input_tokens,
+        cost_per_million_output_tokens,
+        context_window,
+    )
+    _lookup_pricing.cache_clear()
+
+
+def get_model_pricing(model_name: str) -> Optional[Dict[str, Any]]:
+    """
+    Look up pricing and context window for a model.
+
+    An exact entry wins; otherwise the longest entry that the name extends
+    with only version suffixes (dates, snapshot numbers, "-latest",
+    "-preview") is used, so "gpt-4o-2024-08-06" resolves to "gpt-4o" but
+    "o1-mini" does not resolve to "o1".
+
+    :param model_name: The model name (e.g., "gpt-4o-mini-2024-07-18").
+    :return: Dictionary with input_cost_per_million, output_cost_per_million
+        and context_window, or None if the model is not in the table.
+
+    Example:
+        >>> get_model_pricing("gpt-4o-mini")["context_window"]
+        128000
+    """
+    if not model_name:
+        return None
+    key = _lookup_pricing(model_name.lower(), len(MODEL_PRICING))
+    if key is None or key not in MODEL_PRICING:
+        return None
+    input_cost, output_cost, context_window = MODEL_PRICING[key]
+    return {
+        "input_cost_per_million": input_cost,
+        "output_cost_per_million": output_cost,
+        "context_window": context_window,
+    }
+
+
+@lru_cache(maxsize=1024)
+def _lookup_pricing(model_name: str, table_size: int) -> Optional[str]:
+    """
+    Find the MODEL_PRICING key for model_name.
+
+    Only the key is cached and prices are read from the table on each
+    call, so overriding an entry takes effect immediately. table_size is
+    part of the cache key so that entries added directly to MODEL_PRICING
+    are picked up; register_model_pricing() also clears the cache.
+    """
+    # Strip provider prefixes like "openai/gpt-4o" (OpenRouter style)
+    model_name = model_name.rsplit("/", 1)[-1]
+    if model_name in MODEL_PRICING:
+        return model_name
+    best = None
+    for key in MODEL_PRICING:
+        if (model_name.startswith(key) and (best is None or len(key) > len(best))
+                and _VERSION_SUFFIX.fullmatch(model_name[len(key):])):
+            best = key
+    return best
+
+
+def estimate_cost(
+    model_name: str,
+    input_tokens: int,
+    output_tokens: int = 0,
+) -> Optional[float]:
+    """
+    Estimate the USD cost of a request from the pricing table.
+
+    :param model_name: The model name.
+    :param input_tokens: Number of input tokens.
+    :param output_tokens: Number of output tokens.
+    :return: Total cost, or None if the model is not in the pricing table.
+    """
+    pricing = get_model_pricing(model_name)
+    if pricing is None:
+        return None
+    return (
+        (input_tokens or 0) / 1_000_000 * pricing["input_cost_per_million"]
+        + (output_tokens or 0) / 1_000_000 * pricing["output_cost_per_million"]
+    )
+
+
+# ==============================================================================
+# TOKEN COUNTING
+# ==============================================================================
+
+def get_model_family(model_name: Optional[str]) -> str:
+    """
+    Get the model family used for approximate token counting.
+
+    :param model_name: The model name, or None.
+    :return: Family name (e.g., "openai", "anthropic"), or "default".
+    """
+    if not model_name:
+        return "default"
+    name = model_name.lower().rsplit("/", 1)[-1]
+    for prefix, family in _FAMILY_PREFIXES:
+        if name.startswith(prefix):
+            return family
+    return "default"
+
+
+@lru_cache(maxsize=64)
+def get_encoder(model_name: Optional[str] = None) -> Optional["tiktoken.Encoding"]:
+    """
+    Get a tiktoken encoder for a model, building it only once.
+
+    OpenAI models use their own encoding. Other models fall back to
+    cl100k_base, which is a close proxy for most BPE tokenizers.
+
+    :param model_name: The model name, or None for cl100k_base.
+    :return: A cached tiktoken Encoding, or None if the encoding files
+        cannot be loaded (e.g., offline). Counting then falls back to
+        approximate mode.
+    """
+    try:
+        # Imported here so pricing lookups never load tiktoken
+        import tiktoken
+
+        if model_name:
+            try:
+                return tiktoken.encoding_for_model(model_name.rsplit("/", 1)[-1])
+            except KeyError:
+                pass
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+def _approximate_count(text: str, chars_per_token: float) -> int:
+    return int(len(text) / chars_per_token)
+
+
+def count_tokens(
+    text: str,
+    model_name: Optional[str] = None,
+    approximate: bool = False,
+) -> int:
+    """
+    Count the tokens in a text.
+
+    :param text: The text to count.
+    :param model_name: Model whose tokenizer (or calibration) to use.
+    :param approximate: If True, uses the family's characters-per-token ratio
+        instead of running the tokenizer.
+    :return: Number of tokens.
+    """
+    if not text:
+        return 0
+    encoder = None if approximate else get_encoder(model_name)
+    if encoder is None:
+        return _approximate_count(text, FAMILY_CHARS_PER_TOKEN[get_model_family(model_name)])
+    return len(encoder.encode(text, disallowed_special=()))
+
+
+def count_tokens_batch(
+    texts: Sequence[str],
+    model_name: Optional[str] = None,
+    approximate: bool = False,
+    num_threads: int = 8,
+) -> List[int]:
+    """
+    Count the tokens in many texts at once.
+
+    Exact counts use tiktoken's multi-threaded encode_batch.
+
+    :param texts: The texts to count.
+    :param model_name: Model whose tokenizer (or calibration) to use.
+    :param approximate: If True, uses the family's characters-per-token ratio.
+    :param num_threads: Threads used by tiktoken for exact counting.
+    :return: Token count for each text, in order.
+
+    Example:
+        >>> count_tokens_batch(["Hello", "How are you?"], model_name="gpt-4o")
+        [1, 4]
+    """
+    encoder = None if approximate else get_encoder(model_name)
+    if encoder is None:
+        ratio = FAMILY_CHARS_PER_TOKEN[get_model_family(model_name)]
+        return [_approximate_count(text, ratio) for text in texts]
+    encoded = encoder.encode_batch(
+        list(texts), num_threads=num_threads, disallowed_special=()
+    )
+    return [len(tokens) for tokens in encoded]
+
+
+def calibrate_approximation(samples: Sequence[str], model_name: Optional[str] = None) -> float:
+    """
+    Calibrate approximate counting for a model family from sample text.
+
+    Counts the samples exactly and stores the measured characters-per-token
+    ratio for the model's family, so later approximate counts track your
+    own data more closely.
+
+    :param samples: Representative texts.
+    :param model_name: Model whose family to calibrate.
+    :return: The measured characters-per-token ratio.
+    """
+    total_chars = sum(len(text) for text in samples)
+    total_tokens = sum(count_tokens_batch(samples, model_name=model_name))
+    if total_chars == 0 or total_tokens == 0 or get_encoder(model_name) is None:
+        return FAMILY_CHARS_PER_TOKEN[get_model_family(model_name)]
+
+    ratio = total_chars / total_tokens
+    FAMILY_CHARS_PER_TOKEN[get_model_family(model_name)] = ratio
+    return ratio
+
+
+def check_context_limit(
+    prompt: str,
+    model_name: str,
+    max_output_tokens: int = 0,
+    approximate: bool = False,
+    raise_error: bool = False,
+) -> Dict[str, Any]:
+    """
+    Check whether a prompt fits in a model's context window before sending it.
+
+    :param prompt: The full prompt text (including any system prompt).
+    :param model_name: The model name.
+    :param max_output_tokens: Tokens to reserve for the response.
+    :param approximate: If True, uses approximate counting.
+    :param raise_error: If True, raises ValueError when the prompt does not fit.
+    :return: Dictionary with:
+        - input_tokens: Number of tokens in the prompt
+        - context_window: Model context window (None if unknown)
+        - remaining_tokens: Tokens left after the prompt and reserved output (None if unknown)
+        - fits: Whether the request fits (True if the window is unknown)
+    """
+    input_tokens = count_tokens(prompt, model_name=model_name, approximate=approximate)
+    pricing = get_model_pricing(model_name)
+    context_window = pricing["context_window"] if pricing else None
+
+    if context_window is None:
+        return {
+            "input_tokens": input_tokens,
+            "context_window": None,
+            "remaining_tokens": None,
+            "fits": True,
+        }
+
+    remaining = context_window - input_tokens - max_output_tokens
+    if remaining < 0 and raise_error:
+        raise ValueError(
+            f"Prompt needs {input_tokens} tokens plus {max_output_tokens} for output, "
+            f"but {model_name} has a context window of {context_window}"
+        )
+
+    return {
+        "input_tokens": input_tokens,
+        "context_window": context_window,
+        "remaining_tokens": remaining,
+        "fits": remaining >= 0,
+    }
+
+
+# ==============================================================================
+# COST CALCULATION
+# ==============================================================================
 
 def calculate_text_generation_costs(
     input: str,
     response: str,
-    cost_per_million_input_tokens: float,
-    cost_per_million_output_tokens: float,
-    approximate: bool = True
+    cost_per_million_input_tokens: Optional[float] = None,
+    cost_per_million_output_tokens: Optional[float] = None,
+    approximate: bool = True,
+    model_name: Optional[str] = None,
 ) -> dict:
     """
     Calculate the cost of an LLM text generation request.
@@ -21,8 +410,12 @@ def calculate_text_generation_costs(
     :param input: The input text/prompt sent to the LLM.
     :param response: The response text received from the LLM.
     :param cost_per_million_input_tokens: Cost per million input tokens (e.g., 0.50 for $0.50/M).
+        If None, looked up from the pricing table using model_name.
     :param cost_per_million_output_tokens: Cost per million output tokens.
-    :param approximate: If True, uses fast approximation (len/4). If False, uses tiktoken for exact count.
+        If None, looked up from the pricing table using model_name.
+    :param approximate: If True, uses fast approximation (characters per token,
+        calibrated per model family). If False, uses tiktoken for exact count.
+    :param model_name: Optional model name used for tokenizer selection and price lookup.
 
     :return: Dictionary with token counts and costs:
         - input_tokens: Number of input tokens
@@ -31,6 +424,8 @@ def calculate_text_generation_costs(
         - output_cost: Cost for output tokens
         - total_cost: Total cost (input + output)
 
+    :raises ValueError: If a cost is not given and the model is not in the pricing table.
+
     Example:
         >>> costs = calculate_text_generation_costs(
         ...     input="Hello, how are you?",
@@ -41,15 +436,21 @@ def calculate_text_generation_costs(
         ... )
         >>> print(f"Total cost: ${costs['total_cost']:.6f}")
     """
-    def count_tokens(text: str) -> int:
-        if approximate:
-            return len(text) // 4
-        else:
-            encoding = tiktoken.get_encoding("cl100k_base")
-            return len(encoding.encode(text))
+    if cost_per_million_input_tokens is None or cost_per_million_output_tokens is None:
+        pricing = get_model_pricing(model_name)
+        if pricing is None:
+            raise ValueError(
+                f"No pricing available for model '{model_name}'. "
+                "Pass cost_per_million_input_tokens and cost_per_million_output_tokens."
+            )
+        if cost_per_million_input_tokens is None:
+            cost_per_million_input_tokens = pricing["input_cost_per_million"]
+        if cost_per_million_output_tokens is None:
+            cost_per_million_output_tokens = pricing["output_cost_per_million"]
 
-    input_tokens = count_tokens(input)
-    output_tokens = count_tokens(response)
+    input_tokens, output_tokens = count_tokens_batch(
+        [input, response], model_name=model_name, approximate=approximate
+    )
 
     input_cost = (input_tokens / 1_000_000) * cost_per_million_input_tokens
     output_cost = (output_tokens / 1_000_000) * cost_per_million_output_tokens
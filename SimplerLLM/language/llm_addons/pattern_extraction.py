@@ -22,6 +22,14 @@ Supported Patterns:
     - filepath: File paths
     - custom: Custom regex patterns
 
+Strategies:
+    - "llm" (default): Always ask the LLM, then extract from its reply.
+    - "local_first": Scan the source text (the prompt by default) with the
+      compiled pattern and validators first, and only call the LLM when no
+      valid match is found or the pattern is semantic (see
+      pattern_helpers.SEMANTIC_PATTERNS). The result's extraction_source
+      reports which path answered.
+
 Example:
     >>> from SimplerLLM.language import LLM, LLMProvider
     >>> from SimplerLLM.language.llm_addons import generate_structured_pattern
@@ -39,7 +47,7 @@ Example:
 
 import time
 import asyncio
-from typing import Union, Dict, Tuple
+from typing import Union, Dict, Tuple, Optional
 from datetime import datetime
 
 from SimplerLLM.language.llm import LLM, LLMProvider
@@ -56,8 +64,97 @@ from SimplerLLM.tools.pattern_helpers import (
     create_pattern_extraction_prompt,
     get_validation_function,
     get_normalization_function,
+    find_valid_matches,
+    is_semantic_pattern,
 )
 
+STRATEGIES = ("llm", "local_first")
+
+
+def _use_local_path(strategy: str, pattern_type: str, semantic: Optional[bool]) -> bool:
+    """Decide whether local-first extraction should be attempted."""
+    if strategy != "local_first":
+        return False
+    if semantic is None:
+        semantic = is_semantic_pattern(pattern_type)
+    return not semantic
+
+
+def _extract_locally(
+    source_text: str,
+    pattern_type: str,
+    regex_pattern: str,
+    extract_all: bool,
+    validate: bool,
+    normalize: bool,
+) -> Optional[PatternExtractionResult]:
+    """
+    Extract valid matches directly from the source text without an LLM call.
+
+    Returns:
+        PatternExtractionResult with extraction_source="local", or None if
+        the text contains no valid match.
+    """
+    raw_matches = find_valid_matches(
+        text=source_text,
+        pattern_type=pattern_type,
+        pattern=regex_pattern,
+        extract_all=extract_all,
+        validate=validate,
+    )
+    if not raw_matches:
+        return None
+
+    normalizer = get_normalization_function(pattern_type) if normalize else None
+
+    processed_matches = []
+    for match_data in raw_matches:
+        normalized_value = None
+        if normalizer:
+            try:
+                normalized_value = normalizer(match_data['value'])
+            except Exception:
+                normalized_value = match_data['value']
+
+        processed_matches.append(PatternMatch(
+            value=match_data['value'],
+            normalized_value=normalized_value,
+            pattern_type=pattern_type,
+            position=match_data['position'],
+            is_valid=match_data['is_valid'],
+            validation_message=match_data['validation_message'],
+            confidence=1.0,
+        ))
+
+    return PatternExtractionResult(
+        matches=processed_matches,
+        total_matches=len(processed_matches),
+        pattern_used=regex_pattern,
+        original_text=source_text,
+        extraction_timestamp=datetime.now(),
+        extraction_source="local",
+    )
+
+
+def _local_full_response(
+    extraction_result: PatternExtractionResult,
+    start_time: float,
+    model_name: Optional[str] = None,
+    provider=None,
+) -> LLMFullResponse:
+    """Wrap a local extraction result in an LLMFullResponse with zero token usage."""
+    return LLMFullResponse(
+        generated_text=extraction_result.matches[0].value,
+        model=model_name or "local",
+        process_time=time.time() - start_time,
+        input_token_count=0,
+        output_token_count=0,
+        llm_provider_response=None,
+        provider=provider,
+        model_name=model_name,
+        extraction_result=extraction_result,
+    )
+
 
 def generate_structured_pattern(
     pattern: Union[str, Dict[str, str]],
@@ -74,6 +171,9 @@ def generate_structured_pattern(
     custom_prompt_suffix: str = None,
     system_prompt: str = None,
     full_response: bool = False,
+    strategy: str = "llm",
+    source_text: Optional[str] = None,
+    semantic: Optional[bool] = None,
 ) -> Union[PatternExtractionResult, LLMFullResponse, str]:
     """
     Generates a pattern extraction result from LLM output using regex patterns.
@@ -92,11 +192,16 @@ def generate_structured_pattern(
     :param custom_prompt_suffix: Optional custom suffix to override prompt enhancement.
     :param system_prompt: System prompt to set context for the LLM.
     :param full_response: If True, returns full API response including token counts.
+    :param strategy: "llm" (always call the LLM) or "local_first" (scan source_text first and
+        call the LLM only if no valid match is found or the pattern is semantic).
+    :param source_text: Text scanned by the local_first strategy. Defaults to the prompt.
+    :param semantic: Override whether the pattern needs the LLM. None uses SEMANTIC_PATTERNS.
 
     :return:
         - If full_response=False: PatternExtractionResult object
         - If full_response=True: LLMFullResponse object with extraction_result attribute
         - Error message string if unsuccessful
+        When answered locally, extraction_result.extraction_source is "local" and token counts are 0.
 
     Example:
         >>> result = generate_structured_pattern(
@@ -121,6 +226,30 @@ def generate_structured_pattern(
     else:
         return "Invalid pattern format. Provide a pattern name string or dict with 'custom' key."
 
+    if strategy not in STRATEGIES:
+        return f"Unknown strategy: {strategy}. Use one of: {', '.join(STRATEGIES)}."
+
+    # Local-first: answer from the source text when it already contains a valid match
+    if _use_local_path(strategy, pattern_type, semantic):
+        start_time = time.time()
+        local_result = _extract_locally(
+            source_text if source_text is not None else prompt,
+            pattern_type, regex_pattern, extract_all, validate, normalize
+        )
+        if local_result is not None:
+            if full_response:
+                return _local_full_response(
+                    local_result,
+                    start_time,
+                    model_name=getattr(llm_instance, "model_name", None),
+                    provider=getattr(llm_instance, "provider", None),
+                )
+            return local_result
+
+    # Resolve validator and normalizer once rather than per match
+    validator = get_validation_function(pattern_type) if validate else None
+    normalizer = get_normalization_function(pattern_type) if normalize else None
+
     # Create optimized prompt
     if custom_prompt_suffix:
         optimized_prompt = custom_prompt_suffix
@@ -173,7 +302,6 @@ def generate_structured_pattern(
                     is_valid = True
                     validation_msg = "Match found"
                     if validate:
-                        validator = get_validation_function(pattern_type)
                         if validator:
                             is_valid, validation_msg = validator(match_value)
                         else:
@@ -182,7 +310,6 @@ def generate_structured_pattern(
                     # Normalize if requested
                     normalized_value = None
                     if normalize:
-                        normalizer = get_normalization_function(pattern_type)
                         if normalizer:
                             try:
                                 normalized_value = normalizer(match_value)
@@ -242,6 +369,9 @@ async def generate_structured_pattern_async(
     custom_prompt_suffix: str = None,
     system_prompt: str = None,
     full_response: bool = False,
+    strategy: str = "llm",
+    source_text: Optional[str] = None,
+    semantic: Optional[bool] = None,
 ) -> Union[PatternExtractionResult, LLMFullResponse, str]:
     """
     Asynchronously generates a pattern extraction result from LLM output using regex patterns.
@@ -260,11 +390,16 @@ async def generate_structured_pattern_async(
     :param custom_prompt_suffix: Optional custom suffix to override prompt enhancement.
     :param system_prompt: System prompt to set context for the LLM.
     :param full_response: If True, returns full API response including token counts.
+    :param strategy: "llm" (always call the LLM) or "local_first" (scan source_text first and
+        call the LLM only if no valid match is found or the pattern is semantic).
+    :param source_text: Text scanned by the local_first strategy. Defaults to the prompt.
+    :param semantic: Override whether the pattern needs the LLM. None uses SEMANTIC_PATTERNS.
 
     :return:
         - If full_response=False: PatternExtractionResult object
         - If full_response=True: LLMFullResponse object with extraction_result attribute
         - Error message string if unsuccessful
+        When answered locally, extraction_result.extraction_source is "local" and token counts are 0.
 
     Example:
         >>> async def main():
@@ -287,6 +422,30 @@ async def generate_structured_pattern_async(
     else:
         return "Invalid pattern format. Provide a pattern name string or dict with 'custom' key."
 
+    if strategy not in STRATEGIES:
+        return f"Unknown strategy: {strategy}. Use one of: {', '.join(STRATEGIES)}."
+
+    # Local-first: answer from the source text when it already contains a valid match
+    if _use_local_path(strategy, pattern_type, semantic):
+        start_time = time.time()
+        local_result = _extract_locally(
+            source_text if source_text is not None else prompt,
+            pattern_type, regex_pattern, extract_all, validate, normalize
+        )
+        if local_result is not None:
+            if full_response:
+                return _local_full_response(
+                    local_result,
+                    start_time,
+                    model_name=getattr(llm_instance, "model_name", None),
+                    provider=getattr(llm_instance, "provider", None),
+                )
+            return local_result
+
+    # Resolve validator and normalizer once rather than per match
+    validator = get_validation_function(pattern_type) if validate else None
+    normalizer = get_normalization_function(pattern_type) if normalize else None
+
     # Create optimized prompt
     if custom_prompt_suffix:
         optimized_prompt = custom_prompt_suffix
@@ -339,7 +498,6 @@ async def generate_structured_pattern_async(
                     is_valid = True
                     validation_msg = "Match found"
                     if validate:
-                        validator = get_validation_function(pattern_type)
                         if validator:
                             is_valid, validation_msg = validator(match_value)
                         else:
@@ -348,7 +506,6 @@ async def generate_structured_pattern_async(
                     # Normalize if requested
                     normalized_value = None
                     if normalize:
-                        normalizer = get_normalization_function(pattern_type)
                         if normalizer:
                             try:
                                 normalized_value = normalizer(match_value)
@@ -408,6 +565,9 @@ def generate_structured_pattern_reliable(
     custom_prompt_suffix: str = None,
     system_prompt: str = None,
     full_response: bool = False,
+    strategy: str = "llm",
+    source_text: Optional[str] = None,
+    semantic: Optional[bool] = None,
 ) -> Union[Tuple[PatternExtractionResult, LLMProvider, str], LLMFullResponse, str]:
     """
     Generates a pattern extraction result using ReliableLLM with fallback capability.
@@ -426,11 +586,16 @@ def generate_structured_pattern_reliable(
     :param custom_prompt_suffix: Optional custom suffix to override prompt enhancement.
     :param system_prompt: System prompt to set context for the LLM.
     :param full_response: If True, returns full API response including token counts.
+    :param strategy: "llm" (always call the LLM) or "local_first" (scan source_text first and
+        call the LLM only if no valid match is found or the pattern is semantic).
+    :param source_text: Text scanned by the local_first strategy. Defaults to the prompt.
+    :param semantic: Override whether the pattern needs the LLM. None uses SEMANTIC_PATTERNS.
 
     :return:
         - If full_response=False: Tuple of (PatternExtractionResult, provider, model_name)
         - If full_response=True: LLMFullResponse object with extraction_result, provider, and model_name attributes
         - Error message string if unsuccessful
+        When answered locally, provider and model_name are None and extraction_source is "local".
 
     Example:
         >>> reliable = ReliableLLM(primary_llm=openai_llm, secondary_llm=anthropic_llm)
@@ -453,6 +618,25 @@ def generate_structured_pattern_reliable(
     else:
         return "Invalid pattern format. Provide a pattern name string or dict with 'custom' key."
 
+    if strategy not in STRATEGIES:
+        return f"Unknown strategy: {strategy}. Use one of: {', '.join(STRATEGIES)}."
+
+    # Local-first: answer from the source text when it already contains a valid match
+    if _use_local_path(strategy, pattern_type, semantic):
+        start_time = time.time()
+        local_result = _extract_locally(
+            source_text if source_text is not None else prompt,
+            pattern_type, regex_pattern, extract_all, validate, normalize
+        )
+        if local_result is not None:
+            if full_response:
+                return _local_full_response(local_result, start_time)
+            return (local_result, None, None)
+
+    # Resolve validator and normalizer once rather than per match
+    validator = get_validation_function(pattern_type) if validate else None
+    normalizer = get_normalization_function(pattern_type) if normalize else None
+
     # Create optimized prompt
     if custom_prompt_suffix:
         optimized_prompt = custom_prompt_suffix
@@ -510,7 +694,6 @@ def generate_structured_pattern_reliable(
                     is_valid = True
                     validation_msg = "Match found"
                     if validate:
-                        validator = get_validation_function(pattern_type)
                         if validator:
                             is_valid, validation_msg = validator(match_value)
                         else:
@@ -519,7 +702,6 @@ def generate_structured_pattern_reliable(
                     # Normalize if requested
                     normalized_value = None
                     if normalize:
-                        normalizer = get_normalization_function(pattern_type)
                         if normalizer:
                             try:
                                 normalized_value = normalizer(match_value)
@@ -581,6 +763,9 @@ async def generate_structured_pattern_reliable_async(
     custom_prompt_suffix: str = None,
     system_prompt: str = None,
     full_response: bool = False,
+    strategy: str = "llm",
+    source_text: Optional[str] = None,
+    semantic: Optional[bool] = None,
 ) -> Union[Tuple[PatternExtractionResult, LLMProvider, str], LLMFullResponse, str]:
     """
     Asynchronously generates a pattern extraction result using ReliableLLM with fallback capability.
@@ -599,11 +784,16 @@ async def generate_structured_pattern_reliable_async(
     :param custom_prompt_suffix: Optional custom suffix to override prompt enhancement.
     :param system_prompt: System prompt to set context for the LLM.
     :param full_response: If True, returns full API response including token counts.
+    :param strategy: "llm" (always call the LLM) or "local_first" (scan source_text first and
+        call the LLM only if no valid match is found or the pattern is semantic).
+    :param source_text: Text scanned by the local_first strategy. Defaults to the prompt.
+    :param semantic: Override whether the pattern needs the LLM. None uses SEMANTIC_PATTERNS.
 
     :return:
         - If full_response=False: Tuple of (PatternExtractionResult, provider, model_name)
         - If full_response=True: LLMFullResponse object with extraction_result, provider, and model_name attributes
         - Error message string if unsuccessful
+        When answered locally, provider and model_name are None and extraction_source is "local".
 
     Example:
         >>> async def main():
@@ -627,6 +817,25 @@ async def generate_structured_pattern_reliable_async(
     else:
         return "Invalid pattern format. Provide a pattern name string or dict with 'custom' key."
 
+    if strategy not in STRATEGIES:
+        return f"Unknown strategy: {strategy}. Use one of: {', '.join(STRATEGIES)}."
+
+    # Local-first: answer from the source text when it already contains a valid match
+    if _use_local_path(strategy, pattern_type, semantic):
+        start_time = time.time()
+        local_result = _extract_locally(
+            source_text if source_text is not None else prompt,
+            pattern_type, regex_pattern, extract_all, validate, normalize
+        )
+        if local_result is not None:
+            if full_response:
+                return _local_full_response(local_result, start_time)
+            return (local_result, None, None)
+
+    # Resolve validator and normalizer once rather than per match
+    validator = get_validation_function(pattern_type) if validate else None
+    normalizer = get_normalization_function(pattern_type) if normalize else None
+
     # Create optimized prompt
     if custom_prompt_suffix:
         optimized_prompt = custom_prompt_suffix
@@ -684,7 +893,6 @@ async def generate_structured_pattern_reliable_async(
                     is_valid = True
                     validation_msg = "Match found"
                     if validate:
-                        validator = get_validation_function(pattern_type)
                         if validator:
                             is_valid, validation_msg = validator(match_value)
                         else:
@@ -693,7 +901,6 @@ async def generate_structured_pattern_reliable_async(
                     # Normalize if requested
                     normalized_value = None
                     if normalize:
-                        normalizer = get_normalization_function(pattern_type)
                         if normalizer:
                             try:
                                 normalized_value = normalizer(match_value)
@@ -0,0 +1,46 @@
+"""
+LLM Batch - bulk jobs through provider batch APIs.
+
+Sends large numbers of requests through the OpenAI Batch API or the
+Anthropic Message Batches API instead of one online call per request.
+Batch requests cost half as much and do not count against online rate
+limits; results arrive within the provider's completion window
+(usually minutes to hours).
+
+Main Classes:
+    - BatchJob: Submit, poll and stream results, with a checkpoint on disk
+    - BatchRequest: One request of a job
+    - BatchResult: LLMFullResponse (and validated Pydantic object) per request
+    - OpenAIBatchProvider / AnthropicBatchProvider: The provider APIs
+
+Example:
+    >>> from SimplerLLM.language.llm import LLM, LLMProvider
+    >>> from SimplerLLM.language.llm_batch import BatchJob, BatchRequest
+    >>>
+    >>> llm = LLM.create(provider=LLMProvider.ANTHROPIC, model_name="claude-3-5-haiku-latest")
+    >>> job = BatchJob(llm, "jobs/summaries")
+    >>> job.submit(BatchRequest(custom_id=f"doc-{i}", prompt=f"Summarize: {doc}")
+    ...            for i, doc in enumerate(documents))
+    >>> for result in job.results(poll_interval=60):
+    ...     print(result.custom_id, result.generated_text or result.error)
+"""
+
+from SimplerLLM.utils.lazy_imports import lazy_exports
+
+_EXPORTS = {
+    'BatchJob': '.job',
+    'BatchRequest': '.models',
+    'BatchResult': '.models',
+    'BatchInfo': '.models',
+    'BatchStatus': '.models',
+    'BatchError': '.models',
+    'BatchProviderError': '.models',
+    'BatchProvider': '.providers',
+    'OpenAIBatchProvider': '.providers',
+    'AnthropicBatchProvider': '.providers',
+    'create_batch_provider': '.providers',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
@@ -0,0 +1,567 @@
+"""
+Checkpointed batch jobs on top of the provider batch APIs.
+"""
+
+import json
+import os
+import time
+import uuid
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Type, Union
+
+from pydantic import BaseModel
+
+from SimplerLLM.language.llm_addons.json_generation import (
+    _unwrap_rootmodel_list,
+    create_optimized_prompt,
+)
+from SimplerLLM.tools.json_helpers import (
+    convert_json_to_pydantic_model,
+    extract_json_from_text,
+    try_auto_wrap_for_nested_model,
+    validate_json_with_pydantic_model,
+)
+from SimplerLLM.utils.custom_verbose import verbose_print
+
+from .models import BatchError, BatchInfo, BatchRequest, BatchResult, BatchStatus
+from .providers import BatchProvider, create_batch_provider
+
+CHECKPOINT_VERSION = 1
+STATE_FILE = "state.json"
+RESULTS_FILE = "results.jsonl"
+INPUTS_DIR = "inputs"
+
+# Same default system prompt as generate_pydantic_json_model
+JSON_SYSTEM_PROMPT = "The Output is a VALID Structured JSON"
+
+
+class BatchJob:
+    """
+    Run a bulk job through a provider batch API (OpenAI Batch, Anthropic
+    Message Batches) at batch pricing and without online rate limits.
+
+    Requests are serialized with the LLM wrapper's model and defaults,
+    split into provider-sized batches and submitted. Results are streamed
+    back as BatchResults with an LLMFullResponse and, when a model_class
+    is given, a validated Pydantic object.
+
+    Everything needed to resume is kept in checkpoint_dir: the submitted
+    batch ids, and every result already downloaded. After a crash or
+    restart, create the job with the same directory and call submit()
+    with the same requests (batches already submitted are skipped) and
+    results() (downloaded results are read back from disk, and
+    interrupted downloads continue where they stopped).
+
+    Args:
+        llm_instance: OpenAI or Anthropic LLM wrapper
+        checkpoint_dir: Directory for the job's state and results
+        model_class: Pydantic model to validate responses against. Prompts
+            get the same JSON instructions as generate_pydantic_json_model
+        provider: BatchProvider to use (default: created from llm_instance)
+        max_requests_per_batch: Requests per batch (default and maximum:
+            the provider limit)
+        metadata: Labels stored with each batch, where supported
+        custom_prompt_suffix: Replaces the JSON format instructions added
+            to prompts when model_class is set
+        verbose: Print progress
+
+    Raises:
+        BatchError: If checkpoint_dir belongs to a job with another
+            provider, model or model_class
+
+    Example:
+        >>> from pydantic import BaseModel
+        >>> from SimplerLLM.language.llm_batch import BatchJob, BatchRequest
+        >>>
+        >>> class Sentiment(BaseModel):
+        ...     label: str
+        ...     score: float
+        >>>
+        >>> llm = LLM.create(provider=LLMProvider.OPENAI, model_name="gpt-4o-mini")
+        >>> job = BatchJob(llm, "jobs/sentiment-2026-10-18", model_class=Sentiment)
+        >>> job.submit(
+        ...     BatchRequest(custom_id=row_id, prompt=f"Classify: {text}")
+        ...     for row_id, text in rows
+        ... )
+        >>> for result in job.results(poll_interval=60):
+        ...     if result.succeeded:
+        ...         save(result.custom_id, result.parsed.label)
+    """
+
+    def __init__(
+        self,
+        llm_instance,
+        checkpoint_dir: str,
+        model_class: Optional[Type[BaseModel]] = None,
+        provider: Optional[BatchProvider] = None,
+        max_requests_per_batch: Optional[int] = None,
+        metadata: Optional[Dict[str, str]] = None,
+        custom_prompt_suffix: Optional[str] = None,
+        verbose: bool = False,
+    ):
+        self.llm_instance = llm_instance
+        self.checkpoint_dir = checkpoint_dir
+        self.model_class = model_class
+        self.provider = provider or create_batch_provider(llm_instance)
+        self.max_requests_per_batch = min(
+            max_requests_per_batch or self.provider.MAX_REQUESTS_PER_BATCH,
+            self.provider.MAX_REQUESTS_PER_BATCH,
+        )
+        self.metadata = metadata
+        self.custom_prompt_suffix = custom_prompt_suffix
+        self.verbose = verbose
+
+        os.makedirs(os.path.join(checkpoint_dir, INPUTS_DIR), exist_ok=True)
+        self._state = self._load_state()
+
+    # -- Checkpoint ------------------------------------------------------------
+
+    @property
+    def _state_path(self) -> str:
+        return os.path.join(self.checkpoint_dir, STATE_FILE)
+
+    @property
+    def _results_path(self) -> str:
+        return os.path.join(self.checkpoint_dir, RESULTS_FILE)
+
+    def _input_path(self, index: int) -> str:
+        return os.path.join(self.checkpoint_dir, INPUTS_DIR, f"batch-{index:05d}.jsonl")
+
+    def _load_state(self) -> Dict[str, Any]:
+        identity = {
+            "provider": self.provider.name,
+            "model_name": self.llm_instance.model_name,
+            "model_class": (
+                f"{self.model_class.__module__}.{self.model_class.__qualname__}"
+                if self.model_class is not None else None
+            ),
+        }
+        if not os.path.exists(self._state_path):
+            return {
+                "version": CHECKPOINT_VERSION,
+                **identity,
+                "job_id": uuid.uuid4().hex,
+                "input_complete": False,
+                "batches": [],
+            }
+
+        with open(self._state_path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        for key, value in identity.items():
+            if state.get(key) != value:
+                raise BatchError(
+                    f"Checkpoint {self.checkpoint_dir} was created with {key}={state.get(key)!r}, "
+                    f"not {value!r}. Use a new checkpoint_dir for a different job."
+                )
+        state.setdefault("job_id", uuid.uuid4().hex)
+        return state
+
+    def _save_state(self) -> None:
+        # Write-then-rename so a crash never leaves a truncated checkpoint
+        temp_path = self._state_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self._state, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self._state_path)
+
+    @staticmethod
+    def _record_info(entry: Dict[str, Any], info: BatchInfo) -> None:
+        entry.update({
+            "status": info.status.value,
+            "total": info.total,
+            "succeeded": info.succeeded,
+            "failed": info.failed,
+            "created_at": info.created_at,
+            "ended_at": info.ended_at,
+            "output_locations": info.output_locations,
+            "errors": info.errors,
+        })
+
+    def _entry_info(self, entry: Dict[str, Any]) -> BatchInfo:
+        return BatchInfo(
+            batch_id=entry["batch_id"],
+            provider=self.provider.name,
+            status=BatchStatus(entry["status"]),
+            total=entry.get("total") or 0,
+            succeeded=entry.get("succeeded") or 0,
+            failed=entry.get("failed") or 0,
+            created_at=entry.get("created_at"),
+            ended_at=entry.get("ended_at"),
+            output_locations=entry.get("output_locations") or [],
+            errors=entry.get("errors") or [],
+        )
+
+    # -- Submission --------------------------------------------------------------
+
+    def _prepare(self, request: Union[BatchRequest, Dict[str, Any]]) -> BatchRequest:
+        if not isinstance(request, BatchRequest):
+            request = BatchRequest(**request)
+        if self.model_class is None:
+            return request
+
+        update: Dict[str, Any] = {"json_mode": True}
+        if request.prompt:
+            update["prompt"] = create_optimized_prompt(
+                request.prompt, self.model_class, self.custom_prompt_suffix
+            )
+        if "system_prompt" not in request.model_fields_set:
+            update["system_prompt"] = JSON_SYSTEM_PROMPT
+        return request.model_copy(update=update)
+
+    def _submit_batch(self, index: int, lines: List[bytes], ids: List[str]) -> BatchInfo:
+        batches = self._state["batches"]
+        if index < len(batches):
+            entry = batches[index]
+            if entry["count"] != len(ids) or entry["first_id"] != ids[0] or entry["last_id"] != ids[-1]:
+                raise BatchError(
+                    f"Batch {index} in checkpoint {self.checkpoint_dir} holds different requests "
+                    f"than the ones passed to submit(). Pass the same requests in the same order to resume."
+                )
+            return self._entry_info(entry)
+
+        metadata = dict(self.metadata or {})
+        metadata.setdefault("simplerllm_job", self._state["job_id"])
+        metadata.setdefault("simplerllm_batch_index", str(index))
+        bounds = {"index": index, "count": len(ids), "first_id": ids[0], "last_id": ids[-1]}
+
+        # A crash between the provider accepting the batch and the
+        # checkpoint recording it would submit (and bill) it twice; look
+        # for it first
+        info = None
+        submitting = self._state.get("submitting")
+        if submitting is not None and all(submitting.get(k) == v for k, v in bounds.items()):
+            info = self.provider.find_batch(metadata, submitting["started_at"], len(ids))
+            if info is not None and self.verbose:
+                verbose_print(f"Found batch {index} from an interrupted submit: {info.batch_id}", "info")
+
+        if info is None:
+            input_path = self._input_path(index)
+            with open(input_path, "wb") as f:
+                f.writelines(lines)
+            self._state["submitting"] = {**bounds, "started_at": time.time()}
+            self._save_state()
+            info = self.provider.submit(input_path, metadata)
+            if self.verbose:
+                verbose_print(f"Submitted batch {index} ({len(ids)} requests): {info.batch_id}", "info")
+
+        entry = {**bounds, "batch_id": info.batch_id, "collected": False}
+        self._record_info(entry, info)
+        batches.append(entry)
+        self._state.pop("submitting", None)
+        self._save_state()
+        return info
+
+    def submit(self, requests: Iterable[Union[BatchRequest, Dict[str, Any]]]) -> List[BatchInfo]:
+        """
+        Serialize requests and submit them as provider batches.
+
+        Requests are consumed lazily, so a generator over millions of
+        rows never has to fit in memory. Batches recorded in the
+        checkpoint are not submitted again, and a batch whose submission
+        was interrupted is looked up at the provider before it is sent
+        a second time.
+
+        Args:
+            requests: BatchRequests (or dicts with BatchRequest fields)
+
+        Returns:
+            BatchInfo of every batch of the job
+
+        Raises:
+            ValueError: If a request is invalid or a custom_id repeats
+                within a batch
+            BatchError: If the requests differ from the checkpointed ones
+            BatchProviderError: If the provider rejects a submission
+        """
+        infos: List[BatchInfo] = []
+        lines: List[bytes] = []
+        ids: List[str] = []
+        seen = set()
+        size = 0
+        index = 0
+
+        for request in requests:
+            request = self._prepare(request)
+            line = (json.dumps(self.provider.build_line(request, self.llm_instance)) + "\n").encode("utf-8")
+
+            if lines and (
+                len(lines) >= self.max_requests_per_batch
+                or size + len(line) > self.provider.MAX_BYTES_PER_BATCH
+            ):
+                infos.append(self._submit_batch(index, lines, ids))
+                index += 1
+                lines, ids, seen, size = [], [], set(), 0
+
+            if request.custom_id in seen:
+                raise ValueError(f"Duplicate custom_id in batch {index}: {request.custom_id}")
+            seen.add(request.custom_id)
+            lines.append(line)
+            ids.append(request.custom_id)
+            size += len(line)
+
+        if lines:
+            infos.append(self._submit_batch(index, lines, ids))
+            index += 1
+
+        if index == 0 and not self._state["batches"]:
+            raise ValueError("requests must contain at least one request.")
+
+        if not self._state["input_complete"]:
+            self._state["input_complete"] = True
+            self._save_state()
+        return infos
+
+    # -- Status --------------------------------------------------------------------
+
+    def _require_batches(self) -> List[Dict[str, Any]]:
+        if not self._state["batches"]:
+            raise BatchError("Nothing has been submitted for this job yet. Call submit() first.")
+        return self._state["batches"]
+
+    def _refresh(self, entry: Dict[str, Any]) -> BatchInfo:
+        if BatchStatus(entry["status"]).is_terminal:
+            return self._entry_info(entry)
+        info = self.provider.retrieve(entry["batch_id"])
+        self._record_info(entry, info)
+        return info
+
+    def status(self) -> List[BatchInfo]:
+        """
+        Fetch the current state of every batch of the job.
+
+        Returns:
+            BatchInfo per batch, in submission order
+        """
+        infos = [self._refresh(entry) for entry in self._require_batches()]
+        self._save_state()
+        return infos
+
+    def wait(self, poll_interval: float = 30.0, timeout: Optional[float] = None) -> List[BatchInfo]:
+        """
+        Block until every batch has finished, failed, expired or been cancelled.
+
+        Args:
+            poll_interval: Seconds between status checks
+            timeout: Give up after this many seconds (default: wait forever)
+
+        Returns:
+            Final BatchInfo per batch
+
+        Raises:
+            TimeoutError: If the batches are still running after timeout
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            infos = self.status()
+            if all(info.status.is_terminal for info in infos):
+                return infos
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Batch job still running after {timeout} seconds")
+            time.sleep(poll_interval)
+
+    def cancel(self) -> List[BatchInfo]:
+        """
+        Cancel every batch that is still running.
+
+        Requests that already finished keep their results, which
+        results() still returns.
+
+        Returns:
+            BatchInfo per batch
+        """
+        infos = []
+        for entry in self._require_batches():
+            if BatchStatus(entry["status"]).is_terminal:
+                infos.append(self._entry_info(entry))
+                continue
+            info = self.provider.cancel(entry["batch_id"])
+            self._record_info(entry, info)
+            infos.append(info)
+        self._save_state()
+        return infos
+
+    @property
+    def is_complete(self) -> bool:
+        """True once every submitted batch has been downloaded into the checkpoint."""
+        batches = self._state["batches"]
+        return bool(batches) and self._state["input_complete"] and all(e["collected"] for e in batches)
+
+    # -- Results -------------------------------------------------------------------
+
+    def _parse_model(self, text: str):
+        """Validate text against model_class like generate_pydantic_json_model does."""
+        json_object = extract_json_from_text(text) if text else None
+        if json_object is None:
+            return None, "No valid JSON found in response"
+
+        json_object = _unwrap_rootmodel_list(json_object, self.model_class)
+        json_object = try_auto_wrap_for_nested_model(self.model_class, json_object)
+        _, errors = validate_json_with_pydantic_model(self.model_class, json_object)
+        if errors:
+            return None, f"Validation failed: {errors}"
+        return convert_json_to_pydantic_model(self.model_class, json_object[0]), None
+
+    def _to_result(self, record: Dict[str, Any], info: BatchInfo) -> BatchResult:
+        if "line" not in record:
+            return BatchResult(custom_id=record["custom_id"], batch_id=info.batch_id, error=record["error"])
+
+        custom_id, response, error = self.provider.parse_result(record["line"], info)
+        parsed = None
+        if response is not None and self.model_class is not None:
+            parsed, error = self._parse_model(response.generated_text)
+            response.model_object = parsed
+        return BatchResult(
+            custom_id=custom_id, batch_id=info.batch_id, response=response, parsed=parsed, error=error,
+        )
+
+    def _drop_partial_record(self) -> None:
+        """
+        Cut off a record left half-written by a crash, so results.jsonl can
+        be read and appended to again. The record is downloaded again.
+        """
+        if not os.path.exists(self._results_path):
+            return
+        with open(self._results_path, "rb+") as f:
+            end = f.seek(0, os.SEEK_END)
+            if end == 0:
+                return
+            f.seek(end - 1)
+            if f.read(1) == b"\n":
+                return
+            while end > 0:
+                start = max(0, end - 65536)
+                f.seek(start)
+                newline = f.read(end - start).rfind(b"\n")
+                if newline != -1:
+                    f.truncate(start + newline + 1)
+                    return
+                end = start
+            f.truncate(0)
+
+    def _saved_counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        if os.path.exists(self._results_path):
+            with open(self._results_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        batch_id = json.loads(line)["batch_id"]
+                        counts[batch_id] = counts.get(batch_id, 0) + 1
+        return counts
+
+    def _iter_saved(self) -> Iterator[BatchResult]:
+        if not os.path.exists(self._results_path):
+            return
+        infos = {entry["batch_id"]: self._entry_info(entry) for entry in self._state["batches"]}
+        with open(self._results_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    yield self._to_result(record, infos[record["batch_id"]])
+
+    def _failed_batch_records(self, entry: Dict[str, Any], info: BatchInfo) -> Iterator[Dict[str, Any]]:
+        """Error records for a batch the provider rejected as a whole."""
+        message = "; ".join(info.errors) or f"Batch {info.status.value}"
+        input_path = self._input_path(entry["index"])
+        if not os.path.exists(input_path):
+            return
+        with open(input_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield {"batch_id": info.batch_id, "custom_id": json.loads(line)["custom_id"], "error": message}
+
+    def _collect(self, entry: Dict[str, Any], info: BatchInfo, saved: int) -> Iterator[BatchResult]:
+        """Download a finished batch, appending each record to the checkpoint before yielding it."""
+        written = saved
+        with open(self._results_path, "a", encoding="utf-8") as f:
+            records = (
+                {"batch_id": info.batch_id, "line": line}
+                for line in self.provider.iter_result_lines(info, skip=saved)
+            )
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+                f.flush()
+                written += 1
+                yield self._to_result(record, info)
+
+            if written == 0 and info.status != BatchStatus.COMPLETED:
+                for record in self._failed_batch_records(entry, info):
+                    f.write(json.dumps(record) + "\n")
+                    f.flush()
+                    yield self._to_result(record, info)
+
+            os.fsync(f.fileno())
+
+        entry["collected"] = True
+        self._save_state()
+        input_path = self._input_path(entry["index"])
+        if os.path.exists(input_path):
+            os.remove(input_path)
+        if self.verbose:
+            verbose_print(f"Collected batch {entry['index']} ({info.batch_id}): {info.status.value}", "info")
+
+    def results(
+        self,
+        poll_interval: float = 30.0,
+        timeout: Optional[float] = None,
+        include_saved: bool = True,
+    ) -> Iterator[BatchResult]:
+        """
+        Stream the job's results as its batches finish.
+
+        Each batch is downloaded as soon as it ends, line by line, and
+        every result is written to the checkpoint before it is yielded.
+
+        Args:
+            poll_interval: Seconds between status checks while batches run
+            timeout: Give up after this many seconds (default: wait forever)
+            include_saved: Also yield results downloaded by earlier runs
+
+        Yields:
+            BatchResult per request. Failed requests (provider errors,
+            expired or cancelled requests, JSON validation failures) have
+            error set.
+
+        Raises:
+            BatchError: If nothing was submitted
+            TimeoutError: If batches are still running after timeout
+            BatchProviderError: If the provider API fails
+        """
+        self._require_batches()
+        self._drop_partial_record()
+        saved = self._saved_counts()
+        if include_saved:
+            yield from self._iter_saved()
+
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            pending = [entry for entry in self._state["batches"] if not entry["collected"]]
+            if not pending:
+                return
+
+            for entry in pending:
+                info = self._refresh(entry)
+                if info.status.is_terminal:
+                    yield from self._collect(entry, info, saved.get(entry["batch_id"], 0))
+            self._save_state()
+
+            if all(entry["collected"] for entry in pending):
+                continue
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Batch job still running after {timeout} seconds")
+            time.sleep(poll_interval)
+
+    def run(
+        self,
+        requests: Iterable[Union[BatchRequest, Dict[str, Any]]],
+        poll_interval: float = 30.0,
+        timeout: Optional[float] = None,
+    ) -> Iterator[BatchResult]:
+        """
+        Submit requests, then stream their results: submit() followed by results().
+
+        Example:
+            >>> for result in BatchJob(llm, "jobs/nightly").run(requests):
+            ...     print(result.custom_id, result.generated_text)
+        """
+        self.submit(requests)
+        return self.results(poll_interval=poll_interval, timeout=timeout)
@@ -0,0 +1,135 @@
+"""
+Models for provider batch jobs.
+"""
+
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from SimplerLLM.language.llm_providers.llm_response_models import LLMFullResponse
+
+
+class BatchStatus(Enum):
+    """Lifecycle of a provider batch, normalized across providers."""
+    VALIDATING = "validating"
+    IN_PROGRESS = "in_progress"
+    FINALIZING = "finalizing"
+    CANCELLING = "cancelling"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    EXPIRED = "expired"
+    CANCELLED = "cancelled"
+
+    @property
+    def is_terminal(self) -> bool:
+        """True once the provider will not process the batch any further."""
+        return self in (
+            BatchStatus.COMPLETED, BatchStatus.FAILED, BatchStatus.EXPIRED, BatchStatus.CANCELLED,
+        )
+
+
+class BatchRequest(BaseModel):
+    """
+    One request of a batch job.
+
+    Settings left as None use the LLM instance's defaults.
+
+    Attributes:
+        custom_id: Unique id used to match the result to the request
+        prompt: Single user prompt (use either prompt or messages)
+        messages: Chat messages (use either prompt or messages)
+        system_prompt: System message
+        max_tokens: Maximum tokens to generate
+        temperature: Sampling temperature
+        top_p: Nucleus sampling parameter
+        json_mode: Ask for JSON output (OpenAI response_format)
+        model_name: Override the LLM instance's model
+        reasoning_effort: Reasoning depth for OpenAI reasoning models
+        thinking_budget: Extended thinking budget for Anthropic models
+    """
+    custom_id: str = Field(min_length=1, max_length=64)
+    prompt: Optional[str] = None
+    messages: Optional[List[Dict[str, Any]]] = None
+    system_prompt: str = "You are a helpful AI Assistant"
+    max_tokens: int = 300
+    temperature: Optional[float] = None
+    top_p: Optional[float] = None
+    json_mode: bool = False
+    model_name: Optional[str] = None
+    reasoning_effort: Optional[str] = None
+    thinking_budget: Optional[int] = None
+
+
+class BatchInfo(BaseModel):
+    """
+    State of one provider batch.
+
+    Attributes:
+        batch_id: Provider batch id
+        provider: "openai" or "anthropic"
+        status: Normalized status
+        total: Number of requests in the batch
+        succeeded: Requests that completed successfully so far
+        failed: Requests that errored, expired or were cancelled so far
+        created_at: Creation time (seconds since the epoch)
+        ended_at: Time the batch reached a terminal status, if it has
+        output_locations: Where the provider publishes results (file ids
+            or a results URL)
+        errors: Batch-level error messages (e.g. validation failures)
+        raw: The provider's batch object
+    """
+    batch_id: str
+    provider: str
+    status: BatchStatus
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    created_at: Optional[float] = None
+    ended_at: Optional[float] = None
+    output_locations: List[str] = Field(default_factory=list)
+    errors: List[str] = Field(default_factory=list)
+    raw: Dict[str, Any] = Field(default_factory=dict)
+
+
+class BatchResult(BaseModel):
+    """
+    Result of one batch request.
+
+    Attributes:
+        custom_id: The request's custom_id
+        batch_id: Provider batch that produced the result
+        response: Full response, when the provider returned one
+        parsed: Validated Pydantic object, when the job has a model_class
+            and the response passed validation
+        error: Why the request failed (provider error, or JSON
+            validation failure); None on success
+    """
+    custom_id: str
+    batch_id: str
+    response: Optional[LLMFullResponse] = None
+    parsed: Optional[Any] = None
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+    @property
+    def generated_text(self) -> Optional[str]:
+        return self.response.generated_text if self.response is not None else None
+
+
+# Exceptions
+
+class BatchError(Exception):
+    """Base exception for batch job errors"""
+    pass
+
+
+class BatchProviderError(BatchError):
+    """Raised when the provider's batch API returns an error"""
+    def __init__(self, message: str, provider: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.provider = provider
+        self.status_code = status_code
@@ -0,0 +1,689 @@
+"""
+Provider batch APIs.
+
+Each provider turns BatchRequests into lines of its batch input format,
+submits a file of lines as one batch, reports the batch's status and
+streams its result lines back as BatchResults:
+
+- OpenAIBatchProvider: Batch API over /v1/chat/completions (JSONL file
+  upload, then /v1/batches)
+- AnthropicBatchProvider: Message Batches API (/v1/messages/batches)
+
+Requests are built with the same helpers the online providers use, so a
+batch request gets the same model-specific handling (reasoning models,
+system messages, thinking) as llm.generate_response().
+
+Base URLs follow the SDK environment variables (OPENAI_BASE_URL,
+ANTHROPIC_BASE_URL), so jobs can run against a proxy or a local
+stand-in server.
+"""
+
+import json
+import os
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+import SimplerLLM.language.llm_providers.anthropic_llm as anthropic_llm
+import SimplerLLM.language.llm_providers.openai_llm as openai_llm
+from SimplerLLM.instrumentation.core import record_retry
+from SimplerLLM.language.llm.base import LLMProvider
+from SimplerLLM.language.llm_addons.cost_utils import estimate_cost
+from SimplerLLM.language.llm_providers.llm_response_models import LLMFullResponse
+
+from .models import BatchInfo, BatchProviderError, BatchRequest, BatchStatus
+
+MAX_RETRIES = int(os.getenv("MAX_RETRIES", 3))
+RETRY_DELAY = int(os.getenv("RETRY_DELAY", 2))
+
+# Batch requests are billed at half the online price by both providers
+BATCH_PRICE_FACTOR = 0.5
+
+_RETRY_STATUSES = (408, 429, 500, 502, 503, 504, 529)
+
+# Allowed difference between our clock and the provider's when matching
+# batch creation times
+_CLOCK_SKEW = 300
+
+
+def _parse_time(value: Any) -> Optional[float]:
+    """Unix seconds from an epoch number or an RFC 3339 string."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def _error_message(payload: Any) -> str:
+    """Best-effort message from a provider error body."""
+    if isinstance(payload, dict):
+        error = payload.get("error", payload)
+        if isinstance(error, dict):
+            if isinstance(error.get("error"), dict):  # Anthropic nests error objects
+                error = error["error"]
+            message = error.get("message") or error.get("code") or error.get("type")
+            if message:
+                return str(message)
+    return str(payload)
+
+
+class BatchProvider:
+    """
+    Base class for provider batch APIs. Do not instantiate directly.
+
+    Class Attributes:
+        name: Provider name used in checkpoints and BatchInfo
+        llm_provider: LLMProvider the batch API belongs to
+        MAX_REQUESTS_PER_BATCH: Provider limit on requests per batch
+        MAX_BYTES_PER_BATCH: Provider limit on the batch input size
+    """
+
+    name: str = ""
+    llm_provider: Optional[LLMProvider] = None
+    MAX_REQUESTS_PER_BATCH: int = 50_000
+    MAX_BYTES_PER_BATCH: int = 200 * 1024 * 1024
+
+    def __init__(self, api_key: str, base_url: str, timeout: float = 300.0):
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self._client: Optional[httpx.Client] = None
+
+    # -- HTTP plumbing -------------------------------------------------------
+
+    @property
+    def client(self) -> httpx.Client:
+        if self._client is None:
+            self._client = httpx.Client(
+                timeout=self.timeout, headers=self._headers(), follow_redirects=True,
+            )
+        return self._client
+
+    def close(self) -> None:
+        """Close the HTTP connection pool."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def _headers(self) -> Dict[str, str]:
+        raise NotImplementedError
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        build: Optional[Callable[[], Dict[str, Any]]] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Send a request with retries on rate limits, server errors and
+        connection failures, and return the JSON body.
+
+        Args:
+            build: Called before every attempt for request arguments that
+                cannot be reused (e.g. an open upload file)
+        """
+        for attempt in range(MAX_RETRIES):
+            try:
+                extra = build() if build is not None else {}
+                response = self.client.request(method, url, **kwargs, **extra)
+            except httpx.TransportError as e:
+                if attempt < MAX_RETRIES - 1:
+                    record_retry()
+                    time.sleep(RETRY_DELAY * (2 ** attempt))
+                    continue
+                raise BatchProviderError(f"{method} {url} failed: {e}", self.name) from e
+
+            if response.status_code < 400:
+                return response.json()
+            if response.status_code in _RETRY_STATUSES and attempt < MAX_RETRIES - 1:
+                record_retry()
+                time.sleep(RETRY_DELAY * (2 ** attempt))
+                continue
+            try:
+                message = _error_message(response.json())
+            except ValueError:
+                message = response.text
+            raise BatchProviderError(
+                f"{method} {url} returned {response.status_code}: {message}",
+                self.name,
+                response.status_code,
+            )
+
+    def _iter_jsonl(self, urls: List[str], skip: int = 0) -> Iterator[Dict[str, Any]]:
+        """
+        Stream JSONL downloads line by line, as one sequence.
+
+        Args:
+            urls: Files to read, in order
+            skip: Number of leading lines to skip (already processed)
+        """
+        for url in urls:
+            with self.client.stream("GET", url) as response:
+                if response.status_code >= 400:
+                    response.read()
+                    raise BatchProviderError(
+                        f"GET {url} returned {response.status_code}: {response.text}",
+                        self.name,
+                        response.status_code,
+                    )
+                for line in response.iter_lines():
+                    if not line.strip():
+                        continue
+                    if skip:
+                        skip -= 1
+                        continue
+                    yield json.loads(line)
+
+    # -- Provider interface --------------------------------------------------
+
+    def build_line(self, request: BatchRequest, llm_instance) -> Dict[str, Any]:
+        """
+        Build the batch input line for a request.
+
+        Args:
+            request: The request
+            llm_instance: LLM wrapper supplying the model and defaults
+
+        Returns:
+            JSON-serializable line in the provider's batch format
+        """
+        raise NotImplementedError
+
+    def submit(self, input_path: str, metadata: Optional[Dict[str, str]] = None) -> BatchInfo:
+        """
+        Submit a JSONL file of lines from build_line() as one batch.
+
+        Args:
+            input_path: Path of the JSONL file
+            metadata: Labels stored with the batch, where supported
+
+        Returns:
+            BatchInfo of the new batch
+        """
+        raise NotImplementedError
+
+    def find_batch(self, metadata: Dict[str, str], since: float, count: int) -> Optional[BatchInfo]:
+        """
+        Look for a batch submitted by an interrupted submit().
+
+        Args:
+            metadata: Metadata the batch was submitted with
+            since: Time the submission started (seconds since the epoch)
+            count: Number of requests in the batch
+
+        Returns:
+            BatchInfo of the batch, or None if it was not found
+        """
+        return None
+
+    def retrieve(self, batch_id: str) -> BatchInfo:
+        """Fetch the current state of a batch."""
+        raise NotImplementedError
+
+    def cancel(self, batch_id: str) -> BatchInfo:
+        """Ask the provider to cancel a batch."""
+        raise NotImplementedError
+
+    def iter_result_lines(self, info: BatchInfo, skip: int = 0) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the raw result lines of a finished batch.
+
+        Lines come back in a stable order, so `skip` resumes an
+        interrupted download.
+        """
+        raise NotImplementedError
+
+    def parse_result(
+        self, line: Dict[str, Any], info: BatchInfo
+    ) -> Tuple[str, Optional[LLMFullResponse], Optional[str]]:
+        """
+        Map a raw result line onto a response.
+
+        Returns:
+            Tuple of (custom_id, response or None, error message or None)
+        """
+        raise NotImplementedError
+
+    # -- Helpers -------------------------------------------------------------
+
+    def _full_response(
+        self,
+        info: BatchInfo,
+        body: Dict[str, Any],
+        generated_text: str,
+        input_tokens: Optional[int],
+        output_tokens: Optional[int],
+        **fields,
+    ) -> LLMFullResponse:
+        model = body.get("model") or ""
+        cost = estimate_cost(model, input_tokens or 0, output_tokens or 0) if model else None
+        elapsed = (
+            info.ended_at - info.created_at
+            if info.ended_at is not None and info.created_at is not None else 0.0
+        )
+        return LLMFullResponse(
+            generated_text=generated_text,
+            model=model,
+            model_name=model,
+            provider=self.llm_provider,
+            process_time=elapsed,
+            input_token_count=input_tokens,
+            output_token_count=output_tokens,
+            llm_provider_response=body,
+            cost=cost * BATCH_PRICE_FACTOR if cost is not None else None,
+            **fields,
+        )
+
+    @staticmethod
+    def _settings(request: BatchRequest, llm_instance) -> Tuple[str, float, float]:
+        model_name = request.model_name or llm_instance.model_name
+        temperature = request.temperature if request.temperature is not None else llm_instance.temperature
+        top_p = request.top_p if request.top_p is not None else llm_instance.top_p
+        return model_name, temperature, top_p
+
+    @staticmethod
+    def _check_input(request: BatchRequest) -> None:
+        if request.prompt and request.messages:
+            raise ValueError(f"Request {request.custom_id}: only one of 'prompt' or 'messages' should be provided.")
+        if not request.prompt and not request.messages:
+            raise ValueError(f"Request {request.custom_id}: either 'prompt' or 'messages' must be provided.")
+
+
+class OpenAIBatchProvider(BatchProvider):
+    """
+    OpenAI Batch API for chat completions.
+
+    Args:
+        api_key: OpenAI API key (falls back to OPENAI_API_KEY)
+        base_url: API base URL (falls back to OPENAI_BASE_URL, then
+            https://api.openai.com/v1)
+        timeout: HTTP timeout in seconds
+        completion_window: Time the provider has to finish the batch
+
+    Raises:
+        ValueError: If no API key is available
+    """
+
+    name = "openai"
+    llm_provider = LLMProvider.OPENAI
+    MAX_REQUESTS_PER_BATCH = 50_000
+    MAX_BYTES_PER_BATCH = 200 * 1024 * 1024
+
+    _STATUSES = {
+        "validating": BatchStatus.VALIDATING,
+        "in_progress": BatchStatus.IN_PROGRESS,
+        "finalizing": BatchStatus.FINALIZING,
+        "cancelling": BatchStatus.CANCELLING,
+        "completed": BatchStatus.COMPLETED,
+        "failed": BatchStatus.FAILED,
+        "expired": BatchStatus.EXPIRED,
+        "cancelled": BatchStatus.CANCELLED,
+    }
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: float = 300.0,
+        completion_window: str = "24h",
+    ):
+        api_key = api_key or os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY not found. Set it in environment or pass api_key parameter.")
+        super().__init__(
+            api_key,
+            base_url or os.getenv("OPENAI_BASE_URL") or "https://api.openai.com/v1",
+            timeout,
+        )
+        self.completion_window = completion_window
+
+    def _headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.api_key}"}
+
+    def build_line(self, request: BatchRequest, llm_instance) -> Dict[str, Any]:
+        self._check_input(request)
+        model_name, temperature, top_p = self._settings(request, llm_instance)
+        caps = openai_llm.detect_model_capabilities(model_name)
+
+        messages = [{"role": "system", "content": request.system_prompt}]
+        if request.prompt:
+            messages.append({"role": "user", "content": request.prompt})
+        else:
+            messages.extend(request.messages)
+
+        body = openai_llm._build_api_params(
+            model_name=model_name,
+            messages=openai_llm._process_messages_for_model(messages, caps),
+            temperature=temperature,
+            max_tokens=request.max_tokens,
+            top_p=top_p,
+            json_mode=request.json_mode,
+            reasoning_effort=request.reasoning_effort,
+            caps=caps,
+        )
+        return {
+            "custom_id": request.custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": body,
+        }
+
+    def _info(self, batch: Dict[str, Any]) -> BatchInfo:
+        counts = batch.get("request_counts") or {}
+        errors = [
+            f"line {e.get('line')}: {e.get('message')}" if e.get("line") is not None else str(e.get("message"))
+            for e in ((batch.get("errors") or {}).get("data") or [])
+        ]
+        status = self._STATUSES.get(batch.get("status"), BatchStatus.IN_PROGRESS)
+        ended_at = (
+            batch.get("completed_at") or batch.get("failed_at")
+            or batch.get("expired_at") or batch.get("cancelled_at")
+        )
+        return BatchInfo(
+            batch_id=batch["id"],
+            provider=self.name,
+            status=status,
+            total=counts.get("total") or 0,
+            succeeded=counts.get("completed") or 0,
+            failed=counts.get("failed") or 0,
+            created_at=_parse_time(batch.get("created_at")),
+            ended_at=_parse_time(ended_at),
+            output_locations=[f for f in (batch.get("output_file_id"), batch.get("error_file_id")) if f],
+            errors=errors,
+            raw=batch,
+        )
+
+    def submit(self, input_path: str, metadata: Optional[Dict[str, str]] = None) -> BatchInfo:
+        handles = []
+
+        def upload():
+            for handle in handles:
+                handle.close()
+            handle = open(input_path, "rb")
+            handles.append(handle)
+            return {"files": {"file": (os.path.basename(input_path), handle, "application/jsonl")}}
+
+        try:
+            uploaded = self._request("POST", f"{self.base_url}/files", build=upload, data={"purpose": "batch"})
+        finally:
+            for handle in handles:
+                handle.close()
+
+        payload = {
+            "input_file_id": uploaded["id"],
+            "endpoint": "/v1/chat/completions",
+            "completion_window": self.completion_window,
+        }
+        if metadata:
+            payload["metadata"] = {str(k): str(v) for k, v in metadata.items()}
+        return self._info(self._request("POST", f"{self.base_url}/batches", json=payload))
+
+    def find_batch(self, metadata: Dict[str, str], since: float, count: int) -> Optional[BatchInfo]:
+        # Batches are listed newest first; match on the metadata we attached
+        wanted = {str(k): str(v) for k, v in metadata.items()}
+        params: Dict[str, Any] = {"limit": 100}
+        while True:
+            page = self._request("GET", f"{self.base_url}/batches", params=params)
+            for batch in page.get("data") or []:
+                if (batch.get("created_at") or 0) < since - _CLOCK_SKEW:
+                    return None
+                if (batch.get("metadata") or {}) == wanted:
+                    return self._info(batch)
+            if not page.get("has_more") or not page.get("data"):
+                return None
+            params["after"] = page["data"][-1]["id"]
+
+    def retrieve(self, batch_id: str) -> BatchInfo:
+        return self._info(self._request("GET", f"{self.base_url}/batches/{batch_id}"))
+
+    def cancel(self, batch_id: str) -> BatchInfo:
+        return self._info(self._request("POST", f"{self.base_url}/batches/{batch_id}/cancel"))
+
+    def iter_result_lines(self, info: BatchInfo, skip: int = 0) -> Iterator[Dict[str, Any]]:
+        # Successful requests are in the output file, failed ones in the
+        # error file; read them in that order
+        urls = [f"{self.base_url}/files/{file_id}/content" for file_id in info.output_locations]
+        return self._iter_jsonl(urls, skip)
+
+    def parse_result(self, line, info):
+        custom_id = line.get("custom_id")
+        response = line.get("response") or {}
+        body = response.get("body") or {}
+
+        if line.get("error") or response.get("status_code", 200) >= 400 or not body.get("choices"):
+            return custom_id, None, _error_message(line.get("error") or body or "Empty response")
+
+        choice = body["choices"][0]
+        usage = body.get("usage") or {}
+        details = usage.get("completion_tokens_details") or {}
+        model = body.get("model") or ""
+        return custom_id, self._full_response(
+            info,
+            body,
+            generated_text=(choice.get("message") or {}).get("content") or "",
+            input_tokens=usage.get("prompt_tokens"),
+            output_tokens=usage.get("completion_tokens"),
+            reasoning_tokens=details.get("reasoning_tokens"),
+            finish_reason=choice.get("finish_reason"),
+            is_reasoning_model=openai_llm.detect_model_capabilities(model).is_reasoning_model,
+        ), None
+
+
+class AnthropicBatchProvider(BatchProvider):
+    """
+    Anthropic Message Batches API.
+
+    Args:
+        api_key: Anthropic API key (falls back to ANTHROPIC_API_KEY)
+        base_url: API base URL (falls back to ANTHROPIC_BASE_URL, then
+            https://api.anthropic.com)
+        timeout: HTTP timeout in seconds
+
+    Raises:
+        ValueError: If no API key is available
+    """
+
+    name = "anthropic"
+    llm_provider = LLMProvider.ANTHROPIC
+    MAX_REQUESTS_PER_BATCH = 100_000
+    MAX_BYTES_PER_BATCH = 256 * 1024 * 1024
+    API_VERSION = "2023-06-01"
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: float = 300.0,
+    ):
+        api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
+        if not api_key:
+            raise ValueError("ANTHROPIC_API_KEY not found. Set it in environment or pass api_key parameter.")
+        super().__init__(
+            api_key,
+            base_url or os.getenv("ANTHROPIC_BASE_URL") or "https://api.anthropic.com",
+            timeout,
+        )
+
+    def _headers(self) -> Dict[str, str]:
+        return {"x-api-key": self.api_key, "anthropic-version": self.API_VERSION}
+
+    def build_line(self, request: BatchRequest, llm_instance) -> Dict[str, Any]:
+        self._check_input(request)
+        model_name, temperature, top_p = self._settings(request, llm_instance)
+        if request.thinking_budget is not None:
+            if request.thinking_budget < 1024:
+                raise ValueError(f"Request {request.custom_id}: thinking_budget must be at least 1024 tokens")
+            if request.thinking_budget >= request.max_tokens:
+                raise ValueError(f"Request {request.custom_id}: thinking_budget must be less than max_tokens")
+
+        messages = (
+            [{"role": "user", "content": request.prompt}] if request.prompt else list(request.messages)
+        )
+        params = anthropic_llm._build_api_params(
+            model_name=model_name,
+            messages=messages,
+            system=request.system_prompt,
+            max_tokens=request.max_tokens,
+            temperature=temperature,
+            top_p=top_p,
+            thinking_budget=request.thinking_budget,
+            extra_headers={},
+        )
+        return {"custom_id": request.custom_id, "params": params}
+
+    def _info(self, batch: Dict[str, Any]) -> BatchInfo:
+        counts = batch.get("request_counts") or {}
+        processing = batch.get("processing_status")
+        failed = (counts.get("errored") or 0) + (counts.get("canceled") or 0) + (counts.get("expired") or 0)
+        succeeded = counts.get("succeeded") or 0
+
+        if processing == "ended":
+            if batch.get("cancel_initiated_at"):
+                status = BatchStatus.CANCELLED
+            elif counts.get("expired") and not succeeded and not counts.get("errored"):
+                status = BatchStatus.EXPIRED
+            else:
+                status = BatchStatus.COMPLETED
+        elif processing == "canceling":
+            status = BatchStatus.CANCELLING
+        else:
+            status = BatchStatus.IN_PROGRESS
+
+        return BatchInfo(
+            batch_id=batch["id"],
+            provider=self.name,
+            status=status,
+            total=(counts.get("processing") or 0) + succeeded + failed,
+            succeeded=succeeded,
+            failed=failed,
+            created_at=_parse_time(batch.get("created_at")),
+            ended_at=_parse_time(batch.get("ended_at")),
+            output_locations=[batch["results_url"]] if batch.get("results_url") else [],
+            raw=batch,
+        )
+
+    def submit(self, input_path: str, metadata: Optional[Dict[str, str]] = None) -> BatchInfo:
+        # The input file already holds one request object per line; wrap
+        # them into {"requests": [...]} while streaming the upload. The
+        # length is computed up front so the body is not sent chunked.
+        def lines():
+            with open(input_path, "rb") as handle:
+                for line in handle:
+                    line = line.strip()
+                    if line:
+                        yield line
+
+        sizes = [len(line) for line in lines()]
+        length = len(b'{"requests":[]}') + sum(sizes) + max(len(sizes) - 1, 0)
+
+        def body():
+            def chunks():
+                yield b'{"requests":['
+                for n, line in enumerate(lines()):
+                    yield b"," + line if n else line
+                yield b"]}"
+            return {"content": chunks()}
+
+        return self._info(self._request(
+            "POST",
+            f"{self.base_url}/v1/messages/batches",
+            build=body,
+            headers={"content-type": "application/json", "content-length": str(length)},
+        ))
+
+    def find_batch(self, metadata: Dict[str, str], since: float, count: int) -> Optional[BatchInfo]:
+        # Message batches carry no metadata: accept the batch only if it is
+        # the single one with this many requests created since the submit
+        # started
+        candidates = []
+        params: Dict[str, Any] = {"limit": 100}
+        while True:
+            page = self._request("GET", f"{self.base_url}/v1/messages/batches", params=params)
+            for batch in page.get("data") or []:
+                if (_parse_time(batch.get("created_at")) or 0) < since - _CLOCK_SKEW:
+                    return candidates[0] if len(candidates) == 1 else None
+                info = self._info(batch)
+                if info.total == count:
+                    candidates.append(info)
+            if not page.get("has_more") or not page.get("data"):
+                return candidates[0] if len(candidates) == 1 else None
+            params["after_id"] = page.get("last_id") or page["data"][-1]["id"]
+
+    def retrieve(self, batch_id: str) -> BatchInfo:
+        return self._info(self._request("GET", f"{self.base_url}/v1/messages/batches/{batch_id}"))
+
+    def cancel(self, batch_id: str) -> BatchInfo:
+        return self._info(self._request("POST", f"{self.base_url}/v1/messages/batches/{batch_id}/cancel"))
+
+    def iter_result_lines(self, info: BatchInfo, skip: int = 0) -> Iterator[Dict[str, Any]]:
+        return self._iter_jsonl(info.output_locations, skip)
+
+    def parse_result(self, line, info):
+        custom_id = line.get("custom_id")
+        result = line.get("result") or {}
+        result_type = result.get("type")
+
+        if result_type != "succeeded":
+            if result_type == "errored":
+                return custom_id, None, _error_message(result.get("error"))
+            return custom_id, None, f"Request {result_type or 'failed'}"
+
+        message = result.get("message") or {}
+        generated_text, thinking_content = anthropic_llm._extract_response_content(_Message(message))
+        usage = message.get("usage") or {}
+        return custom_id, self._full_response(
+            info,
+            message,
+            generated_text=generated_text,
+            input_tokens=usage.get("input_tokens"),
+            output_tokens=usage.get("output_tokens"),
+            thinking_content=thinking_content,
+            finish_reason=message.get("stop_reason"),
+            is_reasoning_model=thinking_content is not None,
+        ), None
+
+
+class _Message:
+    """Attribute view of a message dict, for anthropic_llm._extract_response_content()."""
+
+    def __init__(self, message: Dict[str, Any]):
+        self.content = [_Block(block) for block in message.get("content") or []]
+
+
+class _Block:
+    def __init__(self, block: Dict[str, Any]):
+        self.type = block.get("type")
+        self.text = block.get("text", "")
+        self.thinking = block.get("thinking", "")
+
+
+def create_batch_provider(llm_instance, **kwargs) -> BatchProvider:
+    """
+    Create the batch provider for an LLM wrapper.
+
+    Args:
+        llm_instance: OpenAI or Anthropic LLM wrapper
+        **kwargs: Extra arguments for the provider (base_url, timeout, ...)
+
+    Returns:
+        OpenAIBatchProvider or AnthropicBatchProvider
+
+    Raises:
+        ValueError: If the LLM's provider has no supported batch API
+    """
+    provider = getattr(llm_instance, "provider", None)
+    api_key = kwargs.pop("api_key", None) or getattr(llm_instance, "api_key", None)
+    if provider == LLMProvider.OPENAI:
+        return OpenAIBatchProvider(api_key=api_key, **kwargs)
+    if provider == LLMProvider.ANTHROPIC:
+        return AnthropicBatchProvider(api_key=api_key, **kwargs)
+    raise ValueError(
+        f"Batch jobs support OpenAI and Anthropic LLMs, got {getattr(provider, 'name', provider)}"
+    )
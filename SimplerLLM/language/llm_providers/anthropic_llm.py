@@ -16,12 +16,10 @@ from dataclasses import dataclass
 import os
 import re
 import time
-from dotenv import load_dotenv
 from anthropic import Anthropic, AsyncAnthropic, RateLimitError, APIError
 from .llm_response_models import LLMFullResponse
+from SimplerLLM.instrumentation.core import record_usage, record_retry
 
-# Load environment variables
-load_dotenv(override=True)
 
 # Constants
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", 3))
@@ -263,6 +261,7 @@ def generate_response(
         except RateLimitError as e:
             last_error = e
             if attempt < MAX_RETRIES - 1:
+                record_retry()
                 time.sleep(RETRY_DELAY * (2 ** attempt))
             else:
                 raise
@@ -271,6 +270,7 @@ def generate_response(
             # Retry on server errors (5xx)
             if hasattr(e, 'status_code') and e.status_code >= 500:
                 if attempt < MAX_RETRIES - 1:
+                    record_retry()
                     time.sleep(RETRY_DELAY * (2 ** attempt))
                 else:
                     raise
@@ -283,6 +283,7 @@ def generate_response(
     # Extract content
     generated_text, thinking_content = _extract_response_content(response)
 
+    record_usage(response.usage.input_tokens, response.usage.output_tokens)
     if full_response:
         return LLMFullResponse(
             generated_text=generated_text,
@@ -397,6 +398,7 @@ async def generate_response_async(
         except RateLimitError as e:
             last_error = e
             if attempt < MAX_RETRIES - 1:
+                record_retry()
                 await asyncio.sleep(RETRY_DELAY * (2 ** attempt))
             else:
                 raise
@@ -405,6 +407,7 @@ async def generate_response_async(
             # Retry on server errors (5xx)
             if hasattr(e, 'status_code') and e.status_code >= 500:
                 if attempt < MAX_RETRIES - 1:
+                    record_retry()
                     await asyncio.sleep(RETRY_DELAY * (2 ** attempt))
                 else:
                     raise
@@ -417,6 +420,7 @@ async def generate_response_async(
     # Extract content
     generated_text, thinking_content = _extract_response_content(response)
 
+    record_usage(response.usage.input_tokens, response.usage.output_tokens)
     if full_response:
         return LLMFullResponse(
             generated_text=generated_text,
@@ -503,6 +507,7 @@ def generate_response_with_web_search(
         except RateLimitError as e:
             last_error = e
             if attempt < MAX_RETRIES - 1:
+                record_retry()
                 time.sleep(RETRY_DELAY * (2 ** attempt))
             else:
                 raise
@@ -510,6 +515,7 @@ def generate_response_with_web_search(
             last_error = e
             if hasattr(e, 'status_code') and e.status_code >= 500:
                 if attempt < MAX_RETRIES - 1:
+                    record_retry()
                     time.sleep(RETRY_DELAY * (2 ** attempt))
                 else:
                     raise
@@ -536,6 +542,7 @@ def generate_response_with_web_search(
                             "cited_text": getattr(citation, 'cited_text', ''),
                         })
 
+    record_usage(response.usage.input_tokens, response.usage.output_tokens)
     if full_response:
         return LLMFullResponse(
             generated_text=generated_text,
@@ -619,6 +626,7 @@ async def generate_response_with_web_search_async(
         except RateLimitError as e:
             last_error = e
             if attempt < MAX_RETRIES - 1:
+                record_retry()
                 await asyncio.sleep(RETRY_DELAY * (2 ** attempt))
             else:
                 raise
@@ -626,6 +634,7 @@ async def generate_response_with_web_search_async(
             last_error = e
             if hasattr(e, 'status_code') and e.status_code >= 500:
                 if attempt < MAX_RETRIES - 1:
+                    record_retry()
                     await asyncio.sleep(RETRY_DELAY * (2 ** attempt))
                 else:
                     raise
@@ -652,6 +661,7 @@ async def generate_response_with_web_search_async(
                             "cited_text": getattr(citation, 'cited_text', ''),
                         })
 
+    record_usage(response.usage.input_tokens, response.usage.output_tokens)
     if full_response:
         return LLMFullResponse(
             generated_text=generated_text,
@@ -45,19 +45,18 @@ Example:
 
 from typing import Optional, Dict, Any, List, Union
 from dataclasses import dataclass
-from dotenv import load_dotenv
 import asyncio
 import logging
 import os
 import time
 
 from .llm_response_models import LLMFullResponse, LLMEmbeddingsResponse
+from .embedding_arrays import to_embedding_array, select_embedding_output
+from SimplerLLM.instrumentation.core import record_usage, record_retry
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
-# Load environment variables
-load_dotenv(override=True)
 
 # Configuration constants
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", 3))
@@ -441,6 +440,7 @@ def generate_response(
             input_tokens, output_tokens = _extract_token_usage(response)
             finish_reason = _extract_finish_reason(response)
 
+            record_usage(input_tokens, output_tokens)
             if full_response:
                 return LLMFullResponse(
                     generated_text=generated_text,
@@ -461,6 +461,7 @@ def generate_response(
                     wait_time = RETRY_DELAY * (2 ** attempt)
                     if DEBUG_COHERE:
                         logger.warning(f"Rate limited, waiting {wait_time}s before retry...")
+                    record_retry()
                     time.sleep(wait_time)
                 else:
                     raise Exception(f"Rate limit exceeded after {MAX_RETRIES} attempts: {e}")
@@ -473,6 +474,7 @@ def generate_response(
                 wait_time = RETRY_DELAY * (2 ** attempt)
                 if DEBUG_COHERE:
                     logger.warning(f"Error: {e}, retrying in {wait_time}s...")
+                record_retry()
                 time.sleep(wait_time)
             else:
                 raise Exception(f"Failed after {MAX_RETRIES} attempts: {e}")
@@ -556,6 +558,7 @@ async def generate_response_async(
             input_tokens, output_tokens = _extract_token_usage(response)
             finish_reason = _extract_finish_reason(response)
 
+            record_usage(input_tokens, output_tokens)
             if full_response:
                 return LLMFullResponse(
                     generated_text=generated_text,
@@ -573,6 +576,7 @@ async def generate_response_async(
             if hasattr(e, 'status_code') and e.status_code == 429:
                 if attempt < MAX_RETRIES - 1:
                     wait_time = RETRY_DELAY * (2 ** attempt)
+                    record_retry()
                     await asyncio.sleep(wait_time)
                 else:
                     raise Exception(f"Rate limit exceeded after {MAX_RETRIES} attempts: {e}")
@@ -581,6 +585,7 @@ async def generate_response_async(
 
         except Exception as e:
             if attempt < MAX_RETRIES - 1:
+                record_retry()
                 await asyncio.sleep(RETRY_DELAY * (2 ** attempt))
             else:
                 raise Exception(f"Failed after {MAX_RETRIES} attempts: {e}")
@@ -598,6 +603,8 @@ def generate_embeddings(
     input_type: str = "search_document",
     embedding_types: Optional[List[str]] = None,
     truncate: str = "END",
+    as_numpy: bool = False,
+    dtype: Any = "float32",
 ) -> any:
     """
     Generate embeddings using Cohere API.
@@ -612,6 +619,8 @@ def generate_embeddings(
             Options: "search_document", "search_query", "classification", "clustering"
         embedding_types (list): List of embedding types to return.
         truncate (str): How to truncate long inputs. Options: "START", "END", "NONE"
+        as_numpy (bool): Return a contiguous NumPy array instead of lists.
+        dtype: NumPy dtype used when as_numpy=True (default: float32).
 
     Returns:
         Embeddings array or LLMEmbeddingsResponse if full_response=True.
@@ -670,7 +679,11 @@ def generate_embeddings(
                 pass  # Already in correct format
 
             # Return single embedding if single input was provided
-            if isinstance(user_input, str) and isinstance(embeddings, list) and len(embeddings) > 0:
+            if as_numpy:
+                embeddings = select_embedding_output(
+                    to_embedding_array(embeddings, dtype), user_input
+                )
+            elif isinstance(user_input, str) and isinstance(embeddings, list) and len(embeddings) > 0:
                 embeddings = embeddings[0]
 
             if full_response:
@@ -684,6 +697,7 @@ def generate_embeddings(
 
         except Exception as e:
             if attempt < MAX_RETRIES - 1:
+                record_retry()
                 time.sleep(RETRY_DELAY * (2 ** attempt))
             else:
                 raise Exception(f"Failed after {MAX_RETRIES} attempts: {e}")
@@ -697,6 +711,8 @@ async def generate_embeddings_async(
     input_type: str = "search_document",
     embedding_types: Optional[List[str]] = None,
     truncate: str = "END",
+    as_numpy: bool = False,
+    dtype: Any = "float32",
 ) -> any:
     """
     Asynchronously generate embeddings using Cohere API.
@@ -754,7 +770,11 @@ async def generate_embeddings_async(
             elif isinstance(embeddings, list):
                 pass
 
-            if isinstance(user_input, str) and isinstance(embeddings, list) and len(embeddings) > 0:
+            if as_numpy:
+                embeddings = select_embedding_output(
+                    to_embedding_array(embeddings, dtype), user_input
+                )
+            elif isinstance(user_input, str) and isinstance(embeddings, list) and len(embeddings) > 0:
                 embeddings = embeddings[0]
 
             if full_response:
@@ -768,6 +788,7 @@ async def generate_embeddings_async(
 
         except Exception as e:
             if attempt < MAX_RETRIES - 1:
+                record_retry()
                 await asyncio.sleep(RETRY_DELAY * (2 ** attempt))
             else:
                 raise Exception(f"Failed after {MAX_RETRIES} attempts: {e}")
@@ -56,7 +56,6 @@ Example:
 """
 
 from openai import AsyncOpenAI, OpenAI, RateLimitError, APIError
-from dotenv import load_dotenv
 from dataclasses import dataclass
 from typing import Optional, Dict, Any, List, Literal, Union
 import asyncio
@@ -64,12 +63,12 @@ import logging
 import os
 import time
 from .llm_response_models import LLMFullResponse, LLMEmbeddingsResponse
+from .embedding_arrays import decode_openai_embeddings, select_embedding_output
+from SimplerLLM.instrumentation.core import record_usage, record_retry
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
-# Load environment variables
-load_dotenv(override=True)
 
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", 3))
 RETRY_DELAY = int(os.getenv("RETRY_DELAY", 2))
@@ -616,6 +615,8 @@ def generate_response(
                 )
 
             # Build and return response
+            if completion.usage:
+                record_usage(completion.usage.prompt_tokens, completion.usage.completion_tokens)
             if full_response:
                 end_time = time.time()
                 process_time = end_time - start_time
@@ -637,6 +638,7 @@ def generate_response(
                 wait_time = RETRY_DELAY * (2 ** attempt)
                 if DEBUG_COMETAPI:
                     logger.warning(f"Rate limited, waiting {wait_time}s before retry...")
+                record_retry()
                 time.sleep(wait_time)
             else:
                 raise
@@ -646,12 +648,14 @@ def generate_response(
                 wait_time = RETRY_DELAY * (2 ** attempt)
                 if DEBUG_COMETAPI:
                     logger.warning(f"API error: {e}, retrying in {wait_time}s...")
+                record_retry()
                 time.sleep(wait_time)
             else:
                 raise
 
         except Exception as e:
             if attempt < MAX_RETRIES - 1:
+                record_retry()
                 time.sleep(RETRY_DELAY * (2 ** attempt))
             else:
                 error_msg = f"Failed after {MAX_RETRIES} attempts due to: {e}"
@@ -789,6 +793,8 @@ async def generate_response_async(
                 )
 
             # Build and return response
+            if completion.usage:
+                record_usage(completion.usage.prompt_tokens, completion.usage.completion_tokens)
             if full_response:
                 end_time = time.time()
                 process_time = end_time - start_time
@@ -810,6 +816,7 @@ async def generate_response_async(
                 wait_time = RETRY_DELAY * (2 ** attempt)
                 if DEBUG_COMETAPI:
                     logger.warning(f"Rate limited, waiting {wait_time}s before retry...")
+                record_retry()
                 await asyncio.sleep(wait_time)
             else:
                 raise
@@ -819,12 +826,14 @@ async def generate_response_async(
                 wait_time = RETRY_DELAY * (2 ** attempt)
                 if DEBUG_COMETAPI:
                     logger.warning(f"API error: {e}, retrying in {wait_time}s...")
+                record_retry()
                 await asyncio.sleep(wait_time)
             else:
                 raise
 
         except Exception as e:
             if attempt < MAX_RETRIES - 1:
+                record_retry()
                 await asyncio.sleep(RETRY_DELAY * (2 ** attempt))
             else:
                 error_msg = f"Failed after {MAX_RETRIES} attempts due to: {e}"
@@ -840,7 +849,9 @@ def generate_embeddings(
     user_input: Optional[Union[str, List[str]]] = None,
     full_response: bool = False,
     api_key: Optional[str] = None,
-) -> Union[List[float], List[List[float]], LLMEmbeddingsResponse]:
+    as_numpy: bool = False,
+    dtype: Any = "float32",
+) -> Union[List[float], List[List[float]], Any, LLMEmbeddingsResponse]:
     """
     Generate embeddings using a CometAPI-available embedding model.
 
@@ -850,10 +861,14 @@ def generate_embeddings(
         full_response: If True, returns LLMEmbeddingsResponse with metadata
         api_key: CometAPI key. Falls back to COMETAPI_API_KEY then
             COMETAPI_KEY env vars.
+        as_numpy: If True, decodes the response into a contiguous NumPy
+            array instead of nested lists
+        dtype: NumPy dtype used when as_numpy=True (default: float32)
 
     Returns:
         List[float]: Single embedding if user_input is a string
         List[List[float]]: List of embeddings if user_input is a list
+        np.ndarray: Contiguous array of the given dtype if as_numpy=True
         LLMEmbeddingsResponse: Full response if full_response=True
 
     Raises:
@@ -871,20 +886,32 @@ def generate_embeddings(
 
     for attempt in range(MAX_RETRIES):
         try:
-            response = cometapi_client.embeddings.create(
-                model=model_name,
-                input=user_input
-            )
+            if as_numpy:
+                response = cometapi_client.embeddings.create(
+                    model=model_name,
+                    input=user_input,
+                    encoding_format="base64",
+                )
+                result_embeddings = select_embedding_output(
+                    decode_openai_embeddings(response.data, dtype), user_input
+                )
+            else:
+                response = cometapi_client.embeddings.create(
+                    model=model_name,
+                    input=user_input
+                )
 
-            # Extract actual embedding vectors from the response
-            embeddings = [item.embedding for item in response.data]
+                # Extract actual embedding vectors from the response
+                embeddings = [item.embedding for item in response.data]
 
-            # For single input, return single embedding; for multiple inputs, return list
-            if isinstance(user_input, str):
-                result_embeddings = embeddings[0] if embeddings else []
-            else:
-                result_embeddings = embeddings
+                # For single input, return single embedding; for multiple inputs, return list
+                if isinstance(user_input, str):
+                    result_embeddings = embeddings[0] if embeddings else []
+                else:
+                    result_embeddings = embeddings
 
+            if response.usage:
+                record_usage(response.usage.prompt_tokens, None)
             if full_response:
                 end_time = time.time()
                 process_time = end_time - start_time
@@ -898,6 +925,7 @@ def generate_embeddings(
 
         except Exception as e:
             if attempt < MAX_RETRIES - 1:
+                record_retry()
                 time.sleep(RETRY_DELAY * (2 ** attempt))
             else:
                 error_msg = f"Failed after {MAX_RETRIES} attempts due to: {e}"
@@ -909,7 +937,9 @@ async def generate_embeddings_async(
     user_input: Optional[Union[str, List[str]]] = None,
     full_response: bool = False,
     api_key: Optional[str] = None,
-) -> Union[List[float], List[List[float]], LLMEmbeddingsResponse]:
+    as_numpy: bool = False,
+    dtype: Any = "float32",
+) -> Union[List[float], List[List[float]], Any, LLMEmbeddingsResponse]:
     """
     Asynchronously generate embeddings using a CometAPI-available embedding model.
 
@@ -919,10 +949,14 @@ async def generate_embeddings_async(
         full_response: If True, returns LLMEmbeddingsResponse with metadata
         api_key: CometAPI key. Falls back to COMETAPI_API_KEY then
             COMETAPI_KEY env vars.
+        as_numpy: If True, decodes the response into a contiguous NumPy
+            array instead of nested lists
+        dtype: NumPy dtype used when as_numpy=True (default: float32)
 
     Returns:
         List[float]: Single embedding if user_input is a string
         List[List[float]]: List of embeddings if user_input is a list
+        np.ndarray: Contiguous array of the given dtype if as_numpy=True
         LLMEmbeddingsResponse: Full response if full_response=True
 
     Raises:
@@ -940,20 +974,32 @@ async def generate_embeddings_async(
 
     for attempt in range(MAX_RETRIES):
         try:
-            response = await async_cometapi_client.embeddings.create(
-                model=model_name,
-                input=user_input
-            )
+            if as_numpy:
+                response = await async_cometapi_client.embeddings.create(
+                    model=model_name,
+                    input=user_input,
+                    encoding_format="base64",
+                )
+                result_embeddings = select_embedding_output(
+                    decode_openai_embeddings(response.data, dtype), user_input
+                )
+            else:
+                response = await async_cometapi_client.embeddings.create(
+                    model=model_name,
+                    input=user_input
+                )
 
-            # Extract actual embedding vectors from the response
-            embeddings = [item.embedding for item in response.data]
+                # Extract actual embedding vectors from the response
+                embeddings = [item.embedding for item in response.data]
 
-            # For single input, return single embedding; for multiple inputs, return list
-            if isinstance(user_input, str):
-                result_embeddings = embeddings[0] if embeddings else []
-            else:
-                result_embeddings = embeddings
+                # For single input, return single embedding; for multiple inputs, return list
+                if isinstance(user_input, str):
+                    result_embeddings = embeddings[0] if embeddings else []
+                else:
+                    result_embeddings = embeddings
 
+            if response.usage:
+                record_usage(response.usage.prompt_tokens, None)
             if full_response:
                 end_time = time.time()
                 process_time = end_time - start_time
@@ -967,6 +1013,7 @@ async def generate_embeddings_async(
 
         except Exception as e:
             if attempt < MAX_RETRIES - 1:
+                record_retry()
                 await asyncio.sleep(RETRY_DELAY * (2 ** attempt))
             else:
                 error_msg = f"Failed after {MAX_RETRIES} attempts due to: {e}"
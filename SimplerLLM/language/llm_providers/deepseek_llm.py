@@ -43,7 +43,6 @@ Example:
     >>> print(f"Reasoning tokens: {response.reasoning_tokens}")
 """
 
-from dotenv import load_dotenv
 from dataclasses import dataclass
 from typing import Optional, Dict, Any, List, Union
 import asyncio
@@ -53,12 +52,11 @@ import time
 import requests
 import aiohttp
 from .llm_response_models import LLMFullResponse
+from SimplerLLM.instrumentation.core import record_usage, record_retry
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
-# Load environment variables
-load_dotenv(override=True)
 
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", 3))
 RETRY_DELAY = int(os.getenv("RETRY_DELAY", 2))
@@ -313,6 +311,7 @@ def generate_response(
             # Extract response data
             extracted = _extract_response_data(result)
 
+            record_usage(extracted["input_tokens"], extracted["output_tokens"])
             if full_response:
                 process_time = time.time() - start_time
                 return LLMFullResponse(
@@ -341,6 +340,7 @@ def generate_response(
                 wait_time = RETRY_DELAY * (2 ** attempt)
                 if DEBUG_DEEPSEEK:
                     logger.warning(f"HTTP error (attempt {attempt + 1}/{MAX_RETRIES}): {e}{error_detail}. Retrying in {wait_time}s...")
+                record_retry()
                 time.sleep(wait_time)
             else:
                 error_msg = f"DeepSeek API error after {MAX_RETRIES} attempts: {e}{error_detail}"
@@ -351,6 +351,7 @@ def generate_response(
                 wait_time = RETRY_DELAY * (2 ** attempt)
                 if DEBUG_DEEPSEEK:
                     logger.warning(f"Error (attempt {attempt + 1}/{MAX_RETRIES}): {e}. Retrying in {wait_time}s...")
+                record_retry()
                 time.sleep(wait_time)
             else:
                 error_msg = f"Failed after {MAX_RETRIES} attempts due to: {e}"
@@ -434,6 +435,7 @@ async def generate_response_async(
                     # Extract response data
                     extracted = _extract_response_data(result, caps)
 
+                    record_usage(extracted["input_tokens"], extracted["output_tokens"])
                     if full_response:
                         process_time = time.time() - start_time
                         return LLMFullResponse(
@@ -455,6 +457,7 @@ async def generate_response_async(
                 wait_time = RETRY_DELAY * (2 ** attempt)
                 if DEBUG_DEEPSEEK:
                     logger.warning(f"HTTP error (attempt {attempt + 1}/{MAX_RETRIES}): {e}. Retrying in {wait_time}s...")
+                record_retry()
                 await asyncio.sleep(wait_time)
             else:
                 error_msg = f"DeepSeek API error after {MAX_RETRIES} attempts: {e}"
@@ -465,6 +468,7 @@ async def generate_response_async(
                 wait_time = RETRY_DELAY * (2 ** attempt)
                 if DEBUG_DEEPSEEK:
                     logger.warning(f"Error (attempt {attempt + 1}/{MAX_RETRIES}): {e}. Retrying in {wait_time}s...")
+                record_retry()
                 await asyncio.sleep(wait_time)
             else:
                 error_msg = f"Failed after {MAX_RETRIES} attempts due to: {e}"
@@ -0,0 +1,96 @@
+"""
+NumPy decoding helpers for embedding provider responses.
+
+Provider SDKs return embeddings as nested Python lists of floats, which cost
+roughly 32 bytes per dimension. These helpers decode responses straight into
+contiguous NumPy arrays instead:
+
+    - decode_openai_embeddings: Decodes OpenAI-compatible response items,
+      including base64 payloads requested with encoding_format="base64"
+    - to_embedding_array: Converts list-of-float embeddings from any provider
+
+Example:
+    >>> response = client.embeddings.create(
+    ...     model="text-embedding-3-small",
+    ...     input=["a", "b"],
+    ...     encoding_format="base64"
+    ... )
+    >>> matrix = decode_openai_embeddings(response.data, dtype=np.float32)
+    >>> matrix.shape
+    (2, 1536)
+"""
+
+import base64
+from typing import Any, List, Sequence
+
+import numpy as np
+
+
+def decode_openai_embeddings(data: Sequence[Any], dtype: Any = np.float32) -> np.ndarray:
+    """
+    Decode OpenAI embedding response items into a 2-D array.
+
+    Items whose embedding is a base64 string are decoded with np.frombuffer
+    (little-endian float32, as returned by the API). Items holding lists of
+    floats are copied directly.
+
+    Args:
+        data: The response.data list of embedding items.
+        dtype: Output dtype (e.g., np.float32 or np.float16).
+
+    Returns:
+        Contiguous array of shape (len(data), dimension).
+    """
+    if not data:
+        return np.empty((0, 0), dtype=dtype)
+
+    first = data[0].embedding
+    dimension = _decoded_length(first)
+    matrix = np.empty((len(data), dimension), dtype=dtype)
+
+    for i, item in enumerate(data):
+        embedding = item.embedding
+        if isinstance(embedding, str):
+            matrix[i] = np.frombuffer(base64.b64decode(embedding), dtype="<f4")
+        else:
+            matrix[i] = embedding
+
+    return matrix
+
+
+def to_embedding_array(embeddings: List[Any], dtype: Any = np.float32) -> np.ndarray:
+    """
+    Convert list-of-float embeddings into a contiguous array.
+
+    Args:
+        embeddings: A list of embedding vectors.
+        dtype: Output dtype.
+
+    Returns:
+        Array of shape (len(embeddings), dimension).
+    """
+    return np.ascontiguousarray(np.asarray(embeddings, dtype=dtype))
+
+
+def select_embedding_output(matrix: np.ndarray, user_input: Any) -> np.ndarray:
+    """
+    Return a single row for string input, or the full matrix for list input.
+
+    Args:
+        matrix: Array of shape (n, dimension).
+        user_input: The original input passed to the provider.
+
+    Returns:
+        1-D array for string input, 2-D array otherwise.
+    """
+    if isinstance(user_input, str):
+        return matrix[0] if len(matrix) else np.empty(0, dtype=matrix.dtype)
+    return matrix
+
+
+def _decoded_length(embedding: Any) -> int:
+    """Get the dimension of a single embedding payload."""
+    if isinstance(embedding, str):
+        padding = embedding[-2:].count("=")
+        return (len(embedding) * 3 // 4 - padding) // 4
+    return len(embedding)
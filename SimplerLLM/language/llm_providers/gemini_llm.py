@@ -41,14 +41,12 @@ import json
 import logging
 import asyncio
 
-from dotenv import load_dotenv
 import requests
 import aiohttp
 
 from .llm_response_models import LLMFullResponse
+from SimplerLLM.instrumentation.core import record_usage, record_retry
 
-# Load environment variables
-load_dotenv(override=True)
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -59,6 +57,7 @@ logger = logging.getLogger(__name__)
 
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", 3))
 RETRY_DELAY = int(os.getenv("RETRY_DELAY", 2))
+GEMINI_BASE_URL = os.getenv("GEMINI_BASE_URL", "https://generativelanguage.googleapis.com/")
 
 # Model pattern constants for capability detection
 GEMINI_3_PATTERNS = ["gemini-3-pro", "gemini-3-flash"]
@@ -620,7 +619,7 @@ def generate_response(
         payload["cachedContent"] = cache_id
 
     # Build URL
-    url = f"https://generativelanguage.googleapis.com/v1beta/models/{model_name}:generateContent?key={api_key}"
+    url = f"{GEMINI_BASE_URL}v1beta/models/{model_name}:generateContent?key={api_key}"
 
     headers = {"Content-Type": "application/json"}
 
@@ -649,6 +648,7 @@ def generate_response(
             web_sources = _extract_grounding_metadata(response_json) if web_search else None
             input_tokens, output_tokens = _extract_token_usage(response_json)
 
+            record_usage(input_tokens, output_tokens)
             if full_response:
                 return LLMFullResponse(
                     generated_text=generated_text,
@@ -671,6 +671,7 @@ def generate_response(
                 logger.warning(
                     f"HTTP error {e.response.status_code}, retrying in {wait_time}s..."
                 )
+                record_retry()
                 time.sleep(wait_time)
             else:
                 error_detail = ""
@@ -688,6 +689,7 @@ def generate_response(
             if attempt < MAX_RETRIES - 1:
                 wait_time = RETRY_DELAY * (2 ** attempt)
                 logger.warning(f"Request timeout, retrying in {wait_time}s...")
+                record_retry()
                 time.sleep(wait_time)
             else:
                 raise Exception(
@@ -698,6 +700,7 @@ def generate_response(
             if attempt < MAX_RETRIES - 1:
                 wait_time = RETRY_DELAY * (2 ** attempt)
                 logger.warning(f"Error: {e}, retrying in {wait_time}s...")
+                record_retry()
                 time.sleep(wait_time)
             else:
                 raise Exception(f"Failed after {MAX_RETRIES} attempts: {e}")
@@ -836,7 +839,7 @@ async def generate_response_async(
     if prompt_caching and cache_id:
         payload["cachedContent"] = cache_id
 
-    url = f"https://generativelanguage.googleapis.com/v1beta/models/{model_name}:generateContent?key={api_key}"
+    url = f"{GEMINI_BASE_URL}v1beta/models/{model_name}:generateContent?key={api_key}"
 
     headers = {"Content-Type": "application/json"}
 
@@ -864,6 +867,7 @@ async def generate_response_async(
                     web_sources = _extract_grounding_metadata(response_json) if web_search else None
                     input_tokens, output_tokens = _extract_token_usage(response_json)
 
+                    record_usage(input_tokens, output_tokens)
                     if full_response:
                         return LLMFullResponse(
                             generated_text=generated_text,
@@ -884,6 +888,7 @@ async def generate_response_async(
             if attempt < MAX_RETRIES - 1:
                 wait_time = RETRY_DELAY * (2 ** attempt)
                 logger.warning(f"HTTP error {e.status}, retrying in {wait_time}s...")
+                record_retry()
                 await asyncio.sleep(wait_time)
             else:
                 raise Exception(
@@ -894,6 +899,7 @@ async def generate_response_async(
             if attempt < MAX_RETRIES - 1:
                 wait_time = RETRY_DELAY * (2 ** attempt)
                 logger.warning(f"Request timeout, retrying in {wait_time}s...")
+                record_retry()
                 await asyncio.sleep(wait_time)
             else:
                 raise Exception(f"Gemini API timeout after {MAX_RETRIES} attempts")
@@ -902,6 +908,7 @@ async def generate_response_async(
             if attempt < MAX_RETRIES - 1:
                 wait_time = RETRY_DELAY * (2 ** attempt)
                 logger.warning(f"Error: {e}, retrying in {wait_time}s...")
+                record_retry()
                 await asyncio.sleep(wait_time)
             else:
                 raise Exception(f"Failed after {MAX_RETRIES} attempts: {e}")
@@ -17,11 +17,9 @@ from typing import Dict, Optional, List, Any, Union
 import os
 import time
 import asyncio
-from dotenv import load_dotenv
 from .llm_response_models import LLMFullResponse
+from SimplerLLM.instrumentation.core import record_usage
 
-# Load environment variables
-load_dotenv(override=True)
 
 # Configuration from environment
 HF_TIMEOUT = int(os.getenv("HF_TIMEOUT", 300))
@@ -312,6 +310,7 @@ def generate_response(
 
     process_time = time.time() - start_time
 
+    record_usage(input_length, output_length)
     if full_response:
         return LLMFullResponse(
             generated_text=generated_text,
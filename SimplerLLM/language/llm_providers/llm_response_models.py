@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, model_validator
 from typing import Any, Optional, List, Dict
 from datetime import datetime
 
@@ -29,6 +29,8 @@ class LLMFullResponse(BaseModel):
             "content_filter" (content was filtered).
         is_reasoning_model: Whether the response came from a reasoning-capable
             model (o1, o3, GPT-5 series).
+        cost: Estimated cost in USD, filled in from the pricing table in
+            llm_addons.cost_utils when token counts are available.
 
     Example:
         >>> response = llm.generate_response(prompt="Hello", full_response=True)
@@ -70,6 +72,20 @@ class LLMFullResponse(BaseModel):
     extraction_result: Optional[Any] = None
     """Pattern extraction result when using generate_structured_pattern with full_response=True."""
 
+    cost: Optional[float] = None
+    """Estimated cost in USD (None if the model is not in the pricing table)."""
+
+    @model_validator(mode="after")
+    def _fill_cost(self):
+        if self.cost is None and (self.input_token_count or self.output_token_count):
+            from SimplerLLM.language.llm_addons.cost_utils import estimate_cost
+            self.cost = estimate_cost(
+                self.model_name or self.model,
+                self.input_token_count or 0,
+                self.output_token_count or 0,
+            )
+        return self
+
 
 class LLMEmbeddingsResponse(BaseModel):
     generated_embedding: Any
@@ -132,6 +148,9 @@ class PatternExtractionResult(BaseModel):
     extraction_timestamp: datetime
     """When the extraction was performed"""
 
+    extraction_source: str = "llm"
+    """Which path produced the matches: "llm" (model reply) or "local" (source text scan)"""
+
     class Config:
         json_schema_extra = {
             "example": {
@@ -149,6 +168,7 @@ class PatternExtractionResult(BaseModel):
                 "total_matches": 1,
                 "pattern_used": r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}",
                 "original_text": "Contact us at john@example.com for more information.",
-                "extraction_timestamp": "2025-01-15T10:30:00"
+                "extraction_timestamp": "2025-01-15T10:30:00",
+                "extraction_source": "llm"
             }
         }
@@ -59,7 +59,6 @@ Example:
 """
 
 from openai import AsyncOpenAI, OpenAI, RateLimitError, APIError
-from dotenv import load_dotenv
 from dataclasses import dataclass
 from typing import Optional, Dict, Any, List, Union
 import asyncio
@@ -67,12 +66,11 @@ import logging
 import os
 import time
 from .llm_response_models import LLMFullResponse
+from SimplerLLM.instrumentation.core import record_usage, record_retry
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
-# Load environment variables
-load_dotenv(override=True)
 
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", 3))
 RETRY_DELAY = int(os.getenv("RETRY_DELAY", 2))
@@ -450,6 +448,7 @@ def generate_response(
             # Extract response data
             extracted = _extract_response_data(completion, caps)
 
+            record_usage(extracted["input_tokens"], extracted["output_tokens"])
             if full_response:
                 process_time = time.time() - start_time
                 return LLMFullResponse(
@@ -471,6 +470,7 @@ def generate_response(
                 wait_time = RETRY_DELAY * (2 ** attempt)
                 if DEBUG_MOONSHOT:
                     logger.warning(f"Rate limited, waiting {wait_time}s before retry...")
+                record_retry()
                 time.sleep(wait_time)
             else:
                 raise
@@ -480,12 +480,14 @@ def generate_response(
                 wait_time = RETRY_DELAY * (2 ** attempt)
                 if DEBUG_MOONSHOT:
                     logger.warning(f"API error: {e}, retrying in {wait_time}s...")
+                record_retry()
                 time.sleep(wait_time)
             else:
                 raise
 
         except Exception as e:
             if attempt < MAX_RETRIES - 1:
+                record_retry()
                 time.sleep(RETRY_DELAY * (2 ** attempt))
             else:
                 error_msg = f"Failed after {MAX_RETRIES} attempts due to: {e}"
@@ -591,6 +593,7 @@ async def generate_response_async(
             # Extract response data
             extracted = _extract_response_data(completion, caps)
 
+            record_usage(extracted["input_tokens"], extracted["output_tokens"])
             if full_response:
                 process_time = time.time() - start_time
                 return LLMFullResponse(
@@ -612,6 +615,7 @@ async def generate_response_async(
                 wait_time = RETRY_DELAY * (2 ** attempt)
                 if DEBUG_MOONSHOT:
                     logger.warning(f"Rate limited, waiting {wait_time}s before retry...")
+                record_retry()
                 await asyncio.sleep(wait_time)
             else:
                 raise
@@ -621,12 +625,14 @@ async def generate_response_async(
                 wait_time = RETRY_DELAY * (2 ** attempt)
                 if DEBUG_MOONSHOT:
                     logger.warning(f"API error: {e}, retrying in {wait_time}s...")
+                record_retry()
                 await asyncio.sleep(wait_time)
             else:
                 raise
 
         except Exception as e:
             if attempt < MAX_RETRIES - 1:
+                record_retry()
                 await asyncio.sleep(RETRY_DELAY * (2 ** attempt))
             else:
                 error_msg = f"Failed after {MAX_RETRIES} attempts due to: {e}"
@@ -1,6 +1,5 @@
 from typing import Dict, Optional, List, Any
 import os
-from dotenv import load_dotenv
 import aiohttp
 import asyncio
 import time
@@ -8,9 +7,8 @@ import json
 import requests
 from requests.exceptions import ConnectionError, Timeout, RequestException
 from .llm_response_models import LLMFullResponse
+from SimplerLLM.instrumentation.core import record_usage, record_retry
 
-# Load environment variables
-load_dotenv(override=True)
 
 # Configuration from environment
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", 3))
@@ -104,6 +102,7 @@ def generate_response(
 
             response_json = response.json()
 
+            record_usage(response_json.get("prompt_eval_count"), response_json.get("eval_count"))
             if full_response:
                 return LLMFullResponse(
                     generated_text=response_json["message"]["content"],
@@ -125,6 +124,7 @@ def generate_response(
 
         except Timeout:
             if attempt < MAX_RETRIES - 1:
+                record_retry()
                 time.sleep(retry_delay)
                 retry_delay *= 2
             else:
@@ -135,6 +135,7 @@ def generate_response(
 
         except RequestException as e:
             if attempt < MAX_RETRIES - 1:
+                record_retry()
                 time.sleep(retry_delay)
                 retry_delay *= 2
             else:
@@ -145,6 +146,7 @@ def generate_response(
             if "not found" in str(e).lower() or "cannot connect" in str(e).lower():
                 raise
             if attempt < MAX_RETRIES - 1:
+                record_retry()
                 time.sleep(retry_delay)
                 retry_delay *= 2
             else:
@@ -228,6 +230,7 @@ async def generate_response_async(
                         response.raise_for_status()
                         data = await response.json()
 
+                        record_usage(data.get("prompt_eval_count"), data.get("eval_count"))
                         if full_response:
                             return LLMFullResponse(
                                 generated_text=data["message"]["content"],
@@ -242,6 +245,7 @@ async def generate_response_async(
 
                 except asyncio.TimeoutError:
                     if attempt < MAX_RETRIES - 1:
+                        record_retry()
                         await asyncio.sleep(retry_delay)
                         retry_delay *= 2
                     else:
@@ -255,6 +259,7 @@ async def generate_response_async(
                     if "not found" in str(e).lower():
                         raise
                     if attempt < MAX_RETRIES - 1:
+                        record_retry()
                         await asyncio.sleep(retry_delay)
                         retry_delay *= 2
                     else:
@@ -265,6 +270,7 @@ async def generate_response_async(
                     if "not found" in str(e).lower() or "cannot connect" in str(e).lower():
                         raise
                     if attempt < MAX_RETRIES - 1:
+                        record_retry()
                         await asyncio.sleep(retry_delay)
                         retry_delay *= 2
                     else:
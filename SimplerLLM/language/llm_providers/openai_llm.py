@@ -52,7 +52,6 @@ Example:
 """
 
 from openai import AsyncOpenAI, OpenAI, RateLimitError, APIError
-from dotenv import load_dotenv
 from dataclasses import dataclass
 from typing import Optional, Dict, Any, List, Literal, Union
 import asyncio
@@ -60,12 +59,12 @@ import logging
 import os
 import time
 from .llm_response_models import LLMFullResponse, LLMEmbeddingsResponse
+from .embedding_arrays import decode_openai_embeddings, select_embedding_output
+from SimplerLLM.instrumentation.core import record_usage, record_retry
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
-# Load environment variables
-load_dotenv(override=True)
 
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", 3))
 RETRY_DELAY = int(os.getenv("RETRY_DELAY", 2))
@@ -498,6 +497,8 @@ def generate_response(
                 )
 
             # Build and return response
+            if completion.usage:
+                record_usage(completion.usage.prompt_tokens, completion.usage.completion_tokens)
             if full_response:
                 end_time = time.time()
                 process_time = end_time - start_time
@@ -519,6 +520,7 @@ def generate_response(
                 wait_time = RETRY_DELAY * (2 ** attempt)
                 if DEBUG_REASONING:
                     logger.warning(f"Rate limited, waiting {wait_time}s before retry...")
+                record_retry()
                 time.sleep(wait_time)
             else:
                 raise
@@ -528,12 +530,14 @@ def generate_response(
                 wait_time = RETRY_DELAY * (2 ** attempt)
                 if DEBUG_REASONING:
                     logger.warning(f"API error: {e}, retrying in {wait_time}s...")
+                record_retry()
                 time.sleep(wait_time)
             else:
                 raise
 
         except Exception as e:
             if attempt < MAX_RETRIES - 1:
+                record_retry()
                 time.sleep(RETRY_DELAY * (2 ** attempt))
             else:
                 error_msg = f"Failed after {MAX_RETRIES} attempts due to: {e}"
@@ -665,6 +669,8 @@ async def generate_response_async(
                 )
 
             # Build and return response
+            if completion.usage:
+                record_usage(completion.usage.prompt_tokens, completion.usage.completion_tokens)
             if full_response:
                 end_time = time.time()
                 process_time = end_time - start_time
@@ -686,6 +692,7 @@ async def generate_response_async(
                 wait_time = RETRY_DELAY * (2 ** attempt)
                 if DEBUG_REASONING:
                     logger.warning(f"Rate limited, waiting {wait_time}s before retry...")
+                record_retry()
                 await asyncio.sleep(wait_time)
             else:
                 raise
@@ -695,12 +702,14 @@ async def generate_response_async(
                 wait_time = RETRY_DELAY * (2 ** attempt)
                 if DEBUG_REASONING:
                     logger.warning(f"API error: {e}, retrying in {wait_time}s...")
+                record_retry()
                 await asyncio.sleep(wait_time)
             else:
                 raise
 
         except Exception as e:
             if attempt < MAX_RETRIES - 1:
+                record_retry()
                 await asyncio.sleep(RETRY_DELAY * (2 ** attempt))
             else:
                 error_msg = f"Failed after {MAX_RETRIES} attempts due to: {e}"
@@ -764,6 +773,9 @@ def generate_response_with_web_search(
                                             "url": annotation.url if hasattr(annotation, 'url') else "",
                                         })
 
+            usage = getattr(response, 'usage', None)
+            if usage:
+                record_usage(usage.input_tokens, usage.output_tokens)
             if full_response:
                 end_time = time.time()
                 process_time = end_time - start_time
@@ -780,6 +792,7 @@ def generate_response_with_web_search(
 
         except Exception as e:
             if attempt < MAX_RETRIES - 1:
+                record_retry()
                 time.sleep(RETRY_DELAY * (2**attempt))
             else:
                 error_msg = f"Failed after {MAX_RETRIES} attempts due to: {e}"
@@ -843,6 +856,9 @@ async def generate_response_with_web_search_async(
                                             "url": annotation.url if hasattr(annotation, 'url') else "",
                                         })
 
+            usage = getattr(response, 'usage', None)
+            if usage:
+                record_usage(usage.input_tokens, usage.output_tokens)
             if full_response:
                 end_time = time.time()
                 process_time = end_time - start_time
@@ -859,6 +875,7 @@ async def generate_response_with_web_search_async(
 
         except Exception as e:
             if attempt < MAX_RETRIES - 1:
+                record_retry()
                 await asyncio.sleep(RETRY_DELAY * (2**attempt))
             else:
                 error_msg = f"Failed after {MAX_RETRIES} attempts due to: {e}"
@@ -869,9 +886,17 @@ def generate_embeddings(
     model_name,
     user_input=None,
     full_response = False,
-    api_key = None
+    api_key = None,
+    as_numpy = False,
+    dtype = "float32",
 ):
-    
+    """
+    Generate embeddings using OpenAI's embedding API.
+
+    When as_numpy=True, embeddings are requested with encoding_format="base64"
+    and decoded straight into a contiguous NumPy array of the given dtype,
+    skipping the per-float Python objects of the default JSON response.
+    """
     if not user_input:
         raise ValueError("user_input must be provided.")
     
@@ -882,20 +907,32 @@ def generate_embeddings(
     for attempt in range(MAX_RETRIES):
         try:
             
-            response = openai_client.embeddings.create(
-                model= model_name,
-                input=user_input
-            )
-            
-            # Extract actual embedding vectors from the response
-            embeddings = [item.embedding for item in response.data]
-            
-            # For single input, return single embedding; for multiple inputs, return list
-            if isinstance(user_input, str):
-                generate_embeddings = embeddings[0] if embeddings else []
+            if as_numpy:
+                response = openai_client.embeddings.create(
+                    model=model_name,
+                    input=user_input,
+                    encoding_format="base64",
+                )
+                generate_embeddings = select_embedding_output(
+                    decode_openai_embeddings(response.data, dtype), user_input
+                )
             else:
-                generate_embeddings = embeddings
+                response = openai_client.embeddings.create(
+                    model= model_name,
+                    input=user_input
+                )
+
+                # Extract actual embedding vectors from the response
+                embeddings = [item.embedding for item in response.data]
+
+                # For single input, return single embedding; for multiple inputs, return list
+                if isinstance(user_input, str):
+                    generate_embeddings = embeddings[0] if embeddings else []
+                else:
+                    generate_embeddings = embeddings
 
+            if response.usage:
+                record_usage(response.usage.prompt_tokens, None)
             if full_response:
                 end_time = time.time()
                 process_time = end_time - start_time
@@ -909,6 +946,7 @@ def generate_embeddings(
 
         except Exception as e:
             if attempt < MAX_RETRIES - 1:
+                record_retry()
                 time.sleep(RETRY_DELAY * (2**attempt))
             else:
                 error_msg = f"Failed after {MAX_RETRIES} attempts due to: {e}"
@@ -919,7 +957,14 @@ async def generate_embeddings_async(
     user_input=None,
     full_response = False,
     api_key = None,
+    as_numpy = False,
+    dtype = "float32",
 ):
+    """
+    Asynchronously generate embeddings using OpenAI's embedding API.
+
+    See generate_embeddings() for the as_numpy and dtype options.
+    """
     async_openai_client = AsyncOpenAI(api_key=api_key)
     if not user_input:
         raise ValueError("user_input must be provided.")
@@ -927,20 +972,32 @@ async def generate_embeddings_async(
     start_time = time.time() if full_response else None
     for attempt in range(MAX_RETRIES):
         try:
-            result = await async_openai_client.embeddings.create(
-                model=model_name,
-                input=user_input,
-            )
-            
-            # Extract actual embedding vectors from the response
-            embeddings = [item.embedding for item in result.data]
-            
-            # For single input, return single embedding; for multiple inputs, return list
-            if isinstance(user_input, str):
-                generate_embeddings = embeddings[0] if embeddings else []
+            if as_numpy:
+                result = await async_openai_client.embeddings.create(
+                    model=model_name,
+                    input=user_input,
+                    encoding_format="base64",
+                )
+                generate_embeddings = select_embedding_output(
+                    decode_openai_embeddings(result.data, dtype), user_input
+                )
             else:
-                generate_embeddings = embeddings
+                result = await async_openai_client.embeddings.create(
+                    model=model_name,
+                    input=user_input,
+                )
+
+                # Extract actual embedding vectors from the response
+                embeddings = [item.embedding for item in result.data]
+
+                # For single input, return single embedding; for multiple inputs, return list
+                if isinstance(user_input, str):
+                    generate_embeddings = embeddings[0] if embeddings else []
+                else:
+                    generate_embeddings = embeddings
 
+            if result.usage:
+                record_usage(result.usage.prompt_tokens, None)
             if full_response:
                 end_time = time.time()
                 process_time = end_time - start_time
@@ -954,6 +1011,7 @@ async def generate_embeddings_async(
 
         except Exception as e:
             if attempt < MAX_RETRIES - 1:
+                record_retry()
                 await asyncio.sleep(RETRY_DELAY * (2**attempt))
             else:
                 error_msg = f"Failed after {MAX_RETRIES} attempts due to: {e}"
@@ -63,7 +63,6 @@ Example:
 """
 
 from openai import AsyncOpenAI, OpenAI, RateLimitError, APIError
-from dotenv import load_dotenv
 from dataclasses import dataclass
 from typing import Optional, Dict, Any, List, Literal, Union, Tuple
 import asyncio
@@ -71,12 +70,12 @@ import logging
 import os
 import time
 from .llm_response_models import LLMFullResponse, LLMEmbeddingsResponse
+from .embedding_arrays import decode_openai_embeddings, select_embedding_output
+from SimplerLLM.instrumentation.core import record_usage, record_retry
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
-# Load environment variables
-load_dotenv(override=True)
 
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", 3))
 RETRY_DELAY = int(os.getenv("RETRY_DELAY", 2))
@@ -625,6 +624,8 @@ def generate_response(
                 )
 
             # Build and return response
+            if completion.usage:
+                record_usage(completion.usage.prompt_tokens, completion.usage.completion_tokens)
             if full_response:
                 end_time = time.time()
                 process_time = end_time - start_time
@@ -646,6 +647,7 @@ def generate_response(
                 wait_time = RETRY_DELAY * (2 ** attempt)
                 if DEBUG_OPENROUTER:
                     logger.warning(f"Rate limited, waiting {wait_time}s before retry...")
+                record_retry()
                 time.sleep(wait_time)
             else:
                 raise
@@ -655,12 +657,14 @@ def generate_response(
                 wait_time = RETRY_DELAY * (2 ** attempt)
                 if DEBUG_OPENROUTER:
                     logger.warning(f"API error: {e}, retrying in {wait_time}s...")
+                record_retry()
                 time.sleep(wait_time)
             else:
                 raise
 
         except Exception as e:
             if attempt < MAX_RETRIES - 1:
+                record_retry()
                 time.sleep(RETRY_DELAY * (2 ** attempt))
             else:
                 error_msg = f"Failed after {MAX_RETRIES} attempts due to: {e}"
@@ -815,6 +819,8 @@ async def generate_response_async(
                 )
 
             # Build and return response
+            if completion.usage:
+                record_usage(completion.usage.prompt_tokens, completion.usage.completion_tokens)
             if full_response:
                 end_time = time.time()
                 process_time = end_time - start_time
@@ -836,6 +842,7 @@ async def generate_response_async(
                 wait_time = RETRY_DELAY * (2 ** attempt)
                 if DEBUG_OPENROUTER:
                     logger.warning(f"Rate limited, waiting {wait_time}s before retry...")
+                record_retry()
                 await asyncio.sleep(wait_time)
             else:
                 raise
@@ -845,12 +852,14 @@ async def generate_response_async(
                 wait_time = RETRY_DELAY * (2 ** attempt)
                 if DEBUG_OPENROUTER:
                     logger.warning(f"API error: {e}, retrying in {wait_time}s...")
+                record_retry()
                 await asyncio.sleep(wait_time)
             else:
                 raise
 
         except Exception as e:
             if attempt < MAX_RETRIES - 1:
+                record_retry()
                 await asyncio.sleep(RETRY_DELAY * (2 ** attempt))
             else:
                 error_msg = f"Failed after {MAX_RETRIES} attempts due to: {e}"
@@ -866,7 +875,9 @@ def generate_embeddings(
     user_input: Optional[Union[str, List[str]]] = None,
     full_response: bool = False,
     api_key: Optional[str] = None,
-) -> Union[List[float], List[List[float]], LLMEmbeddingsResponse]:
+    as_numpy: bool = False,
+    dtype: Any = "float32",
+) -> Union[List[float], List[List[float]], Any, LLMEmbeddingsResponse]:
     """
     Generate embeddings using an OpenRouter-available embedding model.
 
@@ -875,10 +886,14 @@ def generate_embeddings(
         user_input: Text or list of texts to embed
         full_response: If True, returns LLMEmbeddingsResponse with metadata
         api_key: OpenRouter API key. Falls back to OPENROUTER_API_KEY env var.
+        as_numpy: If True, decodes the response into a contiguous NumPy
+            array instead of nested lists
+        dtype: NumPy dtype used when as_numpy=True (default: float32)
 
     Returns:
         List[float]: Single embedding if user_input is a string
         List[List[float]]: List of embeddings if user_input is a list
+        np.ndarray: Contiguous array of the given dtype if as_numpy=True
         LLMEmbeddingsResponse: Full response if full_response=True
 
     Raises:
@@ -896,20 +911,32 @@ def generate_embeddings(
 
     for attempt in range(MAX_RETRIES):
         try:
-            response = openrouter_client.embeddings.create(
-                model=model_name,
-                input=user_input
-            )
+            if as_numpy:
+                response = openrouter_client.embeddings.create(
+                    model=model_name,
+                    input=user_input,
+                    encoding_format="base64",
+                )
+                result_embeddings = select_embedding_output(
+                    decode_openai_embeddings(response.data, dtype), user_input
+                )
+            else:
+                response = openrouter_client.embeddings.create(
+                    model=model_name,
+                    input=user_input
+                )
 
-            # Extract actual embedding vectors from the response
-            embeddings = [item.embedding for item in response.data]
+                # Extract actual embedding vectors from the response
+                embeddings = [item.embedding for item in response.data]
 
-            # For single input, return single embedding; for multiple inputs, return list
-            if isinstance(user_input, str):
-                result_embeddings = embeddings[0] if embeddings else []
-            else:
-                result_embeddings = embeddings
+                # For single input, return single embedding; for multiple inputs, return list
+                if isinstance(user_input, str):
+                    result_embeddings = embeddings[0] if embeddings else []
+                else:
+                    result_embeddings = embeddings
 
+            if response.usage:
+                record_usage(response.usage.prompt_tokens, None)
             if full_response:
                 end_time = time.time()
                 process_time = end_time - start_time
@@ -923,6 +950,7 @@ def generate_embeddings(
 
         except Exception as e:
             if attempt < MAX_RETRIES - 1:
+                record_retry()
                 time.sleep(RETRY_DELAY * (2 ** attempt))
             else:
                 error_msg = f"Failed after {MAX_RETRIES} attempts due to: {e}"
@@ -934,7 +962,9 @@ async def generate_embeddings_async(
     user_input: Optional[Union[str, List[str]]] = None,
     full_response: bool = False,
     api_key: Optional[str] = None,
-) -> Union[List[float], List[List[float]], LLMEmbeddingsResponse]:
+    as_numpy: bool = False,
+    dtype: Any = "float32",
+) -> Union[List[float], List[List[float]], Any, LLMEmbeddingsResponse]:
     """
     Asynchronously generate embeddings using an OpenRouter-available embedding model.
 
@@ -943,10 +973,14 @@ async def generate_embeddings_async(
         user_input: Text or list of texts to embed
         full_response: If True, returns LLMEmbeddingsResponse with metadata
         api_key: OpenRouter API key. Falls back to OPENROUTER_API_KEY env var.
+        as_numpy: If True, decodes the response into a contiguous NumPy
+            array instead of nested lists
+        dtype: NumPy dtype used when as_numpy=True (default: float32)
 
     Returns:
         List[float]: Single embedding if user_input is a string
         List[List[float]]: List of embeddings if user_input is a list
+        np.ndarray: Contiguous array of the given dtype if as_numpy=True
         LLMEmbeddingsResponse: Full response if full_response=True
 
     Raises:
@@ -964,20 +998,32 @@ async def generate_embeddings_async(
 
     for attempt in range(MAX_RETRIES):
         try:
-            response = await async_openrouter_client.embeddings.create(
-                model=model_name,
-                input=user_input
-            )
+            if as_numpy:
+                response = await async_openrouter_client.embeddings.create(
+                    model=model_name,
+                    input=user_input,
+                    encoding_format="base64",
+                )
+                result_embeddings = select_embedding_output(
+                    decode_openai_embeddings(response.data, dtype), user_input
+                )
+            else:
+                response = await async_openrouter_client.embeddings.create(
+                    model=model_name,
+                    input=user_input
+                )
 
-            # Extract actual embedding vectors from the response
-            embeddings = [item.embedding for item in response.data]
+                # Extract actual embedding vectors from the response
+                embeddings = [item.embedding for item in response.data]
 
-            # For single input, return single embedding; for multiple inputs, return list
-            if isinstance(user_input, str):
-                result_embeddings = embeddings[0] if embeddings else []
-            else:
-                result_embeddings = embeddings
+                # For single input, return single embedding; for multiple inputs, return list
+                if isinstance(user_input, str):
+                    result_embeddings = embeddings[0] if embeddings else []
+                else:
+                    result_embeddings = embeddings
 
+            if response.usage:
+                record_usage(response.usage.prompt_tokens, None)
             if full_response:
                 end_time = time.time()
                 process_time = end_time - start_time
@@ -991,6 +1037,7 @@ async def generate_embeddings_async(
 
         except Exception as e:
             if attempt < MAX_RETRIES - 1:
+                record_retry()
                 await asyncio.sleep(RETRY_DELAY * (2 ** attempt))
             else:
                 error_msg = f"Failed after {MAX_RETRIES} attempts due to: {e}"
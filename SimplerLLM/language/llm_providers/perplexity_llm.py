@@ -62,14 +62,12 @@ import asyncio
 import logging
 import requests
 import aiohttp
-from dotenv import load_dotenv
 from .llm_response_models import LLMFullResponse
+from SimplerLLM.instrumentation.core import record_usage, record_retry
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
-# Load environment variables
-load_dotenv(override=True)
 
 # Constants
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", 3))
@@ -425,6 +423,7 @@ def generate_response(
             # Extract web sources (citations)
             web_sources = _extract_web_sources(result)
 
+            record_usage(result.get("usage", {}).get("prompt_tokens", 0), result.get("usage", {}).get("completion_tokens", 0))
             if full_response:
                 end_time = time.time()
                 process_time = end_time - start_time
@@ -445,6 +444,7 @@ def generate_response(
             if attempt < MAX_RETRIES - 1:
                 wait_time = RETRY_DELAY * (2 ** attempt)
                 logger.warning(f"HTTP error {e.response.status_code}, retrying in {wait_time}s...")
+                record_retry()
                 time.sleep(wait_time)
             else:
                 error_detail = ""
@@ -461,6 +461,7 @@ def generate_response(
             if attempt < MAX_RETRIES - 1:
                 wait_time = RETRY_DELAY * (2 ** attempt)
                 logger.warning(f"Request timeout, retrying in {wait_time}s...")
+                record_retry()
                 time.sleep(wait_time)
             else:
                 raise Exception(f"Perplexity API timeout after {MAX_RETRIES} attempts")
@@ -469,6 +470,7 @@ def generate_response(
             if attempt < MAX_RETRIES - 1:
                 wait_time = RETRY_DELAY * (2 ** attempt)
                 logger.warning(f"Error: {e}, retrying in {wait_time}s...")
+                record_retry()
                 time.sleep(wait_time)
             else:
                 raise Exception(f"Failed after {MAX_RETRIES} attempts: {e}")
@@ -608,6 +610,7 @@ async def generate_response_async(
                     # Extract web sources (citations)
                     web_sources = _extract_web_sources(result)
 
+                    record_usage(result.get("usage", {}).get("prompt_tokens", 0), result.get("usage", {}).get("completion_tokens", 0))
                     if full_response:
                         end_time = time.time()
                         process_time = end_time - start_time
@@ -628,6 +631,7 @@ async def generate_response_async(
                 if attempt < MAX_RETRIES - 1:
                     wait_time = RETRY_DELAY * (2 ** attempt)
                     logger.warning(f"HTTP error {e.status}, retrying in {wait_time}s...")
+                    record_retry()
                     await asyncio.sleep(wait_time)
                 else:
                     raise Exception(
@@ -638,6 +642,7 @@ async def generate_response_async(
                 if attempt < MAX_RETRIES - 1:
                     wait_time = RETRY_DELAY * (2 ** attempt)
                     logger.warning(f"Request timeout, retrying in {wait_time}s...")
+                    record_retry()
                     await asyncio.sleep(wait_time)
                 else:
                     raise Exception(f"Perplexity API timeout after {MAX_RETRIES} attempts")
@@ -646,6 +651,7 @@ async def generate_response_async(
                 if attempt < MAX_RETRIES - 1:
                     wait_time = RETRY_DELAY * (2 ** attempt)
                     logger.warning(f"Error: {e}, retrying in {wait_time}s...")
+                    record_retry()
                     await asyncio.sleep(wait_time)
                 else:
                     raise Exception(f"Failed after {MAX_RETRIES} attempts: {e}")
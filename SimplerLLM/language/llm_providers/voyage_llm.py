@@ -1,11 +1,10 @@
 import time
 import asyncio
 import os
-from dotenv import load_dotenv
 from .llm_response_models import LLMEmbeddingsResponse
+from .embedding_arrays import to_embedding_array, select_embedding_output
+from SimplerLLM.instrumentation.core import record_retry
 
-# Load environment variables
-load_dotenv(override=True)
 
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", 3))
 RETRY_DELAY = int(os.getenv("RETRY_DELAY", 2))
@@ -26,7 +25,9 @@ def generate_embeddings(
     api_key=None,
     input_type=None,
     output_dimension=None,
-    output_dtype="float"
+    output_dtype="float",
+    as_numpy=False,
+    dtype="float32",
 ):
     """
     Generate embeddings using Voyage AI API.
@@ -39,6 +40,8 @@ def generate_embeddings(
         input_type (str): Optional input type ("query" or "document")
         output_dimension (int): Optional output dimension (256, 512, 1024, 2048)
         output_dtype (str): Output data type ("float", "int8", "uint8", "binary", "ubinary")
+        as_numpy (bool): Return a contiguous NumPy array instead of lists
+        dtype (str): NumPy dtype used when as_numpy=True
     """
     if not VOYAGE_AVAILABLE:
         raise ImportError("voyageai package is not installed. Install it with: pip install voyageai")
@@ -73,7 +76,11 @@ def generate_embeddings(
             embeddings = response.embeddings
             
             # For single input, return single embedding; for multiple inputs, return list
-            if isinstance(user_input, str):
+            if as_numpy:
+                generated_embeddings = select_embedding_output(
+                    to_embedding_array(embeddings, dtype), user_input
+                )
+            elif isinstance(user_input, str):
                 generated_embeddings = embeddings[0] if embeddings else []
             else:
                 generated_embeddings = embeddings
@@ -91,6 +98,7 @@ def generate_embeddings(
             
         except Exception as e:
             if attempt < MAX_RETRIES - 1:
+                record_retry()
                 time.sleep(RETRY_DELAY * (2**attempt))
             else:
                 error_msg = f"Failed after {MAX_RETRIES} attempts due to: {e}"
@@ -104,7 +112,9 @@ async def generate_embeddings_async(
     api_key=None,
     input_type=None,
     output_dimension=None,
-    output_dtype="float"
+    output_dtype="float",
+    as_numpy=False,
+    dtype="float32",
 ):
     """
     Asynchronously generate embeddings using Voyage AI API.
@@ -117,6 +127,8 @@ async def generate_embeddings_async(
         input_type (str): Optional input type ("query" or "document")
         output_dimension (int): Optional output dimension (256, 512, 1024, 2048)
         output_dtype (str): Output data type ("float", "int8", "uint8", "binary", "ubinary")
+        as_numpy (bool): Return a contiguous NumPy array instead of lists
+        dtype (str): NumPy dtype used when as_numpy=True
     """
     if not VOYAGE_AVAILABLE:
         raise ImportError("voyageai package is not installed. Install it with: pip install voyageai")
@@ -155,7 +167,11 @@ async def generate_embeddings_async(
             embeddings = response.embeddings
             
             # For single input, return single embedding; for multiple inputs, return list
-            if isinstance(user_input, str):
+            if as_numpy:
+                generated_embeddings = select_embedding_output(
+                    to_embedding_array(embeddings, dtype), user_input
+                )
+            elif isinstance(user_input, str):
                 generated_embeddings = embeddings[0] if embeddings else []
             else:
                 generated_embeddings = embeddings
@@ -173,6 +189,7 @@ async def generate_embeddings_async(
             
         except Exception as e:
             if attempt < MAX_RETRIES - 1:
+                record_retry()
                 await asyncio.sleep(RETRY_DELAY * (2**attempt))
             else:
                 error_msg = f"Failed after {MAX_RETRIES} attempts due to: {e}"
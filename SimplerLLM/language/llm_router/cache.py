@@ -0,0 +1,201 @@
+"""
+Routing decision cache for the LLM Router.
+
+Decisions are cached per normalized input text within a context (the kind
+of route, its k and metadata scope, and the choice-set version), so any
+change to the choices makes earlier decisions unreachable. Entries are
+evicted least-recently-used beyond max_size and expire after ttl seconds.
+
+With a similarity threshold the cache also works semantically: an input
+whose embedding has a cosine similarity of at least the threshold with a
+cached input reuses that input's decision.
+
+Values are copied on the way in and out, so a caller modifying the
+decision it got back does not change what later callers receive.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import numpy as np
+
+# Returned by lookups that find nothing (None is a valid cached value)
+MISS = object()
+
+
+def normalize_input(text: str) -> str:
+    """Normalize routing input for exact cache lookups"""
+    return " ".join(text.lower().split())
+
+
+class RoutingCache:
+    """
+    Thread-safe LRU cache of routing decisions with optional TTL and
+    semantic lookups.
+
+    :param max_size: Maximum number of cached decisions
+    :param ttl: Seconds before a decision expires (None = never)
+    :param similarity_threshold: Minimum cosine similarity for a semantic hit
+        (None disables semantic lookups)
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: Optional[float] = None,
+        similarity_threshold: Optional[float] = None
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold
+        self._lock = threading.Lock()
+        # (context, text) -> (expires_at, value, unit vector or None)
+        self._entries: "OrderedDict[Tuple[Hashable, str], Tuple[float, Any, Optional[np.ndarray]]]" = OrderedDict()
+        # context -> (keys, stacked unit vectors), rebuilt after changes
+        self._matrices: Dict[Hashable, Tuple[list, np.ndarray]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.semantic_hits = 0
+        self.semantic_misses = 0
+
+    @property
+    def semantic(self) -> bool:
+        """True when semantic lookups are enabled"""
+        return self.similarity_threshold is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _expired(self, expires_at: float, now: float) -> bool:
+        return self.ttl is not None and now >= expires_at
+
+    def _remove(self, key: Tuple[Hashable, str]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None and entry[2] is not None:
+            self._matrices.pop(key[0], None)
+
+    def get(self, context: Hashable, text: str) -> Any:
+        """
+        Look up a decision by exact normalized input.
+
+        :return: A copy of the cached value, or MISS
+        """
+        key = (context, text)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._expired(entry[0], time.monotonic()):
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return MISS
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry[1]
+        return copy.deepcopy(value)
+
+    def get_similar(self, context: Hashable, vector: np.ndarray) -> Any:
+        """
+        Look up the decision of the most similar cached input.
+
+        :param context: Cache context of the route
+        :param vector: Embedding of the new input
+        :return: A copy of the cached value, or MISS
+        """
+        query = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            with self._lock:
+                self.semantic_misses += 1
+            return MISS
+        query = query / norm
+
+        with self._lock:
+            if context not in self._matrices:
+                keys = [key for key, entry in self._entries.items()
+                        if key[0] == context and entry[2] is not None]
+                matrix = (np.stack([self._entries[key][2] for key in keys])
+                          if keys else np.empty((0, len(query)), dtype=np.float32))
+                self._matrices[context] = (keys, matrix)
+            keys, matrix = self._matrices[context]
+
+            value = MISS
+            if len(keys) and matrix.shape[1] == len(query):
+                similarities = matrix @ query
+                now = time.monotonic()
+                # Best non-expired match above the threshold
+                for row in np.argsort(-similarities):
+                    if similarities[row] < self.similarity_threshold:
+                        break
+                    entry = self._entries.get(keys[row])
+                    if entry is None or self._expired(entry[0], now):
+                        continue
+                    self._entries.move_to_end(keys[row])
+                    self.semantic_hits += 1
+                    value = entry[1]
+                    break
+
+            if value is MISS:
+                self.semantic_misses += 1
+                return MISS
+        return copy.deepcopy(value)
+
+    def put(
+        self,
+        context: Hashable,
+        text: str,
+        value: Any,
+        vector: Optional[np.ndarray] = None
+    ) -> None:
+        """
+        Cache a decision.
+
+        :param context: Cache context of the route
+        :param text: Normalized input
+        :param value: Decision to cache
+        :param vector: Optional embedding of the input, for semantic lookups
+        """
+        if vector is not None:
+            vector = np.asarray(vector, dtype=np.float32)
+            norm = np.linalg.norm(vector)
+            vector = vector / norm if norm else None
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else 0.0
+
+        value = copy.deepcopy(value)
+
+        key = (context, text)
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (expires_at, value, vector)
+            if vector is not None:
+                self._matrices.pop(context, None)
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Remove all cached decisions"""
+        with self._lock:
+            self._entries.clear()
+            self._matrices.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hit and miss counts.
+
+        hits and misses count exact lookups; semantic_hits and
+        semantic_misses count the semantic lookups made after an exact miss.
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "semantic_hits": self.semantic_hits,
+                "semantic_misses": self.semantic_misses,
+            }
@@ -0,0 +1,117 @@
+"""
+Embedding index over router choices.
+
+Choice contents are embedded once with an EmbeddingsLLM instance and kept in
+an in-memory SimplerVectors collection. The router uses the index to
+shortlist the most similar choices before calling the LLM, or to route by
+embedding similarity alone.
+
+Embeddings are cached per choice content, so adding, removing or updating
+choices only embeds the new contents; the vector collection itself is
+rebuilt from the cache (a cheap NumPy copy) when the choice set changes.
+"""
+
+import tempfile
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class ChoiceEmbeddingIndex:
+    """
+    Similarity index over the contents of router choices.
+
+    :param embeddings_llm_instance: EmbeddingsLLM instance used for choices and inputs
+    :param max_concurrency: Maximum embedding requests in flight when indexing
+    """
+
+    def __init__(self, embeddings_llm_instance, max_concurrency: int = 4):
+        self.embeddings_llm = embeddings_llm_instance
+        self.max_concurrency = max_concurrency
+        self._vectors: Dict[str, np.ndarray] = {}
+        self._db = None
+        self._version: Optional[int] = None
+
+    def _missing(self, contents: Sequence[str]) -> List[str]:
+        """Contents that have no cached embedding yet, without duplicates"""
+        return list(dict.fromkeys(c for c in contents if c not in self._vectors))
+
+    def _store(self, contents: List[str], vectors: np.ndarray) -> None:
+        for content, vector in zip(contents, np.asarray(vectors, dtype=np.float32)):
+            self._vectors[content] = vector
+
+    def _build(self, contents: Sequence[str], version: int) -> None:
+        # Imported here so the router does not load the vector package
+        # unless an embedding index is used
+        from SimplerLLM.vectors.providers.local_provider import SimplerVectors
+
+        # Nothing is written to disk unless the collection is saved
+        db = SimplerVectors(db_folder=tempfile.gettempdir())
+        if contents:
+            db.add_vectors_array(
+                np.stack([self._vectors[content] for content in contents]),
+                [{"choice_index": i} for i in range(len(contents))],
+                ids=[str(i) for i in range(len(contents))],
+            )
+        self._db = db
+        self._version = version
+        # Drop embeddings of contents that are no longer choices
+        live = set(contents)
+        self._vectors = {c: v for c, v in self._vectors.items() if c in live}
+
+    def sync(self, contents: Sequence[str], version: int) -> None:
+        """
+        Bring the index up to date with the current choices.
+
+        :param contents: Choice contents in index order
+        :param version: Choice-set version; the index is rebuilt when it changes
+        """
+        if self._version == version:
+            return
+        missing = self._missing(contents)
+        if missing:
+            self._store(missing, self.embeddings_llm.embed_many(
+                missing, max_concurrency=self.max_concurrency
+            ))
+        self._build(contents, version)
+
+    async def sync_async(self, contents: Sequence[str], version: int) -> None:
+        """Async version of sync"""
+        if self._version == version:
+            return
+        missing = self._missing(contents)
+        if missing:
+            self._store(missing, await self.embeddings_llm.embed_many_async(
+                missing, max_concurrency=self.max_concurrency
+            ))
+        self._build(contents, version)
+
+    def embed(self, text: str) -> np.ndarray:
+        """Embed a routing input"""
+        return self.embeddings_llm.generate_embeddings(text, as_numpy=True)
+
+    async def embed_async(self, text: str) -> np.ndarray:
+        """Async version of embed"""
+        return await self.embeddings_llm.generate_embeddings_async(text, as_numpy=True)
+
+    def search(
+        self,
+        query_vector: np.ndarray,
+        top_n: int,
+        indices: Optional[Sequence[int]] = None
+    ) -> List[Tuple[int, float]]:
+        """
+        Find the choices most similar to an embedded input.
+
+        :param query_vector: Embedding of the input
+        :param top_n: Number of choices to return
+        :param indices: Optional choice indices to restrict the search to
+        :return: List of (choice_index, cosine_similarity), most similar first
+        """
+        metadata_filter = None
+        if indices is not None:
+            metadata_filter = {"choice_index": {"$in": list(indices)}}
+        results = self._db.top_cosine_similarity(
+            query_vector, top_n=top_n, metadata_filter=metadata_filter
+        )
+        return [(meta["choice_index"], float(score)) for _, meta, score in results]
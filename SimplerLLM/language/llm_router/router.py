@@ -3,9 +3,21 @@ LLM Router - A system for intelligent content routing using LLMs.
 
 This module provides a flexible routing system that uses Large Language Models to select
 the most appropriate choice from a collection based on input prompt.
+
+With an EmbeddingsLLM instance the router keeps an embedding index over the
+choice contents. It can then shortlist the most similar choices before the
+LLM call (prefilter_top_m), or route by embedding similarity alone with no
+LLM call at all (llm_instance=None).
+
+Routing decisions can be cached (cache_size): repeated inputs are answered
+from an LRU cache keyed on the normalized input and the choice-set version,
+and with semantic_cache_threshold, inputs whose embedding is close enough
+to a cached input reuse its decision.
 """
 
-from typing import List, Optional, Dict, Any, Tuple
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Tuple, Sequence, Set, Callable, Awaitable
 from SimplerLLM.language.llm.reliable import ReliableLLM
 from SimplerLLM.language.llm_addons import (
     generate_pydantic_json_model,
@@ -14,6 +26,8 @@ from SimplerLLM.language.llm_addons import (
     generate_pydantic_json_model_reliable_async
 )
 from .models import RouterResponse, RouterMultiResponse, Choice, PromptTemplate
+from .embedding_index import ChoiceEmbeddingIndex
+from .cache import RoutingCache, MISS, normalize_input
 
 class LLMRouter:
     """Main router class for handling choice selection via LLM"""
@@ -22,13 +36,73 @@ class LLMRouter:
         self, 
         llm_instance: Any,
         confidence_threshold: float = 0.5,
-        max_choices_per_batch: int = 100
+        max_choices_per_batch: int = 100,
+        embeddings_llm_instance: Any = None,
+        prefilter_top_m: Optional[int] = None,
+        similarity_threshold: Optional[float] = None,
+        max_concurrency: int = 4,
+        cache_size: int = 0,
+        cache_ttl: Optional[float] = None,
+        semantic_cache_threshold: Optional[float] = None
     ):
+        """
+        :param llm_instance: LLM or ReliableLLM used to pick choices. Pass None
+            (with embeddings_llm_instance) to route by embedding similarity only.
+        :param confidence_threshold: Minimum confidence for a selection
+        :param max_choices_per_batch: Maximum choices sent in one LLM prompt
+        :param embeddings_llm_instance: Optional EmbeddingsLLM instance used to
+            index choice contents
+        :param prefilter_top_m: Number of most similar choices passed to the LLM.
+            Requires embeddings_llm_instance; None sends every choice.
+        :param similarity_threshold: Minimum cosine similarity when routing by
+            embedding only (default: confidence_threshold)
+        :param max_concurrency: Maximum LLM batches in flight
+        :param cache_size: Maximum cached routing decisions (0 disables caching)
+        :param cache_ttl: Seconds before a cached decision expires (None = never)
+        :param semantic_cache_threshold: Minimum cosine similarity for reusing
+            the decision of a similar cached input. Requires cache_size and
+            embeddings_llm_instance.
+        """
+        if llm_instance is None and embeddings_llm_instance is None:
+            raise ValueError("llm_instance or embeddings_llm_instance is required")
+        if prefilter_top_m is not None:
+            if embeddings_llm_instance is None:
+                raise ValueError("prefilter_top_m requires embeddings_llm_instance")
+            if prefilter_top_m < 1:
+                raise ValueError("prefilter_top_m must be >= 1")
+        if semantic_cache_threshold is not None:
+            if embeddings_llm_instance is None:
+                raise ValueError("semantic_cache_threshold requires embeddings_llm_instance")
+            if not cache_size:
+                raise ValueError("semantic_cache_threshold requires cache_size")
+
         self._choices: List[Choice] = []
+        # Cleaned contents of all choices, for O(1) duplicate checks
+        self._contents_set: Set[str] = set()
         self.llm = llm_instance
         self.confidence_threshold = confidence_threshold
         self.max_choices_per_batch = max_choices_per_batch
         self.prompt_template = PromptTemplate()
+        self.prefilter_top_m = prefilter_top_m
+        self.similarity_threshold = (
+            confidence_threshold if similarity_threshold is None else similarity_threshold
+        )
+        self.max_concurrency = max_concurrency
+        self._embedding_index = (
+            ChoiceEmbeddingIndex(embeddings_llm_instance)
+            if embeddings_llm_instance is not None else None
+        )
+        # Incremented on every change to the choice set
+        self._version = 0
+        self._cache = (
+            RoutingCache(cache_size, cache_ttl, semantic_cache_threshold)
+            if cache_size else None
+        )
+
+    @property
+    def embedding_only(self) -> bool:
+        """True when routing uses embedding similarity without an LLM"""
+        return self.llm is None
 
     def add_choices(self, choices: List[Tuple[str, Optional[Dict]]]) -> List[int]:
         """Add multiple choices at once and return their indices"""
@@ -54,45 +128,151 @@ class LLMRouter:
         cleaned_content = Choice._clean_string(content)
         
         # Check for duplicates
-        if any(choice.content == cleaned_content for choice in self._choices):
+        if cleaned_content in self._contents_set:
             raise ValueError("Duplicate choice content")
             
         choice = Choice(content, metadata)
         self._choices.append(choice)
+        self._contents_set.add(cleaned_content)
+        self._version += 1
         return len(self._choices) - 1
 
     def remove_choice(self, index: int) -> None:
         """Remove a choice by index"""
         if 0 <= index < len(self._choices):
-            self._choices.pop(index)
+            self._contents_set.discard(self._choices.pop(index).content)
+            self._version += 1
         else:
             raise IndexError("Choice index out of range")
 
     def remove_all_choices(self) -> None:
         """Remove all choices from the router"""
         self._choices.clear()
+        self._contents_set.clear()
+        self._version += 1
 
     def update_choice(self, index: int, content: str, metadata: Optional[Dict] = None) -> None:
         """Update an existing choice"""
         if 0 <= index < len(self._choices):
             cleaned_content = Choice._clean_string(content)
-            if any(i != index and choice.content == cleaned_content for i, choice in enumerate(self._choices)):
+            old_content = self._choices[index].content
+            if cleaned_content != old_content and cleaned_content in self._contents_set:
                 raise ValueError("Duplicate choice content")
             self._choices[index] = Choice(content, metadata)
+            self._contents_set.discard(old_content)
+            self._contents_set.add(cleaned_content)
+            self._version += 1
         else:
             raise IndexError("Choice index out of range")
 
     def set_prompt_template(self, template: str) -> None:
         """Set custom prompt template"""
         self.prompt_template = PromptTemplate(template)
+        self.clear_cache()
+
+    def clear_cache(self) -> None:
+        """Remove all cached routing decisions"""
+        if self._cache is not None:
+            self._cache.clear()
+
+    def get_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Get routing cache hit and miss counts (None when caching is disabled)"""
+        return self._cache.get_stats() if self._cache is not None else None
+
+    def _cache_context(self, kind: str, scope: Any, k: Optional[int]) -> Tuple:
+        """Everything besides the input that a cached decision depends on"""
+        return (
+            kind, scope, k, self._version, self.confidence_threshold,
+            self.similarity_threshold, self.prefilter_top_m
+        )
+
+    @staticmethod
+    def _scope_key(metadata_filter: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Hashable key for a metadata filter"""
+        if metadata_filter is None:
+            return None
+        return repr(sorted(metadata_filter.items()))
+
+    def _cached(
+        self,
+        context: Tuple,
+        input_text: str,
+        compute: Callable[[Optional[Any]], Any]
+    ) -> Any:
+        """Serve a decision from the cache or compute and cache it"""
+        if self._cache is None:
+            return compute(None)
+
+        text = normalize_input(input_text)
+        result = self._cache.get(context, text)
+        if result is not MISS:
+            return result
+
+        vector = None
+        if self._cache.semantic:
+            # The embedding is reused by the prefilter / embedding routing
+            vector = self._embedding_index.embed(input_text)
+            result = self._cache.get_similar(context, vector)
+            if result is not MISS:
+                return result
+
+        result = compute(vector)
+        # Empty results are not cached: they may come from a failed LLM call
+        if result:
+            self._cache.put(context, text, result, vector)
+        return result
+
+    async def _cached_async(
+        self,
+        context: Tuple,
+        input_text: str,
+        compute: Callable[[Optional[Any]], Awaitable[Any]]
+    ) -> Any:
+        """Async version of _cached"""
+        if self._cache is None:
+            return await compute(None)
+
+        text = normalize_input(input_text)
+        result = self._cache.get(context, text)
+        if result is not MISS:
+            return result
+
+        vector = None
+        if self._cache.semantic:
+            vector = await self._embedding_index.embed_async(input_text)
+            result = self._cache.get_similar(context, vector)
+            if result is not MISS:
+                return result
+
+        result = await compute(vector)
+        if result:
+            self._cache.put(context, text, result, vector)
+        return result
+
+    def build_embedding_index(self) -> None:
+        """Embed any new choice contents now instead of on the next route"""
+        self._require_embeddings()
+        self._embedding_index.sync(self._contents(), self._version)
+
+    async def build_embedding_index_async(self) -> None:
+        """Async version of build_embedding_index"""
+        self._require_embeddings()
+        await self._embedding_index.sync_async(self._contents(), self._version)
+
+    def _require_embeddings(self) -> None:
+        if self._embedding_index is None:
+            raise ValueError("An embeddings_llm_instance is required for embedding routing")
+
+    def _contents(self) -> List[str]:
+        return [choice.content for choice in self._choices]
 
     def _filter_choices_by_metadata(
         self,
         metadata_filter: Dict[str, Any]
-    ) -> List[Choice]:
-        """Filter choices based on metadata criteria"""
+    ) -> List[int]:
+        """Indices of choices matching the metadata criteria"""
         return [
-            choice for choice in self._choices
+            i for i, choice in enumerate(self._choices)
             if all(
                 key in choice.metadata 
                 and choice.metadata[key] == value
@@ -100,11 +280,11 @@ class LLMRouter:
             )
         ]
 
-    def _chunk_choices(self) -> List[List[Choice]]:
-        """Split choices into manageable batches"""
+    def _chunk_indices(self, indices: Sequence[int]) -> List[List[int]]:
+        """Split choice indices into manageable batches"""
         return [
-            self._choices[i:i + self.max_choices_per_batch]
-            for i in range(0, len(self._choices), self.max_choices_per_batch)
+            list(indices[i:i + self.max_choices_per_batch])
+            for i in range(0, len(indices), self.max_choices_per_batch)
         ]
 
     def _format_choices_text(self, choices: List[Choice]) -> str:
@@ -114,6 +294,171 @@ class LLMRouter:
             for i, choice in enumerate(choices)
         ])
 
+    @staticmethod
+    def _to_choice_index(
+        response: Optional[RouterResponse],
+        indices: Sequence[int]
+    ) -> Optional[RouterResponse]:
+        """Map a prompt-local selected_index back to the router's choice index"""
+        if response is None or response.selected_index >= len(indices):
+            return None
+        return RouterResponse(
+            selected_index=indices[response.selected_index],
+            confidence_score=response.confidence_score,
+            reasoning=response.reasoning
+        )
+
+    def _best_response(
+        self,
+        responses: List[Optional[RouterResponse]]
+    ) -> Optional[RouterResponse]:
+        """Most confident response above the threshold, first one on ties"""
+        best_response = None
+        for response in responses:
+            if response and response.confidence_score > self.confidence_threshold:
+                if not best_response or response.confidence_score > best_response.confidence_score:
+                    best_response = response
+        return best_response
+
+    def _confident_responses(
+        self,
+        multi_response: Optional[RouterMultiResponse],
+        indices: Sequence[int]
+    ) -> List[RouterResponse]:
+        """Convert a multi-choice response to RouterResponses above the threshold"""
+        if not multi_response:
+            return []
+        responses = [
+            self._to_choice_index(
+                RouterResponse(
+                    selected_index=choice.selected_index,
+                    confidence_score=choice.confidence_score,
+                    reasoning=choice.reasoning
+                ),
+                indices
+            )
+            for choice in multi_response.choices
+            if choice.confidence_score > self.confidence_threshold
+        ]
+        return [response for response in responses if response]
+
+    def _shortlist(
+        self,
+        input_text: str,
+        indices: List[int],
+        vector: Optional[Any] = None
+    ) -> List[int]:
+        """Keep the prefilter_top_m choices most similar to the input"""
+        if not self.prefilter_top_m or len(indices) <= self.prefilter_top_m:
+            return indices
+        index = self._embedding_index
+        index.sync(self._contents(), self._version)
+        if vector is None:
+            vector = index.embed(input_text)
+        subset = None if len(indices) == len(self._choices) else indices
+        matches = index.search(vector, self.prefilter_top_m, subset)
+        return [choice_index for choice_index, _ in matches]
+
+    async def _shortlist_async(
+        self,
+        input_text: str,
+        indices: List[int],
+        vector: Optional[Any] = None
+    ) -> List[int]:
+        """Async version of _shortlist"""
+        if not self.prefilter_top_m or len(indices) <= self.prefilter_top_m:
+            return indices
+        index = self._embedding_index
+        await index.sync_async(self._contents(), self._version)
+        if vector is None:
+            vector = await index.embed_async(input_text)
+        subset = None if len(indices) == len(self._choices) else indices
+        matches = index.search(vector, self.prefilter_top_m, subset)
+        return [choice_index for choice_index, _ in matches]
+
+    def _embedding_responses(
+        self,
+        matches: List[Tuple[int, float]]
+    ) -> List[RouterResponse]:
+        """Convert similarity matches to RouterResponses above the threshold"""
+        return [
+            RouterResponse(
+                selected_index=choice_index,
+                confidence_score=min(max(score, 0.0), 1.0),
+                reasoning=f"Most similar by embedding (cosine similarity {score:.3f})"
+            )
+            for choice_index, score in matches
+            if score > self.similarity_threshold
+        ]
+
+    def _route_by_embedding(
+        self,
+        input_text: str,
+        k: int,
+        indices: List[int],
+        vector: Optional[Any] = None
+    ) -> List[RouterResponse]:
+        self._require_embeddings()
+        index = self._embedding_index
+        index.sync(self._contents(), self._version)
+        if vector is None:
+            vector = index.embed(input_text)
+        subset = None if len(indices) == len(self._choices) else indices
+        return self._embedding_responses(index.search(vector, k, subset))
+
+    async def _route_by_embedding_async(
+        self,
+        input_text: str,
+        k: int,
+        indices: List[int],
+        vector: Optional[Any] = None
+    ) -> List[RouterResponse]:
+        self._require_embeddings()
+        index = self._embedding_index
+        await index.sync_async(self._contents(), self._version)
+        if vector is None:
+            vector = await index.embed_async(input_text)
+        subset = None if len(indices) == len(self._choices) else indices
+        return self._embedding_responses(index.search(vector, k, subset))
+
+    def route_by_embedding(self, input_text: str) -> Optional[RouterResponse]:
+        """Route by embedding similarity only, without an LLM call"""
+        if not self._choices:
+            raise ValueError("No choices available for routing")
+        responses = self._route_by_embedding(input_text, 1, list(range(len(self._choices))))
+        return responses[0] if responses else None
+
+    async def route_by_embedding_async(self, input_text: str) -> Optional[RouterResponse]:
+        """Async version of route_by_embedding"""
+        if not self._choices:
+            raise ValueError("No choices available for routing")
+        responses = await self._route_by_embedding_async(
+            input_text, 1, list(range(len(self._choices)))
+        )
+        return responses[0] if responses else None
+
+    def route_top_k_by_embedding(self, input_text: str, k: int = 3) -> List[RouterResponse]:
+        """Get the top k matches by embedding similarity, without an LLM call"""
+        if not self._choices:
+            raise ValueError("No choices available for routing")
+        if k < 1:
+            raise ValueError("k must be >= 1")
+        return self._route_by_embedding(input_text, k, list(range(len(self._choices))))
+
+    async def route_top_k_by_embedding_async(
+        self,
+        input_text: str,
+        k: int = 3
+    ) -> List[RouterResponse]:
+        """Async version of route_top_k_by_embedding"""
+        if not self._choices:
+            raise ValueError("No choices available for routing")
+        if k < 1:
+            raise ValueError("k must be >= 1")
+        return await self._route_by_embedding_async(
+            input_text, k, list(range(len(self._choices)))
+        )
+
     def _route_batch_sync(
         self, 
         input_text: str, 
@@ -172,37 +517,95 @@ class LLMRouter:
             
         return response
 
+    def _route_indices(
+        self,
+        input_text: str,
+        indices: List[int],
+        scope: Optional[str] = None
+    ) -> Optional[RouterResponse]:
+        """Route over the given choices through the decision cache"""
+        return self._cached(
+            self._cache_context("route", scope, None),
+            input_text,
+            lambda vector: self._route_uncached(input_text, indices, vector)
+        )
+
+    def _route_uncached(
+        self,
+        input_text: str,
+        indices: List[int],
+        vector: Optional[Any] = None
+    ) -> Optional[RouterResponse]:
+        """Route over the given choices, running LLM batches in parallel threads"""
+        if self.embedding_only:
+            responses = self._route_by_embedding(input_text, 1, indices, vector)
+            return responses[0] if responses else None
+
+        indices = self._shortlist(input_text, indices, vector)
+        batches = self._chunk_indices(indices)
+
+        def route_batch(batch: List[int]) -> Optional[RouterResponse]:
+            response = self._route_batch_sync(input_text, [self._choices[i] for i in batch])
+            return self._to_choice_index(response, batch)
+
+        if len(batches) == 1 or self.max_concurrency <= 1:
+            responses = [route_batch(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(batches))) as executor:
+                responses = list(executor.map(route_batch, batches))
+
+        return self._best_response(responses)
+
+    async def _route_indices_async(
+        self,
+        input_text: str,
+        indices: List[int],
+        scope: Optional[str] = None
+    ) -> Optional[RouterResponse]:
+        """Async version of _route_indices"""
+        return await self._cached_async(
+            self._cache_context("route", scope, None),
+            input_text,
+            lambda vector: self._route_uncached_async(input_text, indices, vector)
+        )
+
+    async def _route_uncached_async(
+        self,
+        input_text: str,
+        indices: List[int],
+        vector: Optional[Any] = None
+    ) -> Optional[RouterResponse]:
+        """Route over the given choices, running LLM batches concurrently"""
+        if self.embedding_only:
+            responses = await self._route_by_embedding_async(input_text, 1, indices, vector)
+            return responses[0] if responses else None
+
+        indices = await self._shortlist_async(input_text, indices, vector)
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+
+        async def route_batch(batch: List[int]) -> Optional[RouterResponse]:
+            async with semaphore:
+                response = await self._route_batch(input_text, [self._choices[i] for i in batch])
+            return self._to_choice_index(response, batch)
+
+        responses = await asyncio.gather(
+            *(route_batch(batch) for batch in self._chunk_indices(indices))
+        )
+        return self._best_response(list(responses))
+
     def route(self, input_text: str) -> Optional[RouterResponse]:
         """Synchronous version of route"""
         if not self._choices:
             raise ValueError("No choices available for routing")
 
-        best_response = None
-        
-        for batch in self._chunk_choices():
-            response = self._route_batch_sync(input_text, batch)
-            
-            if response and response.confidence_score > self.confidence_threshold:
-                if not best_response or response.confidence_score > best_response.confidence_score:
-                    best_response = response
-
-        return best_response
+        return self._route_indices(input_text, list(range(len(self._choices))))
 
     async def route_async(self, input_text: str) -> Optional[RouterResponse]:
         """Asynchronous version of route"""
         if not self._choices:
             raise ValueError("No choices available for routing")
 
-        best_response = None
-        
-        for batch in self._chunk_choices():
-            response = await self._route_batch(input_text, batch)
-            
-            if response and response.confidence_score > self.confidence_threshold:
-                if not best_response or response.confidence_score > best_response.confidence_score:
-                    best_response = response
-
-        return best_response
+        return await self._route_indices_async(input_text, list(range(len(self._choices))))
 
     def _route_top_k_sync(
         self,
@@ -234,37 +637,6 @@ class LLMRouter:
             
         return response
 
-    def route_top_k(self, input_text: str, k: int = 3) -> List[RouterResponse]:
-        """Get top k matches using a single LLM call"""
-        if not self._choices:
-            raise ValueError("No choices available for routing")
-        
-        if k < 1:
-            raise ValueError("k must be >= 1")
-        
-        # Cap k by the number of available choices
-        effective_k = min(k, len(self._choices))
-        if effective_k == 0:
-            return []
-            
-        multi_response = self._route_top_k_sync(input_text, effective_k, self._choices)
-        if not multi_response:
-            return []
-            
-        confident_choices = [
-            choice_item for choice_item in multi_response.choices
-            if choice_item.confidence_score > self.confidence_threshold
-        ]
-        # Convert RouterMultiResponse choices to list of RouterResponse
-        return [
-            RouterResponse(
-                selected_index=choice.selected_index,
-                confidence_score=choice.confidence_score,
-                reasoning=choice.reasoning
-            )
-            for choice in confident_choices
-        ]
-
     async def _route_top_k_async(
         self,
         input_text: str,
@@ -295,32 +667,114 @@ class LLMRouter:
             
         return response
 
+    def _route_top_k_indices(
+        self,
+        input_text: str,
+        k: int,
+        indices: List[int],
+        scope: Optional[str] = None
+    ) -> List[RouterResponse]:
+        """Get top k matches among the given choices through the decision cache"""
+        if k < 1:
+            raise ValueError("k must be >= 1")
+
+        # Cap k by the number of available choices
+        effective_k = min(k, len(indices))
+        if effective_k == 0:
+            return []
+
+        return list(self._cached(
+            self._cache_context("top_k", scope, effective_k),
+            input_text,
+            lambda vector: self._route_top_k_uncached(input_text, effective_k, indices, vector)
+        ))
+
+    def _route_top_k_uncached(
+        self,
+        input_text: str,
+        k: int,
+        indices: List[int],
+        vector: Optional[Any] = None
+    ) -> List[RouterResponse]:
+        """Get top k matches among the given choices in a single LLM call"""
+        if self.embedding_only:
+            return self._route_by_embedding(input_text, k, indices, vector)
+
+        indices = self._shortlist(input_text, indices, vector)
+        multi_response = self._route_top_k_sync(
+            input_text, k, [self._choices[i] for i in indices]
+        )
+        return self._confident_responses(multi_response, indices)
+
+    async def _route_top_k_indices_async(
+        self,
+        input_text: str,
+        k: int,
+        indices: List[int],
+        scope: Optional[str] = None
+    ) -> List[RouterResponse]:
+        """Async version of _route_top_k_indices"""
+        if k < 1:
+            raise ValueError("k must be >= 1")
+
+        effective_k = min(k, len(indices))
+        if effective_k == 0:
+            return []
+
+        return list(await self._cached_async(
+            self._cache_context("top_k", scope, effective_k),
+            input_text,
+            lambda vector: self._route_top_k_uncached_async(input_text, effective_k, indices, vector)
+        ))
+
+    async def _route_top_k_uncached_async(
+        self,
+        input_text: str,
+        k: int,
+        indices: List[int],
+        vector: Optional[Any] = None
+    ) -> List[RouterResponse]:
+        """Async version of _route_top_k_uncached"""
+        if self.embedding_only:
+            return await self._route_by_embedding_async(input_text, k, indices, vector)
+
+        indices = await self._shortlist_async(input_text, indices, vector)
+        multi_response = await self._route_top_k_async(
+            input_text, k, [self._choices[i] for i in indices]
+        )
+        return self._confident_responses(multi_response, indices)
+
+    def route_top_k(self, input_text: str, k: int = 3) -> List[RouterResponse]:
+        """Get top k matches using a single LLM call"""
+        if not self._choices:
+            raise ValueError("No choices available for routing")
+
+        return self._route_top_k_indices(input_text, k, list(range(len(self._choices))))
+
+    async def route_top_k_async(
+        self, 
+        input_text: str, 
+        k: int = 3
+    ) -> List[RouterResponse]:
+        """Get top k matches using a single LLM call"""
+        if not self._choices:
+            raise ValueError("No choices available for routing")
+
+        return await self._route_top_k_indices_async(
+            input_text, k, list(range(len(self._choices)))
+        )
+
     def route_with_metadata(
         self, 
         input_text: str, 
         metadata_filter: Dict[str, Any]
     ) -> Optional[RouterResponse]:
         """Route through choices that match the metadata filter"""
-        filtered_choices = self._filter_choices_by_metadata(metadata_filter)
-        if not filtered_choices:
+        filtered_indices = self._filter_choices_by_metadata(metadata_filter)
+        if not filtered_indices:
             return None
 
-        best_response = None
-        
-        # Split filtered choices into batches
-        batches = [
-            filtered_choices[i:i + self.max_choices_per_batch]
-            for i in range(0, len(filtered_choices), self.max_choices_per_batch)
-        ]
-        
-        for batch in batches:
-            response = self._route_batch_sync(input_text, batch)
-            
-            if response and response.confidence_score > self.confidence_threshold:
-                if not best_response or response.confidence_score > best_response.confidence_score:
-                    best_response = response
-
-        return best_response
+        return self._route_indices(input_text, filtered_indices, self._scope_key(metadata_filter))
 
     def route_top_k_with_metadata(
         self, 
@@ -329,34 +783,13 @@ class LLMRouter:
         k: int = 3
     ) -> List[RouterResponse]:
         """Get top k matches from choices that match the metadata filter"""
-        filtered_choices = self._filter_choices_by_metadata(metadata_filter)
-        if not filtered_choices:
+        filtered_indices = self._filter_choices_by_metadata(metadata_filter)
+        if not filtered_indices:
             return []
-        
-        if k < 1:
-            raise ValueError("k must be >= 1")
-        
-        # Cap k by the number of filtered choices
-        effective_k = min(k, len(filtered_choices))
-        if effective_k == 0:
-            return []
-            
-        multi_response = self._route_top_k_sync(input_text, effective_k, filtered_choices)
-        if not multi_response:
-            return []
-            
-        confident_choices = [
-            choice_item for choice_item in multi_response.choices
-            if choice_item.confidence_score > self.confidence_threshold
-        ]
-        return [
-            RouterResponse(
-                selected_index=choice.selected_index,
-                confidence_score=choice.confidence_score,
-                reasoning=choice.reasoning
-            )
-            for choice in confident_choices
-        ]
+
+        return self._route_top_k_indices(
+            input_text, k, filtered_indices, self._scope_key(metadata_filter)
+        )
 
     async def route_with_metadata_async(
         self, 
@@ -364,26 +797,13 @@ class LLMRouter:
         metadata_filter: Dict[str, Any]
     ) -> Optional[RouterResponse]:
         """Async version of route_with_metadata"""
-        filtered_choices = self._filter_choices_by_metadata(metadata_filter)
-        if not filtered_choices:
+        filtered_indices = self._filter_choices_by_metadata(metadata_filter)
+        if not filtered_indices:
             return None
 
-        best_response = None
-        
-        # Split filtered choices into batches
-        batches = [
-            filtered_choices[i:i + self.max_choices_per_batch]
-            for i in range(0, len(filtered_choices), self.max_choices_per_batch)
-        ]
-        
-        for batch in batches:
-            response = await self._route_batch(input_text, batch)
-            
-            if response and response.confidence_score > self.confidence_threshold:
-                if not best_response or response.confidence_score > best_response.confidence_score:
-                    best_response = response
-
-        return best_response
+        return await self._route_indices_async(
+            input_text, filtered_indices, self._scope_key(metadata_filter)
+        )
 
     async def route_top_k_with_metadata_async(
         self, 
@@ -392,66 +812,10 @@ class LLMRouter:
         k: int = 3
     ) -> List[RouterResponse]:
         """Async version of route_top_k_with_metadata"""
-        filtered_choices = self._filter_choices_by_metadata(metadata_filter)
-        if not filtered_choices:
-            return []
-        
-        if k < 1:
-            raise ValueError("k must be >= 1")
-            
-        # Cap k by the number of filtered choices
-        effective_k = min(k, len(filtered_choices))
-        if effective_k == 0:
-            return []
-            
-        multi_response = await self._route_top_k_async(input_text, effective_k, filtered_choices)
-        if not multi_response:
+        filtered_indices = self._filter_choices_by_metadata(metadata_filter)
+        if not filtered_indices:
             return []
-            
-        confident_choices = [
-            choice_item for choice_item in multi_response.choices
-            if choice_item.confidence_score > self.confidence_threshold
-        ]
-        return [
-            RouterResponse(
-                selected_index=choice.selected_index,
-                confidence_score=choice.confidence_score,
-                reasoning=choice.reasoning
-            )
-            for choice in confident_choices
-        ]
 
-    async def route_top_k_async(
-        self, 
-        input_text: str, 
-        k: int = 3
-    ) -> List[RouterResponse]:
-        """Get top k matches using a single LLM call"""
-        if not self._choices:
-            raise ValueError("No choices available for routing")
-        
-        if k < 1:
-            raise ValueError("k must be >= 1")
-            
-        # Cap k by the number of available choices
-        effective_k = min(k, len(self._choices))
-        if effective_k == 0:
-            return []
-            
-        multi_response = await self._route_top_k_async(input_text, effective_k, self._choices)
-        if not multi_response:
-            return []
-            
-        confident_choices = [
-            choice_item for choice_item in multi_response.choices
-            if choice_item.confidence_score > self.confidence_threshold
-        ]
-        # Convert RouterMultiResponse choices to list of RouterResponse
-        return [
-            RouterResponse(
-                selected_index=choice.selected_index,
-                confidence_score=choice.confidence_score,
-                reasoning=choice.reasoning
-            )
-            for choice in confident_choices
-        ]
+        return await self._route_top_k_indices_async(
+            input_text, k, filtered_indices, self._scope_key(metadata_filter)
+        )
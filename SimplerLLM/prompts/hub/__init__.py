@@ -18,6 +18,7 @@ from .prompt_manager import (
     PromptSummaryData,     # Added
     fetch_prompt_version_from_hub, # Added
 )
+from .hub_client import PromptHubClient, get_default_client
 
 __all__ = [
     "fetch_prompt_from_hub",
@@ -31,4 +32,6 @@ __all__ = [
     "list_prompts_from_hub", # Added
     "PromptSummaryData",     # Added
     "fetch_prompt_version_from_hub", # Added
+    "PromptHubClient",
+    "get_default_client",
 ]
@@ -0,0 +1,544 @@
+"""
+Caching client for the SimplerLLM Prompt Manager hub.
+
+PromptHubClient keeps one pooled HTTP session and a cache of fetched
+prompts, so rendering a prompt does not need a remote call:
+
+- Versioned prompts, (prompt_id, version), are immutable and never expire.
+- The latest version of a prompt is served from the cache for
+  latest_max_age seconds, then revalidated with If-None-Match; an
+  unchanged prompt costs a 304 response and no download.
+- With cache_dir, entries are persisted as JSON files and survive restarts.
+- With serve_stale_on_error, network failures and server errors fall back
+  to the last cached copy.
+
+Example:
+    >>> client = PromptHubClient(cache_dir="./.prompt_cache")
+    >>> client.prefetch(["welcome_email", ("summarizer", 3)])
+    >>> prompt = client.fetch_prompt("welcome_email")
+    >>> prompt.set_variables(name="Ada")
+    >>> print(prompt.get_formatted_prompt())
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import aiohttp
+import requests
+from pydantic import ValidationError
+from requests.adapters import HTTPAdapter
+
+from .prompt_manager import (
+    API_BASE_URL,
+    API_KEY_ENV_VAR,
+    ManagedPrompt,
+    PromptHubData,
+    PromptSummaryData,
+    PromptManagerError,
+    AuthenticationError,
+    PromptNotFoundError,
+    NetworkError,
+    MissingAPIKeyError,
+)
+
+# A prompt to prefetch: an ID (latest version) or an (ID, version) pair
+PromptRef = Union[str, Tuple[str, int]]
+
+
+class _CacheEntry:
+    """A cached API response body with its validator."""
+
+    __slots__ = ("data", "etag", "fetched_at")
+
+    def __init__(self, data: Any, etag: Optional[str], fetched_at: float):
+        self.data = data
+        self.etag = etag
+        self.fetched_at = fetched_at
+
+
+class PromptHubClient:
+    """
+    Prompt hub client with a pooled session and a persistent cache.
+
+    Args:
+        api_key: Your SimplerLLM API key. If None, it is read from the
+                 'SIMPLERLLM_API_KEY' environment variable.
+        cache_dir: Folder for the on-disk cache. If None, prompts are only
+                   cached in memory.
+        latest_max_age: Seconds a cached latest version is served without
+                        revalidation (0 revalidates on every fetch).
+        serve_stale_on_error: Return the cached copy when the hub cannot be
+                              reached or answers with a server error.
+        timeout: Request timeout in seconds.
+        pool_size: Maximum pooled connections (also the prefetch concurrency).
+        base_url: Prompt API base URL.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        latest_max_age: float = 60.0,
+        serve_stale_on_error: bool = True,
+        timeout: float = 30.0,
+        pool_size: int = 8,
+        base_url: str = API_BASE_URL,
+    ):
+        self.api_key = api_key or os.getenv(API_KEY_ENV_VAR)
+        if not self.api_key:
+            raise MissingAPIKeyError(f"API key not provided and environment variable '{API_KEY_ENV_VAR}' not set.")
+
+        self.base_url = base_url if base_url.endswith("/") else base_url + "/"
+        self.cache_dir = cache_dir
+        self.latest_max_age = latest_max_age
+        self.serve_stale_on_error = serve_stale_on_error
+        self.timeout = timeout
+        self.pool_size = pool_size
+
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        # One aiohttp session per event loop (sessions cannot cross loops)
+        self._async_sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+
+        self._memory: Dict[str, _CacheEntry] = {}
+        self._lock = threading.Lock()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    # --- Cache ---
+
+    def _cache_key(self, path: str, params: Optional[Dict[str, str]] = None) -> str:
+        key = self.base_url + path
+        if params:
+            key += "?" + "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+        # Responses depend on the caller's account (private prompts,
+        # listings), so clients with other keys sharing a cache_dir must
+        # not see them
+        return key + "#" + hashlib.sha256(self.api_key.encode()).hexdigest()[:16]
+
+    def _cache_file(self, key: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha256(key.encode()).hexdigest() + ".json")
+
+    def _get_cached(self, key: str) -> Optional[_CacheEntry]:
+        with self._lock:
+            entry = self._memory.get(key)
+        if entry is not None or not self.cache_dir:
+            return entry
+        try:
+            with open(self._cache_file(key), "r", encoding="utf-8") as f:
+                stored = json.load(f)
+            entry = _CacheEntry(stored["data"], stored.get("etag"), stored.get("fetched_at", 0.0))
+        except (OSError, ValueError, KeyError):
+            return None
+        with self._lock:
+            self._memory[key] = entry
+        return entry
+
+    def _set_cached(self, key: str, entry: _CacheEntry) -> None:
+        with self._lock:
+            self._memory[key] = entry
+        if not self.cache_dir:
+            return
+        path = self._cache_file(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"key": key, "etag": entry.etag, "fetched_at": entry.fetched_at,
+                           "data": entry.data}, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            # A read-only or full disk only loses persistence
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def clear_cache(self) -> None:
+        """Remove all cached prompts from memory and disk."""
+        with self._lock:
+            self._memory.clear()
+        if self.cache_dir:
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(".json"):
+                    try:
+                        os.remove(os.path.join(self.cache_dir, name))
+                    except OSError:
+                        pass
+
+    # --- Request handling ---
+
+    def _plan(
+        self,
+        key: str,
+        immutable: bool
+    ) -> Tuple[Optional[_CacheEntry], bool, Dict[str, str]]:
+        """Return (cached entry, whether it can be served as is, request headers)."""
+        entry = self._get_cached(key)
+        headers = dict(self._headers)
+        if entry is None:
+            return None, False, headers
+        if immutable or time.time() - entry.fetched_at < self.latest_max_age:
+            return entry, True, headers
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        return entry, False, headers
+
+    def _handle(
+        self,
+        key: str,
+        entry: Optional[_CacheEntry],
+        status: int,
+        etag: Optional[str],
+        read_body,
+        not_found_message: str,
+        validate,
+    ) -> Any:
+        """Update the cache from a response and return the body data."""
+        if status == 304 and entry is not None:
+            refreshed = _CacheEntry(entry.data, etag or entry.etag, time.time())
+            self._set_cached(key, refreshed)
+            return refreshed.data
+        if status == 401:
+            raise AuthenticationError("Authentication failed. Check your API key.")
+        if status == 404:
+            raise PromptNotFoundError(not_found_message)
+        if status >= 400:
+            error = PromptManagerError(f"API request failed with status {status}: {read_body(text=True)}")
+            if status >= 500 or status == 429:
+                return self._stale_or_raise(entry, error)
+            raise error
+        try:
+            data = read_body(text=False)
+        except ValueError as e:  # Catches JSONDecodeError
+            raise PromptManagerError(f"Failed to decode API response as JSON: {e}") from e
+        # Only cache bodies that parse; a cached bad body would be served
+        # again on every 304
+        validate(data)
+        self._set_cached(key, _CacheEntry(data, etag, time.time()))
+        return data
+
+    def _stale_or_raise(self, entry: Optional[_CacheEntry], error: Exception) -> Any:
+        if self.serve_stale_on_error and entry is not None:
+            return entry.data
+        raise error
+
+    def _get_json(
+        self,
+        path: str,
+        not_found_message: str,
+        validate,
+        immutable: bool = False,
+        params: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        key = self._cache_key(path, params)
+        entry, fresh, headers = self._plan(key, immutable)
+        if fresh:
+            return entry.data
+
+        try:
+            response = self._session.get(
+                self.base_url + path if path else self.base_url.rstrip("/"),
+                headers=headers, params=params, timeout=self.timeout
+            )
+        except requests.exceptions.Timeout as e:
+            return self._stale_or_raise(entry, NetworkError(f"API request timed out: {e}"))
+        except requests.exceptions.ConnectionError as e:
+            return self._stale_or_raise(entry, NetworkError(f"Could not connect to API: {e}"))
+        except requests.exceptions.RequestException as e:
+            return self._stale_or_raise(entry, NetworkError(f"An unexpected network error occurred: {e}"))
+
+        def read_body(text: bool):
+            return response.text if text else response.json()
+
+        return self._handle(
+            key, entry, response.status_code, response.headers.get("ETag"),
+            read_body, not_found_message, validate
+        )
+
+    async def _get_async_session(self) -> aiohttp.ClientSession:
+        """Session for the running event loop, closing sessions of closed loops."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            stale = [
+                self._async_sessions.pop(other)
+                for other in list(self._async_sessions) if other.is_closed()
+            ]
+            session = self._async_sessions.get(loop)
+            if session is None or session.closed:
+                session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=self.pool_size),
+                    timeout=aiohttp.ClientTimeout(total=self.timeout),
+                )
+                self._async_sessions[loop] = session
+        for old in stale:
+            # Its loop is gone, so its connections are unusable; closing
+            # just releases the session
+            await old.close()
+        return session
+
+    async def _get_json_async(
+        self,
+        path: str,
+        not_found_message: str,
+        validate,
+        immutable: bool = False,
+        params: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        key = self._cache_key(path, params)
+        entry, fresh, headers = self._plan(key, immutable)
+        if fresh:
+            return entry.data
+
+        session = await self._get_async_session()
+        try:
+            async with session.get(
+                self.base_url + path if path else self.base_url.rstrip("/"),
+                headers=headers, params=params
+            ) as response:
+                body = await response.read()
+                status = response.status
+                etag = response.headers.get("ETag")
+        except asyncio.TimeoutError as e:
+            return self._stale_or_raise(entry, NetworkError(f"API request timed out: {e}"))
+        except aiohttp.ClientConnectionError as e:
+            return self._stale_or_raise(entry, NetworkError(f"Could not connect to API: {e}"))
+        except aiohttp.ClientError as e:
+            return self._stale_or_raise(entry, NetworkError(f"An unexpected network error occurred: {e}"))
+
+        def read_body(text: bool):
+            decoded = body.decode("utf-8", errors="replace")
+            return decoded if text else json.loads(decoded)
+
+        return self._handle(key, entry, status, etag, read_body, not_found_message, validate)
+
+    # --- Response parsing ---
+
+    @staticmethod
+    def _parse_prompt(data: Any) -> PromptHubData:
+        try:
+            return PromptHubData.model_validate(data)
+        except ValidationError as e:
+            raise PromptManagerError(f"API response validation failed: {e}") from e
+
+    def _to_prompt(self, data: Any, prompt_id: str) -> ManagedPrompt:
+        prompt_data = self._parse_prompt(data)
+        # The latest version is also an immutable versioned entry
+        version_key = self._cache_key(f"{prompt_id}/versions/{prompt_data.version}")
+        if self._get_cached(version_key) is None:
+            self._set_cached(version_key, _CacheEntry(data, None, time.time()))
+        return ManagedPrompt(prompt_data)
+
+    @staticmethod
+    def _to_summaries(data: Any) -> List[PromptSummaryData]:
+        if not isinstance(data, list):
+            raise PromptManagerError(f"API response was not a list as expected. Received: {type(data)}")
+        try:
+            return [PromptSummaryData.model_validate(item) for item in data]
+        except ValidationError as e:
+            raise PromptManagerError(f"API response validation failed for one or more items: {e}") from e
+
+    # --- Public API ---
+
+    def fetch_prompt(self, prompt_id: str) -> ManagedPrompt:
+        """
+        Fetch the latest version of a prompt.
+
+        Args:
+            prompt_id: The unique ID of the prompt to fetch.
+
+        Returns:
+            A new ManagedPrompt for the prompt.
+
+        Raises:
+            NetworkError: If the hub cannot be reached and nothing is cached.
+            AuthenticationError: If the API key is invalid (401 status).
+            PromptNotFoundError: If the prompt ID does not exist (404 status).
+            PromptManagerError: For other API-related errors.
+        """
+        data = self._get_json(
+            prompt_id, f"Prompt with ID '{prompt_id}' not found.", self._parse_prompt
+        )
+        return self._to_prompt(data, prompt_id)
+
+    def fetch_prompt_version(self, prompt_id: str, version: int) -> ManagedPrompt:
+        """
+        Fetch a specific version of a prompt. Versions never change, so each
+        is downloaded at most once per cache.
+
+        Args:
+            prompt_id: The unique ID of the prompt to fetch.
+            version: The version number to fetch.
+
+        Returns:
+            A new ManagedPrompt for the version.
+
+        Raises:
+            PromptNotFoundError: If the prompt ID or version does not exist.
+            (See fetch_prompt for the other exceptions.)
+        """
+        data = self._get_json(
+            f"{prompt_id}/versions/{version}",
+            f"Prompt with ID '{prompt_id}' and version '{version}' not found.",
+            self._parse_prompt,
+            immutable=True,
+        )
+        return self._to_prompt(data, prompt_id)
+
+    def list_prompts(self, include_shared: bool = True) -> List[PromptSummaryData]:
+        """
+        List prompts available to the user, revalidated like latest prompts.
+
+        Args:
+            include_shared: Whether to include prompts shared with the user.
+
+        Returns:
+            A list of PromptSummaryData objects.
+        """
+        data = self._get_json(
+            "", "Prompt list endpoint not found.", self._to_summaries,
+            params={"includeShared": str(include_shared).lower()},
+        )
+        return self._to_summaries(data)
+
+    def prefetch(self, prompts: Sequence[PromptRef]) -> Dict[PromptRef, ManagedPrompt]:
+        """
+        Fetch many prompts concurrently, for example at startup.
+
+        Args:
+            prompts: Prompt IDs (latest version) or (prompt_id, version) pairs.
+
+        Returns:
+            Dictionary mapping each requested reference to its ManagedPrompt.
+        """
+        def fetch(ref: PromptRef) -> ManagedPrompt:
+            if isinstance(ref, str):
+                return self.fetch_prompt(ref)
+            return self.fetch_prompt_version(*ref)
+
+        refs = list(dict.fromkeys(prompts))
+        with ThreadPoolExecutor(max_workers=max(1, min(self.pool_size, len(refs)))) as executor:
+            return dict(zip(refs, executor.map(fetch, refs)))
+
+    async def fetch_prompt_async(self, prompt_id: str) -> ManagedPrompt:
+        """Async version of fetch_prompt."""
+        data = await self._get_json_async(
+            prompt_id, f"Prompt with ID '{prompt_id}' not found.", self._parse_prompt
+        )
+        return self._to_prompt(data, prompt_id)
+
+    async def fetch_prompt_version_async(self, prompt_id: str, version: int) -> ManagedPrompt:
+        """Async version of fetch_prompt_version."""
+        data = await self._get_json_async(
+            f"{prompt_id}/versions/{version}",
+            f"Prompt with ID '{prompt_id}' and version '{version}' not found.",
+            self._parse_prompt,
+            immutable=True,
+        )
+        return self._to_prompt(data, prompt_id)
+
+    async def list_prompts_async(self, include_shared: bool = True) -> List[PromptSummaryData]:
+        """Async version of list_prompts."""
+        data = await self._get_json_async(
+            "", "Prompt list endpoint not found.", self._to_summaries,
+            params={"includeShared": str(include_shared).lower()},
+        )
+        return self._to_summaries(data)
+
+    async def prefetch_async(self, prompts: Sequence[PromptRef]) -> Dict[PromptRef, ManagedPrompt]:
+        """Async version of prefetch."""
+        refs = list(dict.fromkeys(prompts))
+        results = await asyncio.gather(*(
+            self.fetch_prompt_async(ref) if isinstance(ref, str)
+            else self.fetch_prompt_version_async(*ref)
+            for ref in refs
+        ))
+        return dict(zip(refs, results))
+
+    def _take_async_sessions(self) -> List[Tuple[asyncio.AbstractEventLoop, aiohttp.ClientSession]]:
+        with self._lock:
+            sessions = list(self._async_sessions.items())
+            self._async_sessions.clear()
+        return [(loop, session) for loop, session in sessions if not session.closed]
+
+    def close(self) -> None:
+        """Close the pooled HTTP sessions, including the async ones."""
+        self._session.close()
+        for loop, session in self._take_async_sessions():
+            _close_async_session(loop, session)
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP sessions, including the async ones."""
+        self._session.close()
+        current = asyncio.get_running_loop()
+        for loop, session in self._take_async_sessions():
+            if loop is current or loop.is_closed():
+                await session.close()
+            else:
+                _close_async_session(loop, session)
+
+    def __enter__(self) -> "PromptHubClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "PromptHubClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+
+def _close_async_session(loop: asyncio.AbstractEventLoop, session: aiohttp.ClientSession) -> None:
+    """Close an aiohttp session from synchronous code, on its own loop if it still runs."""
+    try:
+        current = asyncio.get_running_loop()
+    except RuntimeError:
+        current = None
+    if loop.is_running() and loop is not current:
+        asyncio.run_coroutine_threadsafe(session.close(), loop)
+    elif current is not None:
+        current.create_task(session.close())
+    elif not loop.is_closed():
+        loop.run_until_complete(session.close())
+    else:
+        asyncio.run(session.close())
+
+
+_default_clients: Dict[str, PromptHubClient] = {}
+_default_clients_lock = threading.Lock()
+
+
+def get_default_client(api_key: Optional[str] = None) -> PromptHubClient:
+    """
+    Get the shared in-memory client used by the module-level hub functions.
+
+    It always revalidates latest versions (latest_max_age=0) and raises
+    instead of serving stale copies, matching the uncached functions, while
+    still reusing connections and caching versioned prompts.
+    """
+    resolved_api_key = api_key or os.getenv(API_KEY_ENV_VAR)
+    if not resolved_api_key:
+        raise MissingAPIKeyError(f"API key not provided and environment variable '{API_KEY_ENV_VAR}' not set.")
+    with _default_clients_lock:
+        client = _default_clients.get(resolved_api_key)
+        if client is None:
+            client = PromptHubClient(
+                api_key=resolved_api_key,
+                latest_max_age=0,
+                serve_stale_on_error=False,
+            )
+            _default_clients[resolved_api_key] = client
+        return client
@@ -1,13 +1,7 @@
-import os
-import requests
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, ValidationError, HttpUrl
-from dotenv import load_dotenv
+from pydantic import BaseModel, Field, HttpUrl
 
 
-# Load environment variables from .env file
-load_dotenv()
-
 # --- Constants ---
 API_BASE_URL = "https://simplerllm.com/api/v1/prompts/"
 API_KEY_ENV_VAR = "SIMPLERLLM_API_KEY"
@@ -189,6 +183,10 @@ def fetch_prompt_from_hub(prompt_id: str, api_key: Optional[str] = None) -> Mana
     """
     Fetches a prompt template from the SimplerLLM Prompt Manager API.
 
+    Connections are reused across calls and unchanged prompts are revalidated
+    with If-None-Match instead of downloaded again. Use PromptHubClient to
+    serve prompts from a local cache without a request per call.
+
     Args:
         prompt_id: The unique ID of the prompt to fetch.
         api_key: Your SimplerLLM API key. If None, it attempts to read the key
@@ -206,43 +204,9 @@ def fetch_prompt_from_hub(prompt_id: str, api_key: Optional[str] = None) -> Mana
         PromptManagerError: For other API-related errors (non-200 status codes).
         ValidationError: If the API response does not match the expected format.
     """
-    resolved_api_key = api_key or os.getenv(API_KEY_ENV_VAR)
-    if not resolved_api_key:
-        raise MissingAPIKeyError(f"API key not provided and environment variable '{API_KEY_ENV_VAR}' not set.")
-
-    headers = {
-        "Authorization": f"Bearer {resolved_api_key}",
-        "Content-Type": "application/json",
-    }
-    url = f"{API_BASE_URL}{prompt_id}"
-
-    try:
-        response = requests.get(url, headers=headers, timeout=30) # Added timeout
-        response.raise_for_status() # Raises HTTPError for bad responses (4xx or 5xx)
-
-    except requests.exceptions.Timeout as e:
-        raise NetworkError(f"API request timed out: {e}") from e
-    except requests.exceptions.ConnectionError as e:
-        raise NetworkError(f"Could not connect to API: {e}") from e
-    except requests.exceptions.HTTPError as e:
-        status_code = e.response.status_code
-        if status_code == 401:
-            raise AuthenticationError("Authentication failed. Check your API key.") from e
-        elif status_code == 404:
-            raise PromptNotFoundError(f"Prompt with ID '{prompt_id}' not found.") from e
-        else:
-            raise PromptManagerError(f"API request failed with status {status_code}: {e.response.text}") from e
-    except requests.exceptions.RequestException as e:
-        raise NetworkError(f"An unexpected network error occurred: {e}") from e
-
-    try:
-        data = response.json()
-        prompt_data = PromptHubData.model_validate(data)
-        return ManagedPrompt(prompt_data)
-    except ValueError as e: # Catches JSONDecodeError
-        raise PromptManagerError(f"Failed to decode API response as JSON: {e}") from e
-    except ValidationError as e:
-        raise PromptManagerError(f"API response validation failed: {e}") from e
+    from .hub_client import get_default_client
+
+    return get_default_client(api_key).fetch_prompt(prompt_id)
 
 
 # --- List Function ---
@@ -265,47 +229,9 @@ def list_prompts_from_hub(api_key: Optional[str] = None, include_shared: bool =
         PromptManagerError: For other API-related errors (non-200 status codes).
         ValidationError: If the API response does not match the expected format.
     """
-    resolved_api_key = api_key or os.getenv(API_KEY_ENV_VAR)
-    if not resolved_api_key:
-        raise MissingAPIKeyError(f"API key not provided and environment variable '{API_KEY_ENV_VAR}' not set.")
-
-    headers = {
-        "Authorization": f"Bearer {resolved_api_key}",
-        "Content-Type": "application/json",
-    }
-    # Base URL for listing prompts doesn't include a specific ID
-    list_url = API_BASE_URL.rstrip('/') # Ensure no trailing slash before adding params
-    params = {"includeShared": str(include_shared).lower()} # API expects 'true' or 'false'
-
-    try:
-        response = requests.get(list_url, headers=headers, params=params, timeout=30)
-        response.raise_for_status()
-
-    except requests.exceptions.Timeout as e:
-        raise NetworkError(f"API request timed out: {e}") from e
-    except requests.exceptions.ConnectionError as e:
-        raise NetworkError(f"Could not connect to API: {e}") from e
-    except requests.exceptions.HTTPError as e:
-        status_code = e.response.status_code
-        if status_code == 401:
-            raise AuthenticationError("Authentication failed. Check your API key.") from e
-        # Add other specific status code checks if needed (e.g., 404 if the base endpoint itself could be missing)
-        else:
-            raise PromptManagerError(f"API request failed with status {status_code}: {e.response.text}") from e
-    except requests.exceptions.RequestException as e:
-        raise NetworkError(f"An unexpected network error occurred: {e}") from e
-
-    try:
-        data = response.json()
-        if not isinstance(data, list):
-             raise PromptManagerError(f"API response was not a list as expected. Received: {type(data)}")
-        # Validate each item in the list
-        prompt_list = [PromptSummaryData.model_validate(item) for item in data]
-        return prompt_list
-    except ValueError as e: # Catches JSONDecodeError
-        raise PromptManagerError(f"Failed to decode API response as JSON: {e}") from e
-    except ValidationError as e:
-        raise PromptManagerError(f"API response validation failed for one or more items: {e}") from e
+    from .hub_client import get_default_client
+
+    return get_default_client(api_key).list_prompts(include_shared=include_shared)
 
 
 # --- Fetch Specific Version Function ---
@@ -313,6 +239,9 @@ def fetch_prompt_version_from_hub(prompt_id: str, version: int, api_key: Optiona
     """
     Fetches a specific version of a prompt template from the SimplerLLM Prompt Manager API.
 
+    Versions are immutable, so each one is downloaded at most once per process.
+    Use PromptHubClient for a persistent on-disk cache.
+
     Args:
         prompt_id: The unique ID of the prompt to fetch.
         version: The specific version number of the prompt to fetch.
@@ -330,42 +259,6 @@ def fetch_prompt_version_from_hub(prompt_id: str, version: int, api_key: Optiona
         PromptManagerError: For other API-related errors (non-200 status codes).
         ValidationError: If the API response does not match the expected format.
     """
-    resolved_api_key = api_key or os.getenv(API_KEY_ENV_VAR)
-    if not resolved_api_key:
-        raise MissingAPIKeyError(f"API key not provided and environment variable '{API_KEY_ENV_VAR}' not set.")
-
-    headers = {
-        "Authorization": f"Bearer {resolved_api_key}",
-        "Content-Type": "application/json",
-    }
-    # Construct URL for specific version
-    url = f"{API_BASE_URL}{prompt_id}/versions/{version}"
-
-    try:
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-
-    except requests.exceptions.Timeout as e:
-        raise NetworkError(f"API request timed out: {e}") from e
-    except requests.exceptions.ConnectionError as e:
-        raise NetworkError(f"Could not connect to API: {e}") from e
-    except requests.exceptions.HTTPError as e:
-        status_code = e.response.status_code
-        if status_code == 401:
-            raise AuthenticationError("Authentication failed. Check your API key.") from e
-        elif status_code == 404:
-            raise PromptNotFoundError(f"Prompt with ID '{prompt_id}' and version '{version}' not found.") from e
-        else:
-            raise PromptManagerError(f"API request failed with status {status_code}: {e.response.text}") from e
-    except requests.exceptions.RequestException as e:
-        raise NetworkError(f"An unexpected network error occurred: {e}") from e
-
-    try:
-        data = response.json()
-        # Reuse the same detailed data model as fetching the latest version
-        prompt_data = PromptHubData.model_validate(data)
-        return ManagedPrompt(prompt_data)
-    except ValueError as e: # Catches JSONDecodeError
-        raise PromptManagerError(f"Failed to decode API response as JSON: {e}") from e
-    except ValidationError as e:
-        raise PromptManagerError(f"API response validation failed: {e}") from e
+    from .hub_client import get_default_client
+
+    return get_default_client(api_key).fetch_prompt_version(prompt_id, version)
@@ -3,12 +3,9 @@ import time
 import asyncio
 import aiohttp
 import requests
-from dotenv import load_dotenv
 from typing import Optional, Any, Dict
 
 
-load_dotenv(override=True) 
-
 class ApifyAPIClient:
     def __init__(self, api_key: Optional[str] = None, timeout: int = 600):
         """
@@ -1,11 +1,9 @@
 import ssl
 import smtplib
 import aiosmtplib
-from dotenv import load_dotenv
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
-load_dotenv(override=True)
 
 def send_email(subject, message, recipient_email, sender_email, sender_app_pass, sender_host, sender_port=465):
     msg = MIMEMultipart()
@@ -19,6 +19,14 @@ Size Limits:
     - Anthropic: 5MB per image, 8000x8000 max dimensions
     - Gemini: 20MB total request size (inline), 3600 images max per request
 
+Image Preparation:
+    Local files (and downloaded URLs for Gemini and Ollama) go through a
+    shared pipeline: when Pillow is installed, images larger than the
+    provider's effective resolution are downscaled and re-encoded before
+    upload (providers resize them anyway), and the base64 payload of each
+    file is cached by (path, mtime, size, profile). Multiple images in one
+    request are prepared concurrently.
+
 Example:
     >>> from SimplerLLM.tools.image_helpers import prepare_vision_content
     >>>
@@ -44,10 +52,17 @@ Example:
 """
 
 import base64
+import io
+import math
 import os
-from typing import Dict, Any, List, Optional, Tuple
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, NamedTuple, Optional, Sequence, Tuple
 from urllib.parse import urlparse
 
+from SimplerLLM.instrumentation.core import record_cache
+
 
 def is_url(source: str) -> bool:
     """
@@ -130,6 +145,286 @@ def validate_image_source(source: str) -> bool:
         return os.path.exists(source)
 
 
+# ============================================================================
+# Shared image preparation pipeline
+# ============================================================================
+
+class ImageProfile(NamedTuple):
+    """
+    Effective input resolution of a vision provider.
+
+    Images are downscaled (never upscaled) until every set limit holds.
+
+    Attributes:
+        name: Profile name, part of the payload cache key
+        max_long_side: Maximum size of the longer side in pixels
+        max_short_side: Maximum size of the shorter side in pixels
+        max_pixels: Maximum width * height
+    """
+    name: str
+    max_long_side: Optional[int] = None
+    max_short_side: Optional[int] = None
+    max_pixels: Optional[int] = None
+
+
+# Resolutions the providers resize to on their side; anything larger only
+# costs upload bandwidth
+IMAGE_PROFILES: Dict[str, ImageProfile] = {
+    # detail="low": a single 512x512 view
+    "openai-low": ImageProfile("openai-low", max_long_side=512),
+    # detail="high"/"auto": fit in 2048x2048, then shortest side 768
+    "openai-high": ImageProfile("openai-high", max_long_side=2048, max_short_side=768),
+    # Long edges over 1568px (or ~1.15 megapixels) are scaled down
+    "anthropic": ImageProfile("anthropic", max_long_side=1568, max_pixels=1_150_000),
+    "gemini": ImageProfile("gemini", max_long_side=3072),
+    "ollama": ImageProfile("ollama", max_long_side=1344),
+    "cohere-low": ImageProfile("cohere-low", max_long_side=512),
+    "cohere-high": ImageProfile("cohere-high", max_long_side=2048, max_short_side=768),
+}
+
+# JPEG quality used when re-encoding downscaled images
+IMAGE_JPEG_QUALITY = 85
+
+# Upper bound on the base64 payloads kept in the cache
+IMAGE_CACHE_MAX_BYTES = 128 * 1024 * 1024
+
+# Maximum images prepared in parallel
+IMAGE_PREPARE_MAX_WORKERS = 8
+
+_image_cache: "OrderedDict[tuple, Tuple[Optional[str], str]]" = OrderedDict()
+_image_cache_bytes = 0
+_image_cache_lock = threading.Lock()
+
+
+def get_image_profile(provider: str, detail: str = "auto") -> ImageProfile:
+    """
+    Get the image profile of a provider.
+
+    Args:
+        provider: "openai", "anthropic", "gemini", "ollama" or "cohere"
+        detail: Detail level for providers that support it ("low", "high", "auto")
+
+    Returns:
+        ImageProfile: The provider's effective resolution
+
+    Example:
+        >>> get_image_profile("openai", "low").max_long_side
+        512
+    """
+    if provider in ("openai", "cohere"):
+        return IMAGE_PROFILES[f"{provider}-low" if detail == "low" else f"{provider}-high"]
+    return IMAGE_PROFILES[provider]
+
+
+def clear_image_cache() -> None:
+    """Remove all cached image payloads."""
+    global _image_cache_bytes
+    with _image_cache_lock:
+        _image_cache.clear()
+        _image_cache_bytes = 0
+
+
+def _target_size(width: int, height: int, profile: ImageProfile) -> Optional[Tuple[int, int]]:
+    """Downscaled size for a profile, or None if the image already fits."""
+    scale = 1.0
+    if profile.max_long_side:
+        scale = min(scale, profile.max_long_side / max(width, height))
+    if profile.max_short_side:
+        scale = min(scale, profile.max_short_side / min(width, height))
+    if profile.max_pixels:
+        scale = min(scale, math.sqrt(profile.max_pixels / (width * height)))
+    if scale >= 1.0:
+        return None
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def downscale_image(data: bytes, profile: ImageProfile) -> Tuple[bytes, Optional[str]]:
+    """
+    Downscale encoded image bytes to a provider profile.
+
+    Images that already fit, animated images, unreadable images, and any
+    image when Pillow is not installed are returned unchanged.
+
+    Args:
+        data: Encoded image bytes
+        profile: Target ImageProfile
+
+    Returns:
+        Tuple[bytes, Optional[str]]: The image bytes and their MIME type, or
+            the original bytes and None if the image was left unchanged
+    """
+    try:
+        from PIL import Image, ImageOps
+    except ImportError:
+        return data, None
+
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            if getattr(img, "is_animated", False):
+                return data, None
+            size = _target_size(img.width, img.height, profile)
+            if size is None:
+                return data, None
+
+            # Let the JPEG decoder skip detail we are about to discard
+            img.draft(img.mode, size)
+            orientation = img.getexif().get(0x0112, 1)
+            image = ImageOps.exif_transpose(img)
+            if orientation in (5, 6, 7, 8):
+                size = (size[1], size[0])
+            image = image.resize(size, Image.LANCZOS)
+
+            has_alpha = image.mode in ("RGBA", "LA") or (
+                image.mode == "P" and "transparency" in image.info
+            )
+            output = io.BytesIO()
+            if has_alpha:
+                image.save(output, format="PNG", optimize=True)
+                return output.getvalue(), "image/png"
+            image.convert("RGB").save(output, format="JPEG", quality=IMAGE_JPEG_QUALITY)
+            return output.getvalue(), "image/jpeg"
+    except Exception:
+        # Formats Pillow cannot decode (e.g. HEIC without a plugin) are sent as is
+        return data, None
+
+
+def _download_image(source: str) -> Tuple[bytes, str]:
+    """Download an image URL and return its bytes and MIME type."""
+    import requests as req
+    try:
+        response = req.get(source, timeout=30)
+        response.raise_for_status()
+    except req.RequestException as e:
+        raise req.RequestException(f"Failed to download image from URL: {source}. Error: {e}")
+
+    # Detect MIME type from content-type header
+    content_type = response.headers.get('content-type', 'image/jpeg')
+    if ';' in content_type:
+        content_type = content_type.split(';')[0].strip()
+    # Ensure it's an image type
+    if not content_type.startswith('image/'):
+        content_type = 'image/jpeg'
+    return response.content, content_type
+
+
+def prepare_image_payload(
+    source: str,
+    profile: Optional[ImageProfile] = None,
+    resize: bool = True,
+) -> Tuple[Optional[str], str]:
+    """
+    Load, downscale and base64-encode an image through the shared pipeline.
+
+    Payloads of local files are cached by (path, mtime, size, profile), so
+    sending the same image again costs no disk read or encoding. URLs are
+    downloaded on every call.
+
+    Args:
+        source: URL or file path to the image
+        profile: Target ImageProfile (None keeps the original resolution)
+        resize: If False, the original bytes are always sent
+
+    Returns:
+        Tuple[Optional[str], str]: The MIME type (None if the original file
+            bytes are sent and the caller should use the file extension) and
+            the base64 payload
+
+    Raises:
+        FileNotFoundError: If the image file doesn't exist
+        IOError: If there's an error reading the file
+        requests.RequestException: If a URL download fails
+
+    Example:
+        >>> mime_type, data = prepare_image_payload(
+        ...     "photo.jpg", get_image_profile("openai", "low")
+        ... )
+    """
+    global _image_cache_bytes
+    if not resize:
+        profile = None
+
+    if is_url(source):
+        data, mime_type = _download_image(source)
+        if profile is not None:
+            data, resized_mime = downscale_image(data, profile)
+            mime_type = resized_mime or mime_type
+        return mime_type, base64.b64encode(data).decode('utf-8')
+
+    try:
+        stat = os.stat(source)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Image file not found: {source}")
+    key = (os.path.abspath(source), stat.st_mtime_ns, stat.st_size,
+           profile.name if profile is not None else None)
+
+    with _image_cache_lock:
+        cached = _image_cache.get(key)
+        if cached is not None:
+            _image_cache.move_to_end(key)
+    record_cache(cached is not None)
+    if cached is not None:
+        return cached
+
+    try:
+        with open(source, "rb") as image_file:
+            data = image_file.read()
+    except Exception as e:
+        raise IOError(f"Error reading image file {source}: {str(e)}")
+
+    mime_type = None
+    if profile is not None:
+        data, mime_type = downscale_image(data, profile)
+    payload = (mime_type, base64.b64encode(data).decode('utf-8'))
+
+    with _image_cache_lock:
+        if key not in _image_cache and len(payload[1]) <= IMAGE_CACHE_MAX_BYTES:
+            _image_cache[key] = payload
+            _image_cache_bytes += len(payload[1])
+            while _image_cache_bytes > IMAGE_CACHE_MAX_BYTES:
+                _, (_, evicted) = _image_cache.popitem(last=False)
+                _image_cache_bytes -= len(evicted)
+    return payload
+
+
+def prepare_image_payloads(
+    sources: Sequence[str],
+    profile: Optional[ImageProfile] = None,
+    resize: bool = True,
+    max_workers: Optional[int] = None,
+) -> List[Tuple[Optional[str], str]]:
+    """
+    Prepare many images concurrently with prepare_image_payload().
+
+    Decoding, resizing and encoding run in a thread pool (Pillow releases
+    the GIL for the heavy work).
+
+    Args:
+        sources: URLs or file paths
+        profile: Target ImageProfile
+        resize: If False, the original bytes are always sent
+        max_workers: Maximum parallel images (default: IMAGE_PREPARE_MAX_WORKERS)
+
+    Returns:
+        List of (mime_type, base64) tuples in input order
+    """
+    sources = list(sources)
+    if len(sources) <= 1:
+        return [prepare_image_payload(source, profile, resize) for source in sources]
+    workers = min(len(sources), max_workers or IMAGE_PREPARE_MAX_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda source: prepare_image_payload(source, profile, resize), sources))
+
+
+def _local_payloads(
+    images: Sequence[str],
+    profile: ImageProfile,
+    resize: bool = True
+) -> Dict[str, Tuple[Optional[str], str]]:
+    """Prepare the local files among image sources concurrently."""
+    files = list(dict.fromkeys(source for source in images if not is_url(source)))
+    return dict(zip(files, prepare_image_payloads(files, profile, resize)))
+
+
 # OpenAI-specific constants
 OPENAI_MAX_IMAGE_SIZE_MB = 20
 OPENAI_SUPPORTED_FORMATS = ['.png', '.jpg', '.jpeg', '.gif', '.webp']
@@ -234,13 +529,41 @@ def validate_image_for_openai(
     return (is_valid, warning_message)
 
 
-def prepare_image_content(source: str, detail: str = "auto") -> Dict[str, Any]:
+def _image_url_content(
+    source: str,
+    detail: str,
+    payload: Optional[Tuple[Optional[str], str]]
+) -> Dict[str, Any]:
+    """Build an OpenAI-style image_url part from a URL or a prepared payload."""
+    if payload is None:
+        # URL-based image
+        return {
+            "type": "image_url",
+            "image_url": {
+                "url": source,
+                "detail": detail
+            }
+        }
+    mime_type, base64_image = payload
+    mime_type = mime_type or get_image_mime_type(source)
+    return {
+        "type": "image_url",
+        "image_url": {
+            "url": f"data:{mime_type};base64,{base64_image}",
+            "detail": detail
+        }
+    }
+
+
+def prepare_image_content(source: str, detail: str = "auto", resize: bool = True) -> Dict[str, Any]:
     """
     Prepare image content in OpenAI's vision API format.
 
     Args:
         source: URL or file path to the image
         detail: Level of detail for image processing ("low", "high", "auto")
+        resize: Downscale local files to the resolution OpenAI uses for
+            the detail level (default: True)
 
     Returns:
         dict: Image content formatted for OpenAI API
@@ -252,27 +575,11 @@ def prepare_image_content(source: str, detail: str = "auto") -> Dict[str, Any]:
     if detail not in ["low", "high", "auto"]:
         raise ValueError(f"Invalid detail level: {detail}. Must be 'low', 'high', or 'auto'")
 
-    if is_url(source):
-        # URL-based image
-        return {
-            "type": "image_url",
-            "image_url": {
-                "url": source,
-                "detail": detail
-            }
-        }
-    else:
+    payload = None
+    if not is_url(source):
         # Local file - encode to base64
-        base64_image = encode_image_to_base64(source)
-        mime_type = get_image_mime_type(source)
-
-        return {
-            "type": "image_url",
-            "image_url": {
-                "url": f"data:{mime_type};base64,{base64_image}",
-                "detail": detail
-            }
-        }
+        payload = prepare_image_payload(source, get_image_profile("openai", detail), resize)
+    return _image_url_content(source, detail, payload)
 
 
 def prepare_vision_content(
@@ -321,17 +628,21 @@ def prepare_vision_content(
 
     Notes:
         - URLs are passed directly to the API without validation
-        - Local files are encoded to base64 data URIs
+        - Local files are downscaled to the detail level's resolution,
+          encoded to base64 data URIs and cached
         - Use validate=True to catch issues before API calls
     """
     import logging
     logger = logging.getLogger(__name__)
 
+    if detail not in ["low", "high", "auto"]:
+        raise ValueError(f"Invalid detail level: {detail}. Must be 'low', 'high', or 'auto'")
+
     content = [{"type": "text", "text": text}]
 
-    for image_source in images:
-        # Optionally validate each image
-        if validate:
+    # Optionally validate each image
+    if validate:
+        for image_source in images:
             is_valid, warning = validate_image_for_openai(image_source, verbose)
             if warning:
                 if verbose:
@@ -339,8 +650,9 @@ def prepare_vision_content(
                 else:
                     logger.debug(f"[Vision] {image_source}: {warning}")
 
-        image_content = prepare_image_content(image_source, detail)
-        content.append(image_content)
+    payloads = _local_payloads(images, get_image_profile("openai", detail))
+    for image_source in images:
+        content.append(_image_url_content(image_source, detail, payloads.get(image_source)))
 
     return content
 
@@ -386,20 +698,12 @@ def validate_image_size(image_path: str) -> tuple:
     return (len(warnings) == 0, "; ".join(warnings) if warnings else None)
 
 
-def prepare_image_content_anthropic(source: str) -> Dict[str, Any]:
-    """
-    Prepare image content in Anthropic's vision API format.
-
-    Args:
-        source: URL or file path to the image
-
-    Returns:
-        dict: Image content formatted for Anthropic API
-
-    Raises:
-        FileNotFoundError: If local file doesn't exist
-    """
-    if is_url(source):
+def _anthropic_image_content(
+    source: str,
+    payload: Optional[Tuple[Optional[str], str]]
+) -> Dict[str, Any]:
+    """Build an Anthropic image block from a URL or a prepared payload."""
+    if payload is None:
         # URL-based image
         return {
             "type": "image",
@@ -408,26 +712,47 @@ def prepare_image_content_anthropic(source: str) -> Dict[str, Any]:
                 "url": source
             }
         }
-    else:
-        # Local file - encode to base64
-        # Validate size and warn if needed
+
+    mime_type, base64_image = payload
+    if mime_type is None:
+        # Original bytes are sent; validate size and warn if needed
         is_valid, warning = validate_image_size(source)
         if not is_valid and warning:
             import warnings
             warnings.warn(f"Image validation warning: {warning}. The API may reject this image.")
-
-        base64_image = encode_image_to_base64(source)
         mime_type = get_image_mime_type(source)
 
-        # Anthropic format: raw base64 data (no data URI prefix)
-        return {
-            "type": "image",
-            "source": {
-                "type": "base64",
-                "media_type": mime_type,
-                "data": base64_image
-            }
+    # Anthropic format: raw base64 data (no data URI prefix)
+    return {
+        "type": "image",
+        "source": {
+            "type": "base64",
+            "media_type": mime_type,
+            "data": base64_image
         }
+    }
+
+
+def prepare_image_content_anthropic(source: str, resize: bool = True) -> Dict[str, Any]:
+    """
+    Prepare image content in Anthropic's vision API format.
+
+    Args:
+        source: URL or file path to the image
+        resize: Downscale local files to the resolution Anthropic uses
+            (1568px long edge, ~1.15 megapixels). Default: True
+
+    Returns:
+        dict: Image content formatted for Anthropic API
+
+    Raises:
+        FileNotFoundError: If local file doesn't exist
+    """
+    payload = None
+    if not is_url(source):
+        # Local file - encode to base64
+        payload = prepare_image_payload(source, get_image_profile("anthropic"), resize)
+    return _anthropic_image_content(source, payload)
 
 
 def prepare_vision_content_anthropic(text: str, images: list) -> list:
@@ -446,9 +771,9 @@ def prepare_vision_content_anthropic(text: str, images: list) -> list:
     content = []
 
     # Anthropic best practice: images BEFORE text
+    payloads = _local_payloads(images, get_image_profile("anthropic"))
     for image_source in images:
-        image_content = prepare_image_content_anthropic(image_source)
-        content.append(image_content)
+        content.append(_anthropic_image_content(image_source, payloads.get(image_source)))
 
     # Text comes after images
     content.append({"type": "text", "text": text})
@@ -563,7 +888,7 @@ def validate_image_for_gemini(
     return (is_valid, warning_message)
 
 
-def prepare_image_content_gemini(source: str) -> Dict[str, Any]:
+def prepare_image_content_gemini(source: str, resize: bool = True) -> Dict[str, Any]:
     """
     Prepare image content in Gemini's vision API format.
 
@@ -572,6 +897,8 @@ def prepare_image_content_gemini(source: str) -> Dict[str, Any]:
 
     Args:
         source: URL or file path to the image.
+        resize: Downscale images larger than Gemini's 3072px input
+            resolution. Default: True
 
     Returns:
         dict: Image part formatted for Gemini API with inline_data.
@@ -588,46 +915,19 @@ def prepare_image_content_gemini(source: str) -> Dict[str, Any]:
         >>> # Also works with URLs
         >>> part = prepare_image_content_gemini("https://example.com/image.png")
     """
-    if is_url(source):
-        # For URLs, download and encode
-        import requests as req
-        try:
-            response = req.get(source, timeout=30)
-            response.raise_for_status()
-
-            # Detect MIME type from content-type header or URL
-            content_type = response.headers.get('content-type', 'image/jpeg')
-            if ';' in content_type:
-                content_type = content_type.split(';')[0].strip()
-
-            # Ensure it's an image type
-            if not content_type.startswith('image/'):
-                content_type = 'image/jpeg'
-
-            base64_data = base64.b64encode(response.content).decode('utf-8')
-
-            return {
-                "inline_data": {
-                    "mime_type": content_type,
-                    "data": base64_data
-                }
-            }
-        except req.RequestException as e:
-            raise req.RequestException(f"Failed to download image from URL: {source}. Error: {e}")
-    else:
-        # Local file
-        if not os.path.exists(source):
-            raise FileNotFoundError(f"Image file not found: {source}")
+    # URLs are downloaded; both URLs and files are downscaled and encoded
+    return _gemini_image_part(source, prepare_image_payload(source, get_image_profile("gemini"), resize))
 
-        base64_data = encode_image_to_base64(source)
-        mime_type = get_gemini_mime_type(source)
 
-        return {
-            "inline_data": {
-                "mime_type": mime_type,
-                "data": base64_data
-            }
+def _gemini_image_part(source: str, payload: Tuple[Optional[str], str]) -> Dict[str, Any]:
+    """Build a Gemini inline_data part from a prepared payload."""
+    mime_type, base64_data = payload
+    return {
+        "inline_data": {
+            "mime_type": mime_type or get_gemini_mime_type(source),
+            "data": base64_data
         }
+    }
 
 
 def prepare_vision_content_gemini(
@@ -668,6 +968,7 @@ def prepare_vision_content_gemini(
     Notes:
         - Images are placed before text (Gemini best practice)
         - URLs are downloaded and converted to base64 inline_data
+        - Images are downscaled to Gemini's input resolution before upload
         - For very large images, consider using Gemini's File API instead
     """
     import logging
@@ -681,18 +982,20 @@ def prepare_vision_content_gemini(
 
     parts = []
 
-    # Add images first (Gemini best practice)
-    for image_source in images:
-        # Optionally validate each image
-        if validate:
+    # Optionally validate each image
+    if validate:
+        for image_source in images:
             is_valid, warning = validate_image_for_gemini(image_source, verbose)
             if not is_valid:
                 logger.warning(f"[Gemini Vision] {image_source}: {warning}")
             elif warning and verbose:
                 logger.debug(f"[Gemini Vision] {image_source}: {warning}")
 
-        image_part = prepare_image_content_gemini(image_source)
-        parts.append(image_part)
+    # Add images first (Gemini best practice); files and URL downloads
+    # are prepared concurrently
+    payloads = prepare_image_payloads(images, get_image_profile("gemini"))
+    for image_source, payload in zip(images, payloads):
+        parts.append(_gemini_image_part(image_source, payload))
 
     # Add text after images
     parts.append({"text": text})
@@ -737,7 +1040,7 @@ def is_ollama_vision_model(model_name: str) -> bool:
     return any(pattern in model_lower for pattern in OLLAMA_VISION_PATTERNS)
 
 
-def prepare_image_for_ollama(source: str) -> str:
+def prepare_image_for_ollama(source: str, resize: bool = True) -> str:
     """
     Prepare an image for Ollama's vision API format.
 
@@ -746,6 +1049,8 @@ def prepare_image_for_ollama(source: str) -> str:
 
     Args:
         source: URL or file path to the image.
+        resize: Downscale images larger than 1344px on the long side, more
+            than current Ollama vision models use. Default: True
 
     Returns:
         str: Base64-encoded image data.
@@ -762,18 +1067,7 @@ def prepare_image_for_ollama(source: str) -> str:
         >>> # Also works with URLs
         >>> base64_data = prepare_image_for_ollama("https://example.com/image.png")
     """
-    if is_url(source):
-        # Download URL and convert to base64
-        import requests as req
-        try:
-            response = req.get(source, timeout=30)
-            response.raise_for_status()
-            return base64.b64encode(response.content).decode('utf-8')
-        except req.RequestException as e:
-            raise Exception(f"Failed to download image from URL: {source}. Error: {e}")
-    else:
-        # Local file - use existing helper
-        return encode_image_to_base64(source)
+    return prepare_image_payload(source, get_image_profile("ollama"), resize)[1]
 
 
 def prepare_vision_message_ollama(
@@ -820,7 +1114,9 @@ def prepare_vision_message_ollama(
         >>> len(msg["images"])
         2
     """
-    encoded_images = [prepare_image_for_ollama(img) for img in images]
+    encoded_images = [
+        payload for _, payload in prepare_image_payloads(images, get_image_profile("ollama"))
+    ]
 
     return {
         "role": role,
@@ -932,7 +1228,7 @@ def validate_image_for_cohere(
     return (is_valid, warning_message)
 
 
-def prepare_image_content_cohere(source: str, detail: str = "auto") -> Dict[str, Any]:
+def prepare_image_content_cohere(source: str, detail: str = "auto", resize: bool = True) -> Dict[str, Any]:
     """
     Prepare image content in Cohere's V2 vision API format.
 
@@ -943,6 +1239,8 @@ def prepare_image_content_cohere(source: str, detail: str = "auto") -> Dict[str,
     Args:
         source: URL or file path to the image.
         detail: Detail level ("low", "high", "auto"). Default: "auto"
+        resize: Downscale local files to the detail level's resolution.
+            Default: True
 
     Returns:
         dict: Image content formatted for Cohere V2 API.
@@ -955,30 +1253,11 @@ def prepare_image_content_cohere(source: str, detail: str = "auto") -> Dict[str,
         >>> content["type"]
         'image_url'
     """
-    if is_url(source):
-        # URL-based image
-        return {
-            "type": "image_url",
-            "image_url": {
-                "url": source,
-                "detail": detail
-            }
-        }
-    else:
+    payload = None
+    if not is_url(source):
         # Local file - encode to base64 data URL
-        if not os.path.exists(source):
-            raise FileNotFoundError(f"Image file not found: {source}")
-
-        base64_image = encode_image_to_base64(source)
-        mime_type = get_image_mime_type(source)
-
-        return {
-            "type": "image_url",
-            "image_url": {
-                "url": f"data:{mime_type};base64,{base64_image}",
-                "detail": detail
-            }
-        }
+        payload = prepare_image_payload(source, get_image_profile("cohere", detail), resize)
+    return _image_url_content(source, detail, payload)
 
 
 def prepare_vision_content_cohere(
@@ -1026,17 +1305,18 @@ def prepare_vision_content_cohere(
     # Add text first (following Cohere's example format)
     content.append({"type": "text", "text": text})
 
-    # Add images after text
-    for image_source in images:
-        # Optionally validate each image
-        if validate:
+    # Optionally validate each image
+    if validate:
+        for image_source in images:
             valid, warning = validate_image_for_cohere(image_source, verbose)
             if not valid:
                 logger.warning(f"[Cohere Vision] {image_source}: {warning}")
             elif warning and verbose:
                 logger.debug(f"[Cohere Vision] {image_source}: {warning}")
 
-        image_content = prepare_image_content_cohere(image_source, detail)
-        content.append(image_content)
+    # Add images after text
+    payloads = _local_payloads(images, get_image_profile("cohere", detail))
+    for image_source in images:
+        content.append(_image_url_content(image_source, detail, payloads.get(image_source)))
 
     return content
@@ -3,10 +3,16 @@ Pattern extraction utilities for SimplerLLM.
 
 This module provides regex-based pattern extraction, validation, and normalization
 for common data types like emails, phone numbers, URLs, dates, and more.
+
+For scanning large texts for many pattern types at once, use PatternScanner,
+which combines the patterns into a single named-group regex and supports
+chunked streaming input from files.
 """
 
 import re
-from typing import List, Dict, Optional, Union, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Dict, Optional, Union, Tuple, Any, Iterable, Iterator
 from datetime import datetime
 from urllib.parse import urlparse
 
@@ -62,6 +68,32 @@ PREDEFINED_PATTERNS = {
     "filepath": r"(?:[a-zA-Z]:\\|/)(?:[^\\/:*?\"<>|\r\n]+[\\\/])*[^\\/:*?\"<>|\r\n]*",
 }
 
+# Patterns whose regex matches too broadly to trust a hit in arbitrary source
+# text (any word looks like a username, any number like a currency amount).
+# Local-first extraction always defers these to the LLM.
+SEMANTIC_PATTERNS = {
+    "username",
+    "currency",
+    "filepath",
+    "zip_code",
+}
+
+# Default scan order for PatternScanner. When two pattern types match at the
+# same position, the earlier (more specific) one wins.
+SCAN_PRIORITY = [
+    "email",
+    "url",
+    "ipv6",
+    "ipv4",
+    "credit_card",
+    "ssn",
+    "date",
+    "phone",
+    "time",
+    "hex_color",
+    "hashtag",
+]
+
 
 # ==============================================================================
 # PATTERN EXTRACTION FUNCTIONS
@@ -84,6 +116,98 @@ def get_predefined_pattern(pattern_name: str) -> Optional[str]:
     return PREDEFINED_PATTERNS.get(pattern_name.lower())
 
 
+@lru_cache(maxsize=256)
+def get_compiled_pattern(pattern: str, flags: int = 0) -> re.Pattern:
+    """
+    Get a compiled regex, compiling each (pattern, flags) pair only once.
+
+    Args:
+        pattern: The regex pattern string
+        flags: Optional regex flags
+
+    Returns:
+        The compiled pattern
+
+    Raises:
+        re.error: If the pattern is invalid
+    """
+    return re.compile(pattern, flags)
+
+
+def is_semantic_pattern(pattern_type: str) -> bool:
+    """
+    Check whether a pattern type needs the LLM to judge which match is the answer.
+
+    Args:
+        pattern_type: Name of the pattern (e.g., 'email', 'username')
+
+    Returns:
+        True if the pattern is listed in SEMANTIC_PATTERNS
+    """
+    return pattern_type.lower() in SEMANTIC_PATTERNS
+
+
+def find_valid_matches(
+    text: str,
+    pattern_type: str,
+    pattern: Optional[str] = None,
+    extract_all: bool = False,
+    validate: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Scan text for matches of a pattern and keep only those that pass validation.
+
+    This is the deterministic path used by local-first extraction: it looks
+    for the answer directly in the source text without calling an LLM.
+
+    Args:
+        text: The text to scan
+        pattern_type: Name of the pattern, used to look up the validator
+        pattern: Regex pattern (defaults to the predefined pattern for pattern_type)
+        extract_all: If True, return all valid matches; if False, stop at the first
+        validate: If True, run the pattern's validator on each match
+
+    Returns:
+        List of dictionaries with 'value', 'position', 'is_valid' and
+        'validation_message' keys. Empty if nothing valid was found.
+
+    Example:
+        >>> find_valid_matches("Reach us at help@example.com", "email")
+        [{'value': 'help@example.com', 'position': 12, 'is_valid': True, 'validation_message': 'Valid email format'}]
+    """
+    pattern = pattern or get_predefined_pattern(pattern_type)
+    if not pattern or not text:
+        return []
+
+    try:
+        compiled = get_compiled_pattern(pattern)
+    except re.error:
+        return []
+
+    validator = get_validation_function(pattern_type) if validate else None
+    matches = []
+
+    for match in compiled.finditer(text):
+        value = match.group()
+        if validator:
+            is_valid, message = validator(value)
+            if not is_valid:
+                continue
+        else:
+            message = "Match found"
+
+        matches.append({
+            'value': value,
+            'position': match.start(),
+            'is_valid': True,
+            'validation_message': message,
+        })
+        if not extract_all:
+            break
+
+    return matches
+
+
 def extract_pattern_from_text(
     text: str,
     pattern: str,
@@ -109,14 +233,15 @@ def extract_pattern_from_text(
     matches = []
 
     try:
+        compiled = get_compiled_pattern(pattern, flags)
         if extract_all:
-            for match in re.finditer(pattern, text, flags):
+            for match in compiled.finditer(text):
                 matches.append({
                     'value': match.group(),
                     'position': match.start()
                 })
         else:
-            match = re.search(pattern, text, flags)
+            match = compiled.search(text)
             if match:
                 matches.append({
                     'value': match.group(),
@@ -129,6 +254,237 @@ def extract_pattern_from_text(
     return matches
 
 
+# ==============================================================================
+# MULTI-PATTERN SCANNER
+# ==============================================================================
+
+@dataclass
+class ScanMatch:
+    """A single match produced by PatternScanner."""
+    pattern_type: str
+    value: str
+    start: int
+    end: int
+    is_valid: bool = True
+    validation_message: str = "Match found"
+    normalized_value: Optional[str] = None
+
+
+class PatternScanner:
+    """
+    Single-pass extractor for many pattern types.
+
+    All patterns are combined into one regex of named alternatives, so a text
+    is scanned once no matter how many pattern types are requested. When two
+    types match at the same position, the one listed first wins.
+
+    Validation and normalization are batched: each distinct value is
+    validated and normalized once per scanned chunk, which matters for logs
+    where the same address or number repeats many times.
+
+    Args:
+        pattern_types: Predefined pattern names to scan for, in priority
+            order. Defaults to SCAN_PRIORITY.
+        custom_patterns: Extra {name: regex} patterns, scanned after the
+            predefined ones.
+        validate: If True, run each type's validator on its matches
+        normalize: If True, run each type's normalizer on valid matches
+        only_valid: If True, drop matches that fail validation
+        flags: Regex flags for the combined pattern
+
+    Raises:
+        ValueError: If a pattern name is unknown or a pattern is invalid
+
+    Example:
+        >>> scanner = PatternScanner(["email", "ipv4"])
+        >>> [(m.pattern_type, m.value, m.start) for m in scanner.scan("a@b.com from 10.0.0.1")]
+        [('email', 'a@b.com', 0), ('ipv4', '10.0.0.1', 13)]
+        >>> for match in scanner.scan_file("server.log"):
+        ...     print(match.pattern_type, match.start)
+    """
+
+    def __init__(
+        self,
+        pattern_types: Optional[List[str]] = None,
+        custom_patterns: Optional[Dict[str, str]] = None,
+        validate: bool = True,
+        normalize: bool = True,
+        only_valid: bool = False,
+        flags: int = 0,
+    ):
+        self.only_valid = only_valid
+
+        patterns = []
+        for name in (SCAN_PRIORITY if pattern_types is None else pattern_types):
+            pattern = get_predefined_pattern(name)
+            if pattern is None:
+                raise ValueError(f"Unknown pattern type: {name}")
+            patterns.append((name.lower(), pattern))
+        for name, pattern in (custom_patterns or {}).items():
+            patterns.append((name, pattern))
+
+        if not patterns:
+            raise ValueError("PatternScanner needs at least one pattern")
+
+        # Group names are positional so any pattern name can be used
+        self.pattern_types = [name for name, _ in patterns]
+        self._group_types = {}
+        alternatives = []
+        for i, (name, pattern) in enumerate(patterns):
+            group = f"p{i}"
+            self._group_types[group] = name
+            alternatives.append(f"(?P<{group}>{pattern})")
+
+        try:
+            self._regex = re.compile("|".join(alternatives), flags)
+        except re.error as e:
+            raise ValueError(f"Invalid pattern: {e}")
+
+        # Resolve validators and normalizers once per type
+        self._validators = {
+            name: get_validation_function(name) if validate else None
+            for name in self.pattern_types
+        }
+        self._normalizers = {
+            name: get_normalization_function(name) if normalize else None
+            for name in self.pattern_types
+        }
+
+    def scan(self, text: str) -> List[ScanMatch]:
+        """
+        Scan a text and return all matches in order of position.
+
+        Args:
+            text: The text to scan
+
+        Returns:
+            List of ScanMatch objects with absolute offsets
+        """
+        return self._process(self._find(text, 0, len(text)), 0)
+
+    def scan_stream(
+        self,
+        chunks: Iterable[str],
+        max_match_length: int = 1024,
+    ) -> Iterator[ScanMatch]:
+        """
+        Scan text arriving in chunks, yielding matches as they are confirmed.
+
+        A tail of max_match_length characters is carried over between chunks,
+        so matches that straddle a chunk boundary are found once, with
+        offsets relative to the start of the whole stream.
+
+        Args:
+            chunks: Iterable of text chunks (e.g., an open text file)
+            max_match_length: Longest match expected. Matches longer than
+                this may be split at chunk boundaries.
+
+        Yields:
+            ScanMatch objects in order of position
+        """
+        # Characters kept before the scan position so \b and lookbehinds
+        # see the real preceding text
+        context = 64
+        buffer = ""
+        buffer_offset = 0  # Stream offset of buffer[0]
+        scan_from = 0      # Buffer index where the next scan starts
+
+        for chunk in chunks:
+            if not chunk:
+                continue
+            buffer += chunk
+            if len(buffer) - scan_from <= max_match_length:
+                continue
+
+            cut = len(buffer) - max_match_length
+            confirmed = []
+            resume = cut
+            for match in self._regex.finditer(buffer, scan_from):
+                if match.end() > cut:
+                    resume = min(match.start(), cut)
+                    break
+                confirmed.append(match)
+
+            yield from self._process(confirmed, buffer_offset)
+
+            drop = max(0, resume - context)
+            buffer = buffer[drop:]
+            buffer_offset += drop
+            scan_from = resume - drop
+
+        yield from self._process(self._find(buffer, scan_from, len(buffer)), buffer_offset)
+
+    def scan_file(
+        self,
+        file_path: str,
+        chunk_size: int = 1024 * 1024,
+        encoding: str = "utf-8",
+        max_match_length: int = 1024,
+    ) -> Iterator[ScanMatch]:
+        """
+        Stream a text file through the scanner without loading it whole.
+
+        Args:
+            file_path: Path to the file
+            chunk_size: Characters read per chunk
+            encoding: File encoding
+            max_match_length: Longest match expected (see scan_stream)
+
+        Yields:
+            ScanMatch objects with offsets in characters from the file start
+        """
+        with open(file_path, "r", encoding=encoding, errors="replace") as f:
+            chunks = iter(lambda: f.read(chunk_size), "")
+            yield from self.scan_stream(chunks, max_match_length=max_match_length)
+
+    def _find(self, text: str, start: int, end: int) -> List[re.Match]:
+        """Run the combined regex over text[start:end]."""
+        return list(self._regex.finditer(text, start, end))
+
+    def _process(self, matches: List[re.Match], offset: int) -> List[ScanMatch]:
+        """Turn raw regex matches into validated, normalized ScanMatch objects."""
+        group_types = self._group_types
+
+        # Group distinct values by type so each is validated once
+        values_by_type: Dict[str, set] = {}
+        raw = []
+        for match in matches:
+            pattern_type = group_types[match.lastgroup]
+            value = match.group(match.lastgroup)
+            raw.append((pattern_type, value, match.start(), match.end()))
+            values_by_type.setdefault(pattern_type, set()).add(value)
+
+        results = {}
+        for pattern_type, values in values_by_type.items():
+            validator = self._validators[pattern_type]
+            normalizer = self._normalizers[pattern_type]
+            for value in values:
+                is_valid, message = validator(value) if validator else (True, "Match found")
+                normalized = None
+                if normalizer and is_valid:
+                    try:
+                        normalized = normalizer(value)
+                    except Exception:
+                        normalized = value
+                results[(pattern_type, value)] = (is_valid, message, normalized)
+
+        scanned = []
+        for pattern_type, value, start, end in raw:
+            is_valid, message, normalized = results[(pattern_type, value)]
+            if self.only_valid and not is_valid:
+                continue
+            scanned.append(ScanMatch(
+                pattern_type=pattern_type,
+                value=value,
+                start=offset + start,
+                end=offset + end,
+                is_valid=is_valid,
+                validation_message=message,
+                normalized_value=normalized,
+            ))
+        return scanned
+
+
 # ==============================================================================
 # VALIDATION FUNCTIONS
 # ==============================================================================
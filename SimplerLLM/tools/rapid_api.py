@@ -1,4 +1,3 @@
-from dotenv import load_dotenv
 import os
 import time
 import requests
@@ -6,7 +5,6 @@ import aiohttp
 import asyncio
 from typing import Optional, Any, Dict
 
-load_dotenv()  # Load the environment variables
 
 class RapidAPIClient:
     def __init__(self, api_key: Optional[str] = None, timeout: int = 30):
@@ -1,5 +1,4 @@
 from duckduckgo_search import DDGS
-from dotenv import load_dotenv
 from urllib.parse import urlparse
 from pydantic import BaseModel, HttpUrl
 from typing import Optional, List
@@ -21,10 +20,6 @@ def get_domain_from_url(url):
     return parsed_url.netloc
 
 
-# Load environment variables
-load_dotenv()
-
-
 VALUE_SERP_API_KEY = os.getenv("VALUE_SERP_API_KEY")
 
 SERPER_API_KEY = os.getenv("SERPER_API_KEY")
@@ -195,10 +195,12 @@ def __combine_sentences(sentences):
 def __convert_to_vector(combined_sentences_list, llm_embeddings_instance: llm_embeddings_instance):
     # Try to generate embeddings for a list of texts using a pre-trained model and handle any exceptions.
     try:
-        response = llm_embeddings_instance.generate_embeddings(combined_sentences_list)
+        response = llm_embeddings_instance.generate_embeddings(
+            combined_sentences_list, as_numpy=True
+        )
         #response = openai.embeddings.create(input=combined_sentences_list, model="text-embedding-3-small")
-        # The response is already a list of embeddings when input is a list
-        embeddings = np.array(response) if isinstance(response, list) else np.array([response])
+        # The response is already a (n, dimension) float32 array when input is a list
+        embeddings = np.atleast_2d(response)
         return embeddings
     except Exception as e:
         print("An error occurred:", e)
@@ -3,10 +3,8 @@ import re
 import requests
 from typing import List
 from pydantic import BaseModel
-from dotenv import load_dotenv
 from youtube_transcript_api import YouTubeTranscriptApi
 
-load_dotenv(override=True) 
 
 class TranscriptSegment(BaseModel):
     text: str
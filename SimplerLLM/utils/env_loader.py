@@ -0,0 +1,71 @@
+"""
+One-time loading of .env files.
+
+SimplerLLM reads API keys and settings from environment variables. The
+package loads the nearest .env file once, when it is first imported;
+provider modules no longer load it themselves.
+
+Set SIMPLERLLM_AUTOLOAD_DOTENV=0 to skip the automatic load (for example
+in serverless functions where the platform provides the variables), and
+call load_env() to load a specific file explicitly.
+"""
+
+import os
+import threading
+from typing import Optional
+
+_lock = threading.Lock()
+_loaded_path: Optional[str] = None
+_autoload_done = False
+
+
+def load_env(dotenv_path: Optional[str] = None, override: bool = True) -> Optional[str]:
+    """
+    Load variables from a .env file into os.environ.
+
+    Args:
+        dotenv_path: File to load (default: the first .env found from the
+            current directory upwards, then from the package location upwards)
+        override: Whether .env values replace variables that are already set
+
+    Returns:
+        Path of the loaded file, or None if no file was found
+
+    Example:
+        >>> from SimplerLLM import load_env
+        >>> load_env("config/production.env")
+    """
+    global _loaded_path
+    from dotenv import find_dotenv, load_dotenv
+
+    if dotenv_path is None:
+        dotenv_path = find_dotenv(usecwd=True) or find_dotenv()
+    if not dotenv_path or not os.path.isfile(dotenv_path):
+        return None
+
+    with _lock:
+        load_dotenv(dotenv_path, override=override)
+        _loaded_path = dotenv_path
+    return dotenv_path
+
+
+def autoload_env() -> None:
+    """
+    Load the default .env file on the first call only.
+
+    Called by the package on import. Does nothing when
+    SIMPLERLLM_AUTOLOAD_DOTENV is set to 0, false or no.
+    """
+    global _autoload_done
+    if _autoload_done:
+        return
+    _autoload_done = True
+
+    if os.getenv("SIMPLERLLM_AUTOLOAD_DOTENV", "1").strip().lower() in ("0", "false", "no"):
+        return
+    load_env()
+
+
+def loaded_env_path() -> Optional[str]:
+    """Return the path of the last .env file loaded, if any."""
+    return _loaded_path
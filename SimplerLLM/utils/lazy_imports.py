@@ -0,0 +1,58 @@
+"""
+Lazy package exports (PEP 562).
+
+Package __init__ modules map each public name to the submodule that
+defines it. The submodule, and the provider SDK it depends on, is only
+imported when the name is first accessed, which keeps `import SimplerLLM`
+fast.
+"""
+
+import importlib
+import sys
+from typing import Callable, Dict, Iterable, List, Tuple
+
+
+def lazy_exports(
+    package_name: str,
+    exports: Dict[str, str],
+    optional: Iterable[str] = (),
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Build module-level __getattr__ and __dir__ functions for lazy exports.
+
+    Args:
+        package_name: __name__ of the package
+        exports: Public name -> module defining it (relative to the package)
+        optional: Names that resolve to None when their module cannot be
+            imported (missing optional dependency)
+
+    Returns:
+        tuple: (__getattr__, __dir__)
+
+    Example:
+        >>> _EXPORTS = {"LLM": ".llm.base", "LLMProvider": ".llm.base"}
+        >>> __getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+        >>> __all__ = list(_EXPORTS)
+    """
+    optional = frozenset(optional)
+
+    def __getattr__(name: str):
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+
+        try:
+            value = getattr(importlib.import_module(module_name, package_name), name)
+        except (ImportError, TypeError):
+            if name not in optional:
+                raise
+            value = None
+
+        # Cache on the package so later lookups skip __getattr__
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package_name])) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,331 @@
+"""
+Single-flight coalescing of identical in-flight requests.
+
+When many threads or coroutines ask for the same completion or embedding
+at the same moment (for example right after a cache entry expires), only
+the first call reaches the provider. The others wait for it and receive
+the same result or exception, which keeps bursts of duplicate traffic
+from eating into rate limits.
+
+LLM wrappers and embedding providers use this when their single_flight
+attribute is True:
+
+    >>> llm = LLM.create(provider=LLMProvider.OPENAI, model_name="gpt-4o-mini")
+    >>> llm.single_flight = True        # one instance
+    >>> LLM.single_flight = True        # every LLM wrapper
+    >>> BaseEmbeddings.single_flight = True  # every embeddings provider
+
+Requests are identical when the provider class, the instance settings
+(model, temperature, API key, ...) and every argument, after defaults
+are applied, are equal. Only calls that overlap in time are shared;
+nothing is cached once the call completes.
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import threading
+from contextvars import ContextVar
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterable, Optional, Tuple
+
+from SimplerLLM.instrumentation.core import current_span
+
+# Keys this context is currently computing, so a leader that re-enters
+# the same request (e.g. through super()) calls through instead of
+# waiting on itself
+_leading: ContextVar[FrozenSet[str]] = ContextVar("simplerllm_single_flight", default=frozenset())
+
+# Instance attributes that never change what the provider returns
+_IGNORED_ATTRIBUTES = ("verbose", "single_flight")
+
+
+def _canonical(value: Any) -> Any:
+    """Convert value to a JSON-serializable form that is equal for equal requests."""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, Enum):
+        return f"{type(value).__qualname__}.{value.name}"
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return "bytes:" + hashlib.sha256(value).hexdigest()
+    if isinstance(value, type):
+        return f"{value.__module__}.{value.__qualname__}"
+    if hasattr(value, "model_dump"):  # Pydantic models
+        return _canonical(value.model_dump())
+    if hasattr(value, "tolist"):  # NumPy arrays and scalars
+        return _canonical(value.tolist())
+    # Unknown objects only match themselves
+    return f"{type(value).__qualname__}@{id(value):x}"
+
+
+def request_key(*parts: Any) -> str:
+    """
+    Build a canonical hash for a request.
+
+    Dicts are compared regardless of key order, tuples equal lists, and
+    Pydantic models and NumPy arrays compare by content. Objects with no
+    canonical form only match themselves.
+
+    Args:
+        *parts: Values that together identify the request
+
+    Returns:
+        Hex SHA-256 digest
+
+    Example:
+        >>> request_key("gpt-4o-mini", {"b": 1, "a": 2}) == request_key("gpt-4o-mini", {"a": 2, "b": 1})
+        True
+    """
+    payload = json.dumps(_canonical(parts), sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class _Call:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class _AsyncCall:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Task"):
+        self.task = task
+        self.waiters = 0
+
+
+def _retrieve_exception(task: "asyncio.Task") -> None:
+    # Keep asyncio from logging "exception was never retrieved" when every
+    # waiter was cancelled before the shared call failed
+    if not task.cancelled():
+        task.exception()
+
+
+class SingleFlight:
+    """
+    Share one execution between concurrent calls with the same key.
+
+    do() coalesces across threads; do_async() coalesces coroutines on the
+    same event loop. The underlying async call runs in its own task, so
+    cancelling one waiter does not cancel it for the others; it is
+    cancelled only when every waiter has gone.
+
+    All callers receive the same result object, so treat results as
+    read-only.
+
+    Example:
+        >>> flight = SingleFlight()
+        >>> result = flight.do(request_key("user", 42), load_user, 42)
+        >>> result = await flight.do_async(request_key("user", 42), load_user_async, 42)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._async_calls: Dict[Tuple[asyncio.AbstractEventLoop, str], _AsyncCall] = {}
+
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running."""
+        with self._lock:
+            return len(self._calls) + len(self._async_calls)
+
+    def do(self, key: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run fn(*args, **kwargs), or wait for the identical call already running.
+
+        Args:
+            key: Request key (see request_key())
+            fn: Function to run if no call with this key is in flight
+
+        Returns:
+            The result of the shared call
+
+        Raises:
+            Whatever the shared call raised
+        """
+        return self._do(key, fn, args, kwargs)[0]
+
+    async def do_async(self, key: str, fn: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """
+        Await fn(*args, **kwargs), or wait for the identical call already running.
+
+        Args:
+            key: Request key (see request_key())
+            fn: Coroutine function to run if no call with this key is in flight
+
+        Returns:
+            The result of the shared call
+
+        Raises:
+            Whatever the shared call raised
+        """
+        return (await self._do_async(key, fn, args, kwargs))[0]
+
+    def _do(self, key, fn, args, kwargs) -> Tuple[Any, bool]:
+        leading = _leading.get()
+        if key in leading:
+            return fn(*args, **kwargs), False
+
+        with self._lock:
+            call = self._calls.get(key)
+            shared = call is not None
+            if not shared:
+                call = self._calls[key] = _Call()
+
+        if shared:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        token = _leading.set(leading | {key})
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result, False
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            _leading.reset(token)
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    async def _lead(self, flight_key, key, fn, args, kwargs):
+        _leading.set(_leading.get() | {key})
+        try:
+            return await fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._async_calls.pop(flight_key, None)
+
+    async def _do_async(self, key, fn, args, kwargs) -> Tuple[Any, bool]:
+        if key in _leading.get():
+            return await fn(*args, **kwargs), False
+
+        loop = asyncio.get_running_loop()
+        flight_key = (loop, key)
+        with self._lock:
+            call = self._async_calls.get(flight_key)
+            shared = call is not None
+            if not shared:
+                task = loop.create_task(self._lead(flight_key, key, fn, args, kwargs))
+                task.add_done_callback(_retrieve_exception)
+                call = self._async_calls[flight_key] = _AsyncCall(task)
+            call.waiters += 1
+
+        try:
+            return await asyncio.shield(call.task), shared
+        finally:
+            with self._lock:
+                call.waiters -= 1
+                abandoned = call.waiters == 0 and not call.task.done()
+            if abandoned:
+                call.task.cancel()
+
+
+# Shared by all providers so separate instances with the same settings coalesce
+_default_flight = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    """Return the SingleFlight group used by LLM wrappers and embedding providers."""
+    return _default_flight
+
+
+def _instance_settings(owner) -> Dict[str, Any]:
+    return {
+        name: value
+        for name, value in vars(owner).items()
+        if not name.startswith("_")
+        and name not in _IGNORED_ATTRIBUTES
+        and (value is None or isinstance(value, (str, bool, int, float, Enum)))
+    }
+
+
+def _mark_coalesced() -> None:
+    span = current_span()
+    if span is not None:
+        span.set_attribute("simplerllm.coalesced", True)
+
+
+def _wrap(func: Callable) -> Callable:
+    signature = inspect.signature(func)
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    def key_for(self, args, kwargs) -> Optional[str]:
+        try:
+            bound = signature.bind(self, *args, **kwargs)
+        except TypeError:
+            return None  # Let the call itself report the bad arguments
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        arguments.pop(next(iter(signature.parameters)))
+        return request_key(name, _instance_settings(self), arguments)
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            if not self.single_flight:
+                return await func(self, *args, **kwargs)
+            key = key_for(self, args, kwargs)
+            if key is None:
+                return await func(self, *args, **kwargs)
+            result, shared = await _default_flight._do_async(key, func, (self, *args), kwargs)
+            if shared:
+                _mark_coalesced()
+            return result
+
+        wrapper = async_wrapper
+
+    else:
+        @functools.wraps(func)
+        def sync_wrapper(self, *args, **kwargs):
+            if not self.single_flight:
+                return func(self, *args, **kwargs)
+            key = key_for(self, args, kwargs)
+            if key is None:
+                return func(self, *args, **kwargs)
+            result, shared = _default_flight._do(key, func, (self, *args), kwargs)
+            if shared:
+                _mark_coalesced()
+            return result
+
+        wrapper = sync_wrapper
+
+    wrapper.__single_flight__ = True
+    return wrapper
+
+
+def coalesce_class(cls: type, method_names: Iterable[str]) -> type:
+    """
+    Wrap the listed methods of cls so identical concurrent calls are shared.
+
+    Coalescing is active for an instance while its single_flight
+    attribute is True. Only methods defined on cls itself are wrapped;
+    call it from a base class's __init_subclass__ to cover every
+    provider. Call it before instrument_class() so each caller still
+    gets its own span (shared ones carry simplerllm.coalesced=True).
+
+    Args:
+        cls: Class to wrap
+        method_names: Sync or async methods to coalesce
+
+    Returns:
+        cls
+    """
+    for method_name in method_names:
+        func = cls.__dict__.get(method_name)
+        if func is None or not callable(func) or getattr(func, "__single_flight__", False):
+            continue
+        setattr(cls, method_name, _wrap(func))
+    return cls
@@ -104,11 +104,20 @@ from .exceptions import (
     VectorDBOperationError,
 )
 
+# Declarative metadata filters
+from .filters import MetadataColumns, matches_filter, to_qdrant_filter
+
 # Wrapper implementations (high-level)
 from .wrappers import LocalVectorDB, QdrantVectorDB
 
 # Provider implementations (low-level)
-from .providers import SimplerVectors, SerializationFormat
+from .providers import (
+    SimplerVectors,
+    SerializationFormat,
+    convert_collection_format,
+    WALSyncPolicy,
+    QuantizationMethod,
+)
 
 __all__ = [
     # Core factory and enum
@@ -125,10 +134,17 @@ __all__ = [
     'DimensionMismatchError',
     'VectorDBConnectionError',
     'VectorDBOperationError',
+    # Metadata filters
+    'MetadataColumns',
+    'matches_filter',
+    'to_qdrant_filter',
     # Wrapper implementations
     'LocalVectorDB',
     'QdrantVectorDB',
     # Provider implementations
     'SimplerVectors',
     'SerializationFormat',
+    'convert_collection_format',
+    'WALSyncPolicy',
+    'QuantizationMethod',
 ]
@@ -0,0 +1,297 @@
+"""
+Declarative metadata filters for vector search.
+
+Filters are plain dictionaries in a MongoDB-like syntax, shared by all
+providers. The local provider evaluates them as vectorized NumPy masks over
+columnar metadata; Qdrant receives them translated into server-side
+filters.
+
+Syntax:
+    {"lang": "en"}                              Equality
+    {"year": {"$gte": 2020, "$lt": 2025}}       Comparison (AND of operators)
+    {"tag": {"$in": ["ai", "ml"]}}              Membership
+    {"draft": {"$exists": False}}               Presence
+    {"$or": [{"lang": "en"}, {"lang": "fr"}]}   Logical OR
+    {"$and": [...]}, {"$not": {...}}            Logical AND / NOT
+
+Top-level keys are combined with AND. Comparison operators: $eq, $ne, $gt,
+$gte, $lt, $lte, $in, $nin, $exists. As in MongoDB, $ne and $nin also
+match rows where the key is missing.
+
+Example:
+    >>> results = db.top_cosine_similarity(
+    ...     query_vector,
+    ...     top_n=5,
+    ...     metadata_filter={"lang": "en", "year": {"$gte": 2020}}
+    ... )
+"""
+
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .exceptions import VectorDBOperationError
+
+COMPARISON_OPERATORS = {"$eq", "$ne", "$gt", "$gte", "$lt", "$lte", "$in", "$nin", "$exists"}
+LOGICAL_OPERATORS = {"$and", "$or", "$not"}
+_RANGE_OPERATORS = {"$gt": "gt", "$gte": "gte", "$lt": "lt", "$lte": "lte"}
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _field_conditions(condition: Any) -> Dict[str, Any]:
+    """Normalize a field condition to an {operator: operand} dict."""
+    if isinstance(condition, dict) and condition and all(k.startswith("$") for k in condition):
+        unknown = set(condition) - COMPARISON_OPERATORS
+        if unknown:
+            raise VectorDBOperationError(f"Unknown filter operator(s): {', '.join(sorted(unknown))}")
+        return condition
+    return {"$eq": condition}
+
+
+class MetadataColumns:
+    """
+    Columnar view of metadata for vectorized filter evaluation.
+
+    Built in one pass over the metadata; per-key numeric and string arrays
+    are materialized on first use and cached. Rebuild after the metadata
+    changes.
+
+    Args:
+        metadata: Sequence of metadata objects (only dicts are filterable)
+    """
+
+    def __init__(self, metadata: Sequence[Any]):
+        self.size = len(metadata)
+        self._rows: Dict[str, List[int]] = defaultdict(list)
+        self._values: Dict[str, List[Any]] = defaultdict(list)
+        for i, meta in enumerate(metadata):
+            if isinstance(meta, dict):
+                for key, value in meta.items():
+                    self._rows[key].append(i)
+                    self._values[key].append(value)
+        self._cache: Dict[tuple, Any] = {}
+
+    def present(self, key: str) -> np.ndarray:
+        """Boolean mask of rows that have the key."""
+        cache_key = ("present", key)
+        if cache_key not in self._cache:
+            mask = np.zeros(self.size, dtype=bool)
+            mask[self._rows.get(key, [])] = True
+            self._cache[cache_key] = mask
+        return self._cache[cache_key]
+
+    def numeric(self, key: str) -> np.ndarray:
+        """Float column of numeric values (NaN where missing or non-numeric)."""
+        cache_key = ("numeric", key)
+        if cache_key not in self._cache:
+            column = np.full(self.size, np.nan)
+            for row, value in zip(self._rows.get(key, []), self._values.get(key, [])):
+                if _is_number(value):
+                    column[row] = value
+            self._cache[cache_key] = column
+        return self._cache[cache_key]
+
+    def strings(self, key: str):
+        """Unicode column of string values and the mask of rows holding strings."""
+        cache_key = ("strings", key)
+        if cache_key not in self._cache:
+            values = [""] * self.size
+            mask = np.zeros(self.size, dtype=bool)
+            for row, value in zip(self._rows.get(key, []), self._values.get(key, [])):
+                if isinstance(value, str):
+                    values[row] = value
+                    mask[row] = True
+            self._cache[cache_key] = (np.array(values, dtype=str), mask)
+        return self._cache[cache_key]
+
+    def objects(self, key: str) -> np.ndarray:
+        """Object column of raw values (None where missing)."""
+        cache_key = ("objects", key)
+        if cache_key not in self._cache:
+            column = np.empty(self.size, dtype=object)
+            rows = self._rows.get(key, [])
+            if rows:
+                column[rows] = self._values[key]
+            self._cache[cache_key] = column
+        return self._cache[cache_key]
+
+    def evaluate(
+        self,
+        metadata_filter: Dict[str, Any],
+        index: Optional[Dict[str, List[int]]] = None
+    ) -> np.ndarray:
+        """
+        Evaluate a filter to a boolean row mask.
+
+        Args:
+            metadata_filter: Filter dictionary
+            index: Optional "key:value" -> rows inverted index, used to
+                narrow string equality checks to candidate rows
+
+        Returns:
+            Boolean array of length size
+
+        Raises:
+            VectorDBOperationError: If the filter is malformed
+        """
+        if not isinstance(metadata_filter, dict):
+            raise VectorDBOperationError("metadata_filter must be a dictionary")
+
+        mask = np.ones(self.size, dtype=bool)
+        for key, condition in metadata_filter.items():
+            if key == "$and":
+                for sub in condition:
+                    mask &= self.evaluate(sub, index)
+            elif key == "$or":
+                any_mask = np.zeros(self.size, dtype=bool)
+                for sub in condition:
+                    any_mask |= self.evaluate(sub, index)
+                mask &= any_mask
+            elif key == "$not":
+                mask &= ~self.evaluate(condition, index)
+            elif key.startswith("$"):
+                raise VectorDBOperationError(f"Unknown filter operator: {key}")
+            else:
+                for op, operand in _field_conditions(condition).items():
+                    mask &= self._compare(key, op, operand, index)
+        return mask
+
+    def _equals(self, key: str, value: Any, index: Optional[Dict[str, List[int]]]) -> np.ndarray:
+        if isinstance(value, str):
+            column, is_string = self.strings(key)
+            if index is not None:
+                mask = np.zeros(self.size, dtype=bool)
+                candidates = np.asarray(index.get(f"{key}:{value}", []), dtype=np.intp)
+                if len(candidates):
+                    mask[candidates] = is_string[candidates] & (column[candidates] == value)
+                return mask
+            return is_string & (column == value)
+        if _is_number(value):
+            return self.numeric(key) == value
+        column = self.objects(key)
+        present = self.present(key)
+        return present & np.fromiter(
+            (type(v) is type(value) and v == value for v in column),
+            dtype=bool, count=self.size
+        )
+
+    def _compare(self, key: str, op: str, operand: Any, index) -> np.ndarray:
+        if op == "$eq":
+            return self._equals(key, operand, index)
+        if op == "$ne":
+            return ~self._equals(key, operand, index)
+        if op in ("$in", "$nin"):
+            mask = np.zeros(self.size, dtype=bool)
+            for value in operand:
+                mask |= self._equals(key, value, index)
+            return mask if op == "$in" else ~mask
+        if op == "$exists":
+            present = self.present(key)
+            return present if operand else ~present
+
+        # Range operators
+        if _is_number(operand):
+            column = self.numeric(key)
+            valid = ~np.isnan(column)
+            column = np.where(valid, column, 0)
+        elif isinstance(operand, str):
+            column, valid = self.strings(key)
+        else:
+            raise VectorDBOperationError(
+                f"{op} needs a number or string operand, got {type(operand).__name__}"
+            )
+        if op == "$gt":
+            return valid & (column > operand)
+        if op == "$gte":
+            return valid & (column >= operand)
+        if op == "$lt":
+            return valid & (column < operand)
+        return valid & (column <= operand)
+
+
+def matches_filter(metadata: Any, metadata_filter: Dict[str, Any]) -> bool:
+    """
+    Check a single metadata object against a filter.
+
+    Args:
+        metadata: The metadata object
+        metadata_filter: Filter dictionary
+
+    Returns:
+        True if the metadata matches
+    """
+    return bool(MetadataColumns([metadata]).evaluate(metadata_filter)[0])
+
+
+def to_qdrant_filter(metadata_filter: Dict[str, Any]):
+    """
+    Translate a filter dictionary into a Qdrant Filter.
+
+    Args:
+        metadata_filter: Filter dictionary
+
+    Returns:
+        qdrant_client.models.Filter
+
+    Raises:
+        VectorDBOperationError: If the filter cannot be expressed in Qdrant
+            (e.g., string range comparisons)
+    """
+    from qdrant_client.models import (
+        Filter,
+        FieldCondition,
+        MatchValue,
+        MatchAny,
+        Range,
+        IsEmptyCondition,
+        PayloadField,
+    )
+
+    if not isinstance(metadata_filter, dict):
+        raise VectorDBOperationError("metadata_filter must be a dictionary")
+
+    must, must_not = [], []
+
+    def match(key: str, value: Any):
+        if isinstance(value, float):
+            return FieldCondition(key=key, range=Range(gte=value, lte=value))
+        return FieldCondition(key=key, match=MatchValue(value=value))
+
+    for key, condition in metadata_filter.items():
+        if key == "$and":
+            must.extend(to_qdrant_filter(sub) for sub in condition)
+        elif key == "$or":
+            must.append(Filter(should=[to_qdrant_filter(sub) for sub in condition]))
+        elif key == "$not":
+            must_not.append(to_qdrant_filter(condition))
+        elif key.startswith("$"):
+            raise VectorDBOperationError(f"Unknown filter operator: {key}")
+        else:
+            conditions = _field_conditions(condition)
+            range_args = {}
+            for op, operand in conditions.items():
+                if op == "$eq":
+                    must.append(match(key, operand))
+                elif op == "$ne":
+                    must_not.append(match(key, operand))
+                elif op == "$in":
+                    must.append(FieldCondition(key=key, match=MatchAny(any=list(operand))))
+                elif op == "$nin":
+                    must_not.append(FieldCondition(key=key, match=MatchAny(any=list(operand))))
+                elif op == "$exists":
+                    empty = IsEmptyCondition(is_empty=PayloadField(key=key))
+                    (must_not if operand else must).append(empty)
+                else:
+                    if not _is_number(operand):
+                        raise VectorDBOperationError(
+                            f"Qdrant range filters need numeric operands, got {operand!r} for {op}"
+                        )
+                    range_args[_RANGE_OPERATORS[op]] = operand
+            if range_args:
+                must.append(FieldCondition(key=key, range=Range(**range_args)))
+
+    return Filter(must=must or None, must_not=must_not or None)
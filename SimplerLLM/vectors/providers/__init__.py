@@ -7,6 +7,9 @@ These modules contain the core logic for each database type.
 Available Providers:
     SimplerVectors: In-memory vector storage with NumPy
     SerializationFormat: Enum for serialization formats
+    convert_collection_format: Convert a saved local collection between formats
+    WALSyncPolicy: Enum for write-ahead log fsync policies
+    QuantizationMethod: Enum for local vector quantization methods
     QdrantProvider: Qdrant database operations
 
 Note:
@@ -18,11 +21,16 @@ Example:
     >>> db = SimplerVectors(db_folder="./vectors")
 """
 
-from .local_provider import SimplerVectors, SerializationFormat
+from .local_provider import SimplerVectors, SerializationFormat, convert_collection_format
+from .local_wal import WALSyncPolicy
+from .local_quantization import QuantizationMethod
 from .qdrant_provider import QdrantProvider
 
 __all__ = [
     'SimplerVectors',
     'SerializationFormat',
+    'convert_collection_format',
+    'WALSyncPolicy',
+    'QuantizationMethod',
     'QdrantProvider',
 ]
@@ -0,0 +1,115 @@
+"""
+BM25 keyword index for the local vector provider.
+
+An in-process inverted index over the text stored in vector metadata
+(the "text" key written by add_text_with_embedding). It complements dense
+cosine search for keyword-heavy queries such as names, codes and rare
+terms, and feeds hybrid search.
+
+Scoring uses Okapi BM25:
+
+    idf(t) * tf * (k1 + 1) / (tf + k1 * (1 - b + b * doc_len / avg_doc_len))
+
+with idf(t) = ln(1 + (N - df + 0.5) / (df + 0.5)).
+
+Example:
+    >>> index = BM25Index()
+    >>> index.add_documents(["the quick brown fox", "lazy dogs sleep"])
+    >>> scores = index.score("quick fox")
+    >>> scores.argmax()
+    0
+"""
+
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class BM25Index:
+    """
+    Inverted index with BM25 scoring over row-numbered documents.
+
+    Documents are appended in row order; rows without text count as empty
+    documents so row numbers line up with the vector store.
+
+    Args:
+        k1: Term frequency saturation (default: 1.5)
+        b: Document length normalization (default: 0.75)
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Tuple[List[int], List[int]]] = defaultdict(lambda: ([], []))
+        self._lengths: List[int] = []
+        self._total_length = 0
+        # term -> (rows, term frequencies) as arrays, built on first query
+        self._arrays: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._length_array: Optional[np.ndarray] = None
+
+    @property
+    def size(self) -> int:
+        """Number of indexed rows."""
+        return len(self._lengths)
+
+    def add_documents(self, texts: Iterable[Optional[str]]) -> None:
+        """Append documents; None is indexed as an empty document."""
+        for text in texts:
+            row = len(self._lengths)
+            counts = Counter(tokenize(text)) if text else Counter()
+            for term, tf in counts.items():
+                rows, tfs = self._postings[term]
+                rows.append(row)
+                tfs.append(tf)
+                self._arrays.pop(term, None)
+            length = sum(counts.values())
+            self._lengths.append(length)
+            self._total_length += length
+        self._length_array = None
+
+    def _term_arrays(self, term: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        if term not in self._postings:
+            return None
+        if term not in self._arrays:
+            rows, tfs = self._postings[term]
+            self._arrays[term] = (
+                np.asarray(rows, dtype=np.intp),
+                np.asarray(tfs, dtype=np.float32),
+            )
+        return self._arrays[term]
+
+    def score(self, query: str) -> np.ndarray:
+        """
+        Score every row against a query.
+
+        Returns:
+            Float array of length size; rows sharing no term score 0
+        """
+        scores = np.zeros(self.size, dtype=np.float32)
+        if not self.size or not self._total_length:
+            return scores
+
+        if self._length_array is None:
+            self._length_array = np.asarray(self._lengths, dtype=np.float32)
+        avg_length = self._total_length / self.size
+
+        for term in set(tokenize(query)):
+            arrays = self._term_arrays(term)
+            if arrays is None:
+                continue
+            rows, tfs = arrays
+            df = len(rows)
+            idf = math.log(1.0 + (self.size - df + 0.5) / (df + 0.5))
+            norm = self.k1 * (1.0 - self.b + self.b * self._length_array[rows] / avg_length)
+            scores[rows] += idf * tfs * (self.k1 + 1.0) / (tfs + norm)
+        return scores
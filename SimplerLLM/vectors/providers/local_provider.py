@@ -2,7 +2,7 @@
 Local Vector Database Provider.
 
 Low-level in-memory vector storage implementation using NumPy arrays
-with pickle-based file persistence.
+with pickle-based or memory-mapped columnar file persistence.
 
 This module provides the core SimplerVectors class that handles all
 vector operations for the local provider. For high-level usage, prefer
@@ -11,10 +11,13 @@ the LocalVectorDB wrapper or VectorDB.create() factory.
 Features:
     - In-memory storage with fast NumPy operations
     - Pickle-based file persistence (.svdb format)
+    - Memory-mapped columnar persistence (.svdc format) for fast loading
+    - Optional write-ahead log with background checkpointing
+    - Read-only shared snapshots served to many worker processes
     - Automatic dimension validation
     - Metadata indexing for fast lookups
     - Vector normalization for cosine similarity
-    - Optional vector compression
+    - Optional vector compression and int8 / product quantization
 
 Example:
     >>> from SimplerLLM.vectors.providers import SimplerVectors
@@ -28,8 +31,13 @@ import numpy as np
 import os
 import pickle
 import enum
+import tempfile
 import uuid
+import functools
+import threading
+import time
 from collections import defaultdict
+from collections.abc import Sequence
 from typing import List, Tuple, Dict, Any, Optional, Callable, Union
 
 from ..exceptions import (
@@ -38,6 +46,12 @@ from ..exceptions import (
     DimensionMismatchError,
     VectorDBOperationError,
 )
+from ..filters import MetadataColumns
+from .local_storage import LazyMetadata, columnar_path, save_columnar, load_columnar
+from .local_wal import WriteAheadLog, WALSyncPolicy
+from .local_shared import shared_path, generation_path, read_generation, publish_snapshot
+from .local_quantization import QuantizationMethod, create_quantizer
+from .local_bm25 import BM25Index
 
 
 class SerializationFormat(enum.Enum):
@@ -46,11 +60,71 @@ class SerializationFormat(enum.Enum):
 
     Attributes:
         BINARY: Pickle-based binary format (.svdb files)
+        COLUMNAR: Memory-mapped .npy matrix with a JSONL metadata sidecar
+            (.svdc folders). Loads without reading vectors into memory;
+            metadata must be JSON-serializable.
 
     Example:
         >>> db.save_to_disk("my_collection", SerializationFormat.BINARY)
+        >>> db.save_to_disk("my_collection", SerializationFormat.COLUMNAR)
     """
     BINARY = 'pickle'
+    COLUMNAR = 'columnar'
+
+
+class _RowView(Sequence):
+    """Read-only sequence of the rows of a matrix, without copying them."""
+
+    def __init__(self, matrix: np.ndarray):
+        matrix = matrix.view()
+        matrix.flags.writeable = False
+        self._matrix = matrix
+
+    def __len__(self) -> int:
+        return len(self._matrix)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._matrix[index])
+        return self._matrix[index]
+
+    def __iter__(self):
+        return iter(self._matrix)
+
+
+def _synchronized(method):
+    """Run a mutating method under the instance lock, rejecting read-only instances."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self._shared_dir is not None:
+            raise VectorDBOperationError(
+                "This database is attached to a shared snapshot and is read-only"
+            )
+        with self._lock:
+            result = method(self, *args, **kwargs)
+            checkpoint_due, self._checkpoint_due = self._checkpoint_due, False
+        # Size-triggered checkpoints run once the write is applied in
+        # memory, and outside the lock (checkpoint() takes it itself)
+        if checkpoint_due:
+            self._request_checkpoint()
+        return result
+    return wrapper
+
+
+def _reads_shared(method):
+    """
+    Map in a newer shared generation before a read, and keep it mapped in
+    until the read returns, so the read sees a single generation.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        registered = self._begin_shared_read()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            if registered:
+                self._end_shared_read()
+    return wrapper
 
 
 class SimplerVectors:
@@ -64,7 +138,8 @@ class SimplerVectors:
     Attributes:
         db_folder: Path to the folder for storing database files
         dimension: Vector dimension (set by first vector or explicitly)
-        vectors: List of stored vectors as NumPy arrays
+        vectors: Stored vectors as a read-only sequence of NumPy arrays
+            (a view of the underlying matrix)
         metadata: List of metadata associated with each vector
         ids: List of unique vector IDs
 
@@ -105,11 +180,62 @@ class SimplerVectors:
             >>> db = SimplerVectors(db_folder="./vectors", dimension=1536)
         """
         self.db_folder = db_folder
-        self.vectors: List[np.ndarray] = []
         self.metadata: List[Any] = []
         self.ids: List[str] = []
         self.dimension = dimension
-        self._index: Dict[str, List[int]] = defaultdict(list)
+        # Built lazily on first metadata query (None = not built)
+        self._index: Optional[Dict[str, List[int]]] = defaultdict(list)
+        # Columnar metadata for declarative filters, built lazily
+        self._columns: Optional[MetadataColumns] = None
+        # BM25 keyword index over metadata["text"], built lazily and
+        # extended after appends
+        self._bm25: Optional[BM25Index] = None
+        # Row storage: the first _count rows of _matrix are live. The buffer
+        # grows geometrically and may be a read-only memory map after a
+        # columnar load, in which case it is copied on first write.
+        self._matrix: Optional[np.ndarray] = None
+        self._count = 0
+        self._id_rows: Optional[Dict[str, int]] = {}
+
+        # Write-ahead log state (see enable_wal)
+        self._lock = threading.RLock()
+        self._checkpoint_lock = threading.Lock()
+        self._wal: Optional[WriteAheadLog] = None
+        self._wal_collection: Optional[str] = None
+        self._wal_format = SerializationFormat.BINARY
+        self._wal_max_bytes: Optional[int] = None
+        self._checkpoint_due = False
+        self._replaying = False
+        # Last log segment replayed by load_from_disk, per collection, with
+        # the format it was loaded in; save_to_disk removes those segments
+        self._replayed_wal: Dict[str, Tuple[SerializationFormat, int]] = {}
+        self._checkpoint_thread: Optional[threading.Thread] = None
+        self._checkpoint_wake = threading.Event()
+        self._checkpoint_stopping = False
+        self.last_checkpoint_error: Optional[Exception] = None
+
+        # Quantization state (see quantize). Codes cover the first
+        # _codes_count rows and are extended lazily after appends.
+        self._quantizer = None
+        self._codes: Optional[np.ndarray] = None
+        self._codes_count = 0
+        self._rerank_factor = 0
+        self._quantization_stats: Dict[str, Any] = {}
+        # Full-precision rows moved to a temporary memory-mapped file by
+        # compress_vectors(bits=8); None when the matrix is not spilled
+        self._spilled: Optional[np.memmap] = None
+
+        # Shared snapshot state (see attach_shared)
+        self._shared_dir: Optional[str] = None
+        self._shared_refresh_interval = 1.0
+        self._shared_checked_at = 0.0
+        self.generation: Optional[int] = None
+        # Reads in progress and whether a generation switch is waiting for
+        # them; reads nested in a read (per thread) are not counted again
+        self._shared_reads = 0
+        self._shared_switching = False
+        self._shared_changed = threading.Condition(self._lock)
+        self._shared_depth = threading.local()
 
         try:
             if not os.path.exists(self.db_folder):
@@ -125,6 +251,9 @@ class SimplerVectors:
         """
         Load a collection from disk.
 
+        Any write-ahead log segments left for the collection (for example
+        after a crash) are replayed on top of the loaded file.
+
         Args:
             collection_name: Name of the collection (without extension)
             serialization_format: Format used for serialization
@@ -134,9 +263,22 @@ class SimplerVectors:
             >>> db.load_from_disk("my_collection")
             >>> print(f"Loaded {db.get_vector_count()} vectors")
         """
-        file_path = os.path.join(self.db_folder, collection_name + '.svdb')
-        if serialization_format == SerializationFormat.BINARY:
-            self._load_pickle(file_path)
+        if self._shared_dir is not None:
+            raise VectorDBOperationError(
+                "This database is attached to a shared snapshot and is read-only"
+            )
+
+        with self._lock:
+            if serialization_format == SerializationFormat.COLUMNAR:
+                self._load_columnar(columnar_path(self.db_folder, collection_name))
+            elif serialization_format == SerializationFormat.BINARY:
+                self._load_pickle(os.path.join(self.db_folder, collection_name + '.svdb'))
+
+            sequence = self._replay_wal(os.path.join(self.db_folder, collection_name))
+            if sequence is not None:
+                self._replayed_wal[collection_name] = (serialization_format, sequence)
+            else:
+                self._replayed_wal.pop(collection_name, None)
 
     def save_to_disk(
         self,
@@ -146,6 +288,12 @@ class SimplerVectors:
         """
         Save the collection to disk.
 
+        Files are written to a temporary name and renamed into place. If a
+        write-ahead log is enabled for this collection and format, this is
+        the same as checkpoint(). Otherwise, log segments replayed when the
+        collection was loaded are removed once the file is saved, since it
+        now contains their changes.
+
         Args:
             collection_name: Name for the saved collection (without extension)
             serialization_format: Format to use for serialization
@@ -154,40 +302,563 @@ class SimplerVectors:
             >>> db.add_vector([0.1, 0.2, 0.3], {"text": "example"})
             >>> db.save_to_disk("my_collection")
         """
-        file_path = os.path.join(self.db_folder, collection_name + '.svdb')
-        if serialization_format == SerializationFormat.BINARY:
-            self._save_pickle(file_path)
+        if (self._wal is not None and collection_name == self._wal_collection
+                and serialization_format == self._wal_format):
+            self.checkpoint()
+            return
+
+        with self._lock:
+            self._release_mapped_files()
+            self._write_collection(
+                collection_name, serialization_format,
+                self._get_matrix(), self.metadata, self.ids, self.dimension
+            )
+            replayed = self._replayed_wal.get(collection_name)
+            if (replayed is not None and replayed[0] == serialization_format
+                    and collection_name != self._wal_collection):
+                WriteAheadLog.remove_segments(
+                    os.path.join(self.db_folder, collection_name), replayed[1]
+                )
+                del self._replayed_wal[collection_name]
 
     def _load_pickle(self, file_path: str) -> None:
         """Load database from pickle file."""
+        self._release_storage()
         if os.path.exists(file_path):
             with open(file_path, 'rb') as file:
                 data = pickle.load(file)
                 # Handle both old (2-tuple) and new (4-tuple) format
                 if len(data) == 2:
-                    self.vectors, self.metadata = data
-                    self.ids = [str(uuid.uuid4()) for _ in range(len(self.vectors))]
+                    vectors, self.metadata = data
+                    self.ids = [str(uuid.uuid4()) for _ in range(len(vectors))]
                 else:
-                    self.vectors, self.metadata, self.ids, self.dimension = data
-                self._rebuild_index()
+                    vectors, self.metadata, self.ids, self.dimension = data
+            self._set_rows(np.vstack(vectors) if len(vectors) else None)
         else:
-            self.vectors, self.metadata, self.ids = [], [], []
+            self.metadata, self.ids = [], []
+            self._set_rows(None)
 
-    def _save_pickle(self, file_path: str) -> None:
-        """Save database to pickle file."""
-        with open(file_path, 'wb') as file:
-            pickle.dump((self.vectors, self.metadata, self.ids, self.dimension), file)
+    def _write_collection(
+        self,
+        collection_name: str,
+        serialization_format: SerializationFormat,
+        matrix: np.ndarray,
+        metadata: List[Any],
+        ids: List[str],
+        dimension: Optional[int]
+    ) -> None:
+        """Write a snapshot of the collection in the given format."""
+        if serialization_format == SerializationFormat.COLUMNAR:
+            save_columnar(
+                columnar_path(self.db_folder, collection_name),
+                matrix, metadata, ids, dimension
+            )
+        elif serialization_format == SerializationFormat.BINARY:
+            file_path = os.path.join(self.db_folder, collection_name + '.svdb')
+            tmp_path = file_path + '.tmp'
+            with open(tmp_path, 'wb') as file:
+                pickle.dump((list(matrix), list(metadata), list(ids), dimension), file)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, file_path)
+
+    def _load_columnar(self, path: str) -> None:
+        """Open a columnar collection with memory-mapped vectors."""
+        self._release_storage()
+        if os.path.isdir(path):
+            matrix, self.metadata, self.ids, self.dimension = load_columnar(path)
+            self._set_rows(matrix if len(matrix) else None)
+        else:
+            self.metadata, self.ids = [], []
+            self._set_rows(None)
+
+    def _release_mapped_files(self) -> None:
+        """
+        Copy memory-mapped data into memory so the files can be replaced.
+
+        Replacing a mapped file fails on Windows. Rows spilled to a
+        temporary file by compress_vectors() stay mapped.
+        """
+        self._materialize_metadata()
+        if isinstance(self._matrix, np.memmap) and self._matrix is not self._spilled:
+            self._matrix = np.array(self._get_matrix())
+
+    def _set_rows(self, matrix: Optional[np.ndarray]) -> None:
+        """Replace all stored rows and reset derived state."""
+        self._matrix = matrix
+        self._spilled = None
+        self._count = 0 if matrix is None else len(matrix)
+        self._index = None
+        self._columns = None
+        self._bm25 = None
+        self._id_rows = None
+        self._codes = None
+
+    def _release_storage(self) -> None:
+        """Close any files held open by a columnar load."""
+        if isinstance(self.metadata, LazyMetadata):
+            self.metadata.close()
+        self._matrix = None
+        self._spilled = None
+        self._count = 0
+
+    def _materialize_metadata(self) -> None:
+        """Turn lazily loaded metadata into a regular list before mutating it."""
+        if isinstance(self.metadata, LazyMetadata):
+            lazy = self.metadata
+            self.metadata = list(lazy)
+            lazy.close()
+
+    @property
+    def vectors(self) -> Sequence:
+        """
+        Stored vectors as a read-only sequence of row arrays.
+
+        The sequence is a view of the storage matrix, so taking it does not
+        copy the vectors. Take it again after adding or deleting vectors.
+        """
+        return _RowView(self._get_matrix())
+
+    def _get_matrix(self) -> np.ndarray:
+        """
+        Get all stored vectors as one contiguous (n, dimension) matrix.
+
+        Returns a view of the storage buffer; no copy is made.
+        """
+        if self._matrix is None:
+            return np.empty((0, self.dimension or 0), dtype=np.float32)
+        return self._matrix[:self._count]
+
+    def _reserve(self, extra: int, dimension: int) -> None:
+        """
+        Make the storage buffer writable with room for extra more rows.
+
+        Read-only buffers (memory maps) are copied on first write.
+        """
+        needed = self._count + extra
+        if self._matrix is None:
+            self._matrix = np.empty((max(needed, 16), dimension), dtype=np.float32)
+            return
+
+        if self._matrix.flags.writeable and not isinstance(self._matrix, np.memmap) \
+                and len(self._matrix) >= needed:
+            return
+
+        capacity = len(self._matrix)
+        if needed > capacity:
+            capacity = max(needed, capacity * 2, 16)
+        buffer = np.empty((capacity, self._matrix.shape[1]), dtype=self._matrix.dtype)
+        buffer[:self._count] = self._matrix[:self._count]
+        self._matrix = buffer
+        self._spilled = None
+
+    def _row_of(self, vector_id: str) -> Optional[int]:
+        """Get the row index of a vector ID, or None if absent."""
+        if self._id_rows is None:
+            # First occurrence wins, matching list.index() semantics
+            self._id_rows = {}
+            for i, row_id in enumerate(self.ids):
+                self._id_rows.setdefault(row_id, i)
+        return self._id_rows.get(vector_id)
+
+    def _get_index(self) -> Dict[str, List[int]]:
+        """Get the metadata index, building it on first use."""
+        if self._index is None:
+            self._rebuild_index()
+        return self._index
+
+    def _index_row(self, idx: int, meta: Any) -> None:
+        """Add a single row's metadata to the inverted index."""
+        if self._index is None:
+            return
+        if isinstance(meta, dict):
+            for key, value in meta.items():
+                if isinstance(value, (str, int, float, bool)):
+                    self._index[f"{key}:{value}"].append(idx)
+        else:
+            self._index[str(meta)].append(idx)
+
+    def _get_columns(self) -> MetadataColumns:
+        """Get the columnar metadata view, building it on first use."""
+        if self._columns is None:
+            self._columns = MetadataColumns(self.metadata)
+        return self._columns
 
     def _rebuild_index(self) -> None:
-        """Rebuild the metadata index after loading from disk."""
+        """Rebuild the metadata index from all stored metadata."""
         self._index = defaultdict(list)
         for i, meta in enumerate(self.metadata):
-            if isinstance(meta, dict):
-                for key, value in meta.items():
-                    if isinstance(value, (str, int, float, bool)):
-                        self._index[f"{key}:{value}"].append(i)
-            else:
-                self._index[str(meta)].append(i)
+            self._index_row(i, meta)
+
+    def enable_wal(
+        self,
+        collection_name: str,
+        serialization_format: SerializationFormat = SerializationFormat.BINARY,
+        sync_policy: WALSyncPolicy = WALSyncPolicy.ALWAYS,
+        sync_interval: float = 1.0,
+        checkpoint_interval: Optional[float] = None,
+        checkpoint_max_bytes: Optional[int] = None
+    ) -> None:
+        """
+        Log every write to an append-only write-ahead log.
+
+        Writes are appended to <collection_name>.wal.<n> files in db_folder
+        instead of rewriting the collection. checkpoint() folds the log into
+        the collection file. Call load_from_disk() first so the in-memory
+        state matches the files on disk.
+
+        Args:
+            collection_name: Collection the log belongs to
+            serialization_format: Format used when checkpointing
+            sync_policy: When log records are fsynced (WALSyncPolicy or its value)
+            sync_interval: Seconds between fsyncs for WALSyncPolicy.INTERVAL
+            checkpoint_interval: If set, checkpoint in a background thread
+                every this many seconds when the log is not empty
+            checkpoint_max_bytes: If set, checkpoint once the active log
+                segment grows past this size
+
+        Example:
+            >>> db = SimplerVectors(db_folder="./vectors")
+            >>> db.load_from_disk("docs")
+            >>> db.enable_wal("docs", checkpoint_interval=60)
+            >>> db.add_vector([0.1, 0.2, 0.3], {"text": "durable"})  # logged
+        """
+        if self._shared_dir is not None:
+            raise VectorDBOperationError(
+                "This database is attached to a shared snapshot and is read-only"
+            )
+        if self._wal is not None:
+            self.disable_wal(checkpoint=False)
+
+        with self._lock:
+            self._wal = WriteAheadLog(
+                os.path.join(self.db_folder, collection_name),
+                sync_policy=sync_policy,
+                sync_interval=sync_interval,
+            )
+            self._wal_collection = collection_name
+            self._wal_format = serialization_format
+            self._wal_max_bytes = checkpoint_max_bytes
+            self.last_checkpoint_error = None
+
+        if checkpoint_interval:
+            self._checkpoint_stopping = False
+            self._checkpoint_wake.clear()
+            self._checkpoint_thread = threading.Thread(
+                target=self._checkpoint_loop,
+                args=(checkpoint_interval,),
+                name=f"svdb-checkpoint-{collection_name}",
+                daemon=True,
+            )
+            self._checkpoint_thread.start()
+
+    def disable_wal(self, checkpoint: bool = True) -> None:
+        """
+        Stop logging writes and close the write-ahead log.
+
+        Args:
+            checkpoint: If True, fold the log into the collection file first
+        """
+        if self._wal is None:
+            return
+
+        if self._checkpoint_thread is not None:
+            self._checkpoint_stopping = True
+            self._checkpoint_wake.set()
+            self._checkpoint_thread.join()
+            self._checkpoint_thread = None
+
+        if checkpoint:
+            self.checkpoint()
+
+        with self._lock:
+            self._wal.close()
+            self._wal = None
+            self._wal_collection = None
+
+    def checkpoint(self) -> None:
+        """
+        Fold the write-ahead log into the collection file.
+
+        The active log segment is sealed and a snapshot is taken under the
+        lock; writing the snapshot happens outside it, so writers are only
+        blocked for the copy. Sealed segments are removed once the new
+        collection file is in place.
+
+        Raises:
+            VectorDBOperationError: If no write-ahead log is enabled
+
+        Example:
+            >>> db.enable_wal("docs")
+            >>> db.add_vector([0.1, 0.2, 0.3], {"text": "example"})
+            >>> db.checkpoint()
+        """
+        if self._wal is None:
+            raise VectorDBOperationError("Write-ahead log is not enabled")
+
+        with self._checkpoint_lock:
+            with self._lock:
+                wal = self._wal
+                sealed = wal.rotate()
+                self._release_mapped_files()
+                snapshot = (
+                    self._get_matrix().copy(),
+                    list(self.metadata),
+                    list(self.ids),
+                    self.dimension,
+                )
+            self._write_collection(self._wal_collection, self._wal_format, *snapshot)
+            wal.remove_through(sealed)
+
+    def _checkpoint_loop(self, interval: float) -> None:
+        """Background thread body for periodic checkpoints."""
+        while True:
+            self._checkpoint_wake.wait(interval)
+            self._checkpoint_wake.clear()
+            if self._checkpoint_stopping:
+                return
+            wal = self._wal
+            if wal is None:
+                return
+            if wal.active_size == 0 and len(WriteAheadLog.segments(wal.base_path)) <= 1:
+                continue
+            try:
+                self.checkpoint()
+            except Exception as e:
+                self.last_checkpoint_error = e
+
+    def _log(self, record: Tuple) -> None:
+        """Append a write to the write-ahead log, if enabled."""
+        if self._wal is None or self._replaying:
+            return
+        try:
+            self._wal.append(record)
+        except Exception as e:
+            raise VectorDBOperationError(f"Failed to write to write-ahead log: {e}")
+
+        if self._wal_max_bytes and self._wal.active_size >= self._wal_max_bytes:
+            self._checkpoint_due = True
+
+    def _request_checkpoint(self) -> None:
+        """Run a size-triggered checkpoint, in the background thread if there is one."""
+        if self._wal is None:
+            return
+        if self._checkpoint_thread is not None:
+            self._checkpoint_wake.set()
+        else:
+            self.checkpoint()
+
+    def _replay_wal(self, base_path: str) -> Optional[int]:
+        """
+        Apply write-ahead log records left on disk for a collection.
+
+        Returns:
+            Sequence number of the last segment replayed, or None if there
+            were no segments
+        """
+        segments = WriteAheadLog.segments(base_path)
+        if not segments:
+            return None
+        self._replaying = True
+        try:
+            for record in WriteAheadLog.read_records(base_path):
+                op = record[0]
+                if op == "add":
+                    _, vector_id, vector, meta = record
+                    if self._row_of(vector_id) is not None:
+                        self.update_vector(vector_id, vector, meta, normalize=False)
+                    else:
+                        self.add_vector(vector, meta, normalize=False, id=vector_id)
+                elif op == "add_many":
+                    _, ids, vectors, metadatas = record
+                    new_rows = []
+                    for i, vector_id in enumerate(ids):
+                        if self._row_of(vector_id) is not None:
+                            self.update_vector(vector_id, vectors[i], metadatas[i], normalize=False)
+                        else:
+                            new_rows.append(i)
+                    if new_rows:
+                        self.add_vectors_array(
+                            vectors[new_rows],
+                            [metadatas[i] for i in new_rows],
+                            ids=[ids[i] for i in new_rows],
+                            normalize=False,
+                        )
+                elif op == "update":
+                    _, vector_id, vector, meta = record
+                    self.update_vector(vector_id, vector, meta, normalize=False)
+                elif op == "delete":
+                    self.delete_vector(record[1])
+                elif op == "clear":
+                    self.clear_database()
+        finally:
+            self._replaying = False
+        return segments[-1][0]
+
+    def publish_shared(self, collection_name: str, keep: int = 2) -> int:
+        """
+        Publish the collection as a read-only snapshot for other processes.
+
+        Worker processes attach with attach_shared() and search the
+        memory-mapped snapshot, so N workers share one copy of the vectors
+        through the operating system's page cache. Publishing again creates
+        a new generation that attached workers pick up automatically.
+
+        Args:
+            collection_name: Name under which to publish
+            keep: Number of most recent generations to keep on disk
+
+        Returns:
+            The published generation number
+
+        Raises:
+            VectorDBOperationError: If metadata is not JSON-serializable
+
+        Example:
+            >>> # In the process that builds the index
+            >>> db.publish_shared("docs")
+            1
+        """
+        with self._lock:
+            matrix = self._get_matrix()
+            metadata = list(self.metadata)
+            ids = list(self.ids)
+            dimension = self.dimension
+            return publish_snapshot(
+                shared_path(self.db_folder, collection_name),
+                matrix, metadata, ids, dimension, keep=keep
+            )
+
+    @classmethod
+    def attach_shared(
+        cls,
+        db_folder: str,
+        collection_name: str,
+        refresh_interval: float = 1.0
+    ) -> "SimplerVectors":
+        """
+        Attach read-only to a snapshot published with publish_shared().
+
+        The returned instance supports all search and lookup methods; write
+        methods raise VectorDBOperationError. Before a search, the published
+        generation is checked (at most once per refresh_interval seconds)
+        and a newer snapshot is mapped in if available.
+
+        Args:
+            db_folder: Folder the snapshot was published in
+            collection_name: Published collection name
+            refresh_interval: Minimum seconds between generation checks.
+                Use 0 to check before every search.
+
+        Returns:
+            A read-only SimplerVectors instance
+
+        Raises:
+            VectorDBOperationError: If nothing has been published yet
+
+        Example:
+            >>> # In each worker process
+            >>> db = SimplerVectors.attach_shared("./vectors", "docs")
+            >>> results = db.top_cosine_similarity(query, top_n=5)
+        """
+        db = cls(db_folder=db_folder)
+        db._shared_dir = shared_path(db_folder, collection_name)
+        db._shared_refresh_interval = refresh_interval
+        if not db.refresh_shared(force=True):
+            raise VectorDBOperationError(
+                f"No shared snapshot published for collection '{collection_name}'"
+            )
+        return db
+
+    def refresh_shared(self, force: bool = False) -> bool:
+        """
+        Map in the latest published generation if it has changed.
+
+        The switch waits for searches running in other threads to return,
+        so every search sees a single generation.
+
+        Args:
+            force: Check now, ignoring refresh_interval
+
+        Returns:
+            True if a new generation was mapped in
+        """
+        if self._shared_dir is None:
+            return False
+        if getattr(self._shared_depth, "value", 0):
+            # Called from within a read on this thread (e.g. a filter
+            # function); switching would wait for that read forever
+            return False
+
+        now = time.monotonic()
+        if not force and now - self._shared_checked_at < self._shared_refresh_interval:
+            return False
+        self._shared_checked_at = now
+
+        generation = read_generation(self._shared_dir)
+        if generation is None or generation == self.generation:
+            return False
+
+        matrix, metadata, ids, dimension = load_columnar(
+            generation_path(self._shared_dir, generation)
+        )
+        # Switch once reads running in other threads have returned; reads
+        # starting meanwhile wait, so no read mixes two generations
+        with self._shared_changed:
+            self._shared_changed.wait_for(lambda: not self._shared_switching)
+            if generation == self.generation:
+                # Another thread switched first
+                metadata.close()
+                return False
+            self._shared_switching = True
+            self._shared_changed.wait_for(lambda: self._shared_reads == 0)
+
+            # The vector mapping needs no close: dropping the last array
+            # that uses it unmaps it
+            if isinstance(self.metadata, LazyMetadata):
+                self.metadata.close()
+            self._matrix = matrix if len(matrix) else None
+            self._count = len(matrix)
+            self.metadata = metadata
+            self.ids = ids
+            self.dimension = dimension
+            self._index = None
+            self._columns = None
+            self._bm25 = None
+            self._id_rows = None
+            self._codes = None
+            self.generation = generation
+            self._shared_switching = False
+            self._shared_changed.notify_all()
+        return True
+
+    def _begin_shared_read(self) -> bool:
+        """
+        Refresh an attached snapshot and register a read of it.
+
+        Returns:
+            True if the read was registered and must be ended with
+            _end_shared_read()
+        """
+        if self._shared_dir is None:
+            return False
+        depth = getattr(self._shared_depth, "value", 0)
+        if not depth:
+            self.refresh_shared()
+            with self._shared_changed:
+                self._shared_changed.wait_for(lambda: not self._shared_switching)
+                self._shared_reads += 1
+        self._shared_depth.value = depth + 1
+        return True
+
+    def _end_shared_read(self) -> None:
+        self._shared_depth.value -= 1
+        if self._shared_depth.value:
+            return
+        with self._shared_changed:
+            self._shared_reads -= 1
+            if not self._shared_reads:
+                self._shared_changed.notify_all()
 
     @staticmethod
     def normalize_vector(vector: np.ndarray) -> np.ndarray:
@@ -222,6 +893,7 @@ class SimplerVectors:
             )
         return True
 
+    @_synchronized
     def add_vector(
         self,
         vector: Union[np.ndarray, List[float]],
@@ -261,22 +933,24 @@ class SimplerVectors:
                 vector = self.normalize_vector(vector)
 
             vector_id = id if id is not None else str(uuid.uuid4())
+            self._log(("add", vector_id, vector, meta))
 
-            self.vectors.append(vector)
+            self._materialize_metadata()
+            self._reserve(1, len(vector))
+            row = self._count
+            self._matrix[row] = vector
+            self._count += 1
             self.metadata.append(meta)
             self.ids.append(vector_id)
+            if self._id_rows is not None:
+                self._id_rows.setdefault(vector_id, row)
 
             # Update index
-            idx = len(self.vectors) - 1
-            if isinstance(meta, dict):
-                for key, value in meta.items():
-                    if isinstance(value, (str, int, float, bool)):
-                        self._index[f"{key}:{value}"].append(idx)
-            else:
-                self._index[str(meta)].append(idx)
+            self._index_row(row, meta)
+            self._columns = None
 
             return vector_id
-        except DimensionMismatchError:
+        except (DimensionMismatchError, VectorDBOperationError):
             raise
         except Exception as e:
             raise VectorDBOperationError(f"Failed to add vector: {e}")
@@ -317,6 +991,81 @@ class SimplerVectors:
 
         return added_ids
 
+    @_synchronized
+    def add_vectors_array(
+        self,
+        vectors: np.ndarray,
+        metadatas: List[Any],
+        ids: Optional[List[str]] = None,
+        normalize: bool = True
+    ) -> List[str]:
+        """
+        Add a 2-D array of vectors in one vectorized operation.
+
+        This is the fast path for embeddings returned with as_numpy=True or
+        from embed_many(): dimension checks and normalization run once over
+        the whole matrix, and rows are copied into storage in one step.
+
+        Args:
+            vectors: Array of shape (n, dimension)
+            metadatas: List of n metadata objects
+            ids: Optional list of n custom IDs (auto-generated UUIDs if None)
+            normalize: Whether to normalize the vectors to unit length
+
+        Returns:
+            List of IDs for the added vectors
+
+        Raises:
+            DimensionMismatchError: If vector dimension doesn't match
+            VectorDBOperationError: If shapes or lengths are inconsistent
+
+        Example:
+            >>> vectors = embeddings.embed_many(texts)
+            >>> ids = db.add_vectors_array(vectors, [{"text": t} for t in texts])
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim != 2:
+            raise VectorDBOperationError(
+                f"Expected a 2-D array of vectors, got shape {vectors.shape}"
+            )
+        if len(metadatas) != len(vectors):
+            raise VectorDBOperationError(
+                f"Got {len(vectors)} vectors but {len(metadatas)} metadata entries"
+            )
+        if ids is not None and len(ids) != len(vectors):
+            raise VectorDBOperationError(
+                f"Got {len(vectors)} vectors but {len(ids)} IDs"
+            )
+        if len(vectors) == 0:
+            return []
+
+        self._validate_dimension(vectors[0])
+
+        if normalize:
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            vectors = vectors / norms
+
+        new_ids = list(ids) if ids is not None else [str(uuid.uuid4()) for _ in range(len(vectors))]
+        self._log(("add_many", new_ids, vectors, list(metadatas)))
+
+        self._materialize_metadata()
+        self._reserve(len(vectors), vectors.shape[1])
+        start = self._count
+        self._matrix[start:start + len(vectors)] = vectors
+        self._count += len(vectors)
+        self.metadata.extend(metadatas)
+        self.ids.extend(new_ids)
+        if self._id_rows is not None:
+            for offset, vector_id in enumerate(new_ids):
+                self._id_rows.setdefault(vector_id, start + offset)
+
+        for offset, meta in enumerate(metadatas):
+            self._index_row(start + offset, meta)
+        self._columns = None
+
+        return new_ids
+
     def add_text_with_embedding(
         self,
         text: str,
@@ -356,6 +1105,7 @@ class SimplerVectors:
 
         return self.add_vector(embedding, metadata, normalize, id)
 
+    @_synchronized
     def delete_vector(self, vector_id: str) -> bool:
         """
         Delete a vector by its ID.
@@ -372,15 +1122,27 @@ class SimplerVectors:
             ... else:
             ...     print("Vector not found")
         """
-        if vector_id in self.ids:
-            idx = self.ids.index(vector_id)
-            self.vectors.pop(idx)
-            self.metadata.pop(idx)
-            self.ids.pop(idx)
-            self._rebuild_index()
-            return True
-        return False
+        idx = self._row_of(vector_id)
+        if idx is None:
+            return False
+
+        self._log(("delete", vector_id))
+        self._materialize_metadata()
+        self._reserve(0, self.dimension)
+        self._matrix[idx:self._count - 1] = self._matrix[idx + 1:self._count]
+        self._count -= 1
+        self.metadata.pop(idx)
+        self.ids.pop(idx)
+        self._id_rows = None
+        if self._codes is not None and idx < self._codes_count:
+            self._codes = np.delete(self._codes[:self._codes_count], idx, axis=0)
+            self._codes_count -= 1
+        self._index = None
+        self._columns = None
+        self._bm25 = None
+        return True
 
+    @_synchronized
     def update_vector(
         self,
         vector_id: str,
@@ -411,28 +1173,40 @@ class SimplerVectors:
             ...     new_metadata={"text": "New content"}
             ... )
         """
-        if vector_id in self.ids:
-            idx = self.ids.index(vector_id)
+        idx = self._row_of(vector_id)
+        if idx is None:
+            return False
 
-            if new_vector is not None:
-                new_vector = np.array(new_vector, dtype=np.float32)
-                self._validate_dimension(new_vector)
-                if normalize:
-                    new_vector = self.normalize_vector(new_vector)
-                self.vectors[idx] = new_vector
+        if new_vector is not None:
+            new_vector = np.array(new_vector, dtype=np.float32)
+            self._validate_dimension(new_vector)
+            if normalize:
+                new_vector = self.normalize_vector(new_vector)
 
-            if new_metadata is not None:
-                self.metadata[idx] = new_metadata
-                self._rebuild_index()
+        self._log(("update", vector_id, new_vector, new_metadata))
 
-            return True
-        return False
+        if new_vector is not None:
+            self._reserve(0, self.dimension)
+            self._matrix[idx] = new_vector
+            if self._codes is not None and idx < self._codes_count:
+                self._codes[idx] = self._quantizer.encode(new_vector[None, :])[0]
+
+        if new_metadata is not None:
+            self._materialize_metadata()
+            self.metadata[idx] = new_metadata
+            self._index = None
+            self._columns = None
+            self._bm25 = None
+
+        return True
 
+    @_reads_shared
     def top_cosine_similarity(
         self,
         target_vector: Union[np.ndarray, List[float]],
         top_n: int = 3,
-        filter_func: Optional[Callable[[str, Any], bool]] = None
+        filter_func: Optional[Callable[[str, Any], bool]] = None,
+        metadata_filter: Optional[Dict[str, Any]] = None
     ) -> List[Tuple[str, Any, float]]:
         """
         Find vectors with highest cosine similarity to the target.
@@ -440,7 +1214,12 @@ class SimplerVectors:
         Args:
             target_vector: The vector to compare against
             top_n: Number of top results to return
-            filter_func: Optional function (id, metadata) -> bool to filter results
+            filter_func: Optional function (id, metadata) -> bool to filter results.
+                Called once per candidate row, so prefer metadata_filter.
+            metadata_filter: Optional declarative filter such as
+                {"lang": "en", "year": {"$gte": 2020}}. Evaluated as vectorized
+                masks over columnar metadata; only matching rows are scored.
+                See SimplerLLM.vectors.filters for the syntax.
 
         Returns:
             List of (id, metadata, similarity_score) tuples, sorted by similarity
@@ -457,7 +1236,14 @@ class SimplerVectors:
             >>> for vid, meta, score in results:
             ...     print(f"Score: {score:.3f}, Text: {meta.get('text', 'N/A')}")
             >>>
-            >>> # With filter
+            >>> # With a declarative filter
+            >>> results = db.top_cosine_similarity(
+            ...     target_vector=[0.1, 0.2, 0.3],
+            ...     top_n=5,
+            ...     metadata_filter={"source": "wikipedia", "year": {"$gte": 2020}}
+            ... )
+            >>>
+            >>> # With a filter function
             >>> results = db.top_cosine_similarity(
             ...     target_vector=[0.1, 0.2, 0.3],
             ...     top_n=5,
@@ -473,45 +1259,369 @@ class SimplerVectors:
                     f"Query vector dimension mismatch. Expected {self.dimension}, got {len(target_vector)}"
                 )
 
-            if not self.vectors:
+            if self._count == 0 or top_n <= 0:
+                return []
+
+            rows = self._filter_rows(filter_func, metadata_filter)
+            if rows is not None and len(rows) == 0:
                 return []
 
-            # Create mask for filtered vectors if filter provided
-            mask = None
-            if filter_func and self.vectors:
-                mask = np.array([
-                    filter_func(self.ids[i], self.metadata[i])
-                    for i in range(len(self.vectors))
-                ])
-                if not np.any(mask):
-                    return []
-
-            # Calculate cosine similarities
-            vectors_array = np.array(self.vectors)
-            similarities = np.dot(vectors_array, target_vector)
-
-            # Apply filter if provided
-            if mask is not None:
-                similarities = np.where(mask, similarities, -1)
-
-            # Get the indices of the top N similar vectors
-            top_indices = np.argsort(-similarities)[:top_n]
-
-            return [
-                (self.ids[i], self.metadata[i], float(similarities[i]))
-                for i in top_indices if similarities[i] > -1
-            ]
-        except DimensionMismatchError:
+            # Score only the surviving rows
+            vectors_array = self._get_matrix()
+            codes = self._get_codes()
+            if codes is None:
+                if rows is not None:
+                    vectors_array = vectors_array[rows]
+                similarities = vectors_array @ target_vector
+            else:
+                similarities = self._quantizer.score(
+                    codes if rows is None else codes[rows], target_vector
+                )
+                if self._rerank_factor:
+                    # Re-score the best candidates with the full-precision vectors
+                    n_candidates = min(len(similarities), top_n * self._rerank_factor)
+                    candidates = np.argpartition(-similarities, n_candidates - 1)[:n_candidates]
+                    rows = candidates if rows is None else rows[candidates]
+                    similarities = vectors_array[rows] @ target_vector
+
+            return self._top_results(similarities, rows, top_n)
+        except (DimensionMismatchError, VectorDBOperationError):
             raise
         except Exception as e:
             raise VectorDBOperationError(f"Failed to search vectors: {e}")
 
+    def _filter_rows(
+        self,
+        filter_func: Optional[Callable[[str, Any], bool]],
+        metadata_filter: Optional[Dict[str, Any]]
+    ) -> Optional[np.ndarray]:
+        """Get the rows that pass the filters, or None when there are no filters."""
+        rows = None
+        if metadata_filter:
+            index = self._get_index()
+            mask = self._get_columns().evaluate(metadata_filter, index)
+            rows = np.flatnonzero(mask)
+        if filter_func:
+            candidates = range(self._count) if rows is None else rows
+            rows = np.array([
+                i for i in candidates
+                if filter_func(self.ids[i], self.metadata[i])
+            ], dtype=np.intp)
+        return rows
+
+    def _top_results(
+        self,
+        scores: np.ndarray,
+        rows: Optional[np.ndarray],
+        top_n: int
+    ) -> List[Tuple[str, Any, float]]:
+        """
+        Select the top_n scores and return them as (id, metadata, score).
+
+        scores[j] belongs to row rows[j] (or row j when rows is None).
+        """
+        k = min(top_n, len(scores))
+        if k <= 0:
+            return []
+        # Partial sort: select the top N, then order just those
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        row_indices = top if rows is None else rows[top]
+        return [
+            (self.ids[i], self.metadata[i], float(scores[j]))
+            for i, j in zip(row_indices, top)
+        ]
+
+    @_reads_shared
+    def search_batch(
+        self,
+        target_vectors: Union[np.ndarray, List[List[float]]],
+        top_n: int = 3,
+        filter_func: Optional[Callable[[str, Any], bool]] = None,
+        metadata_filter: Optional[Dict[str, Any]] = None
+    ) -> List[List[Tuple[str, Any, float]]]:
+        """
+        Run many similarity searches with one matrix multiply.
+
+        The filters are evaluated once and shared by all queries.
+        Quantized databases search query by query (see quantize).
+
+        Args:
+            target_vectors: Array of shape (q, dimension) or list of query vectors
+            top_n: Number of top results per query
+            filter_func: Optional function (id, metadata) -> bool
+            metadata_filter: Optional declarative metadata filter
+
+        Returns:
+            One list of (id, metadata, similarity_score) tuples per query
+
+        Raises:
+            DimensionMismatchError: If the query dimension doesn't match
+            VectorDBOperationError: If the operation fails
+
+        Example:
+            >>> queries = embeddings.embed_many(["first question", "second question"])
+            >>> for results in db.search_batch(queries, top_n=5):
+            ...     print([vid for vid, meta, score in results])
+        """
+        try:
+            queries = np.array(target_vectors, dtype=np.float32, ndmin=2)
+            if queries.size == 0:
+                return []
+            if self.dimension and queries.shape[1] != self.dimension:
+                raise DimensionMismatchError(
+                    f"Query vector dimension mismatch. Expected {self.dimension}, got {queries.shape[1]}"
+                )
+            norms = np.linalg.norm(queries, axis=1, keepdims=True)
+            queries = queries / np.where(norms > 0, norms, 1)
+
+            if self._count == 0 or top_n <= 0:
+                return [[] for _ in range(len(queries))]
+
+            rows = self._filter_rows(filter_func, metadata_filter)
+            if rows is not None and len(rows) == 0:
+                return [[] for _ in range(len(queries))]
+
+            if self._get_codes() is not None:
+                return [
+                    self.top_cosine_similarity(query, top_n, filter_func, metadata_filter)
+                    for query in queries
+                ]
+
+            vectors_array = self._get_matrix()
+            if rows is not None:
+                vectors_array = vectors_array[rows]
+
+            # Bound the (rows, queries) score matrix to about 64M floats
+            step = max(1, (64 * 1024 * 1024) // max(len(vectors_array), 1))
+            results = []
+            for start in range(0, len(queries), step):
+                scores = vectors_array @ queries[start:start + step].T
+                for column in range(scores.shape[1]):
+                    results.append(self._top_results(scores[:, column], rows, top_n))
+            return results
+        except (DimensionMismatchError, VectorDBOperationError):
+            raise
+        except Exception as e:
+            raise VectorDBOperationError(f"Failed to run batch search: {e}")
+
+    def _get_bm25(self) -> BM25Index:
+        """Get the keyword index, indexing rows added since the last call."""
+        with self._lock:
+            if self._bm25 is None:
+                self._bm25 = BM25Index()
+            if self._bm25.size < self._count:
+                self._bm25.add_documents(
+                    self._text_of(self.metadata[i])
+                    for i in range(self._bm25.size, self._count)
+                )
+            return self._bm25
+
+    @staticmethod
+    def _text_of(meta: Any) -> Optional[str]:
+        """Get the indexable text of a metadata entry."""
+        if isinstance(meta, dict):
+            text = meta.get("text")
+            return text if isinstance(text, str) else None
+        return meta if isinstance(meta, str) else None
+
+    @_reads_shared
+    def keyword_search(
+        self,
+        query_text: str,
+        top_n: int = 3,
+        filter_func: Optional[Callable[[str, Any], bool]] = None,
+        metadata_filter: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[str, Any, float]]:
+        """
+        Rank vectors by BM25 keyword relevance of their text.
+
+        Indexes metadata["text"] (as stored by add_text_with_embedding), or
+        the metadata itself when it is a string. The index is built on first
+        use and kept up to date as vectors are added.
+
+        Args:
+            query_text: Keywords to search for
+            top_n: Number of top results to return
+            filter_func: Optional function (id, metadata) -> bool
+            metadata_filter: Optional declarative metadata filter
+
+        Returns:
+            List of (id, metadata, bm25_score) tuples with score > 0
+
+        Example:
+            >>> results = db.keyword_search("error code E1234", top_n=5)
+        """
+        try:
+            if self._count == 0 or top_n <= 0:
+                return []
+            scores = self._get_bm25().score(query_text)
+            rows = self._filter_rows(filter_func, metadata_filter)
+            if rows is None:
+                rows = np.flatnonzero(scores > 0)
+            else:
+                rows = rows[scores[rows] > 0]
+            return self._top_results(scores[rows], rows, top_n)
+        except VectorDBOperationError:
+            raise
+        except Exception as e:
+            raise VectorDBOperationError(f"Failed to run keyword search: {e}")
+
+    def hybrid_search(
+        self,
+        query_text: str,
+        embeddings_llm_instance: Any = None,
+        top_n: int = 3,
+        vector_weight: float = 1.0,
+        keyword_weight: float = 1.0,
+        rrf_k: int = 60,
+        candidates: Optional[int] = None,
+        filter_func: Optional[Callable[[str, Any], bool]] = None,
+        metadata_filter: Optional[Dict[str, Any]] = None,
+        target_vector: Optional[Union[np.ndarray, List[float]]] = None
+    ) -> List[Tuple[str, Any, float]]:
+        """
+        Combine vector and BM25 keyword rankings with reciprocal rank fusion.
+
+        Each result scores sum(weight / (rrf_k + rank)) over the rankings it
+        appears in (rank starting at 1).
+
+        Args:
+            query_text: The text query
+            embeddings_llm_instance: EmbeddingsLLM instance used to embed the
+                query (not needed when target_vector is given)
+            top_n: Number of top results to return
+            vector_weight: Weight of the vector ranking
+            keyword_weight: Weight of the keyword ranking
+            rrf_k: Rank smoothing constant (higher flattens rank differences)
+            candidates: Results taken from each ranking before fusion
+                (default: max(top_n * 5, 50))
+            filter_func: Optional function (id, metadata) -> bool
+            metadata_filter: Optional declarative metadata filter
+            target_vector: Precomputed query embedding
+
+        Returns:
+            List of (id, metadata, fused_score) tuples, sorted by fused score
+
+        Raises:
+            VectorDBOperationError: If neither embeddings_llm_instance nor
+                target_vector is given, or the search fails
+
+        Example:
+            >>> results = db.hybrid_search(
+            ...     "reset password for SSO accounts",
+            ...     embeddings,
+            ...     top_n=5,
+            ...     keyword_weight=0.5
+            ... )
+        """
+        if target_vector is None:
+            if embeddings_llm_instance is None:
+                raise VectorDBOperationError(
+                    "hybrid_search needs embeddings_llm_instance or target_vector"
+                )
+            target_vector = self._embed_queries([query_text], embeddings_llm_instance)[0]
+
+        candidates = candidates or max(top_n * 5, 50)
+        rankings = [
+            (vector_weight, self.top_cosine_similarity(
+                target_vector, candidates, filter_func, metadata_filter
+            ) if vector_weight else []),
+            (keyword_weight, self.keyword_search(
+                query_text, candidates, filter_func, metadata_filter
+            ) if keyword_weight else []),
+        ]
+        return self._fuse_rankings(rankings, top_n, rrf_k)
+
+    def search_many(
+        self,
+        queries: List[str],
+        embeddings_llm_instance: Any,
+        top_n: int = 3,
+        filter_func: Optional[Callable[[str, Any], bool]] = None,
+        metadata_filter: Optional[Dict[str, Any]] = None,
+        keyword_weight: float = 0.0,
+        rrf_k: int = 60
+    ) -> List[List[Tuple[str, Any, float]]]:
+        """
+        Search many text queries: one embedding call, one matrix multiply.
+
+        Args:
+            queries: Text queries
+            embeddings_llm_instance: EmbeddingsLLM instance to generate embeddings
+            top_n: Number of top results per query
+            filter_func: Optional function (id, metadata) -> bool
+            metadata_filter: Optional declarative metadata filter
+            keyword_weight: When above 0, fuse each vector ranking with BM25
+                keyword results (vector weight 1.0), as in hybrid_search
+            rrf_k: Rank smoothing constant for fusion
+
+        Returns:
+            One list of (id, metadata, score) tuples per query
+
+        Example:
+            >>> all_results = db.search_many(
+            ...     ["What is RAG?", "How do embeddings work?"],
+            ...     embeddings,
+            ...     top_n=5
+            ... )
+        """
+        if not queries:
+            return []
+        if any(not query or not query.strip() for query in queries):
+            raise VectorDBOperationError("Query text cannot be empty")
+
+        vectors = self._embed_queries(queries, embeddings_llm_instance)
+        if not keyword_weight:
+            return self.search_batch(vectors, top_n, filter_func, metadata_filter)
+
+        candidates = max(top_n * 5, 50)
+        dense = self.search_batch(vectors, candidates, filter_func, metadata_filter)
+        return [
+            self._fuse_rankings([
+                (1.0, results),
+                (keyword_weight, self.keyword_search(query, candidates, filter_func, metadata_filter)),
+            ], top_n, rrf_k)
+            for query, results in zip(queries, dense)
+        ]
+
+    @staticmethod
+    def _embed_queries(queries: List[str], embeddings_llm_instance: Any) -> np.ndarray:
+        """Embed query texts in a single provider call."""
+        try:
+            vectors = embeddings_llm_instance.generate_embeddings(list(queries), as_numpy=True)
+        except Exception as e:
+            raise VectorDBOperationError(f"Failed to embed queries: {e}")
+        vectors = np.array(vectors, dtype=np.float32, ndmin=2)
+        if vectors.size == 0:
+            raise VectorDBOperationError("Empty embedding returned")
+        return vectors
+
+    @staticmethod
+    def _fuse_rankings(
+        rankings: List[Tuple[float, List[Tuple[str, Any, float]]]],
+        top_n: int,
+        rrf_k: int
+    ) -> List[Tuple[str, Any, float]]:
+        """Reciprocal rank fusion of weighted (id, metadata, score) rankings."""
+        fused: Dict[str, float] = defaultdict(float)
+        metadata: Dict[str, Any] = {}
+        for weight, results in rankings:
+            if not weight:
+                continue
+            for rank, (vector_id, meta, _) in enumerate(results, start=1):
+                fused[vector_id] += weight / (rrf_k + rank)
+                metadata[vector_id] = meta
+        ordered = sorted(fused.items(), key=lambda item: item[1], reverse=True)[:top_n]
+        return [(vector_id, metadata[vector_id], score) for vector_id, score in ordered]
+
     def search_by_text(
         self,
         query_text: str,
         embeddings_llm_instance: Any,
         top_n: int = 3,
-        filter_func: Optional[Callable[[str, Any], bool]] = None
+        filter_func: Optional[Callable[[str, Any], bool]] = None,
+        metadata_filter: Optional[Dict[str, Any]] = None
     ) -> List[Tuple[str, Any, float]]:
         """
         Search using text query - converts to embedding internally.
@@ -521,6 +1631,7 @@ class SimplerVectors:
             embeddings_llm_instance: EmbeddingsLLM instance to generate embeddings
             top_n: Number of top results to return
             filter_func: Optional filter function
+            metadata_filter: Optional declarative metadata filter
 
         Returns:
             List of (id, metadata, similarity_score) tuples
@@ -539,18 +1650,23 @@ class SimplerVectors:
             if not query_text or not query_text.strip():
                 raise VectorDBOperationError("Query text cannot be empty")
 
-            query_embedding = embeddings_llm_instance.generate_embeddings(query_text)
-            query_embedding = np.array(query_embedding, dtype=np.float32)
+            query_embedding = embeddings_llm_instance.generate_embeddings(
+                query_text, as_numpy=True
+            )
+            query_embedding = np.asarray(query_embedding, dtype=np.float32)
 
             if query_embedding.size == 0:
                 raise VectorDBOperationError("Empty embedding returned")
 
-            return self.top_cosine_similarity(query_embedding, top_n, filter_func)
+            return self.top_cosine_similarity(
+                query_embedding, top_n, filter_func, metadata_filter
+            )
         except (DimensionMismatchError, VectorDBOperationError):
             raise
         except Exception as e:
             raise VectorDBOperationError(f"Failed to search by text: {e}")
 
+    @_reads_shared
     def query_by_metadata(self, **kwargs) -> List[Tuple[str, np.ndarray, Any]]:
         """
         Query vectors by metadata fields (AND logic).
@@ -570,20 +1686,23 @@ class SimplerVectors:
         """
         matching_indices = set()
         first_key = True
+        index = self._get_index()
 
         for key, value in kwargs.items():
-            indices = set(self._index.get(f"{key}:{value}", []))
+            indices = set(index.get(f"{key}:{value}", []))
             if first_key:
                 matching_indices = indices
                 first_key = False
             else:
                 matching_indices &= indices
 
+        matrix = self._get_matrix()
         return [
-            (self.ids[i], self.vectors[i], self.metadata[i])
+            (self.ids[i], np.array(matrix[i]), self.metadata[i])
             for i in matching_indices
         ]
 
+    @_reads_shared
     def get_vector_by_id(self, vector_id: str) -> Optional[Tuple[np.ndarray, Any]]:
         """
         Retrieve a vector and its metadata by ID.
@@ -600,11 +1719,12 @@ class SimplerVectors:
             ...     vector, metadata = result
             ...     print(f"Found: {metadata}")
         """
-        if vector_id in self.ids:
-            idx = self.ids.index(vector_id)
-            return (self.vectors[idx], self.metadata[idx])
-        return None
+        idx = self._row_of(vector_id)
+        if idx is None:
+            return None
+        return (np.array(self._matrix[idx]), self.metadata[idx])
 
+    @_reads_shared
     def list_all_ids(self) -> List[str]:
         """
         Get all vector IDs in the database.
@@ -618,6 +1738,7 @@ class SimplerVectors:
         """
         return self.ids.copy()
 
+    @_reads_shared
     def get_vector_count(self) -> int:
         """
         Get the total number of vectors in the database.
@@ -629,8 +1750,9 @@ class SimplerVectors:
             >>> count = db.get_vector_count()
             >>> print(f"Vectors: {count}")
         """
-        return len(self.vectors)
+        return self._count
 
+    @_synchronized
     def clear_database(self) -> None:
         """
         Remove all vectors from the database.
@@ -639,10 +1761,15 @@ class SimplerVectors:
             >>> db.clear_database()
             >>> print(db.get_vector_count())  # 0
         """
-        self.vectors.clear()
-        self.metadata.clear()
-        self.ids.clear()
-        self._index.clear()
+        self._log(("clear",))
+        self._release_storage()
+        self.metadata = []
+        self.ids = []
+        self._index = defaultdict(list)
+        self._columns = None
+        self._bm25 = None
+        self._id_rows = {}
+        self._codes = None
         self.dimension = None
 
     def get_stats(self) -> Dict[str, Any]:
@@ -651,7 +1778,10 @@ class SimplerVectors:
 
         Returns:
             Dictionary with: total_vectors, dimension, provider,
-            size_in_memory_mb, metadata_keys
+            size_in_memory_mb (vectors held in memory plus quantization
+            codes), memory_mapped_mb (vectors read from a memory-mapped
+            file), metadata_keys, quantization (see get_quantization_stats;
+            None when not quantized)
 
         Example:
             >>> stats = db.get_stats()
@@ -660,16 +1790,28 @@ class SimplerVectors:
             >>> print(f"Memory: {stats['size_in_memory_mb']:.2f} MB")
         """
         try:
+            matrix = self._get_matrix()
+            mapped = matrix.nbytes if isinstance(matrix, np.memmap) else 0
             return {
-                "total_vectors": len(self.vectors),
+                "total_vectors": self._count,
                 "dimension": self.dimension,
                 "provider": "local",
-                "size_in_memory_mb": sum(v.nbytes for v in self.vectors) / (1024 * 1024) if self.vectors else 0,
+                "size_in_memory_mb": self._resident_bytes() / (1024 * 1024),
+                "memory_mapped_mb": mapped / (1024 * 1024),
                 "metadata_keys": self._get_metadata_keys(),
+                "quantization": self.get_quantization_stats(),
             }
         except Exception as e:
             raise VectorDBOperationError(f"Failed to get stats: {e}")
 
+    def _resident_bytes(self) -> int:
+        """Bytes of vectors and quantization codes held in memory."""
+        matrix = self._get_matrix()
+        size = 0 if isinstance(matrix, np.memmap) else matrix.nbytes
+        if self._codes is not None:
+            size += self._codes[:self._codes_count].nbytes
+        return size
+
     def _get_metadata_keys(self) -> List[str]:
         """Get unique metadata keys across all entries."""
         keys = set()
@@ -678,29 +1820,257 @@ class SimplerVectors:
                 keys.update(meta.keys())
         return list(keys)
 
+    @_synchronized
     def compress_vectors(self, bits: int = 16) -> float:
         """
         Compress vectors to lower precision to save memory.
 
+        With bits=8 the stored vectors are int8-quantized (see quantize)
+        and the full-precision rows are moved to a temporary memory-mapped
+        file in db_folder, which re-ranking reads candidate rows from. The
+        next write copies them back into memory, so compress after loading
+        or bulk inserts.
+
         Args:
-            bits: Target bit precision (16 or 32)
+            bits: Target bit precision: 16 casts the stored vectors to
+                float16; 8 quantizes them as described above
 
         Returns:
-            Compression ratio achieved
+            Ratio of memory held before and after compressing
 
         Example:
             >>> original_stats = db.get_stats()
             >>> ratio = db.compress_vectors(bits=16)
             >>> print(f"Compressed {ratio:.1f}x")
         """
-        if not self.vectors:
+        if self._count == 0:
             return 1.0
 
-        original_size = sum(v.nbytes for v in self.vectors)
+        if bits == 8:
+            original_size = self._resident_bytes()
+            self.quantize(QuantizationMethod.INT8, measure_recall=False)
+            self._spill_matrix()
+            new_size = self._resident_bytes()
+            return original_size / new_size if new_size > 0 else 1.0
+
+        original_size = self._get_matrix().nbytes
         dtype = np.float16 if bits == 16 else np.float32
 
-        for i in range(len(self.vectors)):
-            self.vectors[i] = np.array(self.vectors[i], dtype=dtype)
+        self._matrix = self._get_matrix().astype(dtype)
 
-        new_size = sum(v.nbytes for v in self.vectors)
+        new_size = self._matrix.nbytes
         return original_size / new_size if new_size > 0 else 1.0
+
+    def _spill_matrix(self) -> None:
+        """Move the live rows to a temporary memory-mapped file."""
+        matrix = self._get_matrix()
+        if isinstance(matrix, np.memmap):
+            return  # Already on disk (columnar load or shared snapshot)
+        # The file is deleted when closed; the mapping keeps it readable
+        with tempfile.TemporaryFile(dir=self.db_folder, suffix=".spill") as f:
+            spilled = np.memmap(f, dtype=matrix.dtype, mode="w+", shape=matrix.shape)
+            spilled[:] = matrix
+            spilled.flush()
+        self._matrix = spilled
+        self._spilled = spilled
+
+    def quantize(
+        self,
+        method: QuantizationMethod = QuantizationMethod.INT8,
+        subspaces: Optional[int] = None,
+        rerank_factor: Optional[int] = None,
+        training_size: int = 65536,
+        measure_recall: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Build compact codes for the stored vectors and search over them.
+
+        Searches scan the codes with the query kept in float32, then
+        re-score the best top_n * rerank_factor candidates with the
+        full-precision vectors. Vectors added later are encoded with the
+        same calibration. Codes are rebuilt in memory after loading and are
+        not saved to disk.
+
+        To hold collections larger than RAM, save them in the columnar
+        format and load (or attach_shared) before quantizing: the float32
+        matrix then stays memory-mapped on disk, only the codes live in
+        memory, and re-ranking reads just the candidate rows.
+
+        Args:
+            method: QuantizationMethod.INT8 (1 byte per dimension),
+                QuantizationMethod.PRODUCT (1 byte per subspace) or
+                QuantizationMethod.NONE to turn quantization off
+            subspaces: Subspaces for PRODUCT (default: dimension // 8)
+            rerank_factor: Candidates re-ranked per result (default: 4 for
+                INT8, 16 for PRODUCT); 0 returns the approximate scores directly
+            training_size: Vectors sampled to calibrate the quantizer
+            measure_recall: Estimate recall@10 on a sample of the collection
+
+        Returns:
+            Quantization statistics (see get_quantization_stats)
+
+        Raises:
+            VectorDBOperationError: If the database is empty or the
+                parameters are invalid
+
+        Example:
+            >>> stats = db.quantize(QuantizationMethod.PRODUCT, subspaces=192)
+            >>> print(f"{stats['compression_ratio']:.0f}x smaller, "
+            ...       f"recall@10 {stats['recall_at_10_reranked']:.2f}")
+        """
+        method = QuantizationMethod(method)
+        with self._lock:
+            if method == QuantizationMethod.NONE:
+                self._quantizer = None
+                self._codes = None
+                self._quantization_stats = {}
+                return {}
+
+            if self._count == 0:
+                raise VectorDBOperationError("Cannot quantize an empty database")
+            if rerank_factor is None:
+                rerank_factor = 4 if method == QuantizationMethod.INT8 else 16
+            if rerank_factor < 0:
+                raise VectorDBOperationError("rerank_factor cannot be negative")
+
+            matrix = self._get_matrix()
+            rng = np.random.default_rng(0)
+            sample_rows = np.sort(rng.choice(
+                self._count, min(self._count, training_size), replace=False
+            ))
+            quantizer = create_quantizer(method, matrix.shape[1], subspaces)
+            quantizer.fit(matrix[sample_rows])
+
+            self._quantizer = quantizer
+            self._rerank_factor = rerank_factor
+            self._codes = None
+            self._quantization_stats = {}
+            self._get_codes()
+
+            if measure_recall:
+                self._quantization_stats = self._measure_recall()
+            return self.get_quantization_stats()
+
+    def _get_codes(self) -> Optional[np.ndarray]:
+        """Get codes for all live rows, encoding rows added since the last call."""
+        if self._quantizer is None or self._count == 0:
+            return None
+        if self._codes is not None and self._codes_count == self._count:
+            return self._codes
+
+        with self._lock:
+            matrix = self._get_matrix()
+            if self._quantizer.dimension != matrix.shape[1]:
+                # Dimension changed (e.g. cleared and refilled): recalibrate
+                self._quantizer = create_quantizer(
+                    self._quantizer.method, matrix.shape[1],
+                    getattr(self._quantizer, "subspaces", None)
+                ).fit(matrix[:65536])
+                self._codes = None
+
+            if self._codes is None:
+                self._codes = self._quantizer.encode(matrix)
+            elif self._codes_count < self._count:
+                new_codes = self._quantizer.encode(matrix[self._codes_count:])
+                self._codes = np.concatenate([self._codes[:self._codes_count], new_codes])
+            self._codes_count = self._count
+            return self._codes
+
+    def _measure_recall(
+        self,
+        k: int = 10,
+        queries: int = 100,
+        sample_size: int = 50000
+    ) -> Dict[str, float]:
+        """Estimate recall@k of the quantized search against exact search on a sample."""
+        rng = np.random.default_rng(1)
+        rows = np.sort(rng.choice(self._count, min(self._count, sample_size), replace=False))
+        vectors = np.asarray(self._get_matrix()[rows], dtype=np.float32)
+        codes = self._get_codes()[rows]
+        k = min(k, len(rows))
+        query_rows = rng.choice(len(rows), min(queries, len(rows)), replace=False)
+
+        def top(scores: np.ndarray, n: int) -> np.ndarray:
+            return np.argpartition(-scores, n - 1)[:n]
+
+        hits = hits_reranked = 0
+        n_candidates = min(len(rows), k * max(self._rerank_factor, 1))
+        for q in query_rows:
+            query = vectors[q]
+            exact = set(top(vectors @ query, k).tolist())
+            approx = self._quantizer.score(codes, query)
+            hits += len(exact & set(top(approx, k).tolist()))
+            candidates = top(approx, n_candidates)
+            reranked = candidates[top(vectors[candidates] @ query, k)]
+            hits_reranked += len(exact & set(reranked.tolist()))
+
+        total = k * len(query_rows)
+        return {
+            "recall_at_10": hits / total,
+            "recall_at_10_reranked": hits_reranked / total,
+        }
+
+    def get_quantization_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the memory and accuracy trade-off of the current quantization.
+
+        Returns:
+            None if quantization is off, otherwise a dictionary with:
+            method, bytes_per_vector, codes_size_mb, full_precision_size_mb,
+            compression_ratio, rerank_factor, and recall_at_10 /
+            recall_at_10_reranked when measured by quantize()
+
+        Example:
+            >>> stats = db.get_quantization_stats()
+            >>> print(f"Codes: {stats['codes_size_mb']:.1f} MB")
+        """
+        if self._quantizer is None:
+            return None
+        bytes_per_vector = self._quantizer.code_size
+        full_bytes = (self.dimension or self._quantizer.dimension) * 4
+        stats = {
+            "method": self._quantizer.method.value,
+            "bytes_per_vector": bytes_per_vector,
+            "codes_size_mb": self._count * bytes_per_vector / (1024 * 1024),
+            "full_precision_size_mb": self._count * full_bytes / (1024 * 1024),
+            "compression_ratio": full_bytes / bytes_per_vector,
+            "rerank_factor": self._rerank_factor,
+        }
+        stats.update(self._quantization_stats)
+        return stats
+
+
+def convert_collection_format(
+    db_folder: str,
+    collection_name: str,
+    source_format: SerializationFormat = SerializationFormat.BINARY,
+    target_format: SerializationFormat = SerializationFormat.COLUMNAR,
+) -> int:
+    """
+    Convert a saved collection from one serialization format to another.
+
+    The source files are left in place.
+
+    Args:
+        db_folder: Folder containing the collection
+        collection_name: Name of the collection (without extension)
+        source_format: Format the collection is currently saved in
+        target_format: Format to write
+
+    Returns:
+        Number of vectors converted
+
+    Raises:
+        VectorDBOperationError: If metadata cannot be stored in the target format
+
+    Example:
+        >>> from SimplerLLM.vectors.providers.local_provider import convert_collection_format
+        >>> convert_collection_format("./vectors", "my_collection")
+        300000
+    """
+    db = SimplerVectors(db_folder=db_folder)
+    db.load_from_disk(collection_name, source_format)
+    db.save_to_disk(collection_name, target_format)
+    count = db.get_vector_count()
+    db.clear_database()
+    return count
@@ -0,0 +1,111 @@
+"""
+Shared read-only snapshots of a local vector collection.
+
+One process publishes the collection as a numbered generation of the
+columnar format; any number of worker processes attach to the latest
+generation read-only. Vectors and metadata are memory-mapped, so the
+operating system keeps a single copy in the page cache no matter how many
+workers attach.
+
+Layout in db_folder:
+
+    <collection>.shared/
+        CURRENT        Latest published generation number
+        gen-1/         Columnar snapshot (see local_storage)
+        gen-2/
+
+Publishing writes a new generation folder and then atomically replaces
+CURRENT. Workers compare CURRENT with the generation they have mapped and
+switch to the new snapshot when it changes. Older generations are removed,
+keeping the most recent few so workers still mapping them are unaffected.
+
+Example:
+    >>> # Publisher
+    >>> gen = publish_snapshot("./vectors/docs.shared", matrix, metadata, ids, 1536)
+    >>>
+    >>> # Worker
+    >>> read_generation("./vectors/docs.shared")
+    1
+"""
+
+import os
+import shutil
+from typing import Any, Optional, Sequence
+
+import numpy as np
+
+from .local_storage import save_columnar
+
+SHARED_EXTENSION = ".shared"
+
+
+def shared_path(db_folder: str, collection_name: str) -> str:
+    """Get the folder holding the shared generations of a collection."""
+    return os.path.join(db_folder, collection_name + SHARED_EXTENSION)
+
+
+def generation_path(base_dir: str, generation: int) -> str:
+    """Get the folder of one published generation."""
+    return os.path.join(base_dir, f"gen-{generation}")
+
+
+def read_generation(base_dir: str) -> Optional[int]:
+    """
+    Read the latest published generation number.
+
+    Returns:
+        The generation number, or None if nothing has been published
+    """
+    try:
+        with open(os.path.join(base_dir, "CURRENT"), "r", encoding="utf-8") as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def publish_snapshot(
+    base_dir: str,
+    matrix: np.ndarray,
+    metadata: Sequence[Any],
+    ids: Sequence[str],
+    dimension: Optional[int],
+    keep: int = 2,
+) -> int:
+    """
+    Publish a new generation of a collection.
+
+    Args:
+        base_dir: Shared folder from shared_path()
+        matrix: Array of shape (n, dimension)
+        metadata: n JSON-serializable metadata objects
+        ids: n vector IDs
+        dimension: Vector dimension
+        keep: Number of most recent generations to keep on disk
+
+    Returns:
+        The new generation number
+    """
+    os.makedirs(base_dir, exist_ok=True)
+    generation = (read_generation(base_dir) or 0) + 1
+
+    target = generation_path(base_dir, generation)
+    if os.path.exists(target):
+        # Left over from a publish that failed before updating CURRENT
+        shutil.rmtree(target, ignore_errors=True)
+    save_columnar(target, matrix, metadata, ids, dimension)
+
+    current = os.path.join(base_dir, "CURRENT")
+    with open(current + ".tmp", "w", encoding="utf-8") as f:
+        f.write(str(generation))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(current + ".tmp", current)
+
+    for name in os.listdir(base_dir):
+        if name.startswith("gen-") and name[4:].isdigit():
+            if int(name[4:]) <= generation - keep:
+                # Mapped files stay readable on POSIX; on Windows removal
+                # fails while a worker still has them open
+                shutil.rmtree(os.path.join(base_dir, name), ignore_errors=True)
+
+    return generation
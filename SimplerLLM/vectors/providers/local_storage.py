@@ -0,0 +1,226 @@
+"""
+Columnar on-disk storage for the local vector provider.
+
+A columnar collection is a folder named <collection>.svdc containing:
+
+    manifest.json                  Format version, row count, dimension,
+                                   dtype and the data file names
+    vectors-<token>.npy            The (n, dimension) vector matrix
+    ids-<token>.npy                Vector IDs as a fixed-width unicode array
+    metadata-<token>.jsonl         One JSON document per row
+    metadata_offsets-<token>.npy   Byte offsets of each row in the metadata
+                                   file (n + 1)
+
+<token> is a random save token shared by the files of one save.
+
+Loading memory-maps vectors.npy with np.load(mmap_mode="r") and reads
+metadata rows on demand through the offset index, so opening a large
+collection costs a few file opens rather than deserializing every row.
+
+Each save writes a new set of data files and then atomically replaces the
+manifest, which is the only pointer to them, so a crash mid-save leaves
+the previous snapshot intact rather than mixing old and new files. Data
+files of earlier saves are then removed; processes that still have them
+mapped keep reading the old snapshot (on Windows they are removed by a
+later save instead).
+
+Example:
+    >>> save_columnar("./vectors/docs.svdc", matrix, metadata, ids, 1536)
+    >>> matrix, metadata, ids, dimension = load_columnar("./vectors/docs.svdc")
+    >>> metadata[10]  # decoded on access
+    {'text': '...'}
+"""
+
+import json
+import mmap
+import os
+import re
+import uuid
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..exceptions import VectorDBOperationError
+
+COLUMNAR_EXTENSION = ".svdc"
+COLUMNAR_VERSION = 2
+
+# Data file names of version 1 collections, which had no save token
+_V1_FILES = {
+    "vectors": "vectors.npy",
+    "ids": "ids.npy",
+    "metadata": "metadata.jsonl",
+    "metadata_offsets": "metadata_offsets.npy",
+}
+_DATA_FILE = re.compile(r"(vectors|ids|metadata|metadata_offsets)(-[0-9a-f]+)?\.(npy|jsonl)(\.tmp)?")
+
+
+class LazyMetadata(Sequence):
+    """
+    Read-only sequence of metadata rows backed by a memory-mapped JSONL file.
+
+    Rows are decoded with json.loads when accessed. Convert with list() to
+    get a regular, mutable list.
+    """
+
+    def __init__(self, jsonl_path: str, offsets: np.ndarray):
+        self._offsets = offsets
+        self._file = open(jsonl_path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("metadata index out of range")
+        start = int(self._offsets[index])
+        end = int(self._offsets[index + 1])
+        return json.loads(self._data[start:end])
+
+    def __iter__(self) -> Iterator[Any]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def close(self) -> None:
+        """Release the memory map and file handle."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+
+def columnar_path(db_folder: str, collection_name: str) -> str:
+    """Get the folder path of a columnar collection."""
+    return os.path.join(db_folder, collection_name + COLUMNAR_EXTENSION)
+
+
+def save_columnar(
+    path: str,
+    matrix: np.ndarray,
+    metadata: Sequence[Any],
+    ids: Sequence[str],
+    dimension: Optional[int],
+) -> None:
+    """
+    Write a collection in the columnar format.
+
+    Args:
+        path: Collection folder (created if missing)
+        matrix: Array of shape (n, dimension)
+        metadata: n JSON-serializable metadata objects
+        ids: n vector IDs
+        dimension: Vector dimension
+
+    Raises:
+        VectorDBOperationError: If metadata is not JSON-serializable
+    """
+    os.makedirs(path, exist_ok=True)
+
+    # Encode metadata first so a serialization error leaves the old files intact
+    offsets = np.zeros(len(metadata) + 1, dtype=np.int64)
+    lines = []
+    position = 0
+    for i, meta in enumerate(metadata):
+        try:
+            line = json.dumps(meta, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        except (TypeError, ValueError) as e:
+            raise VectorDBOperationError(
+                f"Metadata for row {i} is not JSON-serializable ({e}). "
+                "Use SerializationFormat.BINARY for arbitrary Python metadata."
+            )
+        lines.append(line)
+        position += len(line) + 1
+        offsets[i + 1] = position
+
+    id_width = max((len(vector_id) for vector_id in ids), default=1)
+    id_array = np.array(list(ids), dtype=f"<U{id_width}")
+
+    def write_atomic(name: str, writer) -> None:
+        final_path = os.path.join(path, name)
+        tmp_path = final_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            writer(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, final_path)
+
+    def write_lines(f) -> None:
+        for line in lines:
+            f.write(line)
+            f.write(b"\n")
+
+    token = uuid.uuid4().hex[:16]
+    files = {
+        "vectors": f"vectors-{token}.npy",
+        "ids": f"ids-{token}.npy",
+        "metadata": f"metadata-{token}.jsonl",
+        "metadata_offsets": f"metadata_offsets-{token}.npy",
+    }
+    write_atomic(files["vectors"], lambda f: np.save(f, np.ascontiguousarray(matrix)))
+    write_atomic(files["ids"], lambda f: np.save(f, id_array))
+    write_atomic(files["metadata"], write_lines)
+    write_atomic(files["metadata_offsets"], lambda f: np.save(f, offsets))
+
+    # Switching the manifest publishes the new files in one step
+    manifest = {
+        "version": COLUMNAR_VERSION,
+        "count": int(len(ids)),
+        "dimension": dimension,
+        "dtype": str(matrix.dtype),
+        "files": files,
+    }
+    write_atomic("manifest.json", lambda f: f.write(json.dumps(manifest).encode("utf-8")))
+
+    current = set(files.values())
+    for name in os.listdir(path):
+        if name not in current and _DATA_FILE.fullmatch(name):
+            try:
+                os.remove(os.path.join(path, name))
+            except OSError:
+                pass  # Still mapped (Windows); removed by a later save
+
+
+def load_columnar(path: str) -> Tuple[np.ndarray, LazyMetadata, List[str], Optional[int]]:
+    """
+    Open a columnar collection without reading the vectors into memory.
+
+    Args:
+        path: Collection folder
+
+    Returns:
+        Tuple of (read-only memory-mapped matrix, LazyMetadata, ids, dimension)
+
+    Raises:
+        VectorDBOperationError: If the folder is not a valid collection
+    """
+    try:
+        with open(os.path.join(path, "manifest.json"), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        raise VectorDBOperationError(f"Invalid columnar collection at {path}: {e}")
+
+    if manifest.get("version", 0) > COLUMNAR_VERSION:
+        raise VectorDBOperationError(
+            f"Columnar collection version {manifest['version']} is newer than supported"
+        )
+
+    # Zero-length arrays cannot be memory-mapped
+    mmap_mode = "r" if manifest["count"] else None
+    files = manifest.get("files", _V1_FILES)
+    try:
+        matrix = np.load(os.path.join(path, files["vectors"]), mmap_mode=mmap_mode)
+        ids = np.load(os.path.join(path, files["ids"])).tolist()
+        offsets = np.load(os.path.join(path, files["metadata_offsets"]), mmap_mode="r")
+        metadata = LazyMetadata(os.path.join(path, files["metadata"]), offsets)
+    except (OSError, ValueError, KeyError) as e:
+        raise VectorDBOperationError(f"Invalid columnar collection at {path}: {e}")
+
+    if not (len(matrix) == len(ids) == len(metadata) == manifest["count"]):
+        raise VectorDBOperationError(f"Columnar collection at {path} is inconsistent")
+
+    return matrix, metadata, ids, manifest.get("dimension")
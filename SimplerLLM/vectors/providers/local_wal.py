@@ -0,0 +1,209 @@
+"""
+Append-only write-ahead log for the local vector provider.
+
+Every add, update, delete and clear is appended to a log segment next to
+the collection file, so writes survive a crash without rewriting the whole
+collection. Checkpoints fold the log into the main file and remove the
+segments it covers.
+
+Segments are named <collection>.wal.<sequence>. Each record is framed as:
+
+    4 bytes   payload length (little-endian)
+    4 bytes   CRC32 of the payload
+    n bytes   pickled operation tuple
+
+A torn record at the end of a segment (from a crash mid-write) fails its
+length or CRC check and is ignored, along with anything after it.
+
+Replaying is idempotent: each record carries the full new state of the
+vector it touches, so replaying records already folded into the main file
+produces the same collection.
+
+Example:
+    >>> wal = WriteAheadLog("./vectors/docs", sync_policy=WALSyncPolicy.ALWAYS)
+    >>> wal.append(("delete", "vector-id"))
+    >>> list(WriteAheadLog.read_records("./vectors/docs"))
+    [('delete', 'vector-id')]
+"""
+
+import enum
+import glob
+import os
+import pickle
+import struct
+import threading
+import time
+import zlib
+from typing import Any, Iterator, List, Optional, Tuple
+
+_HEADER = struct.Struct("<II")
+
+
+class WALSyncPolicy(enum.Enum):
+    """
+    When write-ahead log records are flushed to stable storage.
+
+    Attributes:
+        ALWAYS: fsync after every record. No acknowledged write is lost.
+        INTERVAL: Flush every record and fsync within sync_interval
+            seconds, also when writes stop. Survives process crashes; up
+            to sync_interval of work can be lost on power failure.
+        NEVER: Flush every record and leave fsync to the operating system.
+            Survives process crashes but not power loss.
+    """
+    ALWAYS = 'always'
+    INTERVAL = 'interval'
+    NEVER = 'never'
+
+
+class WriteAheadLog:
+    """
+    Segmented append-only log of vector operations.
+
+    Args:
+        base_path: Collection path without extension (e.g., "./vectors/docs")
+        sync_policy: When to fsync appended records
+        sync_interval: Seconds between fsyncs for WALSyncPolicy.INTERVAL
+    """
+
+    def __init__(
+        self,
+        base_path: str,
+        sync_policy: WALSyncPolicy = WALSyncPolicy.ALWAYS,
+        sync_interval: float = 1.0,
+    ):
+        self.base_path = base_path
+        self.sync_policy = WALSyncPolicy(sync_policy)
+        self.sync_interval = sync_interval
+        self._last_sync = time.monotonic()
+        # Guards the file against the timer that syncs an idle log
+        self._lock = threading.Lock()
+        self._unsynced = False
+        self._sync_timer: Optional[threading.Timer] = None
+
+        segments = self.segments(base_path)
+        self._sequence = segments[-1][0] if segments else 1
+        self._file = open(self._segment_path(self._sequence), "ab")
+        self.active_size = self._file.tell()
+
+    @staticmethod
+    def segments(base_path: str) -> List[Tuple[int, str]]:
+        """List existing (sequence, path) segments in replay order."""
+        found = []
+        for path in glob.glob(glob.escape(base_path) + ".wal.*"):
+            suffix = path.rsplit(".", 1)[-1]
+            if suffix.isdigit():
+                found.append((int(suffix), path))
+        return sorted(found)
+
+    @staticmethod
+    def read_records(base_path: str) -> Iterator[Any]:
+        """
+        Yield every intact record from all segments, oldest first.
+
+        Reading a segment stops at the first truncated or corrupt record.
+        """
+        for _, path in WriteAheadLog.segments(base_path):
+            with open(path, "rb") as f:
+                while True:
+                    header = f.read(_HEADER.size)
+                    if len(header) < _HEADER.size:
+                        break
+                    length, checksum = _HEADER.unpack(header)
+                    payload = f.read(length)
+                    if len(payload) < length or zlib.crc32(payload) != checksum:
+                        break
+                    yield pickle.loads(payload)
+
+    def _segment_path(self, sequence: int) -> str:
+        return f"{self.base_path}.wal.{sequence}"
+
+    def append(self, record: Any) -> None:
+        """Append one operation record and sync according to the policy."""
+        payload = pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._file.write(_HEADER.pack(len(payload), zlib.crc32(payload)))
+            self._file.write(payload)
+            self.active_size += _HEADER.size + len(payload)
+
+            if self.sync_policy == WALSyncPolicy.ALWAYS:
+                self._sync()
+            elif self.sync_policy == WALSyncPolicy.INTERVAL:
+                self._file.flush()
+                if time.monotonic() - self._last_sync >= self.sync_interval:
+                    self._sync()
+                else:
+                    self._unsynced = True
+                    self._schedule_sync()
+            else:
+                self._file.flush()
+
+    def _schedule_sync(self) -> None:
+        """Start a timer that fsyncs the log if no later append does."""
+        if self._sync_timer is not None:
+            return
+        delay = max(0.0, self._last_sync + self.sync_interval - time.monotonic())
+        self._sync_timer = threading.Timer(delay, self._sync_pending)
+        self._sync_timer.daemon = True
+        self._sync_timer.start()
+
+    def _sync_pending(self) -> None:
+        with self._lock:
+            self._sync_timer = None
+            if self._unsynced and not self._file.closed:
+                try:
+                    self._sync()
+                except OSError:
+                    # Retried by the next append's timer or sync
+                    pass
+
+    def sync(self) -> None:
+        """Flush and fsync the active segment."""
+        with self._lock:
+            self._sync()
+
+    def _sync(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._last_sync = time.monotonic()
+        self._unsynced = False
+
+    def rotate(self) -> int:
+        """
+        Seal the active segment and start a new one.
+
+        Returns:
+            Sequence number of the sealed segment. Segments up to and
+            including it can be removed once a checkpoint covers them.
+        """
+        with self._lock:
+            self._sync()
+            self._file.close()
+            sealed = self._sequence
+            self._sequence += 1
+            self._file = open(self._segment_path(self._sequence), "ab")
+            self.active_size = 0
+            return sealed
+
+    @staticmethod
+    def remove_segments(base_path: str, sequence: int) -> None:
+        """Delete segments with sequence numbers up to and including sequence."""
+        for seq, path in WriteAheadLog.segments(base_path):
+            if seq <= sequence:
+                os.remove(path)
+
+    def remove_through(self, sequence: int) -> None:
+        """Delete sealed segments with sequence numbers up to and including sequence."""
+        for seq, path in self.segments(self.base_path):
+            if seq <= sequence and seq != self._sequence:
+                os.remove(path)
+
+    def close(self) -> None:
+        """Sync and close the active segment."""
+        with self._lock:
+            if self._sync_timer is not None:
+                self._sync_timer.cancel()
+                self._sync_timer = None
+            if not self._file.closed:
+                self._sync()
+                self._file.close()
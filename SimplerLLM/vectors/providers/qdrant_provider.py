@@ -9,11 +9,13 @@ vector operations for the Qdrant provider. For high-level usage, prefer
 the QdrantVectorDB wrapper or VectorDB.create() factory.
 
 Features:
-    - Self-hosted or Qdrant Cloud support
+    - Self-hosted, Qdrant Cloud or local mode (":memory:") support
     - Automatic collection management
     - DOT distance metric (cosine when normalized)
-    - Efficient batch operations
-    - Metadata filtering with Qdrant's native filters
+    - Chunked, concurrent batch upserts
+    - Metadata filters evaluated server-side
+    - Batch search (many queries per round trip)
+    - Async methods backed by AsyncQdrantClient
 
 Requirements:
     pip install qdrant-client
@@ -29,8 +31,10 @@ Example:
     >>> vector_id = db.add_vector([0.1, 0.2, 0.3], {"text": "example"})
 """
 
+import asyncio
 import numpy as np
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Callable, Tuple, Union
 
 from ..exceptions import (
@@ -40,14 +44,17 @@ from ..exceptions import (
     VectorDBOperationError,
     VectorDBConnectionError,
 )
+from ..filters import to_qdrant_filter
 
 # Lazy import for qdrant-client
 try:
-    from qdrant_client import QdrantClient
+    from qdrant_client import QdrantClient, AsyncQdrantClient
     from qdrant_client.models import (
+        Batch,
         Distance,
         VectorParams,
         PointStruct,
+        SearchRequest,
         Filter,
         FieldCondition,
         MatchValue,
@@ -71,6 +78,9 @@ class QdrantProvider:
         collection_name: Name of the collection
         dimension: Vector dimension
         api_key: API key for Qdrant Cloud (optional)
+        location: Local mode location (":memory:" or a folder), if used
+        batch_size: Points per upsert request in batch operations
+        parallel: Concurrent upsert requests in batch operations
 
     Example:
         >>> # Local Qdrant instance
@@ -92,6 +102,9 @@ class QdrantProvider:
         >>>
         >>> # Search
         >>> results = db.top_cosine_similarity([0.1, 0.2, 0.3], top_n=5)
+        >>>
+        >>> # In-memory instance, no server needed
+        >>> db = QdrantProvider(location=":memory:", collection_name="test")
     """
 
     def __init__(
@@ -101,6 +114,9 @@ class QdrantProvider:
         collection_name: str = 'default_collection',
         dimension: Optional[int] = None,
         api_key: Optional[str] = None,
+        location: Optional[str] = None,
+        batch_size: int = 256,
+        parallel: int = 4,
     ):
         """
         Initialize the Qdrant provider.
@@ -111,6 +127,12 @@ class QdrantProvider:
             collection_name: Name of the collection to use
             dimension: Vector dimension (optional, detected from first vector)
             api_key: API key for Qdrant Cloud authentication
+            location: Run qdrant-client in local mode instead of connecting
+                to a server: ":memory:" or a folder path. url, port and
+                api_key are ignored when set.
+            batch_size: Points per upsert request in batch operations
+            parallel: Concurrent upsert requests in batch operations
+                (local mode always upserts sequentially)
 
         Raises:
             ImportError: If qdrant-client is not installed
@@ -138,21 +160,22 @@ class QdrantProvider:
         self.collection_name = collection_name
         self.dimension = dimension
         self.api_key = api_key
+        self.location = location
+        self.batch_size = batch_size
+        self.parallel = parallel
+
+        if location is not None:
+            self._client_kwargs = {"location": location}
+        elif self.api_key:
+            self._client_kwargs = {
+                "url": self.url, "port": self.port, "api_key": self.api_key, "timeout": 10
+            }
+        else:
+            self._client_kwargs = {"host": self.url, "port": self.port, "timeout": 10}
+        self._async_client = None
 
         try:
-            if self.api_key:
-                self.client = QdrantClient(
-                    url=self.url,
-                    port=self.port,
-                    api_key=self.api_key,
-                    timeout=10
-                )
-            else:
-                self.client = QdrantClient(
-                    host=self.url,
-                    port=self.port,
-                    timeout=10
-                )
+            self.client = QdrantClient(**self._client_kwargs)
             self._ensure_collection_exists()
         except Exception as e:
             raise VectorDBConnectionError(f"Failed to connect to Qdrant: {e}")
@@ -173,6 +196,136 @@ class QdrantProvider:
         except Exception as e:
             print(f"Warning: Could not check/create collection: {e}")
 
+    @property
+    def async_client(self) -> "AsyncQdrantClient":
+        """AsyncQdrantClient with the same connection settings, created on first use."""
+        if self._async_client is None:
+            self._async_client = AsyncQdrantClient(**self._client_kwargs)
+        return self._async_client
+
+    async def _run_async(self, method: Callable, *args, **kwargs):
+        """
+        Run the async variant of a client method.
+
+        In local mode the sync client is used from a worker thread instead:
+        a second local client would not see the same data.
+        """
+        if self.location is not None:
+            return await asyncio.to_thread(getattr(self.client, method), *args, **kwargs)
+        return await getattr(self.async_client, method)(*args, **kwargs)
+
+    @staticmethod
+    def _to_payload(meta: Any) -> Dict[str, Any]:
+        """Convert metadata to a Qdrant payload."""
+        return meta.copy() if isinstance(meta, dict) else {"metadata": meta}
+
+    def _prepare_matrix(
+        self,
+        vectors: Union[np.ndarray, List],
+        normalize: bool
+    ) -> np.ndarray:
+        """Validate and optionally normalize a batch of vectors as one matrix."""
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim != 2:
+            raise VectorDBOperationError(
+                f"Expected a 2-D array of vectors, got shape {matrix.shape}"
+            )
+        if self.dimension is not None and matrix.shape[1] != self.dimension:
+            raise DimensionMismatchError(
+                f"Vector dimension mismatch. Expected {self.dimension}, got {matrix.shape[1]}"
+            )
+        if normalize:
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            matrix = matrix / np.where(norms > 0, norms, 1)
+        return matrix
+
+    def _chunks(self, count: int, batch_size: Optional[int]) -> List[Tuple[int, int]]:
+        """Split count rows into (start, end) upsert chunks."""
+        size = batch_size or self.batch_size
+        return [(start, min(start + size, count)) for start in range(0, count, size)]
+
+    def _batch(
+        self,
+        ids: List[str],
+        matrix: np.ndarray,
+        payloads: List[Dict[str, Any]],
+        bounds: Tuple[int, int]
+    ) -> "Batch":
+        """Build a columnar Batch for one chunk."""
+        start, end = bounds
+        return Batch(
+            ids=ids[start:end],
+            vectors=matrix[start:end].tolist(),
+            payloads=payloads[start:end]
+        )
+
+    def _upsert_chunks(
+        self,
+        ids: List[str],
+        matrix: np.ndarray,
+        payloads: List[Dict[str, Any]],
+        batch_size: Optional[int],
+        wait: bool
+    ) -> None:
+        """
+        Upsert rows in chunks, sending up to `parallel` chunks at once.
+
+        All chunks but the last are sent with wait=False so the server
+        acknowledges them on receipt. The last chunk is sent after the
+        others were accepted, with the caller's wait flag; Qdrant applies
+        updates in the order it accepts them, so waiting for it waits
+        for the whole batch.
+        """
+        chunks = self._chunks(len(ids), batch_size)
+        if not chunks:
+            return
+
+        def send(bounds: Tuple[int, int], wait_for: bool) -> None:
+            self.client.upsert(
+                collection_name=self.collection_name,
+                points=self._batch(ids, matrix, payloads, bounds),
+                wait=wait_for
+            )
+
+        head, last = chunks[:-1], chunks[-1]
+        if self.location is not None or self.parallel <= 1:
+            for bounds in head:
+                send(bounds, False)
+        elif head:
+            with ThreadPoolExecutor(max_workers=self.parallel) as pool:
+                list(pool.map(lambda bounds: send(bounds, False), head))
+        send(last, wait)
+
+    async def _upsert_chunks_async(
+        self,
+        ids: List[str],
+        matrix: np.ndarray,
+        payloads: List[Dict[str, Any]],
+        batch_size: Optional[int],
+        wait: bool
+    ) -> None:
+        """Async version of _upsert_chunks using AsyncQdrantClient."""
+        if self.location is not None:
+            await asyncio.to_thread(self._upsert_chunks, ids, matrix, payloads, batch_size, wait)
+            return
+
+        chunks = self._chunks(len(ids), batch_size)
+        if not chunks:
+            return
+
+        semaphore = asyncio.Semaphore(max(self.parallel, 1))
+
+        async def send(bounds: Tuple[int, int], wait_for: bool) -> None:
+            async with semaphore:
+                await self.async_client.upsert(
+                    collection_name=self.collection_name,
+                    points=self._batch(ids, matrix, payloads, bounds),
+                    wait=wait_for
+                )
+
+        await asyncio.gather(*(send(bounds, False) for bounds in chunks[:-1]))
+        await send(chunks[-1], wait)
+
     def _create_collection_if_needed(self, vector_size: int) -> None:
         """Create collection with the given vector size if it doesn't exist."""
         if self.dimension is None:
@@ -254,17 +407,41 @@ class QdrantProvider:
         except Exception as e:
             raise VectorDBOperationError(f"Failed to add vector: {e}")
 
+    def _split_batch(
+        self,
+        vectors_with_meta: List[Tuple]
+    ) -> Tuple[List[Any], List[Any], List[str]]:
+        """Split (vector, metadata[, id]) tuples into vectors, metadata and IDs."""
+        vectors, metadatas, ids = [], [], []
+        for item in vectors_with_meta:
+            if len(item) == 2:
+                vector, meta = item
+                vector_id = None
+            else:
+                vector, meta, vector_id = item
+            vectors.append(vector)
+            metadatas.append(meta)
+            ids.append(vector_id if vector_id is not None else str(uuid.uuid4()))
+        return vectors, metadatas, ids
+
     def add_vectors_batch(
         self,
         vectors_with_meta: List[Tuple],
-        normalize: bool = False
+        normalize: bool = False,
+        batch_size: Optional[int] = None,
+        wait: bool = True
     ) -> List[str]:
         """
         Add multiple vectors with metadata in batch.
 
+        Points are sent in chunks of batch_size, up to `parallel` chunks
+        at a time.
+
         Args:
             vectors_with_meta: List of tuples: (vector, metadata) or (vector, metadata, id)
             normalize: Whether to normalize the vectors
+            batch_size: Points per upsert request (default: self.batch_size)
+            wait: Wait until Qdrant has applied the batch before returning
 
         Returns:
             List of IDs for the added vectors
@@ -276,47 +453,115 @@ class QdrantProvider:
             ... ]
             >>> ids = db.add_vectors_batch(batch, normalize=True)
         """
-        points = []
-        added_ids = []
+        if not vectors_with_meta:
+            return []
+        vectors, metadatas, ids = self._split_batch(vectors_with_meta)
+        return self.add_vectors_array(vectors, metadatas, ids, normalize, batch_size, wait)
 
-        for item in vectors_with_meta:
-            if len(item) == 2:
-                vector, meta = item
-                vector_id = None
-            else:
-                vector, meta, vector_id = item
+    def add_vectors_array(
+        self,
+        vectors: Union[np.ndarray, List[List[float]]],
+        metadatas: List[Any],
+        ids: Optional[List[str]] = None,
+        normalize: bool = True,
+        batch_size: Optional[int] = None,
+        wait: bool = True
+    ) -> List[str]:
+        """
+        Add a 2-D array of vectors, uploading in concurrent chunks.
 
-            vector = np.array(vector, dtype=np.float32)
+        Args:
+            vectors: Array of shape (n, dimension), e.g. from embed_many()
+            metadatas: List of n metadata objects
+            ids: Optional list of n custom IDs
+            normalize: Whether to normalize the vectors
+            batch_size: Points per upsert request (default: self.batch_size)
+            wait: Wait until Qdrant has applied the batch before returning
 
-            if not points:
-                self._create_collection_if_needed(len(vector))
+        Returns:
+            List of IDs for the added vectors
 
-            if normalize:
-                norm = np.linalg.norm(vector)
-                if norm > 0:
-                    vector = vector / norm
+        Raises:
+            DimensionMismatchError: If the vector dimension doesn't match
+            VectorDBOperationError: If the operation fails
 
-            if vector_id is None:
-                vector_id = str(uuid.uuid4())
+        Example:
+            >>> vectors = embeddings.embed_many(texts)
+            >>> ids = db.add_vectors_array(vectors, [{"text": t} for t in texts])
+        """
+        try:
+            matrix, ids, payloads = self._prepare_array(vectors, metadatas, ids, normalize)
+            self._upsert_chunks(ids, matrix, payloads, batch_size, wait)
+            return ids
+        except (DimensionMismatchError, VectorDBOperationError):
+            raise
+        except Exception as e:
+            raise VectorDBOperationError(f"Failed to add vectors: {e}")
 
-            payload = meta.copy() if isinstance(meta, dict) else {"metadata": meta}
+    async def add_vectors_array_async(
+        self,
+        vectors: Union[np.ndarray, List[List[float]]],
+        metadatas: List[Any],
+        ids: Optional[List[str]] = None,
+        normalize: bool = True,
+        batch_size: Optional[int] = None,
+        wait: bool = True
+    ) -> List[str]:
+        """
+        Async version of add_vectors_array().
 
-            point = PointStruct(
-                id=vector_id,
-                vector=vector.tolist(),
-                payload=payload
-            )
+        Example:
+            >>> ids = await db.add_vectors_array_async(vectors, metadatas)
+        """
+        try:
+            matrix, ids, payloads = self._prepare_array(vectors, metadatas, ids, normalize)
+            await self._upsert_chunks_async(ids, matrix, payloads, batch_size, wait)
+            return ids
+        except (DimensionMismatchError, VectorDBOperationError):
+            raise
+        except Exception as e:
+            raise VectorDBOperationError(f"Failed to add vectors: {e}")
 
-            points.append(point)
-            added_ids.append(vector_id)
+    async def add_vectors_batch_async(
+        self,
+        vectors_with_meta: List[Tuple],
+        normalize: bool = False,
+        batch_size: Optional[int] = None,
+        wait: bool = True
+    ) -> List[str]:
+        """
+        Async version of add_vectors_batch().
 
-        if points:
-            self.client.upsert(
-                collection_name=self.collection_name,
-                points=points
-            )
+        Example:
+            >>> ids = await db.add_vectors_batch_async(batch)
+        """
+        if not vectors_with_meta:
+            return []
+        vectors, metadatas, ids = self._split_batch(vectors_with_meta)
+        return await self.add_vectors_array_async(
+            vectors, metadatas, ids, normalize, batch_size, wait
+        )
 
-        return added_ids
+    def _prepare_array(
+        self,
+        vectors: Union[np.ndarray, List[List[float]]],
+        metadatas: List[Any],
+        ids: Optional[List[str]],
+        normalize: bool
+    ) -> Tuple[np.ndarray, List[str], List[Dict[str, Any]]]:
+        """Validate a batch and build its matrix, IDs and payloads."""
+        matrix = self._prepare_matrix(vectors, normalize)
+        if len(metadatas) != len(matrix):
+            raise VectorDBOperationError(
+                f"Got {len(matrix)} vectors but {len(metadatas)} metadata entries"
+            )
+        if ids is None:
+            ids = [str(uuid.uuid4()) for _ in range(len(matrix))]
+        elif len(ids) != len(matrix):
+            raise VectorDBOperationError(f"Got {len(matrix)} vectors but {len(ids)} IDs")
+        if len(matrix):
+            self._create_collection_if_needed(matrix.shape[1])
+        return matrix, list(ids), [self._to_payload(meta) for meta in metadatas]
 
     def add_text_with_embedding(
         self,
@@ -461,7 +706,8 @@ class QdrantProvider:
         self,
         target_vector: Union[np.ndarray, List[float]],
         top_n: int = 3,
-        filter_func: Optional[Callable[[str, Any], bool]] = None
+        filter_func: Optional[Callable[[str, Any], bool]] = None,
+        metadata_filter: Optional[Dict[str, Any]] = None
     ) -> List[Tuple[str, Any, float]]:
         """
         Find vectors with highest cosine similarity to the target.
@@ -470,6 +716,9 @@ class QdrantProvider:
             target_vector: The vector to compare against
             top_n: Number of top results to return
             filter_func: Optional function (id, metadata) -> bool to filter results
+                (applied client-side)
+            metadata_filter: Optional declarative filter, translated to a
+                Qdrant Filter and evaluated server-side
 
         Returns:
             List of (id, metadata, similarity_score) tuples, sorted by similarity
@@ -485,49 +734,222 @@ class QdrantProvider:
             ... )
             >>> for vid, meta, score in results:
             ...     print(f"Score: {score:.3f}, Text: {meta.get('text')}")
+            >>>
+            >>> # Filtered on the server
+            >>> results = db.top_cosine_similarity(
+            ...     target_vector=[0.1, 0.2, 0.3],
+            ...     top_n=5,
+            ...     metadata_filter={"lang": "en", "year": {"$gte": 2020}}
+            ... )
         """
         try:
-            target_vector = np.array(target_vector, dtype=np.float32)
+            target_vector, query_filter = self._prepare_query(target_vector, metadata_filter)
+            if filter_func is None:
+                hits = self.client.search(
+                    collection_name=self.collection_name,
+                    query_vector=target_vector,
+                    query_filter=query_filter,
+                    limit=top_n,
+                    with_payload=True
+                )
+                return self._to_results(hits)
 
-            if self.dimension is not None and len(target_vector) != self.dimension:
-                raise DimensionMismatchError(
-                    f"Query vector dimension mismatch. Expected {self.dimension}, got {len(target_vector)}"
+            # filter_func runs client-side: page through hits until enough pass
+            results = []
+            page_size = max(top_n * 4, 32)
+            offset = 0
+            while len(results) < top_n:
+                hits = self.client.search(
+                    collection_name=self.collection_name,
+                    query_vector=target_vector,
+                    query_filter=query_filter,
+                    limit=page_size,
+                    offset=offset,
+                    with_payload=True
+                )
+                if self._collect(hits, filter_func, results, top_n, page_size):
+                    break
+                offset += page_size
+            return results
+        except (DimensionMismatchError, VectorDBOperationError):
+            raise
+        except Exception as e:
+            raise VectorDBOperationError(f"Failed to search vectors: {e}")
+
+    async def top_cosine_similarity_async(
+        self,
+        target_vector: Union[np.ndarray, List[float]],
+        top_n: int = 3,
+        filter_func: Optional[Callable[[str, Any], bool]] = None,
+        metadata_filter: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[str, Any, float]]:
+        """
+        Async version of top_cosine_similarity().
+
+        Example:
+            >>> results = await db.top_cosine_similarity_async(query_vector, top_n=5)
+        """
+        try:
+            target_vector, query_filter = self._prepare_query(target_vector, metadata_filter)
+            results = []
+            page_size = top_n if filter_func is None else max(top_n * 4, 32)
+            offset = 0
+            while True:
+                hits = await self._run_async(
+                    "search",
+                    collection_name=self.collection_name,
+                    query_vector=target_vector,
+                    query_filter=query_filter,
+                    limit=page_size,
+                    offset=offset,
+                    with_payload=True
                 )
+                if filter_func is None:
+                    return self._to_results(hits)
+                if self._collect(hits, filter_func, results, top_n, page_size):
+                    return results
+                offset += page_size
+        except (DimensionMismatchError, VectorDBOperationError):
+            raise
+        except Exception as e:
+            raise VectorDBOperationError(f"Failed to search vectors: {e}")
 
-            norm = np.linalg.norm(target_vector)
-            if norm > 0:
-                target_vector = target_vector / norm
+    def search_batch(
+        self,
+        target_vectors: Union[np.ndarray, List[List[float]]],
+        top_n: int = 3,
+        metadata_filter: Optional[Dict[str, Any]] = None
+    ) -> List[List[Tuple[str, Any, float]]]:
+        """
+        Run many similarity searches in a single request.
+
+        Args:
+            target_vectors: Array of shape (q, dimension) or list of query vectors
+            top_n: Number of top results per query
+            metadata_filter: Optional declarative filter applied to every query
 
-            search_result = self.client.search(
+        Returns:
+            One list of (id, metadata, similarity_score) tuples per query
+
+        Raises:
+            DimensionMismatchError: If a query vector dimension doesn't match
+            VectorDBOperationError: If the operation fails
+
+        Example:
+            >>> queries = embeddings.embed_many(["first question", "second question"])
+            >>> for results in db.search_batch(queries, top_n=5):
+            ...     print([vid for vid, meta, score in results])
+        """
+        try:
+            requests = self._search_requests(target_vectors, top_n, metadata_filter)
+            if not requests:
+                return []
+            responses = self.client.search_batch(
                 collection_name=self.collection_name,
-                query_vector=target_vector.tolist(),
-                limit=top_n * 2 if filter_func else top_n,
-                with_payload=True
+                requests=requests
             )
+            return [self._to_results(hits) for hits in responses]
+        except (DimensionMismatchError, VectorDBOperationError):
+            raise
+        except Exception as e:
+            raise VectorDBOperationError(f"Failed to run batch search: {e}")
 
-            results = []
-            for point in search_result:
-                point_id = str(point.id)
-                metadata = point.payload
-                similarity = point.score
-
-                if filter_func is None or filter_func(point_id, metadata):
-                    results.append((point_id, metadata, similarity))
-                    if len(results) >= top_n:
-                        break
+    async def search_batch_async(
+        self,
+        target_vectors: Union[np.ndarray, List[List[float]]],
+        top_n: int = 3,
+        metadata_filter: Optional[Dict[str, Any]] = None
+    ) -> List[List[Tuple[str, Any, float]]]:
+        """
+        Async version of search_batch().
 
-            return results
-        except DimensionMismatchError:
+        Example:
+            >>> all_results = await db.search_batch_async(queries, top_n=5)
+        """
+        try:
+            requests = self._search_requests(target_vectors, top_n, metadata_filter)
+            if not requests:
+                return []
+            responses = await self._run_async(
+                "search_batch",
+                collection_name=self.collection_name,
+                requests=requests
+            )
+            return [self._to_results(hits) for hits in responses]
+        except (DimensionMismatchError, VectorDBOperationError):
             raise
         except Exception as e:
-            raise VectorDBOperationError(f"Failed to search vectors: {e}")
+            raise VectorDBOperationError(f"Failed to run batch search: {e}")
+
+    def _prepare_query(
+        self,
+        target_vector: Union[np.ndarray, List[float]],
+        metadata_filter: Optional[Dict[str, Any]]
+    ) -> Tuple[List[float], Optional["Filter"]]:
+        """Validate and normalize a query vector and translate its filter."""
+        target_vector = np.array(target_vector, dtype=np.float32)
+
+        if self.dimension is not None and len(target_vector) != self.dimension:
+            raise DimensionMismatchError(
+                f"Query vector dimension mismatch. Expected {self.dimension}, got {len(target_vector)}"
+            )
+
+        norm = np.linalg.norm(target_vector)
+        if norm > 0:
+            target_vector = target_vector / norm
+
+        query_filter = to_qdrant_filter(metadata_filter) if metadata_filter else None
+        return target_vector.tolist(), query_filter
+
+    def _search_requests(
+        self,
+        target_vectors: Union[np.ndarray, List[List[float]]],
+        top_n: int,
+        metadata_filter: Optional[Dict[str, Any]]
+    ) -> List["SearchRequest"]:
+        """Build one SearchRequest per query vector."""
+        if len(target_vectors) == 0:
+            return []
+        matrix = self._prepare_matrix(target_vectors, normalize=True)
+        query_filter = to_qdrant_filter(metadata_filter) if metadata_filter else None
+        return [
+            SearchRequest(vector=vector, filter=query_filter, limit=top_n, with_payload=True)
+            for vector in matrix.tolist()
+        ]
+
+    @staticmethod
+    def _to_results(hits: List[Any]) -> List[Tuple[str, Any, float]]:
+        """Convert scored points to (id, metadata, similarity) tuples."""
+        return [(str(point.id), point.payload, point.score) for point in hits]
+
+    @staticmethod
+    def _collect(
+        hits: List[Any],
+        filter_func: Callable[[str, Any], bool],
+        results: List[Tuple[str, Any, float]],
+        top_n: int,
+        page_size: int
+    ) -> bool:
+        """
+        Append hits that pass filter_func to results.
+
+        Returns:
+            True when no more pages are needed
+        """
+        for point_id, metadata, similarity in QdrantProvider._to_results(hits):
+            if filter_func(point_id, metadata):
+                results.append((point_id, metadata, similarity))
+                if len(results) >= top_n:
+                    return True
+        return len(hits) < page_size
 
     def search_by_text(
         self,
         query_text: str,
         embeddings_llm_instance: Any,
         top_n: int = 3,
-        filter_func: Optional[Callable[[str, Any], bool]] = None
+        filter_func: Optional[Callable[[str, Any], bool]] = None,
+        metadata_filter: Optional[Dict[str, Any]] = None
     ) -> List[Tuple[str, Any, float]]:
         """
         Search using text query - converts to embedding internally.
@@ -537,6 +959,7 @@ class QdrantProvider:
             embeddings_llm_instance: EmbeddingsLLM instance to generate embeddings
             top_n: Number of top results to return
             filter_func: Optional filter function
+            metadata_filter: Optional declarative metadata filter
 
         Returns:
             List of (id, metadata, similarity_score) tuples
@@ -552,13 +975,17 @@ class QdrantProvider:
             if not query_text or not query_text.strip():
                 raise VectorDBOperationError("Query text cannot be empty")
 
-            query_embedding = embeddings_llm_instance.generate_embeddings(query_text)
-            query_embedding = np.array(query_embedding, dtype=np.float32)
+            query_embedding = embeddings_llm_instance.generate_embeddings(
+                query_text, as_numpy=True
+            )
+            query_embedding = np.asarray(query_embedding, dtype=np.float32)
 
             if query_embedding.size == 0:
                 raise VectorDBOperationError("Empty embedding returned")
 
-            return self.top_cosine_similarity(query_embedding, top_n, filter_func)
+            return self.top_cosine_similarity(
+                query_embedding, top_n, filter_func, metadata_filter
+            )
         except (DimensionMismatchError, VectorDBOperationError):
             raise
         except Exception as e:
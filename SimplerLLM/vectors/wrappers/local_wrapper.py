@@ -7,6 +7,9 @@ database with verbose logging support and comprehensive documentation.
 Features:
     - In-memory storage with fast NumPy operations
     - Pickle-based file persistence (.svdb format)
+    - Memory-mapped columnar persistence (.svdc format) for fast loading
+    - Optional write-ahead log with background checkpointing
+    - Read-only shared snapshots served to many worker processes
     - Automatic dimension validation
     - Metadata indexing for fast lookups
     - Vector normalization for cosine similarity
@@ -45,6 +48,8 @@ from typing import List, Tuple, Dict, Any, Optional, Callable, Union
 import numpy as np
 
 from ..providers.local_provider import SimplerVectors, SerializationFormat
+from ..providers.local_wal import WALSyncPolicy
+from ..providers.local_quantization import QuantizationMethod
 from ..exceptions import (
     VectorDBError,
     VectorNotFoundError,
@@ -52,6 +57,7 @@ from ..exceptions import (
     VectorDBOperationError,
 )
 from ..models import VectorSearchResult, VectorStats, VectorOperationResult
+from SimplerLLM.instrumentation.core import instrumented
 
 try:
     from SimplerLLM.utils.custom_verbose import verbose_print
@@ -60,6 +66,23 @@ except ImportError:
         print(f"[{level.upper()}] {message}")
 
 
+@instrumented("vectors", {
+    "add_vector": "add",
+    "add_vectors_batch": "add",
+    "add_vectors_array": "add",
+    "add_text_with_embedding": "add",
+    "delete_vector": "delete",
+    "update_vector": "update",
+    "top_cosine_similarity": "search",
+    "search_by_text": "search",
+    "search_batch": "search",
+    "search_many": "search",
+    "keyword_search": "search",
+    "hybrid_search": "search",
+    "query_by_metadata": "query",
+    "save_to_disk": "save",
+    "load_from_disk": "load",
+})
 class LocalVectorDB:
     """
     Local vector database wrapper with in-memory storage.
@@ -253,6 +276,57 @@ class LocalVectorDB:
                 )
             raise
 
+    def add_vectors_array(
+        self,
+        vectors: np.ndarray,
+        metadatas: List[Any],
+        ids: Optional[List[str]] = None,
+        normalize: bool = True,
+        full_response: bool = False
+    ) -> Union[List[str], VectorOperationResult]:
+        """
+        Add a 2-D array of vectors in one vectorized operation.
+
+        Args:
+            vectors: Array of shape (n, dimension), e.g. from embed_many()
+            metadatas: List of n metadata objects
+            ids: Optional list of n custom IDs
+            normalize: Whether to normalize the vectors
+            full_response: Return VectorOperationResult instead of just IDs
+
+        Returns:
+            List of vector IDs or VectorOperationResult if full_response=True
+
+        Example:
+            >>> vectors = embeddings.embed_many(texts)
+            >>> ids = db.add_vectors_array(vectors, [{"text": t} for t in texts])
+        """
+        if self.verbose:
+            verbose_print(f"Adding array of {len(vectors)} vectors", "info")
+
+        try:
+            ids = self._provider.add_vectors_array(vectors, metadatas, ids, normalize)
+
+            if self.verbose:
+                verbose_print(f"Added {len(ids)} vectors from array", "info")
+
+            if full_response:
+                return VectorOperationResult(
+                    success=True,
+                    operation="batch_add",
+                    message=f"Added {len(ids)} vectors",
+                    count=len(ids)
+                )
+            return ids
+        except Exception as e:
+            if full_response:
+                return VectorOperationResult(
+                    success=False,
+                    operation="batch_add",
+                    message=str(e)
+                )
+            raise
+
     def add_text_with_embedding(
         self,
         text: str,
@@ -365,7 +439,8 @@ class LocalVectorDB:
         target_vector: Union[np.ndarray, List[float]],
         top_n: int = 3,
         filter_func: Optional[Callable[[str, Any], bool]] = None,
-        full_response: bool = False
+        full_response: bool = False,
+        metadata_filter: Optional[Dict[str, Any]] = None
     ) -> Union[List[Tuple[str, Any, float]], List[VectorSearchResult]]:
         """
         Find vectors with highest cosine similarity to the target.
@@ -375,6 +450,8 @@ class LocalVectorDB:
             top_n: Number of top results to return
             filter_func: Optional function (id, metadata) -> bool to filter results
             full_response: Return VectorSearchResult objects instead of tuples
+            metadata_filter: Optional declarative filter, e.g.
+                {"lang": "en", "year": {"$gte": 2020}}
 
         Returns:
             List of (id, metadata, similarity) tuples or VectorSearchResult objects
@@ -399,6 +476,13 @@ class LocalVectorDB:
             ...     filter_func=lambda id, meta: meta.get('source') == 'wikipedia'
             ... )
             >>>
+            >>> # With a declarative metadata filter (vectorized, much faster)
+            >>> results = db.top_cosine_similarity(
+            ...     target_vector=query_vec,
+            ...     top_n=5,
+            ...     metadata_filter={"source": "wikipedia", "year": {"$gte": 2020}}
+            ... )
+            >>>
             >>> # With full response
             >>> results = db.top_cosine_similarity(
             ...     target_vector=query_vec,
@@ -411,7 +495,9 @@ class LocalVectorDB:
         if self.verbose:
             verbose_print(f"Searching for top {top_n} similar vectors", "debug")
 
-        results = self._provider.top_cosine_similarity(target_vector, top_n, filter_func)
+        results = self._provider.top_cosine_similarity(
+            target_vector, top_n, filter_func, metadata_filter
+        )
 
         if self.verbose:
             verbose_print(f"Found {len(results)} matching vectors", "info")
@@ -433,7 +519,8 @@ class LocalVectorDB:
         embeddings_llm_instance: Any,
         top_n: int = 3,
         filter_func: Optional[Callable[[str, Any], bool]] = None,
-        full_response: bool = False
+        full_response: bool = False,
+        metadata_filter: Optional[Dict[str, Any]] = None
     ) -> Union[List[Tuple[str, Any, float]], List[VectorSearchResult]]:
         """
         Search using text query - converts to embedding internally.
@@ -444,6 +531,7 @@ class LocalVectorDB:
             top_n: Number of top results to return
             filter_func: Optional filter function
             full_response: Return VectorSearchResult objects instead of tuples
+            metadata_filter: Optional declarative metadata filter
 
         Returns:
             List of (id, metadata, similarity) tuples or VectorSearchResult objects
@@ -463,7 +551,9 @@ class LocalVectorDB:
         if self.verbose:
             verbose_print(f"Searching by text: {query_text[:50]}...", "debug")
 
-        results = self._provider.search_by_text(query_text, embeddings_llm_instance, top_n, filter_func)
+        results = self._provider.search_by_text(
+            query_text, embeddings_llm_instance, top_n, filter_func, metadata_filter
+        )
 
         if self.verbose:
             verbose_print(f"Found {len(results)} matching vectors", "info")
@@ -479,6 +569,201 @@ class LocalVectorDB:
             ]
         return results
 
+    def search_batch(
+        self,
+        target_vectors: Union[np.ndarray, List[List[float]]],
+        top_n: int = 3,
+        filter_func: Optional[Callable[[str, Any], bool]] = None,
+        metadata_filter: Optional[Dict[str, Any]] = None,
+        full_response: bool = False
+    ) -> Union[List[List[Tuple[str, Any, float]]], List[List[VectorSearchResult]]]:
+        """
+        Run many similarity searches with one matrix multiply.
+
+        Args:
+            target_vectors: Array of shape (q, dimension) or list of query vectors
+            top_n: Number of top results per query
+            filter_func: Optional function (id, metadata) -> bool
+            metadata_filter: Optional declarative metadata filter
+            full_response: Return VectorSearchResult objects instead of tuples
+
+        Returns:
+            One result list per query
+
+        Example:
+            >>> queries = embeddings.embed_many(["first question", "second question"])
+            >>> for results in db.search_batch(queries, top_n=5):
+            ...     print([vid for vid, meta, score in results])
+        """
+        if self.verbose:
+            verbose_print(f"Running batch search for {len(target_vectors)} queries", "debug")
+
+        batches = self._provider.search_batch(target_vectors, top_n, filter_func, metadata_filter)
+
+        if full_response:
+            return [self._to_search_results(results) for results in batches]
+        return batches
+
+    def search_many(
+        self,
+        queries: List[str],
+        embeddings_llm_instance: Any,
+        top_n: int = 3,
+        filter_func: Optional[Callable[[str, Any], bool]] = None,
+        metadata_filter: Optional[Dict[str, Any]] = None,
+        keyword_weight: float = 0.0,
+        full_response: bool = False
+    ) -> Union[List[List[Tuple[str, Any, float]]], List[List[VectorSearchResult]]]:
+        """
+        Search many text queries with one embedding call and one matrix multiply.
+
+        Args:
+            queries: Text queries
+            embeddings_llm_instance: EmbeddingsLLM instance to generate embeddings
+            top_n: Number of top results per query
+            filter_func: Optional function (id, metadata) -> bool
+            metadata_filter: Optional declarative metadata filter
+            keyword_weight: When above 0, fuse each result list with BM25
+                keyword results, as in hybrid_search
+            full_response: Return VectorSearchResult objects instead of tuples
+
+        Returns:
+            One result list per query
+
+        Example:
+            >>> all_results = db.search_many(
+            ...     ["What is RAG?", "How do embeddings work?"],
+            ...     embeddings_llm_instance=embeddings,
+            ...     top_n=5
+            ... )
+        """
+        if self.verbose:
+            verbose_print(f"Searching {len(queries)} text queries", "debug")
+
+        batches = self._provider.search_many(
+            queries, embeddings_llm_instance, top_n, filter_func, metadata_filter,
+            keyword_weight
+        )
+
+        if self.verbose:
+            verbose_print(f"Found results for {len(batches)} queries", "info")
+
+        if full_response:
+            return [self._to_search_results(results) for results in batches]
+        return batches
+
+    def keyword_search(
+        self,
+        query_text: str,
+        top_n: int = 3,
+        filter_func: Optional[Callable[[str, Any], bool]] = None,
+        metadata_filter: Optional[Dict[str, Any]] = None,
+        full_response: bool = False
+    ) -> Union[List[Tuple[str, Any, float]], List[VectorSearchResult]]:
+        """
+        Rank stored texts by BM25 keyword relevance.
+
+        Searches the "text" metadata written by add_text_with_embedding.
+        Scores are BM25 scores, not cosine similarities.
+
+        Args:
+            query_text: Keywords to search for
+            top_n: Number of top results to return
+            filter_func: Optional function (id, metadata) -> bool
+            metadata_filter: Optional declarative metadata filter
+            full_response: Return VectorSearchResult objects instead of tuples
+
+        Returns:
+            List of (id, metadata, score) tuples or VectorSearchResult objects
+
+        Example:
+            >>> results = db.keyword_search("error code E1234", top_n=5)
+        """
+        if self.verbose:
+            verbose_print(f"Keyword search: {query_text[:50]}...", "debug")
+
+        results = self._provider.keyword_search(query_text, top_n, filter_func, metadata_filter)
+
+        if self.verbose:
+            verbose_print(f"Found {len(results)} matching vectors", "info")
+
+        if full_response:
+            return self._to_search_results(results)
+        return results
+
+    def hybrid_search(
+        self,
+        query_text: str,
+        embeddings_llm_instance: Any = None,
+        top_n: int = 3,
+        vector_weight: float = 1.0,
+        keyword_weight: float = 1.0,
+        rrf_k: int = 60,
+        filter_func: Optional[Callable[[str, Any], bool]] = None,
+        metadata_filter: Optional[Dict[str, Any]] = None,
+        target_vector: Optional[Union[np.ndarray, List[float]]] = None,
+        full_response: bool = False
+    ) -> Union[List[Tuple[str, Any, float]], List[VectorSearchResult]]:
+        """
+        Combine vector similarity and BM25 keyword ranking.
+
+        The two rankings are merged with reciprocal rank fusion: each result
+        scores sum(weight / (rrf_k + rank)).
+
+        Args:
+            query_text: The text query
+            embeddings_llm_instance: EmbeddingsLLM instance to embed the query
+                (not needed when target_vector is given)
+            top_n: Number of top results to return
+            vector_weight: Weight of the vector ranking
+            keyword_weight: Weight of the keyword ranking
+            rrf_k: Rank smoothing constant (default: 60)
+            filter_func: Optional function (id, metadata) -> bool
+            metadata_filter: Optional declarative metadata filter
+            target_vector: Precomputed query embedding
+            full_response: Return VectorSearchResult objects instead of tuples
+
+        Returns:
+            List of (id, metadata, fused_score) tuples or VectorSearchResult objects
+
+        Example:
+            >>> results = db.hybrid_search(
+            ...     "reset password for SSO accounts",
+            ...     embeddings_llm_instance=embeddings,
+            ...     top_n=5,
+            ...     keyword_weight=0.5
+            ... )
+        """
+        if self.verbose:
+            verbose_print(f"Hybrid search: {query_text[:50]}...", "debug")
+
+        results = self._provider.hybrid_search(
+            query_text,
+            embeddings_llm_instance,
+            top_n,
+            vector_weight=vector_weight,
+            keyword_weight=keyword_weight,
+            rrf_k=rrf_k,
+            filter_func=filter_func,
+            metadata_filter=metadata_filter,
+            target_vector=target_vector
+        )
+
+        if self.verbose:
+            verbose_print(f"Found {len(results)} matching vectors", "info")
+
+        if full_response:
+            return self._to_search_results(results)
+        return results
+
+    @staticmethod
+    def _to_search_results(results: List[Tuple[str, Any, float]]) -> List[VectorSearchResult]:
+        """Convert result tuples to VectorSearchResult objects."""
+        return [
+            VectorSearchResult(vector_id=vid, metadata=meta, similarity=score)
+            for vid, meta, score in results
+        ]
+
     def query_by_metadata(self, **kwargs) -> List[Tuple[str, np.ndarray, Any]]:
         """
         Query vectors by metadata fields (AND logic).
@@ -608,10 +893,12 @@ class LocalVectorDB:
         Compress vectors to lower precision to save memory.
 
         Args:
-            bits: Target bit precision (16 or 32)
+            bits: Target bit precision: 16 (float16), 8 (int8 quantization,
+                with the full-precision vectors moved to a memory-mapped
+                file; see SimplerVectors.compress_vectors) or 32
 
         Returns:
-            Compression ratio achieved
+            Ratio of memory held before and after compressing
 
         Example:
             >>> original_stats = db.get_stats()
@@ -628,6 +915,55 @@ class LocalVectorDB:
 
         return ratio
 
+    def quantize(
+        self,
+        method: QuantizationMethod = QuantizationMethod.INT8,
+        subspaces: Optional[int] = None,
+        rerank_factor: Optional[int] = None,
+        training_size: int = 65536,
+        measure_recall: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Build compact codes for the stored vectors and search over them.
+
+        Searches scan the codes, then re-score the best candidates with the
+        full-precision vectors.
+
+        Args:
+            method: QuantizationMethod.INT8 (4x smaller), PRODUCT (1 byte per
+                subspace) or NONE to turn quantization off
+            subspaces: Subspaces for PRODUCT (default: dimension // 8)
+            rerank_factor: Candidates re-ranked per result (default: 4 for
+                INT8, 16 for PRODUCT); 0 disables re-ranking
+            training_size: Vectors sampled to calibrate the quantizer
+            measure_recall: Estimate recall@10 on a sample of the collection
+
+        Returns:
+            Quantization statistics: method, bytes_per_vector, codes_size_mb,
+            full_precision_size_mb, compression_ratio, rerank_factor,
+            recall_at_10, recall_at_10_reranked
+
+        Example:
+            >>> from SimplerLLM.vectors import QuantizationMethod
+            >>> stats = db.quantize(QuantizationMethod.PRODUCT, subspaces=192)
+            >>> print(f"{stats['compression_ratio']:.0f}x smaller")
+        """
+        if self.verbose:
+            verbose_print(f"Quantizing vectors ({QuantizationMethod(method).value})", "info")
+
+        stats = self._provider.quantize(
+            method, subspaces, rerank_factor, training_size, measure_recall
+        )
+
+        if self.verbose and stats:
+            recall = stats.get("recall_at_10_reranked")
+            verbose_print(
+                f"Quantized: {stats['compression_ratio']:.1f}x smaller"
+                + (f", recall@10 {recall:.3f}" if recall is not None else ""),
+                "info"
+            )
+        return stats
+
     def save_to_disk(
         self,
         collection_name: str,
@@ -677,3 +1013,160 @@ class LocalVectorDB:
         if self.verbose:
             count = self._provider.get_vector_count()
             verbose_print(f"Loaded {count} vectors from {collection_name}", "info")
+
+    def enable_wal(
+        self,
+        collection_name: str,
+        serialization_format: SerializationFormat = SerializationFormat.BINARY,
+        sync_policy: WALSyncPolicy = WALSyncPolicy.ALWAYS,
+        sync_interval: float = 1.0,
+        checkpoint_interval: Optional[float] = None,
+        checkpoint_max_bytes: Optional[int] = None
+    ) -> None:
+        """
+        Log every write to an append-only write-ahead log.
+
+        Writes are appended to small log files instead of rewriting the
+        whole collection, and load_from_disk() replays them after a crash.
+        Call load_from_disk() before enabling.
+
+        Args:
+            collection_name: Collection the log belongs to
+            serialization_format: Format used when checkpointing
+            sync_policy: When log records are fsynced (ALWAYS, INTERVAL or NEVER)
+            sync_interval: Seconds between fsyncs for WALSyncPolicy.INTERVAL
+            checkpoint_interval: If set, checkpoint in the background every
+                this many seconds
+            checkpoint_max_bytes: If set, checkpoint once the log grows past
+                this size
+
+        Example:
+            >>> db.load_from_disk("docs")
+            >>> db.enable_wal("docs", checkpoint_interval=60)
+            >>> db.add_vector([0.1, 0.2, 0.3], {"text": "durable"})
+        """
+        if self.verbose:
+            verbose_print(f"Enabling write-ahead log for {collection_name}", "info")
+
+        self._provider.enable_wal(
+            collection_name,
+            serialization_format=serialization_format,
+            sync_policy=sync_policy,
+            sync_interval=sync_interval,
+            checkpoint_interval=checkpoint_interval,
+            checkpoint_max_bytes=checkpoint_max_bytes,
+        )
+
+    def disable_wal(self, checkpoint: bool = True) -> None:
+        """
+        Stop logging writes and close the write-ahead log.
+
+        Args:
+            checkpoint: If True, fold the log into the collection file first
+
+        Example:
+            >>> db.disable_wal()
+        """
+        if self.verbose:
+            verbose_print("Disabling write-ahead log", "info")
+
+        self._provider.disable_wal(checkpoint=checkpoint)
+
+    def checkpoint(self) -> None:
+        """
+        Fold the write-ahead log into the collection file.
+
+        Raises:
+            VectorDBOperationError: If no write-ahead log is enabled
+
+        Example:
+            >>> db.checkpoint()
+        """
+        if self.verbose:
+            verbose_print("Checkpointing write-ahead log", "info")
+
+        self._provider.checkpoint()
+
+        if self.verbose:
+            verbose_print("Checkpoint complete", "info")
+
+    def publish_shared(self, collection_name: str, keep: int = 2) -> int:
+        """
+        Publish the collection as a read-only snapshot for worker processes.
+
+        Workers attach with LocalVectorDB.attach_shared() and share one
+        memory-mapped copy of the vectors. Publishing again creates a new
+        generation that attached workers pick up automatically.
+
+        Args:
+            collection_name: Name under which to publish
+            keep: Number of most recent generations to keep on disk
+
+        Returns:
+            The published generation number
+
+        Example:
+            >>> db.publish_shared("docs")
+            1
+        """
+        if self.verbose:
+            verbose_print(f"Publishing shared snapshot: {collection_name}", "info")
+
+        generation = self._provider.publish_shared(collection_name, keep=keep)
+
+        if self.verbose:
+            verbose_print(f"Published {collection_name} generation {generation}", "info")
+
+        return generation
+
+    @classmethod
+    def attach_shared(
+        cls,
+        collection_name: str,
+        db_folder: str = "./vectors",
+        refresh_interval: float = 1.0,
+        verbose: bool = False
+    ) -> "LocalVectorDB":
+        """
+        Attach read-only to a snapshot published with publish_shared().
+
+        Searches work as usual; write methods raise VectorDBOperationError.
+        Newly published generations are mapped in automatically, checked at
+        most once per refresh_interval seconds.
+
+        Args:
+            collection_name: Published collection name
+            db_folder: Folder the snapshot was published in
+            refresh_interval: Minimum seconds between generation checks
+            verbose: Enable verbose logging
+
+        Returns:
+            A read-only LocalVectorDB
+
+        Raises:
+            VectorDBOperationError: If nothing has been published yet
+
+        Example:
+            >>> # In each gunicorn worker
+            >>> db = LocalVectorDB.attach_shared("docs", db_folder="./vectors")
+            >>> results = db.top_cosine_similarity(query_vector, top_n=5)
+        """
+        db = cls(db_folder=db_folder, verbose=verbose)
+        db._provider = SimplerVectors.attach_shared(
+            db_folder, collection_name, refresh_interval=refresh_interval
+        )
+        db.dimension = db._provider.dimension
+
+        if verbose:
+            verbose_print(
+                f"Attached to {collection_name} generation {db._provider.generation} "
+                f"({db._provider.get_vector_count()} vectors)",
+                "info"
+            )
+
+        return db
+
+    @property
+    def generation(self) -> Optional[int]:
+        """Shared snapshot generation currently mapped (None if not attached)."""
+        return self._provider.generation
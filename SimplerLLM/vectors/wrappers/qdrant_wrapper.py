@@ -5,11 +5,12 @@ This wrapper provides a unified interface for Qdrant vector database
 with verbose logging support and comprehensive documentation.
 
 Features:
-    - Self-hosted or Qdrant Cloud support
+    - Self-hosted, Qdrant Cloud or local mode (":memory:") support
     - Automatic collection management
     - DOT distance metric (cosine when normalized)
-    - Efficient batch operations
-    - Metadata filtering with Qdrant's native filters
+    - Chunked, concurrent batch upserts
+    - Metadata filters evaluated server-side
+    - Batch search and async methods
     - Verbose logging for debugging
 
 Requirements:
@@ -52,6 +53,7 @@ from ..exceptions import (
     VectorDBConnectionError,
 )
 from ..models import VectorSearchResult, VectorStats, VectorOperationResult
+from SimplerLLM.instrumentation.core import instrumented
 
 try:
     from SimplerLLM.utils.custom_verbose import verbose_print
@@ -60,6 +62,24 @@ except ImportError:
         print(f"[{level.upper()}] {message}")
 
 
+@instrumented("vectors", {
+    "add_vector": "add",
+    "add_vectors_batch": "add",
+    "add_vectors_batch_async": "add",
+    "add_vectors_array": "add",
+    "add_vectors_array_async": "add",
+    "add_text_with_embedding": "add",
+    "delete_vector": "delete",
+    "update_vector": "update",
+    "top_cosine_similarity": "search",
+    "top_cosine_similarity_async": "search",
+    "search_by_text": "search",
+    "search_batch": "search",
+    "search_batch_async": "search",
+    "query_by_metadata": "query",
+    "save_to_disk": "save",
+    "load_from_disk": "load",
+})
 class QdrantVectorDB:
     """
     Qdrant vector database wrapper for self-hosted or cloud deployments.
@@ -103,6 +123,9 @@ class QdrantVectorDB:
         dimension: Optional[int] = None,
         api_key: Optional[str] = None,
         verbose: bool = False,
+        location: Optional[str] = None,
+        batch_size: int = 256,
+        parallel: int = 4,
         **config
     ):
         """
@@ -115,6 +138,10 @@ class QdrantVectorDB:
             dimension: Vector dimension (auto-detected if None)
             api_key: API key for Qdrant Cloud authentication
             verbose: Enable verbose logging (default: False)
+            location: Use qdrant-client local mode instead of a server:
+                ":memory:" or a folder path
+            batch_size: Points per upsert request in batch operations
+            parallel: Concurrent upsert requests in batch operations
             **config: Additional configuration
 
         Raises:
@@ -132,6 +159,9 @@ class QdrantVectorDB:
             ...     collection_name="production",
             ...     verbose=True
             ... )
+            >>>
+            >>> # In-memory, for tests
+            >>> db = QdrantVectorDB(location=":memory:", collection_name="test")
         """
         self.url = url
         self.port = port
@@ -140,15 +170,20 @@ class QdrantVectorDB:
         self.api_key = api_key
         self.verbose = verbose
 
+        self.location = location
+
         if self.verbose:
-            verbose_print(f"Connecting to Qdrant at {url}:{port}", "info")
+            verbose_print(f"Connecting to Qdrant at {location or f'{url}:{port}'}", "info")
 
         self._provider = QdrantProvider(
             url=url,
             port=port,
             collection_name=collection_name,
             dimension=dimension,
-            api_key=api_key
+            api_key=api_key,
+            location=location,
+            batch_size=batch_size,
+            parallel=parallel
         )
 
         if self.verbose:
@@ -224,15 +259,21 @@ class QdrantVectorDB:
         self,
         vectors_with_meta: List[Tuple],
         normalize: bool = False,
-        full_response: bool = False
+        full_response: bool = False,
+        batch_size: Optional[int] = None,
+        wait: bool = True
     ) -> Union[List[str], VectorOperationResult]:
         """
         Add multiple vectors with metadata in batch.
 
+        Points are uploaded in chunks of batch_size, several chunks at a time.
+
         Args:
             vectors_with_meta: List of tuples: (vector, metadata) or (vector, metadata, id)
             normalize: Whether to normalize the vectors
             full_response: Return VectorOperationResult instead of just IDs
+            batch_size: Points per upsert request (default: set at construction)
+            wait: Wait until Qdrant has applied the batch before returning
 
         Returns:
             List of vector IDs or VectorOperationResult if full_response=True
@@ -248,7 +289,9 @@ class QdrantVectorDB:
             verbose_print(f"Adding batch of {len(vectors_with_meta)} vectors", "info")
 
         try:
-            ids = self._provider.add_vectors_batch(vectors_with_meta, normalize)
+            ids = self._provider.add_vectors_batch(
+                vectors_with_meta, normalize, batch_size, wait
+            )
 
             if self.verbose:
                 verbose_print(f"Added {len(ids)} vectors in batch", "info")
@@ -270,6 +313,113 @@ class QdrantVectorDB:
                 )
             raise
 
+    def add_vectors_array(
+        self,
+        vectors: Union[np.ndarray, List[List[float]]],
+        metadatas: List[Any],
+        ids: Optional[List[str]] = None,
+        normalize: bool = True,
+        full_response: bool = False,
+        batch_size: Optional[int] = None,
+        wait: bool = True
+    ) -> Union[List[str], VectorOperationResult]:
+        """
+        Add a 2-D array of vectors, uploading in concurrent chunks.
+
+        Args:
+            vectors: Array of shape (n, dimension), e.g. from embed_many()
+            metadatas: List of n metadata objects
+            ids: Optional list of n custom IDs
+            normalize: Whether to normalize the vectors
+            full_response: Return VectorOperationResult instead of just IDs
+            batch_size: Points per upsert request (default: set at construction)
+            wait: Wait until Qdrant has applied the batch before returning
+
+        Returns:
+            List of vector IDs or VectorOperationResult if full_response=True
+
+        Example:
+            >>> vectors = embeddings.embed_many(texts)
+            >>> ids = db.add_vectors_array(vectors, [{"text": t} for t in texts])
+        """
+        if self.verbose:
+            verbose_print(f"Adding array of {len(vectors)} vectors", "info")
+
+        try:
+            ids = self._provider.add_vectors_array(
+                vectors, metadatas, ids, normalize, batch_size, wait
+            )
+
+            if self.verbose:
+                verbose_print(f"Added {len(ids)} vectors from array", "info")
+
+            if full_response:
+                return VectorOperationResult(
+                    success=True,
+                    operation="batch_add",
+                    message=f"Added {len(ids)} vectors",
+                    count=len(ids)
+                )
+            return ids
+        except Exception as e:
+            if full_response:
+                return VectorOperationResult(
+                    success=False,
+                    operation="batch_add",
+                    message=str(e)
+                )
+            raise
+
+    async def add_vectors_array_async(
+        self,
+        vectors: Union[np.ndarray, List[List[float]]],
+        metadatas: List[Any],
+        ids: Optional[List[str]] = None,
+        normalize: bool = True,
+        batch_size: Optional[int] = None,
+        wait: bool = True
+    ) -> List[str]:
+        """
+        Async version of add_vectors_array().
+
+        Example:
+            >>> ids = await db.add_vectors_array_async(vectors, metadatas)
+        """
+        if self.verbose:
+            verbose_print(f"Adding array of {len(vectors)} vectors (async)", "info")
+
+        ids = await self._provider.add_vectors_array_async(
+            vectors, metadatas, ids, normalize, batch_size, wait
+        )
+
+        if self.verbose:
+            verbose_print(f"Added {len(ids)} vectors from array", "info")
+        return ids
+
+    async def add_vectors_batch_async(
+        self,
+        vectors_with_meta: List[Tuple],
+        normalize: bool = False,
+        batch_size: Optional[int] = None,
+        wait: bool = True
+    ) -> List[str]:
+        """
+        Async version of add_vectors_batch().
+
+        Example:
+            >>> ids = await db.add_vectors_batch_async(batch)
+        """
+        if self.verbose:
+            verbose_print(f"Adding batch of {len(vectors_with_meta)} vectors (async)", "info")
+
+        ids = await self._provider.add_vectors_batch_async(
+            vectors_with_meta, normalize, batch_size, wait
+        )
+
+        if self.verbose:
+            verbose_print(f"Added {len(ids)} vectors in batch", "info")
+        return ids
+
     def add_text_with_embedding(
         self,
         text: str,
@@ -372,7 +522,8 @@ class QdrantVectorDB:
         target_vector: Union[np.ndarray, List[float]],
         top_n: int = 3,
         filter_func: Optional[Callable[[str, Any], bool]] = None,
-        full_response: bool = False
+        full_response: bool = False,
+        metadata_filter: Optional[Dict[str, Any]] = None
     ) -> Union[List[Tuple[str, Any, float]], List[VectorSearchResult]]:
         """
         Find vectors with highest cosine similarity to the target.
@@ -382,6 +533,8 @@ class QdrantVectorDB:
             top_n: Number of top results to return
             filter_func: Optional function (id, metadata) -> bool to filter results
             full_response: Return VectorSearchResult objects instead of tuples
+            metadata_filter: Optional declarative filter, e.g.
+                {"lang": "en", "year": {"$gte": 2020}}
 
         Returns:
             List of (id, metadata, similarity) tuples or VectorSearchResult objects
@@ -401,7 +554,9 @@ class QdrantVectorDB:
         if self.verbose:
             verbose_print(f"Searching for top {top_n} similar vectors", "debug")
 
-        results = self._provider.top_cosine_similarity(target_vector, top_n, filter_func)
+        results = self._provider.top_cosine_similarity(
+            target_vector, top_n, filter_func, metadata_filter
+        )
 
         if self.verbose:
             verbose_print(f"Found {len(results)} matching vectors", "info")
@@ -417,13 +572,105 @@ class QdrantVectorDB:
             ]
         return results
 
+    async def top_cosine_similarity_async(
+        self,
+        target_vector: Union[np.ndarray, List[float]],
+        top_n: int = 3,
+        filter_func: Optional[Callable[[str, Any], bool]] = None,
+        full_response: bool = False,
+        metadata_filter: Optional[Dict[str, Any]] = None
+    ) -> Union[List[Tuple[str, Any, float]], List[VectorSearchResult]]:
+        """
+        Async version of top_cosine_similarity().
+
+        Example:
+            >>> results = await db.top_cosine_similarity_async(query_vec, top_n=5)
+        """
+        if self.verbose:
+            verbose_print(f"Searching for top {top_n} similar vectors (async)", "debug")
+
+        results = await self._provider.top_cosine_similarity_async(
+            target_vector, top_n, filter_func, metadata_filter
+        )
+
+        if self.verbose:
+            verbose_print(f"Found {len(results)} matching vectors", "info")
+
+        if full_response:
+            return self._to_search_results(results)
+        return results
+
+    def search_batch(
+        self,
+        target_vectors: Union[np.ndarray, List[List[float]]],
+        top_n: int = 3,
+        metadata_filter: Optional[Dict[str, Any]] = None,
+        full_response: bool = False
+    ) -> Union[List[List[Tuple[str, Any, float]]], List[List[VectorSearchResult]]]:
+        """
+        Run many similarity searches in a single request.
+
+        Args:
+            target_vectors: Array of shape (q, dimension) or list of query vectors
+            top_n: Number of top results per query
+            metadata_filter: Optional declarative filter applied to every query
+            full_response: Return VectorSearchResult objects instead of tuples
+
+        Returns:
+            One result list per query
+
+        Example:
+            >>> queries = embeddings.embed_many(["first question", "second question"])
+            >>> for results in db.search_batch(queries, top_n=5):
+            ...     print([vid for vid, meta, score in results])
+        """
+        if self.verbose:
+            verbose_print(f"Running batch search for {len(target_vectors)} queries", "debug")
+
+        batches = self._provider.search_batch(target_vectors, top_n, metadata_filter)
+
+        if full_response:
+            return [self._to_search_results(results) for results in batches]
+        return batches
+
+    async def search_batch_async(
+        self,
+        target_vectors: Union[np.ndarray, List[List[float]]],
+        top_n: int = 3,
+        metadata_filter: Optional[Dict[str, Any]] = None,
+        full_response: bool = False
+    ) -> Union[List[List[Tuple[str, Any, float]]], List[List[VectorSearchResult]]]:
+        """
+        Async version of search_batch().
+
+        Example:
+            >>> all_results = await db.search_batch_async(queries, top_n=5)
+        """
+        if self.verbose:
+            verbose_print(f"Running batch search for {len(target_vectors)} queries (async)", "debug")
+
+        batches = await self._provider.search_batch_async(target_vectors, top_n, metadata_filter)
+
+        if full_response:
+            return [self._to_search_results(results) for results in batches]
+        return batches
+
+    @staticmethod
+    def _to_search_results(results: List[Tuple[str, Any, float]]) -> List[VectorSearchResult]:
+        """Convert result tuples to VectorSearchResult objects."""
+        return [
+            VectorSearchResult(vector_id=vid, metadata=meta, similarity=score)
+            for vid, meta, score in results
+        ]
+
     def search_by_text(
         self,
         query_text: str,
         embeddings_llm_instance: Any,
         top_n: int = 3,
         filter_func: Optional[Callable[[str, Any], bool]] = None,
-        full_response: bool = False
+        full_response: bool = False,
+        metadata_filter: Optional[Dict[str, Any]] = None
     ) -> Union[List[Tuple[str, Any, float]], List[VectorSearchResult]]:
         """
         Search using text query - converts to embedding internally.
@@ -434,6 +681,7 @@ class QdrantVectorDB:
             top_n: Number of top results to return
             filter_func: Optional filter function
             full_response: Return VectorSearchResult objects instead of tuples
+            metadata_filter: Optional declarative metadata filter
 
         Returns:
             List of (id, metadata, similarity) tuples or VectorSearchResult objects
@@ -448,7 +696,9 @@ class QdrantVectorDB:
         if self.verbose:
             verbose_print(f"Searching by text: {query_text[:50]}...", "debug")
 
-        results = self._provider.search_by_text(query_text, embeddings_llm_instance, top_n, filter_func)
+        results = self._provider.search_by_text(
+            query_text, embeddings_llm_instance, top_n, filter_func, metadata_filter
+        )
 
         if self.verbose:
             verbose_print(f"Found {len(results)} matching vectors", "info")
@@ -4,63 +4,41 @@ SimplerLLM Voice Module
 Text-to-Speech (TTS) and Speech-to-Text (STT) capabilities.
 """
 
-# TTS exports
-from .tts import (
-    TTS,
-    TTSBase,
-    TTSProvider,
-    TTSResponse,
-    Voice,
-    TTSError,
-    TTSValidationError,
-    TTSProviderError,
-    TTSVoiceNotFoundError,
-    OpenAITTS,
-    OPENAI_VOICES,
-    OPENAI_MODELS,
-    OPENAI_FORMATS,
-    ELEVENLABS_MODELS,
-    ELEVENLABS_FORMATS,
-)
+from SimplerLLM.utils.lazy_imports import lazy_exports
 
-# Optional ElevenLabs TTS
-try:
-    from .tts import ElevenLabsTTS
-    _has_elevenlabs = True
-except (ImportError, TypeError):
-    _has_elevenlabs = False
-    ElevenLabsTTS = None
-
-# STT exports
-from .stt import STT, STTProvider, OpenAISTT, STTFullResponse
-
-__all__ = [
+# Public names are imported from their subpackage on first access
+_EXPORTS = {
     # TTS - Factory
-    'TTS',
-    'TTSBase',
+    'TTS': '.tts',
+    'TTSBase': '.tts',
     # TTS - Models
-    'TTSProvider',
-    'TTSResponse',
-    'Voice',
+    'TTSProvider': '.tts',
+    'TTSResponse': '.tts',
+    'Voice': '.tts',
     # TTS - Exceptions
-    'TTSError',
-    'TTSValidationError',
-    'TTSProviderError',
-    'TTSVoiceNotFoundError',
+    'TTSError': '.tts',
+    'TTSValidationError': '.tts',
+    'TTSProviderError': '.tts',
+    'TTSVoiceNotFoundError': '.tts',
     # TTS - Providers
-    'OpenAITTS',
+    'OpenAITTS': '.tts',
+    'ElevenLabsTTS': '.tts',
     # TTS - Constants
-    'OPENAI_VOICES',
-    'OPENAI_MODELS',
-    'OPENAI_FORMATS',
-    'ELEVENLABS_MODELS',
-    'ELEVENLABS_FORMATS',
+    'OPENAI_VOICES': '.tts',
+    'OPENAI_MODELS': '.tts',
+    'OPENAI_FORMATS': '.tts',
+    'ELEVENLABS_MODELS': '.tts',
+    'ELEVENLABS_FORMATS': '.tts',
     # STT
-    'STT',
-    'STTProvider',
-    'OpenAISTT',
-    'STTFullResponse',
-]
+    'STT': '.stt',
+    'STTProvider': '.stt',
+    'OpenAISTT': '.stt',
+    'STTFullResponse': '.stt',
+    'STTSegment': '.stt',
+    'STTPartialTranscript': '.stt',
+}
+
+# ElevenLabsTTS is None when the elevenlabs package is not installed
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, optional=['ElevenLabsTTS'])
 
-if _has_elevenlabs:
-    __all__.append('ElevenLabsTTS')
+__all__ = list(_EXPORTS)
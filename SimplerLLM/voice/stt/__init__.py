@@ -1,10 +1,14 @@
-from .base import STT, STTProvider
-from .wrappers import OpenAISTT
-from .providers import STTFullResponse
+from SimplerLLM.utils.lazy_imports import lazy_exports
 
-__all__ = [
-    'STT',
-    'STTProvider',
-    'OpenAISTT',
-    'STTFullResponse',
-]
+_EXPORTS = {
+    'STT': '.base',
+    'STTProvider': '.base',
+    'OpenAISTT': '.wrappers.openai_wrapper',
+    'STTFullResponse': '.providers.stt_response_models',
+    'STTSegment': '.providers.stt_response_models',
+    'STTPartialTranscript': '.providers.stt_response_models',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
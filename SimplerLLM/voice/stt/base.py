@@ -1,6 +1,7 @@
 from enum import Enum
 import os
 from SimplerLLM.utils.custom_verbose import verbose_print
+from SimplerLLM.instrumentation.core import instrument_class
 
 
 class STTProvider(Enum):
@@ -18,6 +19,16 @@ class STT:
     Provides a unified interface across different STT providers.
     """
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        instrument_class(cls, "voice", {
+            "transcribe": "transcription",
+            "transcribe_async": "transcription",
+            "transcribe_long": "transcription_long",
+            "transcribe_long_async": "transcription_long",
+            "transcribe_long_stream": "transcription_long",
+        })
+
     def __init__(
         self,
         provider=STTProvider.OPENAI,
@@ -1,7 +1,12 @@
-from .stt_response_models import STTFullResponse
-from . import openai_stt
+from SimplerLLM.utils.lazy_imports import lazy_exports
 
-__all__ = [
-    'STTFullResponse',
-    'openai_stt',
-]
+# Provider modules such as openai_stt are imported on first use
+_EXPORTS = {
+    'STTFullResponse': '.stt_response_models',
+    'STTSegment': '.stt_response_models',
+    'STTPartialTranscript': '.stt_response_models',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS) + ['openai_stt']
@@ -0,0 +1,228 @@
+"""
+Long-audio helpers for STT providers.
+
+Splits a recording into segments small enough for one transcription
+request (preferring cuts in silence, otherwise fixed windows that
+overlap) and merges the segment transcripts back together, dropping the
+words transcribed twice in overlaps.
+
+Decoding uses pydub, which needs ffmpeg for formats other than WAV.
+"""
+
+import io
+import os
+import re
+from typing import List, NamedTuple, Optional
+
+from .stt_response_models import STTSegment
+
+# Segments are sent as 16 kHz mono 16-bit WAV: the rate Whisper works at,
+# and about 1.9 MB per minute, so a 10 minute segment stays under 25 MB
+SEGMENT_SAMPLE_RATE = 16000
+
+
+class AudioWindow(NamedTuple):
+    """A slice of the recording, in milliseconds."""
+    index: int
+    start_ms: int
+    end_ms: int
+
+
+def load_audio(audio_file):
+    """
+    Decode an audio file and convert it to 16 kHz mono.
+
+    Args:
+        audio_file: Path to the audio file or binary file-like object
+
+    Returns:
+        pydub.AudioSegment
+    """
+    from pydub import AudioSegment
+
+    def decode(f):
+        # WAV is read natively; anything else goes through ffmpeg
+        header = f.read(12)
+        f.seek(0)
+        audio_format = "wav" if header[:4] == b"RIFF" and header[8:12] == b"WAVE" else None
+        return AudioSegment.from_file(f, format=audio_format)
+
+    if isinstance(audio_file, (str, os.PathLike)):
+        with open(audio_file, "rb") as f:
+            audio = decode(f)
+    else:
+        audio_file.seek(0)
+        audio = decode(audio_file)
+
+    return audio.set_channels(1).set_frame_rate(SEGMENT_SAMPLE_RATE).set_sample_width(2)
+
+
+def _silence_cut(audio, start_ms: int, end_ms: int, min_silence_ms: int,
+                 silence_thresh: float) -> Optional[int]:
+    """Find the middle of the silence closest to end_ms within [start_ms, end_ms]."""
+    from pydub.silence import detect_silence
+
+    silences = detect_silence(
+        audio[start_ms:end_ms],
+        min_silence_len=min_silence_ms,
+        silence_thresh=silence_thresh,
+        seek_step=10,
+    )
+    if not silences:
+        return None
+    silence_start, silence_end = max(silences, key=lambda s: s[1])
+    return start_ms + (silence_start + silence_end) // 2
+
+
+def plan_windows(
+    audio,
+    segment_seconds: float = 600.0,
+    overlap_seconds: float = 2.0,
+    split_on_silence: bool = True,
+    min_silence_ms: int = 500,
+    silence_threshold_db: Optional[float] = None,
+) -> List[AudioWindow]:
+    """
+    Plan the segments a recording is transcribed in.
+
+    Each cut is placed in the longest-running silence found in the last
+    fifth of a segment. Where there is none, the segment ends at the
+    fixed window and the next one starts overlap_seconds earlier so no
+    word is lost at the cut.
+
+    Args:
+        audio: pydub.AudioSegment
+        segment_seconds: Maximum segment length in seconds
+        overlap_seconds: Overlap between fixed-window segments
+        split_on_silence: Look for silence to cut at (default: True)
+        min_silence_ms: Shortest pause that counts as silence
+        silence_threshold_db: Loudness below which audio is silence
+            (default: 16 dB below the recording's average)
+
+    Returns:
+        List of AudioWindow in recording order
+    """
+    segment_ms = int(segment_seconds * 1000)
+    overlap_ms = int(overlap_seconds * 1000)
+    if segment_ms <= overlap_ms:
+        raise ValueError("segment_seconds must be greater than overlap_seconds")
+
+    if silence_threshold_db is None:
+        silence_threshold_db = audio.dBFS - 16
+    search_ms = max(segment_ms // 5, min_silence_ms * 2)
+
+    windows = []
+    cursor = 0
+    total_ms = len(audio)
+    while cursor < total_ms:
+        end = cursor + segment_ms
+        if end >= total_ms:
+            windows.append(AudioWindow(len(windows), cursor, total_ms))
+            break
+
+        cut = None
+        if split_on_silence:
+            cut = _silence_cut(audio, end - search_ms, end, min_silence_ms, silence_threshold_db)
+
+        if cut is not None:
+            windows.append(AudioWindow(len(windows), cursor, cut))
+            cursor = cut
+        else:
+            windows.append(AudioWindow(len(windows), cursor, end))
+            cursor = end - overlap_ms
+
+    return windows
+
+
+def export_window(audio, window: AudioWindow) -> io.BytesIO:
+    """
+    Export a window as an in-memory WAV file ready for upload.
+
+    Returns:
+        BytesIO named "segment-<index>.wav"
+    """
+    buffer = io.BytesIO()
+    audio[window.start_ms:window.end_ms].export(buffer, format="wav")
+    buffer.seek(0)
+    buffer.name = f"segment-{window.index}.wav"
+    return buffer
+
+
+def response_segments(response, offset: float) -> List[STTSegment]:
+    """
+    Read timestamped pieces from a verbose_json transcription, shifted by
+    the segment's offset in the recording.
+    """
+    pieces = []
+    for piece in getattr(response, "segments", None) or []:
+        if isinstance(piece, dict):
+            start, end, text = piece.get("start"), piece.get("end"), piece.get("text", "")
+        else:
+            start, end, text = piece.start, piece.end, piece.text
+        pieces.append(STTSegment(start=start + offset, end=end + offset, text=text.strip()))
+    return pieces
+
+
+def _words(text: str) -> List[str]:
+    return [re.sub(r"[^\w']", "", word.lower()) for word in text.split()]
+
+
+def merge_texts(previous: str, following: str, max_overlap_words: int = 50) -> str:
+    """
+    Join two transcripts, dropping the words the second one repeats from
+    the end of the first.
+
+    The longest run of at least two words that ends the first text and
+    starts the second is removed from the second.
+    """
+    if not previous:
+        return following
+    if not following:
+        return previous
+
+    prev_words = _words(previous)
+    next_raw = following.split()
+    next_words = _words(following)
+
+    limit = min(max_overlap_words, len(prev_words), len(next_words))
+    for size in range(limit, 1, -1):
+        if prev_words[-size:] == next_words[:size]:
+            next_raw = next_raw[size:]
+            break
+
+    return " ".join([previous.strip()] + next_raw).strip()
+
+
+def merge_partials(partials) -> "tuple[str, Optional[List[STTSegment]]]":
+    """
+    Merge segment transcripts in recording order.
+
+    With timestamps, pieces from overlapping segments are split at the
+    middle of the overlap. Otherwise repeated words are removed by text
+    matching.
+
+    Args:
+        partials: STTPartialTranscript objects sorted by index
+
+    Returns:
+        tuple: (merged text, merged timestamped pieces or None)
+    """
+    if partials and all(p.segments or not p.text.strip() for p in partials):
+        merged: List[STTSegment] = []
+        for i, partial in enumerate(partials):
+            keep_from = float("-inf")
+            keep_until = float("inf")
+            if i > 0 and partials[i - 1].end > partial.start:
+                keep_from = (partial.start + partials[i - 1].end) / 2
+            if i + 1 < len(partials) and partial.end > partials[i + 1].start:
+                keep_until = (partials[i + 1].start + partial.end) / 2
+            merged.extend(
+                piece for piece in partial.segments
+                if keep_from <= piece.start < keep_until
+            )
+        return " ".join(piece.text for piece in merged if piece.text), merged
+
+    text = ""
+    for partial in partials:
+        text = merge_texts(text, partial.text.strip())
+    return text, None
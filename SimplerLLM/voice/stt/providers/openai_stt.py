@@ -1,16 +1,62 @@
 from openai import OpenAI, AsyncOpenAI
-from dotenv import load_dotenv
+from contextlib import contextmanager
 import asyncio
 import os
+import threading
 import time
-from .stt_response_models import STTFullResponse
+from .stt_response_models import STTFullResponse, STTPartialTranscript
+from . import long_audio
+from SimplerLLM.instrumentation.core import record_retry
 
-# Load environment variables
-load_dotenv(override=True)
 
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", 3))
 RETRY_DELAY = int(os.getenv("RETRY_DELAY", 2))
 
+_client_lock = threading.Lock()
+_clients = {}
+# (id(loop), api_key) -> (loop, client)
+_async_clients = {}
+
+
+def _get_client(api_key=None):
+    """Get a cached OpenAI client for api_key (connections are reused across calls)."""
+    with _client_lock:
+        client = _clients.get(api_key)
+        if client is None:
+            client = _clients[api_key] = OpenAI(api_key=api_key)
+        return client
+
+
+def _get_async_client(api_key=None):
+    """Get a cached AsyncOpenAI client for api_key bound to the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _client_lock:
+        for stale in [k for k, (owner, _) in _async_clients.items() if owner.is_closed()]:
+            del _async_clients[stale]
+
+        entry = _async_clients.get((id(loop), api_key))
+        if entry is None or entry[0] is not loop:
+            entry = (loop, AsyncOpenAI(api_key=api_key))
+            _async_clients[(id(loop), api_key)] = entry
+        return entry[1]
+
+
+@contextmanager
+def _open_audio(audio_file):
+    """Open a path, or rewind a file-like object so a retry re-sends all of it."""
+    if isinstance(audio_file, (str, os.PathLike)):
+        with open(audio_file, "rb") as audio:
+            yield audio
+    else:
+        audio_file.seek(0)
+        yield audio_file
+
+
+def _audio_name(audio_file):
+    if isinstance(audio_file, (str, os.PathLike)):
+        return os.fspath(audio_file)
+    return getattr(audio_file, "name", None)
+
 
 def transcribe(
     model_name,
@@ -42,7 +88,7 @@ def transcribe(
         Otherwise: transcribed text string (or json/srt/vtt based on response_format)
     """
     start_time = time.time() if full_response else None
-    openai_client = OpenAI(api_key=api_key)
+    openai_client = _get_client(api_key)
 
     if verbose:
         print(f"[OpenAI STT] Transcribing audio with model={model_name}, language={language or 'auto'}, format={response_format}")
@@ -50,7 +96,7 @@ def transcribe(
     for attempt in range(MAX_RETRIES):
         try:
             # Open audio file and create transcription
-            with open(audio_file, "rb") as audio:
+            with _open_audio(audio_file) as audio:
                 # Build API call parameters
                 api_params = {
                     "model": model_name,
@@ -102,7 +148,7 @@ def transcribe(
                     language=detected_language,
                     process_time=process_time,
                     provider="OPENAI",
-                    audio_file=audio_file,
+                    audio_file=_audio_name(audio_file),
                     duration=duration,
                     response_format=response_format,
                     llm_provider_response=response,
@@ -117,6 +163,7 @@ def transcribe(
             if attempt < MAX_RETRIES - 1:
                 if verbose:
                     print(f"[OpenAI STT] Attempt {attempt + 1} failed: {e}. Retrying...")
+                record_retry()
                 time.sleep(RETRY_DELAY * (2**attempt))
             else:
                 error_msg = f"Failed to transcribe audio after {MAX_RETRIES} attempts due to: {e}"
@@ -153,7 +200,7 @@ async def transcribe_async(
         Otherwise: transcribed text string (or json/srt/vtt based on response_format)
     """
     start_time = time.time() if full_response else None
-    async_openai_client = AsyncOpenAI(api_key=api_key)
+    async_openai_client = _get_async_client(api_key)
 
     if verbose:
         print(f"[OpenAI STT] Transcribing audio with model={model_name}, language={language or 'auto'}, format={response_format}")
@@ -161,7 +208,7 @@ async def transcribe_async(
     for attempt in range(MAX_RETRIES):
         try:
             # Open audio file and create transcription
-            with open(audio_file, "rb") as audio:
+            with _open_audio(audio_file) as audio:
                 # Build API call parameters
                 api_params = {
                     "model": model_name,
@@ -213,7 +260,7 @@ async def transcribe_async(
                     language=detected_language,
                     process_time=process_time,
                     provider="OPENAI",
-                    audio_file=audio_file,
+                    audio_file=_audio_name(audio_file),
                     duration=duration,
                     response_format=response_format,
                     llm_provider_response=response,
@@ -228,7 +275,208 @@ async def transcribe_async(
             if attempt < MAX_RETRIES - 1:
                 if verbose:
                     print(f"[OpenAI STT] Attempt {attempt + 1} failed: {e}. Retrying...")
+                record_retry()
                 await asyncio.sleep(RETRY_DELAY * (2**attempt))
             else:
                 error_msg = f"Failed to transcribe audio after {MAX_RETRIES} attempts due to: {e}"
                 raise Exception(error_msg)
+
+
+async def _aclose_async_clients():
+    """Close the cached async clients of the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _client_lock:
+        keys = [k for k, (owner, _) in _async_clients.items() if owner is loop]
+        clients = [_async_clients.pop(k)[1] for k in keys]
+    for client in clients:
+        await client.close()
+
+
+async def transcribe_long_stream_async(
+    model_name,
+    audio_file,
+    api_key=None,
+    language=None,
+    prompt=None,
+    temperature=0.0,
+    segment_seconds=600.0,
+    overlap_seconds=2.0,
+    split_on_silence=True,
+    max_concurrency=4,
+    verbose=False,
+):
+    """
+    Transcribe a long recording in segments, yielding each segment's
+    transcript as soon as it finishes.
+
+    The audio is cut at silences where possible, otherwise into fixed
+    windows that overlap by overlap_seconds. Segments are sent as 16 kHz
+    mono WAV and transcribed concurrently, so results may arrive out of
+    order; use the index field to place them.
+
+    Args:
+        model_name: STT model to use (e.g., "whisper-1")
+        audio_file: Path to the audio file or file-like object
+        api_key: OpenAI API key (uses env var if not provided)
+        language: Language code (e.g., "en") - auto-detect if None
+        prompt: Optional text to guide the model's style (sent with every segment)
+        temperature: Sampling temperature between 0 and 1 (default: 0.0)
+        segment_seconds: Maximum segment length in seconds (default: 600)
+        overlap_seconds: Overlap between fixed-window segments (default: 2)
+        split_on_silence: Prefer cutting at pauses (default: True)
+        max_concurrency: Maximum segments transcribed at once (default: 4)
+        verbose: If True, prints progress information
+
+    Yields:
+        STTPartialTranscript for each finished segment
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be >= 1")
+
+    audio = await asyncio.to_thread(long_audio.load_audio, audio_file)
+    windows = await asyncio.to_thread(
+        long_audio.plan_windows, audio, segment_seconds, overlap_seconds, split_on_silence
+    )
+    # Only whisper models return segment timestamps
+    response_format = "verbose_json" if model_name.startswith("whisper") else "json"
+
+    if verbose:
+        print(f"[OpenAI STT] Long audio: {len(audio) / 1000:.1f}s in {len(windows)} segments")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(window):
+        async with semaphore:
+            segment = await asyncio.to_thread(long_audio.export_window, audio, window)
+            result = await transcribe_async(
+                model_name,
+                segment,
+                api_key=api_key,
+                language=language,
+                prompt=prompt,
+                response_format=response_format,
+                temperature=temperature,
+                full_response=True,
+                verbose=verbose,
+            )
+        start = window.start_ms / 1000
+        return window, result.text, long_audio.response_segments(result.llm_provider_response, start)
+
+    tasks = [asyncio.ensure_future(run(window)) for window in windows]
+    try:
+        for completed, next_done in enumerate(asyncio.as_completed(tasks), start=1):
+            window, text, pieces = await next_done
+            yield STTPartialTranscript(
+                index=window.index,
+                start=window.start_ms / 1000,
+                end=window.end_ms / 1000,
+                text=text,
+                segments=pieces,
+                completed=completed,
+                total=len(windows),
+            )
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def transcribe_long_async(
+    model_name,
+    audio_file,
+    api_key=None,
+    language=None,
+    prompt=None,
+    temperature=0.0,
+    segment_seconds=600.0,
+    overlap_seconds=2.0,
+    split_on_silence=True,
+    max_concurrency=4,
+    full_response=False,
+    verbose=False,
+):
+    """
+    Async version: Transcribe a recording of any length.
+
+    Segments are transcribed concurrently (see transcribe_long_stream_async)
+    and merged in order. Words repeated in overlapping segments are
+    removed, using timestamps when the model returns them.
+
+    Args:
+        model_name: STT model to use (e.g., "whisper-1")
+        audio_file: Path to the audio file or file-like object
+        full_response: If True, returns STTFullResponse with merged timestamped segments
+        Other args: see transcribe_long_stream_async
+
+    Returns:
+        If full_response=True: STTFullResponse object
+        Otherwise: transcribed text string
+    """
+    start_time = time.time()
+    partials = []
+    async for partial in transcribe_long_stream_async(
+        model_name,
+        audio_file,
+        api_key=api_key,
+        language=language,
+        prompt=prompt,
+        temperature=temperature,
+        segment_seconds=segment_seconds,
+        overlap_seconds=overlap_seconds,
+        split_on_silence=split_on_silence,
+        max_concurrency=max_concurrency,
+        verbose=verbose,
+    ):
+        partials.append(partial)
+
+    partials.sort(key=lambda p: p.index)
+    text, segments = long_audio.merge_partials(partials)
+
+    if verbose:
+        preview = text[:100] + "..." if len(text) > 100 else text
+        print(f"[OpenAI STT] Long transcription completed: {preview}")
+
+    if not full_response:
+        return text
+
+    return STTFullResponse(
+        text=text,
+        model=model_name,
+        language=language,
+        process_time=time.time() - start_time,
+        provider="OPENAI",
+        audio_file=_audio_name(audio_file),
+        duration=partials[-1].end if partials else 0.0,
+        response_format="verbose_json" if segments is not None else "json",
+        llm_provider_response=partials,
+        segments=segments,
+    )
+
+
+def transcribe_long(model_name, audio_file, **kwargs):
+    """
+    Transcribe a recording of any length (blocking).
+
+    Runs transcribe_long_async in a new event loop; takes the same
+    arguments.
+
+    Raises:
+        RuntimeError: If called from a running event loop
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise RuntimeError(
+            "transcribe_long() cannot be called from a running event loop. "
+            "Use 'await transcribe_long_async(...)' instead."
+        )
+
+    async def run():
+        try:
+            return await transcribe_long_async(model_name, audio_file, **kwargs)
+        finally:
+            await _aclose_async_clients()
+
+    return asyncio.run(run())
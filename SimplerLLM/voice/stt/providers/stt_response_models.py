@@ -1,5 +1,43 @@
 from pydantic import BaseModel
-from typing import Any, Optional
+from typing import Any, List, Optional
+
+
+class STTSegment(BaseModel):
+    """A timestamped piece of a transcript."""
+
+    start: float
+    """Start time in seconds from the beginning of the audio"""
+
+    end: float
+    """End time in seconds from the beginning of the audio"""
+
+    text: str
+    """Text spoken in this piece"""
+
+
+class STTPartialTranscript(BaseModel):
+    """Transcript of one audio segment in long-audio mode, yielded as it finishes."""
+
+    index: int
+    """Position of the audio segment in the recording"""
+
+    start: float
+    """Segment start time in seconds"""
+
+    end: float
+    """Segment end time in seconds"""
+
+    text: str
+    """Transcribed text of the segment"""
+
+    segments: List[STTSegment] = []
+    """Timestamped pieces with times relative to the whole recording (whisper models)"""
+
+    completed: int
+    """Number of segments finished so far"""
+
+    total: int
+    """Total number of segments"""
 
 
 class STTFullResponse(BaseModel):
@@ -32,6 +70,9 @@ class STTFullResponse(BaseModel):
     llm_provider_response: Optional[Any] = None
     """Raw response from the provider API"""
 
+    segments: Optional[List[STTSegment]] = None
+    """Timestamped transcript pieces (long-audio mode with whisper models)"""
+
     class Config:
         json_schema_extra = {
             "example": {
@@ -1,5 +1,9 @@
-from .openai_wrapper import OpenAISTT
+from SimplerLLM.utils.lazy_imports import lazy_exports
 
-__all__ = [
-    'OpenAISTT',
-]
+_EXPORTS = {
+    'OpenAISTT': '.openai_wrapper',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = list(_EXPORTS)
@@ -170,3 +170,159 @@ class OpenAISTT(STT):
             if self.verbose:
                 verbose_print(f"Error during transcription: {str(e)}", "error")
             raise
+
+    def _long_params(self, audio_file, model, language, prompt, temperature,
+                     segment_seconds, overlap_seconds, split_on_silence, max_concurrency):
+        """Build provider arguments for the long-audio methods."""
+        if not audio_file:
+            if self.verbose:
+                verbose_print("Error: audio_file parameter is required", "error")
+            raise ValueError("audio_file parameter is required for transcription")
+
+        params = self.prepare_params(model, language, temperature)
+        params.update({
+            "api_key": self.api_key,
+            "audio_file": audio_file,
+            "prompt": prompt,
+            "segment_seconds": segment_seconds,
+            "overlap_seconds": overlap_seconds,
+            "split_on_silence": split_on_silence,
+            "max_concurrency": max_concurrency,
+            "verbose": self.verbose,
+        })
+
+        if self.verbose:
+            verbose_print(
+                f"Transcribing long audio - Model: {params['model_name']}, Segments: {segment_seconds}s, Concurrency: {max_concurrency}",
+                "info"
+            )
+            verbose_print(f"Audio file: {audio_file}", "debug")
+        return params
+
+    def transcribe_long(
+        self,
+        audio_file: str,
+        model: str = None,
+        language: str = None,
+        prompt: str = None,
+        temperature: float = 0.0,
+        segment_seconds: float = 600.0,
+        overlap_seconds: float = 2.0,
+        split_on_silence: bool = True,
+        max_concurrency: int = 4,
+        full_response: bool = False,
+    ):
+        """
+        Transcribe a recording of any length.
+
+        The audio is split at pauses (or into overlapping fixed windows
+        where there are none), the segments are transcribed concurrently,
+        and the results are merged with the repeated words of overlaps
+        removed. Files above the 25 MB upload limit work as well.
+
+        Requires pydub (and ffmpeg for formats other than WAV).
+
+        Args:
+            audio_file: Path to the audio file or file-like object (required)
+            model: Model to use (None = use instance default)
+            language: Language code (e.g., "en", "es", "fr") - auto-detect if None
+            prompt: Optional text to guide the model's style (sent with every segment)
+            temperature: Sampling temperature between 0 and 1 (default: 0.0)
+            segment_seconds: Maximum segment length in seconds (default: 600)
+            overlap_seconds: Overlap between fixed-window segments (default: 2)
+            split_on_silence: Prefer cutting at pauses (default: True)
+            max_concurrency: Maximum segments transcribed at once (default: 4)
+            full_response: If True, returns STTFullResponse with timestamped segments
+
+        Returns:
+            If full_response=True: STTFullResponse object with metadata
+            Otherwise: transcribed text string
+
+        Example:
+            >>> stt = STT.create(provider=STTProvider.OPENAI)
+            >>> response = stt.transcribe_long("podcast.mp3", full_response=True)
+            >>> for segment in response.segments:
+            ...     print(f"[{segment.start:.1f}s] {segment.text}")
+        """
+        params = self._long_params(audio_file, model, language, prompt, temperature,
+                                   segment_seconds, overlap_seconds, split_on_silence, max_concurrency)
+        params["full_response"] = full_response
+
+        try:
+            response = openai_stt.transcribe_long(**params)
+            if self.verbose:
+                verbose_print("Transcription completed successfully", "info")
+            return response
+        except Exception as e:
+            if self.verbose:
+                verbose_print(f"Error during transcription: {str(e)}", "error")
+            raise
+
+    async def transcribe_long_async(
+        self,
+        audio_file: str,
+        model: str = None,
+        language: str = None,
+        prompt: str = None,
+        temperature: float = 0.0,
+        segment_seconds: float = 600.0,
+        overlap_seconds: float = 2.0,
+        split_on_silence: bool = True,
+        max_concurrency: int = 4,
+        full_response: bool = False,
+    ):
+        """
+        Asynchronously transcribe a recording of any length.
+
+        Takes the same arguments as transcribe_long().
+
+        Example:
+            >>> stt = STT.create(provider=STTProvider.OPENAI)
+            >>> text = await stt.transcribe_long_async("lecture.wav")
+        """
+        params = self._long_params(audio_file, model, language, prompt, temperature,
+                                   segment_seconds, overlap_seconds, split_on_silence, max_concurrency)
+        params["full_response"] = full_response
+
+        try:
+            response = await openai_stt.transcribe_long_async(**params)
+            if self.verbose:
+                verbose_print("Transcription completed successfully", "info")
+            return response
+        except Exception as e:
+            if self.verbose:
+                verbose_print(f"Error during transcription: {str(e)}", "error")
+            raise
+
+    async def transcribe_long_stream(
+        self,
+        audio_file: str,
+        model: str = None,
+        language: str = None,
+        prompt: str = None,
+        temperature: float = 0.0,
+        segment_seconds: float = 600.0,
+        overlap_seconds: float = 2.0,
+        split_on_silence: bool = True,
+        max_concurrency: int = 4,
+    ):
+        """
+        Transcribe a long recording, yielding each segment as it finishes.
+
+        Segments finish out of order; each STTPartialTranscript carries its
+        index, its start/end time and the completed/total counts for
+        progress reporting. Takes the same arguments as transcribe_long().
+
+        Yields:
+            STTPartialTranscript objects
+
+        Example:
+            >>> stt = STT.create(provider=STTProvider.OPENAI)
+            >>> async for part in stt.transcribe_long_stream("meeting.mp3"):
+            ...     print(f"{part.completed}/{part.total}: {part.text[:60]}")
+        """
+        params = self._long_params(audio_file, model, language, prompt, temperature,
+                                   segment_seconds, overlap_seconds, split_on_silence, max_concurrency)
+
+        async for partial in openai_stt.transcribe_long_stream_async(**params):
+            yield partial
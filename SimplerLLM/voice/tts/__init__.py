@@ -14,66 +14,46 @@ Example:
 
     # List available voices
     voices = tts.list_voices()
-"""
 
-from .factory import TTS
-from .base import TTSBase
-from .models import (
-    TTSProvider,
-    TTSResponse,
-    Voice,
-    TTSError,
-    TTSValidationError,
-    TTSProviderError,
-    TTSVoiceNotFoundError,
-    OPENAI_VOICES,
-    OPENAI_MODELS,
-    OPENAI_FORMATS,
-    ELEVENLABS_MODELS,
-    ELEVENLABS_FORMATS,
-    LAHAJATI_FORMATS,
-    LAHAJATI_INPUT_MODES,
-    Dialect,
-    Performance,
-)
-from .providers import OpenAITTS, LahajatiTTS
+    # Narrate a long article in parallel chunks
+    response = tts.generate_long_speech(article, output_path="article.mp3")
+"""
 
-# Optional provider - only import if elevenlabs package is installed
-try:
-    from .providers import ElevenLabsTTS
-    _has_elevenlabs = True
-except (ImportError, TypeError):
-    _has_elevenlabs = False
-    ElevenLabsTTS = None
+from SimplerLLM.utils.lazy_imports import lazy_exports
 
-__all__ = [
+# Providers (and their SDKs) are imported on first access
+_EXPORTS = {
     # Factory
-    'TTS',
+    'TTS': '.factory',
     # Base class
-    'TTSBase',
+    'TTSBase': '.base',
     # Models
-    'TTSProvider',
-    'TTSResponse',
-    'Voice',
-    'Dialect',
-    'Performance',
+    'TTSProvider': '.models',
+    'TTSResponse': '.models',
+    'TTSChunkTiming': '.models',
+    'Voice': '.models',
+    'Dialect': '.models',
+    'Performance': '.models',
     # Exceptions
-    'TTSError',
-    'TTSValidationError',
-    'TTSProviderError',
-    'TTSVoiceNotFoundError',
+    'TTSError': '.models',
+    'TTSValidationError': '.models',
+    'TTSProviderError': '.models',
+    'TTSVoiceNotFoundError': '.models',
     # Providers
-    'OpenAITTS',
-    'LahajatiTTS',
+    'OpenAITTS': '.providers.openai_tts',
+    'LahajatiTTS': '.providers.lahajati_tts',
+    'ElevenLabsTTS': '.providers.elevenlabs_tts',
     # Constants
-    'OPENAI_VOICES',
-    'OPENAI_MODELS',
-    'OPENAI_FORMATS',
-    'ELEVENLABS_MODELS',
-    'ELEVENLABS_FORMATS',
-    'LAHAJATI_FORMATS',
-    'LAHAJATI_INPUT_MODES',
-]
-
-if _has_elevenlabs:
-    __all__.append('ElevenLabsTTS')
+    'OPENAI_VOICES': '.models',
+    'OPENAI_MODELS': '.models',
+    'OPENAI_FORMATS': '.models',
+    'ELEVENLABS_MODELS': '.models',
+    'ELEVENLABS_FORMATS': '.models',
+    'LAHAJATI_FORMATS': '.models',
+    'LAHAJATI_INPUT_MODES': '.models',
+}
+
+# ElevenLabsTTS is optional - None if the elevenlabs package is not installed
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, optional=['ElevenLabsTTS'])
+
+__all__ = list(_EXPORTS)
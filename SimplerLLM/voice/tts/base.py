@@ -5,10 +5,31 @@ Abstract base class for all TTS providers.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+import asyncio
+import io
 import os
+import time
 
-from .models import Voice, TTSResponse, TTSProvider
+from SimplerLLM.instrumentation.core import instrument_class
+
+from .models import Voice, TTSResponse, TTSProvider, TTSChunkTiming, TTSValidationError
+from .long_form import AudioStitcher, check_stitchable, split_text
+
+
+# Methods run inside instrumentation spans, on TTSBase and every provider
+_TTS_OPERATIONS = {
+    "generate_speech": "speech",
+    "generate_speech_async": "speech",
+    "generate_speech_stream": "speech_stream",
+    "generate_speech_stream_async": "speech_stream",
+    "stream_speech_to": "speech_stream",
+    "stream_speech_to_async": "speech_stream",
+    "generate_long_speech": "speech_long",
+    "generate_long_speech_async": "speech_long",
+}
 
 
 class TTSBase(ABC):
@@ -19,6 +40,13 @@ class TTSBase(ABC):
     a unified API across different providers.
     """
 
+    # Maximum characters the provider accepts in one request
+    MAX_INPUT_CHARS = 4000
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        instrument_class(cls, "voice", _TTS_OPERATIONS)
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -110,6 +138,168 @@ class TTSBase(ABC):
         """
         pass
 
+    def generate_speech_stream(
+        self,
+        text: str,
+        *,
+        chunk_size: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Iterator[bytes]:
+        """
+        Generate speech and yield audio chunks as they arrive.
+
+        Playback can start on the first chunk instead of waiting for the
+        whole clip. Providers that support streaming override this.
+
+        Args:
+            text: Text to convert to speech
+            chunk_size: Buffer chunks to this many bytes (None yields data as
+                it arrives, for the lowest latency)
+            **kwargs: Same options as generate_speech(), except output_path
+
+        Yields:
+            Audio bytes in playback order
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support streaming synthesis"
+        )
+
+    async def generate_speech_stream_async(
+        self,
+        text: str,
+        *,
+        chunk_size: Optional[int] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[bytes]:
+        """
+        Async version: Generate speech and yield audio chunks as they arrive.
+
+        Args:
+            Same as generate_speech_stream()
+
+        Yields:
+            Audio bytes in playback order
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support streaming synthesis"
+        )
+        yield b""  # Unreachable, makes this an async generator
+
+    def stream_speech_to(
+        self,
+        sink: Union[str, BinaryIO],
+        text: str,
+        *,
+        chunk_size: Optional[int] = None,
+        **kwargs: Any,
+    ) -> TTSResponse:
+        """
+        Stream generated speech straight into a file or file-like sink.
+
+        Args:
+            sink: File path, or a binary file-like object with write()
+                (an open file, socket file, audio player pipe, ...)
+            text: Text to convert to speech
+            chunk_size: Buffer chunks to this many bytes (None = as received)
+            **kwargs: Same options as generate_speech(), except output_path
+
+        Returns:
+            TTSResponse with time_to_first_byte set. audio_data is the file
+            path when sink is a path, otherwise empty (the audio went to sink).
+
+        Example:
+            >>> response = tts.stream_speech_to("reply.mp3", "Hello there!")
+            >>> print(f"First audio after {response.time_to_first_byte * 1000:.0f} ms")
+        """
+        start_time = time.time()
+        first_byte_time = None
+        file_path, target = self._open_stream_sink(sink)
+        try:
+            for chunk in self.generate_speech_stream(text, chunk_size=chunk_size, **kwargs):
+                if first_byte_time is None:
+                    first_byte_time = time.time()
+                target.write(chunk)
+        finally:
+            if file_path:
+                target.close()
+
+        return self._stream_response(file_path, start_time, first_byte_time, kwargs)
+
+    async def stream_speech_to_async(
+        self,
+        sink: Union[str, BinaryIO],
+        text: str,
+        *,
+        chunk_size: Optional[int] = None,
+        **kwargs: Any,
+    ) -> TTSResponse:
+        """
+        Async version: Stream generated speech straight into a file or
+        file-like sink.
+
+        Args:
+            Same as stream_speech_to()
+
+        Returns:
+            TTSResponse with time_to_first_byte set
+        """
+        start_time = time.time()
+        first_byte_time = None
+        file_path, target = self._open_stream_sink(sink)
+        try:
+            async for chunk in self.generate_speech_stream_async(text, chunk_size=chunk_size, **kwargs):
+                if first_byte_time is None:
+                    first_byte_time = time.time()
+                target.write(chunk)
+        finally:
+            if file_path:
+                target.close()
+
+        return self._stream_response(file_path, start_time, first_byte_time, kwargs)
+
+    @staticmethod
+    def _open_stream_sink(sink: Union[str, BinaryIO]):
+        """
+        Returns:
+            tuple: (absolute file path or None, writable object)
+        """
+        if isinstance(sink, (str, os.PathLike)):
+            abs_path = os.path.abspath(sink)
+            os.makedirs(os.path.dirname(abs_path), exist_ok=True)
+            return abs_path, open(abs_path, "wb")
+        return None, sink
+
+    def _stream_metadata(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """TTSResponse fields describing a streamed request"""
+        metadata = {
+            "model": self._get_model(kwargs.get("model")) or "",
+            "voice": self._get_voice(kwargs.get("voice")) or "",
+            "format": kwargs.get("output_format", "mp3"),
+        }
+        for field in ("instructions", "language_code", "seed", "stability",
+                      "similarity_boost", "style"):
+            if kwargs.get(field) is not None:
+                metadata[field] = kwargs[field]
+        return metadata
+
+    def _stream_response(
+        self,
+        file_path: Optional[str],
+        start_time: float,
+        first_byte_time: Optional[float],
+        kwargs: Dict[str, Any],
+    ) -> TTSResponse:
+        return TTSResponse(
+            audio_data=file_path if file_path else b"",
+            file_path=file_path,
+            provider=self.provider.value,
+            process_time=time.time() - start_time,
+            time_to_first_byte=(
+                first_byte_time - start_time if first_byte_time is not None else None
+            ),
+            **self._stream_metadata(kwargs),
+        )
+
     @abstractmethod
     def list_voices(self) -> List[Voice]:
         """
@@ -136,6 +326,244 @@ class TTSBase(ABC):
         """
         pass
 
+    def generate_long_speech(
+        self,
+        text: str,
+        *,
+        max_concurrency: int = 4,
+        max_chunk_chars: Optional[int] = None,
+        output_path: Optional[str] = None,
+        **kwargs: Any,
+    ) -> TTSResponse:
+        """
+        Generate speech for text of any length.
+
+        The text is split at sentence boundaries into chunks under the
+        provider's input limit, chunks are synthesized concurrently, and
+        the audio is stitched back in order. Each chunk is written to
+        output_path as soon as all chunks before it are done and its audio
+        is released. Chunk i + max_concurrency is only started once chunk i
+        is written, so with output_path set at most max_concurrency chunks
+        of audio are held in memory.
+
+        Args:
+            text: Text to convert to speech
+            max_concurrency: Maximum number of chunks synthesized at once
+            max_chunk_chars: Characters per chunk (default: MAX_INPUT_CHARS)
+            output_path: Path to save the stitched audio file
+            **kwargs: Arguments forwarded to generate_speech()
+                (voice, model, speed, output_format, ...)
+
+        Returns:
+            TTSResponse with the stitched audio and per-chunk timings in
+            chunks
+
+        Raises:
+            TTSValidationError: If the text is empty, a chunk size exceeds
+                the provider limit, or the format cannot be stitched (flac)
+
+        Example:
+            >>> response = tts.generate_long_speech(article, output_path="article.mp3")
+            >>> for chunk in response.chunks:
+            ...     print(chunk.index, chunk.process_time)
+        """
+        chunks = self._split_for_speech(text, max_concurrency, max_chunk_chars, kwargs)
+        start_time = time.time()
+        sink, file_path = self._open_long_form_sink(output_path)
+        stitcher = None
+        first_response = None
+        timings = []
+
+        window = min(max_concurrency, len(chunks))
+        executor = ThreadPoolExecutor(max_workers=window)
+
+        def submit(index: int):
+            return executor.submit(self._synthesize_chunk, index, chunks[index], start_time, kwargs)
+
+        try:
+            in_flight = deque(submit(index) for index in range(window))
+            # Write in text order as soon as each next chunk is ready, drop
+            # its audio, then start the chunk that slides into the window
+            for index in range(len(chunks)):
+                response, timing = in_flight.popleft().result()
+                if stitcher is None:
+                    stitcher = AudioStitcher(sink, response.format)
+                stitcher.write(response.audio_data)
+                if first_response is None:
+                    first_response = response.model_copy(update={"audio_data": b""})
+                timings.append(timing)
+                del response
+                if index + window < len(chunks):
+                    in_flight.append(submit(index + window))
+            stitcher.finish()
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._discard_long_form_sink(sink, file_path)
+            raise
+        executor.shutdown()
+
+        return self._long_form_response(sink, file_path, first_response, timings, start_time)
+
+    async def generate_long_speech_async(
+        self,
+        text: str,
+        *,
+        max_concurrency: int = 4,
+        max_chunk_chars: Optional[int] = None,
+        output_path: Optional[str] = None,
+        **kwargs: Any,
+    ) -> TTSResponse:
+        """
+        Async version: Generate speech for text of any length.
+
+        Args:
+            Same as generate_long_speech()
+
+        Returns:
+            TTSResponse with the stitched audio and per-chunk timings
+        """
+        chunks = self._split_for_speech(text, max_concurrency, max_chunk_chars, kwargs)
+        start_time = time.time()
+        sink, file_path = self._open_long_form_sink(output_path)
+        window = min(max_concurrency, len(chunks))
+        stitcher = None
+        first_response = None
+        timings = []
+
+        async def synthesize(index: int):
+            chunk_start = time.time()
+            response = await self.generate_speech_async(chunks[index], **kwargs)
+            return response, self._chunk_timing(index, chunks[index], response, start_time, chunk_start)
+
+        in_flight = deque(asyncio.ensure_future(synthesize(index)) for index in range(window))
+        try:
+            for index in range(len(chunks)):
+                response, timing = await in_flight.popleft()
+                if stitcher is None:
+                    stitcher = AudioStitcher(sink, response.format)
+                if file_path:
+                    await asyncio.to_thread(stitcher.write, response.audio_data)
+                else:
+                    stitcher.write(response.audio_data)
+                if first_response is None:
+                    first_response = response.model_copy(update={"audio_data": b""})
+                timings.append(timing)
+                del response
+                if index + window < len(chunks):
+                    in_flight.append(asyncio.ensure_future(synthesize(index + window)))
+            await asyncio.to_thread(stitcher.finish)
+        except BaseException:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+            self._discard_long_form_sink(sink, file_path)
+            raise
+
+        return self._long_form_response(sink, file_path, first_response, timings, start_time)
+
+    def _split_for_speech(
+        self,
+        text: str,
+        max_concurrency: int,
+        max_chunk_chars: Optional[int],
+        kwargs: Dict[str, Any],
+    ) -> List[str]:
+        """Validate long-form arguments and split text into chunks"""
+        if max_concurrency < 1:
+            raise TTSValidationError("max_concurrency must be >= 1")
+
+        # Fail before any request if the chunks could not be joined
+        # (provider format strings such as mp3_44100_128 start with the name)
+        check_stitchable(kwargs.get("output_format", "mp3").split("_")[0])
+
+        max_chunk_chars = max_chunk_chars or self.MAX_INPUT_CHARS
+        if max_chunk_chars > self.MAX_INPUT_CHARS:
+            raise TTSValidationError(
+                f"max_chunk_chars cannot exceed the provider limit of {self.MAX_INPUT_CHARS}"
+            )
+
+        chunks = split_text(text or "", max_chunk_chars)
+        if not chunks:
+            raise TTSValidationError("Text cannot be empty")
+        return chunks
+
+    def _synthesize_chunk(
+        self,
+        index: int,
+        chunk: str,
+        start_time: float,
+        kwargs: Dict[str, Any],
+    ) -> Tuple[TTSResponse, TTSChunkTiming]:
+        """Synthesize one long-form chunk and time it"""
+        chunk_start = time.time()
+        response = self.generate_speech(chunk, **kwargs)
+        return response, self._chunk_timing(index, chunk, response, start_time, chunk_start)
+
+    @staticmethod
+    def _chunk_timing(
+        index: int,
+        chunk: str,
+        response: TTSResponse,
+        start_time: float,
+        chunk_start: float,
+    ) -> TTSChunkTiming:
+        return TTSChunkTiming(
+            index=index,
+            characters=len(chunk),
+            start_offset=chunk_start - start_time,
+            process_time=time.time() - chunk_start,
+            audio_bytes=len(response.audio_data),
+        )
+
+    @staticmethod
+    def _open_long_form_sink(output_path: Optional[str]):
+        """
+        Open the stitched output: a temporary file next to output_path
+        (renamed once complete) or an in-memory buffer.
+
+        Returns:
+            tuple: (file object, absolute output path or None)
+        """
+        if not output_path:
+            return io.BytesIO(), None
+
+        abs_path = os.path.abspath(output_path)
+        os.makedirs(os.path.dirname(abs_path), exist_ok=True)
+        return open(f"{abs_path}.part", "wb"), abs_path
+
+    @staticmethod
+    def _discard_long_form_sink(sink, file_path: Optional[str]) -> None:
+        sink.close()
+        if file_path:
+            try:
+                os.remove(f"{file_path}.part")
+            except OSError:
+                pass
+
+    @staticmethod
+    def _long_form_response(
+        sink,
+        file_path: Optional[str],
+        first_response: TTSResponse,
+        timings: List[TTSChunkTiming],
+        start_time: float,
+    ) -> TTSResponse:
+        """Build the long-form TTSResponse from the first chunk's metadata"""
+        if file_path:
+            sink.close()
+            os.replace(f"{file_path}.part", file_path)
+            audio_data = file_path
+        else:
+            audio_data = sink.getvalue()
+
+        return first_response.model_copy(update={
+            "audio_data": audio_data,
+            "file_path": file_path,
+            "duration_ms": None,
+            "process_time": time.time() - start_time,
+            "chunks": timings,
+        })
+
     def _get_voice(self, voice: Optional[str]) -> str:
         """Get voice to use, falling back to default"""
         return voice if voice is not None else self.default_voice
@@ -165,3 +593,6 @@ class TTSBase(ABC):
             f.write(audio_data)
 
         return abs_path
+
+
+instrument_class(TTSBase, "voice", _TTS_OPERATIONS)
@@ -0,0 +1,186 @@
+"""
+Long-form TTS helpers
+
+Splits long text into provider-sized chunks at sentence boundaries and
+stitches the synthesized audio chunks back into a single stream.
+"""
+
+import re
+import struct
+from typing import BinaryIO, List, Optional
+
+from .models import TTSValidationError
+
+# Sentence ends: Latin, Arabic and CJK terminators, followed by whitespace
+_SENTENCE_END = re.compile(r"(?<=[.!?؟。！？…])[\"'”’)\]]*\s+")
+# Weaker break points for sentences longer than a chunk
+_CLAUSE_END = re.compile(r"(?<=[,;:،؛，；])\s+")
+
+# Formats whose chunks can be joined by plain concatenation
+_CONCAT_FORMATS = {"mp3", "aac", "opus", "pcm", "ulaw"}
+
+
+def _split_long(sentence: str, max_chars: int) -> List[str]:
+    """Split a sentence longer than max_chars at clauses, then words."""
+    pieces = []
+    for clause in _CLAUSE_END.split(sentence):
+        while len(clause) > max_chars:
+            cut = clause.rfind(" ", 0, max_chars + 1)
+            if cut <= 0:
+                cut = max_chars
+            pieces.append(clause[:cut].strip())
+            clause = clause[cut:].strip()
+        if clause:
+            pieces.append(clause)
+    return _pack(pieces, max_chars)
+
+
+def _pack(pieces: List[str], max_chars: int) -> List[str]:
+    """Greedily join pieces into chunks of at most max_chars."""
+    chunks = []
+    current = ""
+    for piece in pieces:
+        if not current:
+            current = piece
+        elif len(current) + 1 + len(piece) <= max_chars:
+            current = f"{current} {piece}"
+        else:
+            chunks.append(current)
+            current = piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def split_text(text: str, max_chars: int) -> List[str]:
+    """
+    Split text into chunks of at most max_chars at sentence boundaries.
+
+    Sentences are kept whole where possible. A sentence longer than
+    max_chars is split at clause punctuation, then at word boundaries.
+
+    Args:
+        text: Text to split
+        max_chars: Maximum characters per chunk
+
+    Returns:
+        List of non-empty chunks in reading order
+
+    Example:
+        >>> split_text("One. Two. Three.", max_chars=9)
+        ['One. Two.', 'Three.']
+    """
+    if max_chars < 1:
+        raise TTSValidationError("max_chars must be >= 1")
+
+    pieces = []
+    for paragraph in re.split(r"\n\s*\n", text):
+        for sentence in _SENTENCE_END.split(paragraph.strip()):
+            sentence = " ".join(sentence.split())
+            if not sentence:
+                continue
+            if len(sentence) > max_chars:
+                pieces.extend(_split_long(sentence, max_chars))
+            else:
+                pieces.append(sentence)
+
+    return _pack(pieces, max_chars)
+
+
+def _parse_wav(data: bytes):
+    """
+    Split a WAV file into its fmt chunk and audio samples.
+
+    Returns:
+        tuple: (fmt chunk bytes including its header, sample bytes)
+    """
+    if len(data) < 12 or data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        raise TTSValidationError("Cannot stitch audio: chunk is not a WAV file")
+
+    fmt_chunk = None
+    offset = 12
+    while offset + 8 <= len(data):
+        chunk_id = data[offset:offset + 4]
+        size = struct.unpack("<I", data[offset + 4:offset + 8])[0]
+        body = offset + 8
+        if chunk_id == b"fmt ":
+            fmt_chunk = data[offset:body + size]
+        elif chunk_id == b"data":
+            # Streamed WAVs may carry a placeholder size, so read to the end
+            end = body + size if body + size <= len(data) else len(data)
+            if fmt_chunk is None:
+                break
+            return fmt_chunk, data[body:end]
+        offset = body + size + (size & 1)
+
+    raise TTSValidationError("Cannot stitch audio: WAV chunk has no fmt or data section")
+
+
+def check_stitchable(audio_format: str) -> None:
+    """
+    Raise if chunks in audio_format cannot be joined into one stream.
+
+    Raises:
+        TTSValidationError: For formats such as flac
+    """
+    audio_format = audio_format.lower()
+    if audio_format != "wav" and audio_format not in _CONCAT_FORMATS:
+        raise TTSValidationError(
+            f"Long-form synthesis cannot stitch '{audio_format}' audio. "
+            f"Use one of: wav, {', '.join(sorted(_CONCAT_FORMATS))}"
+        )
+
+
+class AudioStitcher:
+    """
+    Writes synthesized audio chunks, in order, into one output stream.
+
+    Compressed frame formats (mp3, aac, opus) and raw formats (pcm, ulaw)
+    are concatenated as-is. WAV chunks are merged into a single file with
+    one header whose sizes are patched by finish().
+
+    Args:
+        sink: Writable binary file object (seekable for WAV)
+        audio_format: Format name of the chunks (mp3, wav, pcm, ...)
+    """
+
+    def __init__(self, sink: BinaryIO, audio_format: str):
+        check_stitchable(audio_format)
+        self.sink = sink
+        self.audio_format = audio_format.lower()
+        self.bytes_written = 0
+        self._header_offset: Optional[int] = None
+        self._fmt_chunk: Optional[bytes] = None
+        self._data_size = 0
+
+    def _wav_header(self) -> bytes:
+        riff_size = 4 + len(self._fmt_chunk) + 8 + self._data_size
+        return (
+            b"RIFF" + struct.pack("<I", min(riff_size, 0xFFFFFFFF)) + b"WAVE"
+            + self._fmt_chunk
+            + b"data" + struct.pack("<I", min(self._data_size, 0xFFFFFFFF))
+        )
+
+    def write(self, audio_data: bytes) -> None:
+        """Append the next chunk of audio"""
+        if self.audio_format == "wav":
+            fmt_chunk, audio_data = _parse_wav(audio_data)
+            if self._fmt_chunk is None:
+                self._fmt_chunk = fmt_chunk
+                self._header_offset = self.sink.tell()
+                header = self._wav_header()
+                self.sink.write(header)
+                self.bytes_written += len(header)
+            self._data_size += len(audio_data)
+
+        self.sink.write(audio_data)
+        self.bytes_written += len(audio_data)
+
+    def finish(self) -> None:
+        """Finalize the stream (patches the WAV header sizes)"""
+        if self.audio_format == "wav" and self._fmt_chunk is not None:
+            end = self.sink.tell()
+            self.sink.seek(self._header_offset)
+            self.sink.write(self._wav_header())
+            self.sink.seek(end)
+        self.sink.flush()
@@ -30,6 +30,15 @@ class Voice(BaseModel):
     description: Optional[str] = None
 
 
+class TTSChunkTiming(BaseModel):
+    """Timing of one chunk in long-form synthesis"""
+    index: int
+    characters: int
+    start_offset: float  # Seconds after the long-form request started
+    process_time: float  # Seconds to synthesize this chunk
+    audio_bytes: int
+
+
 class TTSResponse(BaseModel):
     """Unified response model for TTS generation"""
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -42,6 +51,7 @@ class TTSResponse(BaseModel):
     file_path: Optional[str] = None
     provider: str
     process_time: Optional[float] = None  # Time in seconds to generate audio
+    time_to_first_byte: Optional[float] = None  # Seconds until the first audio chunk (streaming)
 
     # Provider-specific metadata
     instructions: Optional[str] = None  # OpenAI gpt-4o-mini-tts
@@ -59,6 +69,9 @@ class TTSResponse(BaseModel):
     custom_prompt: Optional[str] = None
     input_mode: Optional[int] = None  # 0=structured, 1=custom
 
+    # Long-form synthesis (one entry per chunk, in text order)
+    chunks: Optional[List[TTSChunkTiming]] = None
+
 
 # Exceptions
 
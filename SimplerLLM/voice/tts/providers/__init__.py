@@ -2,23 +2,18 @@
 TTS Providers
 
 Provider implementations for different TTS services.
+Each provider module (and its SDK) is imported on first access.
 """
 
-from .openai_tts import OpenAITTS
-from .lahajati_tts import LahajatiTTS
+from SimplerLLM.utils.lazy_imports import lazy_exports
 
-# Optional provider - only import if elevenlabs package is installed
-try:
-    from .elevenlabs_tts import ElevenLabsTTS
-    _has_elevenlabs = True
-except ImportError:
-    _has_elevenlabs = False
-    ElevenLabsTTS = None
+_EXPORTS = {
+    'OpenAITTS': '.openai_tts',
+    'LahajatiTTS': '.lahajati_tts',
+    'ElevenLabsTTS': '.elevenlabs_tts',
+}
 
-__all__ = [
-    'OpenAITTS',
-    'LahajatiTTS',
-]
+# Optional provider - None if the elevenlabs package is not installed
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, optional=['ElevenLabsTTS'])
 
-if _has_elevenlabs:
-    __all__.append('ElevenLabsTTS')
+__all__ = list(_EXPORTS)
@@ -6,12 +6,11 @@ Implements TTS using ElevenLabs API.
 
 from elevenlabs import ElevenLabs, VoiceSettings
 from elevenlabs.client import AsyncElevenLabs
-from dotenv import load_dotenv
 import asyncio
 import os
 import time
 import warnings
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
 from ..base import TTSBase
 from ..models import (
@@ -24,9 +23,8 @@ from ..models import (
     ELEVENLABS_MODELS,
     ELEVENLABS_FORMATS,
 )
+from SimplerLLM.instrumentation.core import record_retry
 
-# Load environment variables
-load_dotenv(override=True)
 
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", 3))
 RETRY_DELAY = int(os.getenv("RETRY_DELAY", 2))
@@ -43,6 +41,9 @@ class ElevenLabsTTS(TTSBase):
                      eleven_multilingual_v2, eleven_monolingual_v1
     """
 
+    # Lowest per-request limit across the supported models
+    MAX_INPUT_CHARS = 10000
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -265,6 +266,7 @@ class ElevenLabsTTS(TTSBase):
                 raise
             except Exception as e:
                 if attempt < MAX_RETRIES - 1:
+                    record_retry()
                     time.sleep(RETRY_DELAY * (2 ** attempt))
                 else:
                     raise TTSProviderError(
@@ -380,6 +382,7 @@ class ElevenLabsTTS(TTSBase):
                 raise
             except Exception as e:
                 if attempt < MAX_RETRIES - 1:
+                    record_retry()
                     await asyncio.sleep(RETRY_DELAY * (2 ** attempt))
                 else:
                     raise TTSProviderError(
@@ -387,6 +390,170 @@ class ElevenLabsTTS(TTSBase):
                         provider=self.provider.value,
                     )
 
+    def _speech_request(
+        self,
+        text: str,
+        voice: Optional[str],
+        model: Optional[str],
+        speed: float,
+        output_format: str,
+        language_code: Optional[str],
+        stability: Optional[float],
+        similarity_boost: Optional[float],
+        style: Optional[float],
+        seed: Optional[int],
+    ) -> Dict[str, Any]:
+        """Validate parameters and build the text-to-speech request kwargs"""
+        voice = self._get_voice(voice)
+        model = self._get_model(model)
+        output_format = self._map_output_format(output_format)
+
+        if speed != 1.0:
+            warnings.warn(
+                "Speed parameter is not supported by ElevenLabs and will be ignored",
+                UserWarning,
+                stacklevel=3
+            )
+
+        self._validate_params(text, model, None, output_format, stability, similarity_boost, style)
+
+        request_kwargs = {
+            "voice_id": voice,
+            "text": text,
+            "model_id": model,
+            "output_format": output_format,
+        }
+
+        if any([stability is not None, similarity_boost is not None, style is not None]):
+            request_kwargs["voice_settings"] = VoiceSettings(
+                stability=stability if stability is not None else 0.5,
+                similarity_boost=similarity_boost if similarity_boost is not None else 0.75,
+                style=style if style is not None else 0.0,
+                use_speaker_boost=True,
+            )
+
+        if language_code:
+            request_kwargs["language_code"] = language_code
+
+        if seed is not None:
+            request_kwargs["seed"] = seed
+
+        return request_kwargs
+
+    def generate_speech_stream(
+        self,
+        text: str,
+        *,
+        voice: Optional[str] = None,
+        model: Optional[str] = None,
+        speed: float = 1.0,
+        output_format: str = "mp3",
+        language_code: Optional[str] = None,
+        stability: Optional[float] = None,
+        similarity_boost: Optional[float] = None,
+        style: Optional[float] = None,
+        seed: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        **kwargs,
+    ) -> Iterator[bytes]:
+        """
+        Generate speech and yield audio chunks as they arrive.
+
+        Uses the ElevenLabs streaming endpoint. eleven_flash_v2_5 with a
+        pcm or ulaw format gives the lowest time to first byte. Connection
+        errors are retried until the first chunk arrives.
+
+        Args:
+            text: Text to convert to speech
+            voice: Voice ID to use
+            model: Model to use (eleven_flash_v2_5, eleven_turbo_v2, etc.)
+            output_format: Audio format (mp3, pcm, opus, or full format string)
+            language_code: ISO 639-1 language code (e.g., "en", "es", "fr")
+            stability: Voice stability 0-1
+            similarity_boost: Similarity boost 0-1
+            style: Style exaggeration 0-1
+            seed: Seed for reproducibility
+            chunk_size: Ignored, chunks are yielded as the SDK delivers them
+
+        Yields:
+            Audio bytes in playback order
+        """
+        request_kwargs = self._speech_request(
+            text, voice, model, speed, output_format, language_code,
+            stability, similarity_boost, style, seed,
+        )
+
+        for attempt in range(MAX_RETRIES):
+            started = False
+            try:
+                for chunk in self.client.text_to_speech.stream(**request_kwargs):
+                    if chunk:
+                        started = True
+                        yield chunk
+                return
+            except Exception as e:
+                if started or attempt == MAX_RETRIES - 1:
+                    raise TTSProviderError(
+                        f"Failed to stream speech: {e}",
+                        provider=self.provider.value,
+                    )
+                record_retry()
+                time.sleep(RETRY_DELAY * (2 ** attempt))
+
+    async def generate_speech_stream_async(
+        self,
+        text: str,
+        *,
+        voice: Optional[str] = None,
+        model: Optional[str] = None,
+        speed: float = 1.0,
+        output_format: str = "mp3",
+        language_code: Optional[str] = None,
+        stability: Optional[float] = None,
+        similarity_boost: Optional[float] = None,
+        style: Optional[float] = None,
+        seed: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        **kwargs,
+    ) -> AsyncIterator[bytes]:
+        """
+        Async version: Generate speech and yield audio chunks as they arrive.
+
+        Args:
+            Same as generate_speech_stream()
+
+        Yields:
+            Audio bytes in playback order
+        """
+        request_kwargs = self._speech_request(
+            text, voice, model, speed, output_format, language_code,
+            stability, similarity_boost, style, seed,
+        )
+
+        for attempt in range(MAX_RETRIES):
+            started = False
+            try:
+                # Returns an async generator directly, no await needed
+                async for chunk in self.async_client.text_to_speech.stream(**request_kwargs):
+                    if chunk:
+                        started = True
+                        yield chunk
+                return
+            except Exception as e:
+                if started or attempt == MAX_RETRIES - 1:
+                    raise TTSProviderError(
+                        f"Failed to stream speech: {e}",
+                        provider=self.provider.value,
+                    )
+                record_retry()
+                await asyncio.sleep(RETRY_DELAY * (2 ** attempt))
+
+    def _stream_metadata(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        metadata = super()._stream_metadata(kwargs)
+        # Extract format name from full format string
+        metadata["format"] = self._map_output_format(metadata["format"]).split("_")[0]
+        return metadata
+
     def list_voices(self, use_cache: bool = True) -> List[Voice]:
         """
         List all available ElevenLabs voices.
@@ -9,8 +9,7 @@ import httpx
 import asyncio
 import os
 import time
-from typing import List, Optional, Dict, Any
-from dotenv import load_dotenv
+from typing import List, Optional, Dict, Any, AsyncIterator, Iterator
 
 from ..base import TTSBase
 from ..models import (
@@ -25,9 +24,8 @@ from ..models import (
     LAHAJATI_FORMATS,
     LAHAJATI_INPUT_MODES,
 )
+from SimplerLLM.instrumentation.core import record_retry
 
-# Load environment variables
-load_dotenv(override=True)
 
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", 3))
 RETRY_DELAY = int(os.getenv("RETRY_DELAY", 2))
@@ -256,6 +254,7 @@ class LahajatiTTS(TTSBase):
                 raise
             except httpx.TimeoutException:
                 if attempt < MAX_RETRIES - 1:
+                    record_retry()
                     time.sleep(RETRY_DELAY * (2 ** attempt))
                 else:
                     raise TTSProviderError(
@@ -264,6 +263,7 @@ class LahajatiTTS(TTSBase):
                     )
             except Exception as e:
                 if attempt < MAX_RETRIES - 1:
+                    record_retry()
                     time.sleep(RETRY_DELAY * (2 ** attempt))
                 else:
                     raise TTSProviderError(
@@ -381,6 +381,7 @@ class LahajatiTTS(TTSBase):
                 raise
             except httpx.TimeoutException:
                 if attempt < MAX_RETRIES - 1:
+                    record_retry()
                     await asyncio.sleep(RETRY_DELAY * (2 ** attempt))
                 else:
                     raise TTSProviderError(
@@ -389,6 +390,7 @@ class LahajatiTTS(TTSBase):
                     )
             except Exception as e:
                 if attempt < MAX_RETRIES - 1:
+                    record_retry()
                     await asyncio.sleep(RETRY_DELAY * (2 ** attempt))
                 else:
                     raise TTSProviderError(
@@ -396,6 +398,180 @@ class LahajatiTTS(TTSBase):
                         provider=self.provider.value,
                     )
 
+    def _speech_request(
+        self,
+        text: str,
+        voice: Optional[str],
+        input_mode: int,
+        dialect_id: Optional[str],
+        performance_id: Optional[str],
+        custom_prompt: Optional[str],
+    ) -> Dict[str, Any]:
+        """Validate parameters and build the request body"""
+        voice = self._get_voice(voice)
+        if not voice:
+            raise TTSValidationError("Voice ID is required for Lahajati TTS")
+
+        self._validate_params(text, input_mode, custom_prompt, dialect_id, performance_id)
+
+        # Note: input_mode must be sent as string per API spec
+        request_body: Dict[str, Any] = {
+            "text": text,
+            "id_voice": voice,
+            "input_mode": str(input_mode),
+        }
+        if input_mode == 0:
+            request_body["dialect_id"] = str(dialect_id)
+            request_body["performance_id"] = str(performance_id)
+        else:
+            request_body["custom_prompt_text"] = custom_prompt
+        return request_body
+
+    def _check_stream_status(self, response: httpx.Response) -> None:
+        """Raise for an error response (its body must already be read)"""
+        if response.status_code == 401:
+            raise TTSProviderError(
+                "Unauthorized: Invalid API key",
+                provider=self.provider.value,
+                status_code=401,
+            )
+        elif response.status_code == 422:
+            raise TTSValidationError(
+                f"Validation error: {response.text}"
+            )
+        elif response.status_code != 200:
+            raise TTSProviderError(
+                f"API error: {response.status_code} - {response.text}",
+                provider=self.provider.value,
+                status_code=response.status_code,
+            )
+
+    def generate_speech_stream(
+        self,
+        text: str,
+        *,
+        voice: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        input_mode: int = 0,
+        dialect_id: Optional[str] = None,
+        performance_id: Optional[str] = None,
+        custom_prompt: Optional[str] = None,
+        **kwargs,
+    ) -> Iterator[bytes]:
+        """
+        Generate speech and yield mp3 chunks as they arrive.
+
+        Network errors and timeouts are retried until the first chunk
+        arrives; a failure after that raises TTSProviderError.
+
+        Args:
+            text: Text to convert to speech (Arabic text recommended)
+            voice: Voice ID to use
+            chunk_size: Buffer chunks to this many bytes (None yields data as
+                it arrives, for the lowest latency)
+            input_mode: 0 for structured mode, 1 for custom mode
+            dialect_id: Dialect ID for structured mode
+            performance_id: Performance style ID for structured mode
+            custom_prompt: Custom instructions for custom mode
+
+        Yields:
+            Audio bytes in playback order
+        """
+        request_body = self._speech_request(
+            text, voice, input_mode, dialect_id, performance_id, custom_prompt
+        )
+
+        for attempt in range(MAX_RETRIES):
+            started = False
+            try:
+                with self.client.stream(
+                    "POST",
+                    "/text-to-speech-absolute-control",
+                    json=request_body,
+                ) as response:
+                    if response.status_code != 200:
+                        response.read()
+                        self._check_stream_status(response)
+                    for chunk in response.iter_bytes(chunk_size):
+                        if chunk:
+                            started = True
+                            yield chunk
+                return
+            except (TTSValidationError, TTSProviderError):
+                raise
+            except Exception as e:
+                if started or attempt == MAX_RETRIES - 1:
+                    raise TTSProviderError(
+                        f"Failed to stream speech: {e}",
+                        provider=self.provider.value,
+                    )
+                record_retry()
+                time.sleep(RETRY_DELAY * (2 ** attempt))
+
+    async def generate_speech_stream_async(
+        self,
+        text: str,
+        *,
+        voice: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        input_mode: int = 0,
+        dialect_id: Optional[str] = None,
+        performance_id: Optional[str] = None,
+        custom_prompt: Optional[str] = None,
+        **kwargs,
+    ) -> AsyncIterator[bytes]:
+        """
+        Async version: Generate speech and yield mp3 chunks as they arrive.
+
+        Args:
+            Same as generate_speech_stream()
+
+        Yields:
+            Audio bytes in playback order
+        """
+        request_body = self._speech_request(
+            text, voice, input_mode, dialect_id, performance_id, custom_prompt
+        )
+
+        for attempt in range(MAX_RETRIES):
+            started = False
+            try:
+                async with self.async_client.stream(
+                    "POST",
+                    "/text-to-speech-absolute-control",
+                    json=request_body,
+                ) as response:
+                    if response.status_code != 200:
+                        await response.aread()
+                        self._check_stream_status(response)
+                    async for chunk in response.aiter_bytes(chunk_size):
+                        if chunk:
+                            started = True
+                            yield chunk
+                return
+            except (TTSValidationError, TTSProviderError):
+                raise
+            except Exception as e:
+                if started or attempt == MAX_RETRIES - 1:
+                    raise TTSProviderError(
+                        f"Failed to stream speech: {e}",
+                        provider=self.provider.value,
+                    )
+                record_retry()
+                await asyncio.sleep(RETRY_DELAY * (2 ** attempt))
+
+    def _stream_metadata(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        input_mode = kwargs.get("input_mode", 0)
+        return {
+            "model": "lahajati-tts",
+            "voice": self._get_voice(kwargs.get("voice")) or "",
+            "format": "mp3",
+            "dialect_id": kwargs.get("dialect_id"),
+            "performance_id": kwargs.get("performance_id"),
+            "custom_prompt": kwargs.get("custom_prompt") if input_mode == 1 else None,
+            "input_mode": input_mode,
+        }
+
     def list_voices(self, use_cache: bool = True) -> List[Voice]:
         """
         List all available Lahajati voices.
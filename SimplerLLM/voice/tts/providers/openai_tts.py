@@ -5,11 +5,10 @@ Implements TTS using OpenAI's Audio API.
 """
 
 from openai import OpenAI, AsyncOpenAI
-from dotenv import load_dotenv
 import asyncio
 import os
 import time
-from typing import List, Optional
+from typing import AsyncIterator, Iterator, List, Optional
 
 from ..base import TTSBase
 from ..models import (
@@ -23,9 +22,8 @@ from ..models import (
     OPENAI_MODELS,
     OPENAI_FORMATS,
 )
+from SimplerLLM.instrumentation.core import record_retry
 
-# Load environment variables
-load_dotenv(override=True)
 
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", 3))
 RETRY_DELAY = int(os.getenv("RETRY_DELAY", 2))
@@ -55,6 +53,8 @@ class OpenAITTS(TTSBase):
     Supports models: tts-1, tts-1-hd, gpt-4o-mini-tts
     """
 
+    MAX_INPUT_CHARS = 4096
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -219,6 +219,7 @@ class OpenAITTS(TTSBase):
                 raise
             except Exception as e:
                 if attempt < MAX_RETRIES - 1:
+                    record_retry()
                     time.sleep(RETRY_DELAY * (2 ** attempt))
                 else:
                     raise TTSProviderError(
@@ -304,6 +305,7 @@ class OpenAITTS(TTSBase):
                 raise
             except Exception as e:
                 if attempt < MAX_RETRIES - 1:
+                    record_retry()
                     await asyncio.sleep(RETRY_DELAY * (2 ** attempt))
                 else:
                     raise TTSProviderError(
@@ -311,6 +313,128 @@ class OpenAITTS(TTSBase):
                         provider=self.provider.value,
                     )
 
+    def _speech_request(
+        self,
+        text: str,
+        voice: Optional[str],
+        model: Optional[str],
+        speed: float,
+        output_format: str,
+        instructions: Optional[str],
+    ) -> dict:
+        """Validate parameters and build the speech request kwargs"""
+        voice = self._get_voice(voice)
+        model = self._get_model(model)
+        self._validate_params(text, voice, model, speed, output_format, instructions)
+
+        request_kwargs = {
+            "model": model,
+            "voice": voice,
+            "input": text,
+            "speed": speed,
+            "response_format": output_format,
+        }
+        if instructions and model == "gpt-4o-mini-tts":
+            request_kwargs["instructions"] = instructions
+        return request_kwargs
+
+    def generate_speech_stream(
+        self,
+        text: str,
+        *,
+        voice: Optional[str] = None,
+        model: Optional[str] = None,
+        speed: float = 1.0,
+        output_format: str = "mp3",
+        instructions: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        **kwargs,
+    ) -> Iterator[bytes]:
+        """
+        Generate speech and yield audio chunks as they arrive.
+
+        Use output_format="pcm" (24kHz 16-bit mono) or "opus" for the lowest
+        playback latency. Connection errors are retried until the first
+        chunk arrives; a failure after that raises TTSProviderError.
+
+        Args:
+            text: Text to convert to speech
+            voice: Voice to use
+            model: Model to use
+            speed: Speech speed from 0.25 to 4.0 (default: 1.0)
+            output_format: Audio format (mp3, opus, aac, flac, wav, pcm)
+            instructions: Voice instructions (only for gpt-4o-mini-tts)
+            chunk_size: Buffer chunks to this many bytes (None yields data as
+                it arrives, for the lowest latency)
+
+        Yields:
+            Audio bytes in playback order
+
+        Example:
+            >>> for chunk in tts.generate_speech_stream("Hello!", output_format="pcm"):
+            ...     player.write(chunk)
+        """
+        request_kwargs = self._speech_request(text, voice, model, speed, output_format, instructions)
+
+        for attempt in range(MAX_RETRIES):
+            started = False
+            try:
+                with self.client.audio.speech.with_streaming_response.create(**request_kwargs) as response:
+                    for chunk in response.iter_bytes(chunk_size):
+                        if chunk:
+                            started = True
+                            yield chunk
+                return
+            except Exception as e:
+                if started or attempt == MAX_RETRIES - 1:
+                    raise TTSProviderError(
+                        f"Failed to stream speech: {e}",
+                        provider=self.provider.value,
+                    )
+                record_retry()
+                time.sleep(RETRY_DELAY * (2 ** attempt))
+
+    async def generate_speech_stream_async(
+        self,
+        text: str,
+        *,
+        voice: Optional[str] = None,
+        model: Optional[str] = None,
+        speed: float = 1.0,
+        output_format: str = "mp3",
+        instructions: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        **kwargs,
+    ) -> AsyncIterator[bytes]:
+        """
+        Async version: Generate speech and yield audio chunks as they arrive.
+
+        Args:
+            Same as generate_speech_stream()
+
+        Yields:
+            Audio bytes in playback order
+        """
+        request_kwargs = self._speech_request(text, voice, model, speed, output_format, instructions)
+
+        for attempt in range(MAX_RETRIES):
+            started = False
+            try:
+                async with self.async_client.audio.speech.with_streaming_response.create(**request_kwargs) as response:
+                    async for chunk in response.iter_bytes(chunk_size):
+                        if chunk:
+                            started = True
+                            yield chunk
+                return
+            except Exception as e:
+                if started or attempt == MAX_RETRIES - 1:
+                    raise TTSProviderError(
+                        f"Failed to stream speech: {e}",
+                        provider=self.provider.value,
+                    )
+                record_retry()
+                await asyncio.sleep(RETRY_DELAY * (2 ** attempt))
+
     def list_voices(self) -> List[Voice]:
         """
         List all available OpenAI TTS voices.
@@ -0,0 +1,141 @@
+"""
+Import-time benchmark for SimplerLLM.
+
+Runs `python -X importtime -c "import SimplerLLM"` in fresh interpreters,
+reports the cumulative import time of the package and the slowest
+modules it pulled in, and fails when the median is over budget or when a
+heavy dependency (a provider SDK or loader library) is imported eagerly.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --budget-ms 50 --runs 10
+    python benchmarks/import_time.py --statement "from SimplerLLM import LLM" --allow-heavy
+
+Exit code is 1 when the budget is exceeded or a heavy module is imported.
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from typing import List, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_BUDGET_MS = float(os.getenv("SIMPLERLLM_IMPORT_BUDGET_MS", 100))
+
+# Modules that must only load on first use, never on `import SimplerLLM`
+HEAVY_MODULES = [
+    "openai",
+    "anthropic",
+    "elevenlabs",
+    "voyageai",
+    "cohere",
+    "aiohttp",
+    "httpx",
+    "requests",
+    "tiktoken",
+    "newspaper",
+    "PyPDF2",
+    "docx",
+    "numpy",
+    "pydantic",
+    "PIL",
+    "pydub",
+]
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+def run_once(statement: str) -> List[Tuple[int, int, int, str]]:
+    """
+    Run statement in a fresh interpreter with -X importtime.
+
+    Returns:
+        List of (self_us, cumulative_us, depth, module) in report order
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = REPO_ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=REPO_ROOT,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Import failed:\n{result.stderr}")
+
+    entries = []
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append((int(self_us), int(cumulative_us), len(indent) // 2, module))
+    return entries
+
+
+def statement_entries(entries, startup_count: int):
+    """Drop the interpreter start-up imports, keeping those of the statement."""
+    return entries[startup_count:]
+
+
+def total_time_us(entries) -> int:
+    """Cumulative microseconds of all top-level imports."""
+    return sum(cumulative for _, cumulative, depth, _ in entries if depth == 0)
+
+
+def slowest(entries, count: int) -> List[Tuple[int, str]]:
+    """Modules with the highest self time."""
+    return sorted(((self_us, module) for self_us, _, _, module in entries), reverse=True)[:count]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--statement", default="import SimplerLLM",
+                        help="Python statement to time (default: import SimplerLLM)")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to run")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="Maximum median import time in milliseconds")
+    parser.add_argument("--top", type=int, default=10, help="Slowest modules to list")
+    parser.add_argument("--allow-heavy", action="store_true",
+                        help="Do not fail when heavy modules are imported")
+    args = parser.parse_args(argv)
+
+    # Imports the interpreter makes before running any statement
+    startup_count = len(run_once("pass"))
+
+    timings: List[float] = []
+    entries = []
+    for _ in range(args.runs):
+        entries = statement_entries(run_once(args.statement), startup_count)
+        timings.append(total_time_us(entries) / 1000)
+
+    median_ms = statistics.median(timings)
+    print(f"Statement: {args.statement}")
+    print(f"Import time over {args.runs} runs: "
+          f"median {median_ms:.1f} ms, min {min(timings):.1f} ms, max {max(timings):.1f} ms")
+
+    print("\nSlowest modules (self time, last run):")
+    for self_us, module in slowest(entries, args.top):
+        print(f"  {self_us / 1000:8.2f} ms  {module}")
+
+    imported = {module for _, _, _, module in entries}
+    loaded = [name for name in HEAVY_MODULES if name in imported]
+
+    failed = False
+    if loaded:
+        print(f"\nHeavy modules imported eagerly: {', '.join(loaded)}")
+        failed = not args.allow_heavy
+    if median_ms > args.budget_ms:
+        print(f"\nOver budget: {median_ms:.1f} ms > {args.budget_ms:.1f} ms")
+        failed = True
+
+    print("\nFAIL" if failed else "\nOK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,807 @@
+"""
+Local stand-in for the provider HTTP APIs, for offline benchmarks and
+batch job tests.
+
+Emulates the endpoints SimplerLLM calls on OpenAI (chat completions,
+embeddings, speech, files and batches), Anthropic (messages and message
+batches), Gemini (generateContent) and Ollama (chat), with configurable
+latency, jitter, streaming and error rates. Batches end batch_delay_ms
+after they are created; each request in them fails at the provider's
+error rate. Point SimplerLLM at it through the usual environment variables
+(see MockProviderServer.env()), so the code under test is unchanged.
+
+Usage:
+    python benchmarks/mock_server.py --port 8765 --latency-ms 50
+    python benchmarks/mock_server.py --error-rate 0.1 --stream-chunks 16
+    python benchmarks/mock_server.py --batch-delay-ms 5000
+
+Control endpoints:
+    GET  /_mock/health   liveness check
+    GET  /_mock/stats    requests and injected errors per provider
+    POST /_mock/config   update the configuration (JSON body, partial)
+    POST /_mock/reset    clear the stats
+"""
+
+import argparse
+import base64
+import email.parser
+import email.policy
+import itertools
+import json
+import random
+import re
+import sys
+import threading
+import time
+import zlib
+from dataclasses import asdict, dataclass, field, fields
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+
+@dataclass
+class MockConfig:
+    """
+    Behaviour of the stand-in server.
+
+    Attributes:
+        latency_ms: Delay before the first byte of every response
+        jitter_ms: Random +/- variation added to latency_ms
+        error_rate: Fraction of requests answered with error_status
+        error_status: HTTP status of injected errors
+        provider_error_rates: Per-provider error rates (openai, anthropic,
+            gemini, ollama, embeddings, speech), overriding error_rate
+        stream_chunks: Number of chunks a streamed reply is split into
+        chunk_delay_ms: Delay between streamed chunks
+        reply: Text every chat endpoint answers with
+        embedding_dimension: Size of the returned embedding vectors
+        audio_bytes: Size of the returned speech audio
+        batch_delay_ms: Time from creating a batch until it ends
+    """
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 500
+    provider_error_rates: Dict[str, float] = field(default_factory=dict)
+    stream_chunks: int = 8
+    chunk_delay_ms: float = 0.0
+    reply: str = "This is a mock response from the local benchmark server."
+    embedding_dimension: int = 256
+    audio_bytes: int = 32000
+    batch_delay_ms: float = 0.0
+
+    def update(self, changes: Dict[str, Any]) -> None:
+        """Apply a partial configuration, rejecting unknown keys."""
+        known = {f.name for f in fields(self)}
+        unknown = set(changes) - known
+        if unknown:
+            raise ValueError(f"Unknown mock config keys: {', '.join(sorted(unknown))}")
+        for key, value in changes.items():
+            setattr(self, key, value)
+
+
+def _count_tokens(text: str) -> int:
+    return max(1, len(text.split()))
+
+
+def _message_text(messages: List[Dict[str, Any]]) -> str:
+    parts = []
+    for message in messages or []:
+        content = message.get("content")
+        if isinstance(content, str):
+            parts.append(content)
+        elif isinstance(content, list):
+            parts.extend(p.get("text", "") for p in content if isinstance(p, dict))
+    return " ".join(parts)
+
+
+def _split(text: str, count: int) -> List[str]:
+    count = max(1, min(count, len(text))) if text else 1
+    size = -(-len(text) // count) if text else 1
+    return [text[i:i + size] for i in range(0, len(text), size)] or [""]
+
+
+def _embedding(text: str, dimension: int) -> np.ndarray:
+    """Deterministic unit vector for text, so similar calls get equal vectors."""
+    rng = np.random.default_rng(zlib.crc32(text.encode("utf-8")))
+    vector = rng.standard_normal(dimension).astype(np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def _openai_completion(body: Dict[str, Any], reply: str) -> Dict[str, Any]:
+    prompt_tokens = _count_tokens(_message_text(body.get("messages")))
+    completion_tokens = _count_tokens(reply)
+    return {
+        "id": "chatcmpl-mock",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "mock-model"),
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": reply},
+            "finish_reason": "stop",
+        }],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        },
+    }
+
+
+def _anthropic_message(body: Dict[str, Any], reply: str) -> Dict[str, Any]:
+    return {
+        "id": "msg_mock",
+        "type": "message",
+        "role": "assistant",
+        "model": body.get("model", "mock-model"),
+        "content": [{"type": "text", "text": reply}],
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": {
+            "input_tokens": _count_tokens(_message_text(body.get("messages"))),
+            "output_tokens": _count_tokens(reply),
+        },
+    }
+
+
+def _rfc3339(timestamp: float) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(timestamp))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as separate writes; without TCP_NODELAY the
+    # client's delayed ACK adds ~40 ms to every response
+    disable_nagle_algorithm = True
+    server: "_Server"
+
+    def log_message(self, format, *args):
+        pass
+
+    # -- plumbing ----------------------------------------------------------
+
+    def _read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        return json.loads(body) if body else {}
+
+    def _send_json(self, status: int, payload: Any) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _start_stream(self, content_type: str) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+    def _write_chunk(self, data: bytes) -> None:
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+    def _end_stream(self) -> None:
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+    def _stream(self, content_type: str, pieces: List[bytes]) -> None:
+        config = self.server.config
+        self._start_stream(content_type)
+        for i, piece in enumerate(pieces):
+            if i and config.chunk_delay_ms:
+                time.sleep(config.chunk_delay_ms / 1000)
+            self._write_chunk(piece)
+        self._end_stream()
+
+    def _wait(self) -> None:
+        config = self.server.config
+        delay = config.latency_ms
+        if config.jitter_ms:
+            delay += random.uniform(-config.jitter_ms, config.jitter_ms)
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+    def _inject_error(self, provider: str) -> bool:
+        config = self.server.config
+        rate = config.provider_error_rates.get(provider, config.error_rate)
+        self.server.record(provider, error=False)
+        if not rate or random.random() >= rate:
+            return False
+        self.server.record(provider, error=True)
+        message = "Injected error from the mock provider server"
+        if provider == "anthropic":
+            payload = {"type": "error", "error": {"type": "api_error", "message": message}}
+        elif provider == "gemini":
+            payload = {"error": {"code": config.error_status, "message": message, "status": "INTERNAL"}}
+        elif provider == "ollama":
+            payload = {"error": message}
+        else:
+            payload = {"error": {"message": message, "type": "server_error", "code": None}}
+        self._send_json(config.error_status, payload)
+        return True
+
+    # -- routing -----------------------------------------------------------
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if path == "/_mock/health":
+            return self._send_json(200, {"status": "ok"})
+        if path == "/_mock/stats":
+            return self._send_json(200, self.server.stats())
+        if path == "/_mock/config":
+            return self._send_json(200, asdict(self.server.config))
+
+        match = re.search(r"/files/([^/]+)/content$", path)
+        if match:
+            return self._file_content(match.group(1))
+        match = re.search(r"/messages/batches/([^/]+)/results$", path)
+        if match:
+            return self._anthropic_batch_results(match.group(1))
+        if path.endswith("/messages/batches"):
+            return self._batch_list("anthropic", parse_qs(urlparse(self.path).query))
+        if path.endswith("/batches"):
+            return self._batch_list("openai", parse_qs(urlparse(self.path).query))
+        match = re.search(r"/batches/([^/]+)$", path)
+        if match:
+            return self._batch_retrieve(match.group(1))
+        self._send_json(404, {"error": {"message": f"Unknown path {path}"}})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        path = url.path
+        if path.endswith("/files"):
+            return self._openai_upload()
+        try:
+            body = self._read_json()
+        except ValueError:
+            return self._send_json(400, {"error": {"message": "Invalid JSON body"}})
+
+        if path == "/_mock/config":
+            try:
+                self.server.config.update(body)
+            except ValueError as e:
+                return self._send_json(400, {"error": {"message": str(e)}})
+            return self._send_json(200, asdict(self.server.config))
+        if path == "/_mock/reset":
+            self.server.reset()
+            return self._send_json(200, {"status": "ok"})
+
+        match = re.search(r"/batches/([^/]+)/cancel$", path)
+        if match:
+            return self._batch_cancel(match.group(1))
+        if path.endswith("/messages/batches"):
+            return self._anthropic_batch_create(body)
+        if path.endswith("/batches"):
+            return self._openai_batch_create(body)
+        if path.endswith("/chat/completions"):
+            return self._openai_chat(body)
+        if path.endswith("/embeddings"):
+            return self._openai_embeddings(body)
+        if path.endswith("/audio/speech"):
+            return self._openai_speech(body)
+        if path.endswith("/messages"):
+            return self._anthropic_messages(body)
+        match = re.search(r"/models/([^/:]+):(generateContent|streamGenerateContent)$", path)
+        if match:
+            stream = match.group(2) == "streamGenerateContent"
+            return self._gemini_generate(body, match.group(1), stream, parse_qs(url.query))
+        if path.endswith("/api/chat"):
+            return self._ollama_chat(body)
+        self._send_json(404, {"error": {"message": f"Unknown path {path}"}})
+
+    # -- providers ---------------------------------------------------------
+
+    def _openai_chat(self, body):
+        if self._inject_error("openai"):
+            return
+        self._wait()
+        completion = _openai_completion(body, self.server.config.reply)
+
+        if body.get("stream"):
+            events = []
+            for piece in _split(self.server.config.reply, self.server.config.stream_chunks):
+                chunk = {
+                    "id": "chatcmpl-mock", "object": "chat.completion.chunk", "created": completion["created"],
+                    "model": completion["model"],
+                    "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}],
+                }
+                events.append(b"data: " + json.dumps(chunk).encode() + b"\n\n")
+            final = {
+                "id": "chatcmpl-mock", "object": "chat.completion.chunk", "created": completion["created"],
+                "model": completion["model"], "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+                "usage": completion["usage"],
+            }
+            events.append(b"data: " + json.dumps(final).encode() + b"\n\ndata: [DONE]\n\n")
+            return self._stream("text/event-stream", events)
+
+        self._send_json(200, completion)
+
+    def _openai_embeddings(self, body):
+        if self._inject_error("embeddings"):
+            return
+        self._wait()
+        texts = body.get("input") or []
+        if isinstance(texts, str):
+            texts = [texts]
+        dimension = body.get("dimensions") or self.server.config.embedding_dimension
+        as_base64 = body.get("encoding_format") == "base64"
+
+        data = []
+        for index, text in enumerate(texts):
+            vector = _embedding(str(text), dimension)
+            embedding = (
+                base64.b64encode(vector.tobytes()).decode("ascii") if as_base64 else vector.tolist()
+            )
+            data.append({"object": "embedding", "index": index, "embedding": embedding})
+        tokens = sum(_count_tokens(str(text)) for text in texts)
+        self._send_json(200, {
+            "object": "list",
+            "data": data,
+            "model": body.get("model", "mock-embedding"),
+            "usage": {"prompt_tokens": tokens, "total_tokens": tokens},
+        })
+
+    def _openai_speech(self, body):
+        if self._inject_error("speech"):
+            return
+        self._wait()
+        audio = b"\x00" * self.server.config.audio_bytes
+        size = -(-len(audio) // max(1, self.server.config.stream_chunks))
+        self._stream("audio/mpeg", [audio[i:i + size] for i in range(0, len(audio), size)])
+
+    def _anthropic_messages(self, body):
+        if self._inject_error("anthropic"):
+            return
+        self._wait()
+        reply = self.server.config.reply
+        message = _anthropic_message(body, reply)
+
+        if body.get("stream"):
+            def event(name, data):
+                return f"event: {name}\ndata: {json.dumps(data)}\n\n".encode()
+
+            start = {**message, "content": [], "stop_reason": None,
+                     "usage": {"input_tokens": message["usage"]["input_tokens"], "output_tokens": 0}}
+            events = [event("message_start", {"type": "message_start", "message": start})]
+            events.append(event("content_block_start", {
+                "type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}}))
+            for piece in _split(reply, self.server.config.stream_chunks):
+                events.append(event("content_block_delta", {
+                    "type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": piece}}))
+            events.append(event("content_block_stop", {"type": "content_block_stop", "index": 0}))
+            events.append(event("message_delta", {
+                "type": "message_delta", "delta": {"stop_reason": "end_turn"},
+                "usage": {"output_tokens": message["usage"]["output_tokens"]}}))
+            events.append(event("message_stop", {"type": "message_stop"}))
+            return self._stream("text/event-stream", events)
+
+        self._send_json(200, message)
+
+    # -- batches -----------------------------------------------------------
+
+    def _openai_upload(self):
+        if self._inject_error("batches"):
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        header = f"Content-Type: {self.headers.get('Content-Type', '')}\r\n\r\n".encode()
+        message = email.parser.BytesParser(policy=email.policy.default).parsebytes(header + raw)
+
+        fields = {}
+        for part in message.iter_parts():
+            name = part.get_param("name", header="content-disposition")
+            fields[name] = (part.get_filename(), part.get_payload(decode=True) or b"")
+        if "file" not in fields:
+            return self._send_json(400, {"error": {"message": "Missing file", "type": "invalid_request_error"}})
+
+        filename, content = fields["file"]
+        purpose = fields.get("purpose", (None, b"batch"))[1].decode()
+        file_id = self.server.add_file(content)
+        self._send_json(200, {
+            "id": file_id, "object": "file", "bytes": len(content), "created_at": int(time.time()),
+            "filename": filename or "upload.jsonl", "purpose": purpose,
+        })
+
+    def _file_content(self, file_id):
+        content = self.server.files.get(file_id)
+        if content is None:
+            return self._send_json(404, {"error": {"message": f"No such file: {file_id}"}})
+        self._stream("application/jsonl", [content[i:i + 65536] for i in range(0, len(content), 65536)] or [b""])
+
+    def _openai_batch_create(self, body):
+        if self._inject_error("batches"):
+            return
+        content = self.server.files.get(body.get("input_file_id"))
+        if content is None:
+            return self._send_json(400, {"error": {
+                "message": f"No such file: {body.get('input_file_id')}", "type": "invalid_request_error"}})
+        requests = [json.loads(line) for line in content.splitlines() if line.strip()]
+        batch = self.server.add_batch("openai", requests, {
+            "object": "batch",
+            "endpoint": body.get("endpoint"),
+            "input_file_id": body.get("input_file_id"),
+            "completion_window": body.get("completion_window", "24h"),
+            "status": "in_progress",
+            "output_file_id": None,
+            "error_file_id": None,
+            "errors": None,
+            "created_at": int(time.time()),
+            "completed_at": None,
+            "cancelled_at": None,
+            "request_counts": {"total": len(requests), "completed": 0, "failed": 0},
+            "metadata": body.get("metadata"),
+        })
+        self._send_json(200, batch)
+
+    def _anthropic_batch_create(self, body):
+        if self._inject_error("batches"):
+            return
+        requests = body.get("requests") or []
+        if not requests:
+            return self._send_json(400, {"type": "error", "error": {
+                "type": "invalid_request_error", "message": "requests: must not be empty"}})
+        batch = self.server.add_batch("anthropic", requests, {
+            "type": "message_batch",
+            "processing_status": "in_progress",
+            "request_counts": {"processing": len(requests), "succeeded": 0, "errored": 0,
+                               "canceled": 0, "expired": 0},
+            "created_at": _rfc3339(time.time()),
+            "ended_at": None,
+            "cancel_initiated_at": None,
+            "results_url": None,
+        }, results_base=f"http://{self.headers.get('Host')}")
+        self._send_json(200, batch)
+
+    def _batch_retrieve(self, batch_id):
+        if self._inject_error("batches"):
+            return
+        batch = self.server.get_batch(batch_id)
+        if batch is None:
+            return self._send_json(404, {"error": {"message": f"No such batch: {batch_id}"}})
+        self._send_json(200, batch)
+
+    def _batch_list(self, kind, query):
+        if self._inject_error("batches"):
+            return
+        after = (query.get("after_id") or query.get("after") or [None])[0]
+        limit = int((query.get("limit") or [20])[0])
+        batches, has_more = self.server.list_batches(kind, after, limit)
+        if kind == "openai":
+            return self._send_json(200, {"object": "list", "data": batches, "has_more": has_more})
+        self._send_json(200, {
+            "data": batches, "has_more": has_more,
+            "first_id": batches[0]["id"] if batches else None,
+            "last_id": batches[-1]["id"] if batches else None,
+        })
+
+    def _batch_cancel(self, batch_id):
+        if self._inject_error("batches"):
+            return
+        batch = self.server.get_batch(batch_id, cancel=True)
+        if batch is None:
+            return self._send_json(404, {"error": {"message": f"No such batch: {batch_id}"}})
+        self._send_json(200, batch)
+
+    def _anthropic_batch_results(self, batch_id):
+        batch = self.server.get_batch(batch_id)
+        if batch is None or batch.get("results_url") is None:
+            return self._send_json(404, {"type": "error", "error": {
+                "type": "not_found_error", "message": f"No results for batch {batch_id}"}})
+        self._file_content(f"results-{batch_id}")
+
+    def _gemini_generate(self, body, model, stream, query):
+        if self._inject_error("gemini"):
+            return
+        self._wait()
+        reply = self.server.config.reply
+        prompt = " ".join(
+            part.get("text", "")
+            for content in body.get("contents", [])
+            for part in content.get("parts", [])
+            if isinstance(part, dict)
+        )
+        usage = {
+            "promptTokenCount": _count_tokens(prompt),
+            "candidatesTokenCount": _count_tokens(reply),
+            "totalTokenCount": _count_tokens(prompt) + _count_tokens(reply),
+        }
+
+        def response(text, finish):
+            candidate = {"content": {"role": "model", "parts": [{"text": text}]}, "index": 0}
+            if finish:
+                candidate["finishReason"] = "STOP"
+            return {"candidates": [candidate], "usageMetadata": usage, "modelVersion": model}
+
+        if stream:
+            pieces = _split(reply, self.server.config.stream_chunks)
+            payloads = [response(p, i == len(pieces) - 1) for i, p in enumerate(pieces)]
+            if query.get("alt") == ["sse"]:
+                events = [b"data: " + json.dumps(p).encode() + b"\r\n\r\n" for p in payloads]
+                return self._stream("text/event-stream", events)
+            return self._send_json(200, payloads)
+
+        self._send_json(200, response(reply, True))
+
+    def _ollama_chat(self, body):
+        if self._inject_error("ollama"):
+            return
+        self._wait()
+        reply = self.server.config.reply
+        model = body.get("model", "mock-model")
+        counts = {
+            "prompt_eval_count": _count_tokens(_message_text(body.get("messages"))),
+            "eval_count": _count_tokens(reply),
+        }
+
+        if body.get("stream", True):
+            lines = [
+                json.dumps({"model": model, "message": {"role": "assistant", "content": piece}, "done": False}).encode() + b"\n"
+                for piece in _split(reply, self.server.config.stream_chunks)
+            ]
+            lines.append(json.dumps({
+                "model": model, "message": {"role": "assistant", "content": ""},
+                "done": True, "done_reason": "stop", **counts,
+            }).encode() + b"\n")
+            return self._stream("application/x-ndjson", lines)
+
+        self._send_json(200, {
+            "model": model,
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "message": {"role": "assistant", "content": reply},
+            "done": True,
+            "done_reason": "stop",
+            **counts,
+        })
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, address, config: MockConfig):
+        super().__init__(address, _Handler)
+        self.config = config
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._batch_lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self.files: Dict[str, bytes] = {}
+        self._batches: Dict[str, Dict[str, Any]] = {}
+
+    # -- batches -----------------------------------------------------------
+
+    def add_file(self, content: bytes, file_id: Optional[str] = None) -> str:
+        with self._batch_lock:
+            file_id = file_id or f"file-mock-{next(self._ids)}"
+            self.files[file_id] = content
+        return file_id
+
+    def add_batch(self, kind: str, requests: List[Dict[str, Any]], batch: Dict[str, Any],
+                  results_base: str = "") -> Dict[str, Any]:
+        with self._batch_lock:
+            prefix = "msgbatch_mock_" if kind == "anthropic" else "batch_mock_"
+            batch["id"] = f"{prefix}{next(self._ids)}"
+            self._batches[batch["id"]] = {
+                "kind": kind,
+                "batch": batch,
+                "requests": requests,
+                "due": time.time() + self.config.batch_delay_ms / 1000,
+                "results_base": results_base,
+            }
+        return dict(batch)
+
+    def get_batch(self, batch_id: str, cancel: bool = False) -> Optional[Dict[str, Any]]:
+        """Return the batch, ending it first if it is due (or cancelled)."""
+        with self._batch_lock:
+            record = self._batches.get(batch_id)
+            if record is None:
+                return None
+            if cancel or time.time() >= record["due"]:
+                self._end_batch(record, cancelled=cancel)
+            return dict(record["batch"])
+
+    def list_batches(self, kind: str, after: Optional[str], limit: int) -> Tuple[List[Dict[str, Any]], bool]:
+        """Return one page of batches of a kind, newest first."""
+        with self._batch_lock:
+            ids = [batch_id for batch_id, record in self._batches.items() if record["kind"] == kind]
+            ids.reverse()
+            if after in ids:
+                ids = ids[ids.index(after) + 1:]
+            return [dict(self._batches[i]["batch"]) for i in ids[:limit]], len(ids) > limit
+
+    def _request_fails(self, provider: str) -> bool:
+        rate = self.config.provider_error_rates.get(provider, self.config.error_rate)
+        return bool(rate) and random.random() < rate
+
+    def _end_batch(self, record: Dict[str, Any], cancelled: bool) -> None:
+        batch = record["batch"]
+        if record.get("ended"):
+            return
+        record["ended"] = True
+        now = time.time()
+        message = "Injected error from the mock provider server"
+
+        if record["kind"] == "openai":
+            output, errors = [], []
+            for n, request in enumerate(record["requests"]):
+                line = {"id": f"batch_req_mock_{n}", "custom_id": request.get("custom_id"), "error": None}
+                if cancelled:
+                    line["response"] = None
+                    line["error"] = {"code": "batch_cancelled", "message": "The batch was cancelled"}
+                    errors.append(line)
+                elif self._request_fails("openai"):
+                    line["response"] = {"status_code": self.config.error_status, "request_id": f"req_mock_{n}",
+                                        "body": {"error": {"message": message, "type": "server_error"}}}
+                    errors.append(line)
+                else:
+                    line["response"] = {"status_code": 200, "request_id": f"req_mock_{n}",
+                                        "body": _openai_completion(request.get("body") or {}, self.config.reply)}
+                    output.append(line)
+            for lines, key in ((output, "output_file_id"), (errors, "error_file_id")):
+                if lines:
+                    batch[key] = f"file-mock-{next(self._ids)}"
+                    self.files[batch[key]] = b"".join(json.dumps(l).encode() + b"\n" for l in lines)
+            batch["status"] = "cancelled" if cancelled else "completed"
+            batch["cancelled_at" if cancelled else "completed_at"] = int(now)
+            batch["request_counts"].update(completed=len(output), failed=len(errors))
+            return
+
+        counts = {"processing": 0, "succeeded": 0, "errored": 0, "canceled": 0, "expired": 0}
+        lines = []
+        for request in record["requests"]:
+            if cancelled:
+                result = {"type": "canceled"}
+                counts["canceled"] += 1
+            elif self._request_fails("anthropic"):
+                result = {"type": "errored", "error": {"type": "error", "error": {
+                    "type": "api_error", "message": message}}}
+                counts["errored"] += 1
+            else:
+                result = {"type": "succeeded",
+                          "message": _anthropic_message(request.get("params") or {}, self.config.reply)}
+                counts["succeeded"] += 1
+            lines.append({"custom_id": request.get("custom_id"), "result": result})
+        self.files[f"results-{batch['id']}"] = b"".join(json.dumps(l).encode() + b"\n" for l in lines)
+        batch.update(
+            processing_status="ended",
+            request_counts=counts,
+            ended_at=_rfc3339(now),
+            results_url=f"{record['results_base']}/v1/messages/batches/{batch['id']}/results",
+        )
+        if cancelled:
+            batch["cancel_initiated_at"] = _rfc3339(now)
+
+    def record(self, provider: str, error: bool) -> None:
+        with self._stats_lock:
+            entry = self._stats.setdefault(provider, {"requests": 0, "errors": 0})
+            entry["errors" if error else "requests"] += 1
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._stats_lock:
+            return {provider: dict(entry) for provider, entry in self._stats.items()}
+
+    def reset(self) -> None:
+        with self._stats_lock:
+            self._stats.clear()
+
+
+class MockProviderServer:
+    """
+    Stand-in provider server running on a background thread.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+        config: Initial MockConfig
+
+    Example:
+        >>> with MockProviderServer(config=MockConfig(latency_ms=20)) as server:
+        ...     os.environ.update(server.env())
+        ...     llm = LLM.create(LLMProvider.OPENAI, model_name="gpt-4o-mini")
+        ...     llm.generate_response(prompt="Hello")
+        ...     print(server.stats())
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, config: Optional[MockConfig] = None):
+        self.config = config or MockConfig()
+        self._server = _Server((host, port), self.config)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockProviderServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def configure(self, **changes) -> None:
+        """Update the configuration (see MockConfig for the keys)."""
+        self.config.update(changes)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Requests and injected errors per provider."""
+        return self._server.stats()
+
+    def reset_stats(self) -> None:
+        self._server.reset()
+
+    def env(self) -> Dict[str, str]:
+        return server_env(self.url)
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def __enter__(self) -> "MockProviderServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def server_env(url: str) -> Dict[str, str]:
+    """
+    Environment variables that point SimplerLLM's providers at a mock server.
+
+    Set them before the provider modules are imported: the Gemini and
+    Ollama base URLs are read at import time.
+    """
+    return {
+        "OPENAI_BASE_URL": f"{url}/v1",
+        "OPENAI_API_KEY": "mock-key",
+        "ANTHROPIC_BASE_URL": url,
+        "ANTHROPIC_API_KEY": "mock-key",
+        "GEMINI_BASE_URL": f"{url}/",
+        "GEMINI_API_KEY": "mock-key",
+        "OLLAMA_URL": f"{url}/",
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765, help="Port to bind (0 picks a free port)")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--stream-chunks", type=int, default=8)
+    parser.add_argument("--chunk-delay-ms", type=float, default=0.0)
+    parser.add_argument("--batch-delay-ms", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    config = MockConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        stream_chunks=args.stream_chunks,
+        chunk_delay_ms=args.chunk_delay_ms,
+        batch_delay_ms=args.batch_delay_ms,
+    )
+    server = MockProviderServer(args.host, args.port, config)
+    # The first line of output is read by the benchmark runner
+    print(f"Mock provider server listening on {server.url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
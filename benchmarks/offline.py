@@ -0,0 +1,394 @@
+"""
+Offline benchmark suite for SimplerLLM.
+
+Starts the mock provider server (benchmarks/mock_server.py) in its own
+process, points SimplerLLM at it, and drives the LLM wrappers,
+ReliableLLM, generate_pydantic_json_model, LLMRouter, SimplerVectors and
+the text chunkers at several concurrency levels. With the server's
+latency at 0 ms the numbers are SimplerLLM's own overhead; raise
+--latency-ms to see how it behaves against a realistic provider.
+
+For every scenario and concurrency level it reports throughput and
+p50/p90/p99 latency, plus the peak memory allocated per operation
+(measured in a separate, sequential pass under tracemalloc). Results can
+be saved as a baseline and later runs compared against it.
+
+Usage:
+    python benchmarks/offline.py --list
+    python benchmarks/offline.py --save-baseline benchmarks/baseline.json
+    python benchmarks/offline.py --baseline benchmarks/baseline.json --tolerance 0.2
+    python benchmarks/offline.py --scenarios openai_chat,embed_many --concurrency 1,16 --latency-ms 50
+
+Exit code is 1 when a scenario regressed past the tolerance, or failed.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCHMARKS_DIR)
+sys.path.insert(0, REPO_ROOT)
+
+from mock_server import server_env  # noqa: E402
+
+# Relative changes compared against the baseline; for throughput lower is worse
+COMPARED_METRICS = {
+    "p50_ms": "higher",
+    "p99_ms": "higher",
+    "throughput": "lower",
+    "alloc_peak_kib": "higher",
+}
+
+
+# ---------------------------------------------------------------------------
+# Mock server process
+# ---------------------------------------------------------------------------
+
+class ServerProcess:
+    """Mock provider server in a child process, so it does not share our GIL."""
+
+    def __init__(self, base_config: Dict[str, Any]):
+        self.base_config = base_config
+        self.process = subprocess.Popen(
+            [sys.executable, os.path.join(BENCHMARKS_DIR, "mock_server.py"), "--port", "0"],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        line = self.process.stdout.readline().strip()
+        if " on " not in line:
+            self.process.kill()
+            raise RuntimeError(f"Mock server did not start: {line!r}")
+        self.url = line.rsplit(" on ", 1)[1]
+
+    def _post(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        request = urllib.request.Request(
+            self.url + path,
+            data=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+        )
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return json.loads(response.read())
+
+    def configure(self, overrides: Dict[str, Any]) -> None:
+        """Reset to the base configuration, then apply the scenario's overrides."""
+        self._post("/_mock/config", {**self.base_config, **overrides})
+
+    def stats(self) -> Dict[str, Any]:
+        with urllib.request.urlopen(self.url + "/_mock/stats", timeout=10) as response:
+            return json.loads(response.read())
+
+    def reset(self) -> None:
+        self._post("/_mock/reset", {})
+
+    def stop(self) -> None:
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+def percentile(sorted_values: List[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * q // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def _timed_sync(op: Callable, i: int) -> Tuple[float, bool]:
+    start = time.perf_counter()
+    try:
+        op(i)
+        ok = True
+    except Exception:
+        ok = False
+    return time.perf_counter() - start, ok
+
+
+async def _timed_async(op: Callable, i: int, semaphore: asyncio.Semaphore) -> Tuple[float, bool]:
+    async with semaphore:
+        start = time.perf_counter()
+        try:
+            await op(i)
+            ok = True
+        except Exception:
+            ok = False
+        return time.perf_counter() - start, ok
+
+
+def run_load(op: Callable, is_async: bool, ops: int, concurrency: int,
+             loop: asyncio.AbstractEventLoop, offset: int = 0) -> Tuple[List[Tuple[float, bool]], float]:
+    """
+    Run ops operations with at most concurrency in flight.
+
+    Returns:
+        tuple: (list of (seconds, succeeded), wall-clock seconds)
+    """
+    indices = range(offset, offset + ops)
+    start = time.perf_counter()
+    if is_async:
+        async def gather():
+            semaphore = asyncio.Semaphore(concurrency)
+            return await asyncio.gather(*(_timed_async(op, i, semaphore) for i in indices))
+
+        samples = loop.run_until_complete(gather())
+    elif concurrency == 1:
+        samples = [_timed_sync(op, i) for i in indices]
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            samples = list(pool.map(lambda i: _timed_sync(op, i), indices))
+    return samples, time.perf_counter() - start
+
+
+def measure_allocations(op: Callable, is_async: bool, ops: int,
+                        loop: asyncio.AbstractEventLoop) -> Dict[str, float]:
+    """
+    Peak memory allocated while one operation runs, and memory retained afterwards.
+
+    Returns:
+        dict: alloc_peak_kib (mean peak per operation) and retained_kib
+            (memory still allocated after all operations, per operation)
+    """
+    tracemalloc.start()
+    try:
+        start_current, _ = tracemalloc.get_traced_memory()
+        peaks = []
+        for i in range(ops):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            try:
+                if is_async:
+                    loop.run_until_complete(op(i))
+                else:
+                    op(i)
+            except Exception:
+                pass
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+        end_current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "alloc_peak_kib": sum(peaks) / len(peaks) / 1024 if peaks else 0.0,
+        "retained_kib": (end_current - start_current) / max(1, ops) / 1024,
+    }
+
+
+def summarize(samples: List[Tuple[float, bool]], wall: float) -> Dict[str, Any]:
+    latencies = sorted(seconds * 1000 for seconds, _ in samples)
+    errors = sum(1 for _, ok in samples if not ok)
+    return {
+        "ops": len(samples),
+        "errors": errors,
+        "wall_s": wall,
+        "throughput": len(samples) / wall if wall else 0.0,
+        "mean_ms": sum(latencies) / len(latencies) if latencies else None,
+        "p50_ms": percentile(latencies, 50),
+        "p90_ms": percentile(latencies, 90),
+        "p99_ms": percentile(latencies, 99),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Baseline comparison
+# ---------------------------------------------------------------------------
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]],
+            tolerance: float) -> List[str]:
+    """
+    Print the change of each compared metric and return the regressions.
+
+    A metric regresses when it is worse than the baseline by more than
+    tolerance (a fraction, 0.2 = 20%).
+    """
+    regressions = []
+    print(f"\nComparison with baseline (tolerance {tolerance:.0%}):")
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            print(f"  {key:40s} new (no baseline)")
+            continue
+        changes = []
+        for metric, worse in COMPARED_METRICS.items():
+            old, new = previous.get(metric), current.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            regressed = change > tolerance if worse == "higher" else change < -tolerance
+            changes.append(f"{metric} {change:+.0%}{' !' if regressed else ''}")
+            if regressed:
+                regressions.append(f"{key} {metric}: {old:.3f} -> {new:.3f} ({change:+.0%})")
+        print(f"  {key:40s} {', '.join(changes)}")
+    return regressions
+
+
+def environment_info() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "commit": commit,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--list", action="store_true", help="List scenarios and exit")
+    parser.add_argument("--scenarios", default="all", help="Comma-separated scenario names (default: all)")
+    parser.add_argument("--concurrency", default="1,8,32", help="Comma-separated concurrency levels")
+    parser.add_argument("--ops", type=int, default=200, help="Operations per scenario and concurrency level")
+    parser.add_argument("--warmup", type=int, default=5, help="Untimed operations before measuring")
+    parser.add_argument("--alloc-ops", type=int, default=20,
+                        help="Sequential operations traced for allocations (0 disables)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Mock provider latency")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Mock provider latency jitter")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Mock provider error rate")
+    parser.add_argument("--stream-chunks", type=int, default=8, help="Chunks per streamed reply")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--save-baseline", help="Write results as the baseline to this file")
+    parser.add_argument("--baseline", help="Compare results against this baseline file")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed relative regression against the baseline (default: 0.2)")
+    args = parser.parse_args(argv)
+
+    # Hermetic runs: no .env from the working directory, no real retry waits
+    os.environ["SIMPLERLLM_AUTOLOAD_DOTENV"] = "0"
+    os.environ.setdefault("RETRY_DELAY", "0")
+
+    from scenarios import SCENARIOS
+
+    if args.list:
+        for scenario in SCENARIOS:
+            kind = "async" if scenario.is_async else "sync"
+            where = "mock server" if scenario.uses_server else "local"
+            print(f"{scenario.name:26s} {kind:5s} {where:11s} {scenario.description}")
+        return 0
+
+    selected = SCENARIOS
+    if args.scenarios != "all":
+        names = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+        known = {scenario.name: scenario for scenario in SCENARIOS}
+        unknown = [name for name in names if name not in known]
+        if unknown:
+            parser.error(f"unknown scenarios: {', '.join(unknown)}")
+        selected = [known[name] for name in names]
+    levels = [int(level) for level in args.concurrency.split(",")]
+
+    base_config = {
+        "latency_ms": args.latency_ms,
+        "jitter_ms": args.jitter_ms,
+        "error_rate": args.error_rate,
+        "stream_chunks": args.stream_chunks,
+        "provider_error_rates": {},
+        "error_status": 500,
+    }
+    server = ServerProcess(base_config)
+    # Must be set before the provider modules are imported by the scenarios
+    os.environ.update(server_env(server.url))
+
+    results: Dict[str, Dict[str, Any]] = {}
+    failed = []
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        print(f"Mock server: {server.url} (latency {args.latency_ms} ms, error rate {args.error_rate})")
+        print(f"{'scenario':40s} {'ops/s':>9s} {'p50 ms':>9s} {'p90 ms':>9s} {'p99 ms':>9s} "
+              f"{'errors':>7s} {'KiB/op':>8s}")
+        for scenario in selected:
+            server.configure(scenario.mock_config)
+            try:
+                op = scenario.setup()
+                run_load(op, scenario.is_async, args.warmup, 1, loop)
+            except Exception as e:
+                print(f"{scenario.name:40s} setup failed: {type(e).__name__}: {e}")
+                failed.append(scenario.name)
+                continue
+
+            allocations = (
+                measure_allocations(op, scenario.is_async, args.alloc_ops, loop)
+                if args.alloc_ops else {}
+            )
+            for level in levels:
+                server.reset()
+                samples, wall = run_load(op, scenario.is_async, args.ops, level, loop, offset=args.warmup)
+                summary = summarize(samples, wall)
+                summary.update(allocations)
+                summary["concurrency"] = level
+                if scenario.uses_server:
+                    summary["server"] = server.stats()
+                key = f"{scenario.name}@c{level}"
+                results[key] = summary
+                if summary["errors"] == summary["ops"]:
+                    failed.append(key)
+                print(f"{key:40s} {summary['throughput']:9.1f} {summary['p50_ms']:9.2f} "
+                      f"{summary['p90_ms']:9.2f} {summary['p99_ms']:9.2f} {summary['errors']:7d} "
+                      f"{allocations.get('alloc_peak_kib', 0):8.1f}")
+    finally:
+        loop.close()
+        server.stop()
+
+    report = {
+        "environment": environment_info(),
+        "settings": {
+            "ops": args.ops,
+            "concurrency": levels,
+            "latency_ms": args.latency_ms,
+            "jitter_ms": args.jitter_ms,
+            "error_rate": args.error_rate,
+        },
+        "results": results,
+    }
+    for path in filter(None, [args.output, args.save_baseline]):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {path}")
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("settings", {}).get("latency_ms") != args.latency_ms:
+            print("\nWarning: the baseline was recorded with a different mock latency")
+        if baseline.get("environment", {}).get("platform") != report["environment"]["platform"]:
+            print("\nWarning: the baseline was recorded on a different platform")
+        regressions = compare(results, baseline.get("results", {}), args.tolerance)
+        if regressions:
+            print("\nRegressions:")
+            for line in regressions:
+                print(f"  {line}")
+
+    if failed:
+        print(f"\nFailed: {', '.join(failed)}")
+    print("\nFAIL" if failed or regressions else "\nOK")
+    return 1 if failed or regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,304 @@
+"""
+Benchmark scenarios for the offline benchmark runner.
+
+Each scenario builds the SimplerLLM objects it exercises once, then
+returns an operation the runner calls many times: op(i) for synchronous
+scenarios, await op(i) for asynchronous ones. Scenarios that talk to a
+provider expect the environment to point at the mock provider server
+(see mock_server.server_env); mock_config holds the server settings the
+scenario needs, such as a JSON reply.
+"""
+
+import json
+import tempfile
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+EMBEDDING_DIMENSION = 256
+
+
+@dataclass
+class Scenario:
+    """
+    One benchmarked operation.
+
+    Attributes:
+        name: Identifier used on the command line and in results
+        description: One-line summary
+        setup: Builds the objects under test and returns op(i)
+        is_async: True when op(i) returns an awaitable
+        uses_server: False for scenarios that run entirely locally
+        mock_config: Mock server settings applied before the scenario runs
+    """
+
+    name: str
+    description: str
+    setup: Callable[[], Callable[[int], Any]]
+    is_async: bool = False
+    uses_server: bool = True
+    mock_config: Dict[str, Any] = field(default_factory=dict)
+
+
+def _llm(provider_name: str, model_name: str):
+    from SimplerLLM.language.llm import LLM, LLMProvider
+
+    return LLM.create(provider=LLMProvider[provider_name], model_name=model_name)
+
+
+def _embeddings():
+    from SimplerLLM.language.embeddings import EmbeddingsLLM, EmbeddingsProvider
+
+    return EmbeddingsLLM.create(
+        provider=EmbeddingsProvider.OPENAI, model_name="text-embedding-3-small"
+    )
+
+
+def _sample_text(paragraphs: int = 200) -> str:
+    sentence = (
+        "SimplerLLM keeps provider calls simple while the benchmark measures "
+        "how much time the library itself adds to every request."
+    )
+    return "\n\n".join(
+        " ".join(f"{sentence} Paragraph {p}, sentence {s}." for s in range(5))
+        for p in range(paragraphs)
+    )
+
+
+# ---------------------------------------------------------------------------
+# LLM wrappers
+# ---------------------------------------------------------------------------
+
+def _chat(provider_name: str, model_name: str):
+    def setup():
+        llm = _llm(provider_name, model_name)
+
+        def op(i):
+            return llm.generate_response(prompt=f"Benchmark question {i}", max_tokens=64)
+
+        return op
+
+    return setup
+
+
+def _chat_async(provider_name: str, model_name: str):
+    def setup():
+        llm = _llm(provider_name, model_name)
+
+        async def op(i):
+            return await llm.generate_response_async(prompt=f"Benchmark question {i}", max_tokens=64)
+
+        return op
+
+    return setup
+
+
+def _chat_single_flight():
+    llm = _llm("OPENAI", "gpt-4o-mini")
+    llm.single_flight = True
+
+    async def op(i):
+        # Four distinct prompts, so concurrent duplicates share one call
+        return await llm.generate_response_async(prompt=f"Benchmark question {i % 4}", max_tokens=64)
+
+    return op
+
+
+def _reliable_llm():
+    from SimplerLLM.language.llm.reliable import ReliableLLM
+
+    reliable = ReliableLLM(
+        _llm("OPENAI", "gpt-4o-mini"),
+        _llm("ANTHROPIC", "claude-3-5-haiku-latest"),
+        skip_validation=True,
+    )
+
+    def op(i):
+        return reliable.generate_response(prompt=f"Benchmark question {i}", max_tokens=64)
+
+    return op
+
+
+# ---------------------------------------------------------------------------
+# Structured output and routing
+# ---------------------------------------------------------------------------
+
+_PRODUCT_JSON = json.dumps({
+    "name": "Benchmark Widget",
+    "price": 19.99,
+    "tags": ["fast", "offline", "repeatable"],
+})
+
+_ROUTER_JSON = json.dumps({
+    "selected_index": 3,
+    "confidence_score": 0.92,
+    "reasoning": "The input matches this choice best.",
+})
+
+
+def _pydantic_json():
+    from pydantic import BaseModel
+    from SimplerLLM.language.llm_addons import generate_pydantic_json_model
+
+    class Product(BaseModel):
+        name: str
+        price: float
+        tags: List[str]
+
+    llm = _llm("OPENAI", "gpt-4o-mini")
+
+    def op(i):
+        result = generate_pydantic_json_model(
+            model_class=Product,
+            prompt=f"Describe product number {i}",
+            llm_instance=llm,
+            max_tokens=256,
+        )
+        if isinstance(result, str):
+            raise RuntimeError(result)
+        return result
+
+    return op
+
+
+def _router():
+    from SimplerLLM.language.llm_router import LLMRouter
+
+    router = LLMRouter(_llm("OPENAI", "gpt-4o-mini"))
+    router.add_choices([(f"Choice {n}: handles topic {n}", {"id": n}) for n in range(20)])
+
+    def op(i):
+        return router.route(f"Which choice handles request {i}?")
+
+    return op
+
+
+def _router_embedding():
+    from SimplerLLM.language.llm_router import LLMRouter
+
+    router = LLMRouter(None, embeddings_llm_instance=_embeddings(), confidence_threshold=0.0)
+    router.add_choices([(f"Choice {n}: handles topic {n}", {"id": n}) for n in range(500)])
+    router.build_embedding_index()
+
+    def op(i):
+        return router.route_by_embedding(f"Which choice handles request {i}?")
+
+    return op
+
+
+# ---------------------------------------------------------------------------
+# Embeddings, vectors and chunking
+# ---------------------------------------------------------------------------
+
+def _embed_many():
+    embeddings = _embeddings()
+    texts = [f"Document {n} about topic {n % 17}" for n in range(512)]
+
+    def op(i):
+        return embeddings.embed_many(texts, batch_size=64)
+
+    return op
+
+
+def _vector_db(count: int):
+    from SimplerLLM.vectors.providers.local_provider import SimplerVectors
+
+    rng = np.random.default_rng(0)
+    db = SimplerVectors(tempfile.mkdtemp(prefix="simplerllm-bench-"), dimension=EMBEDDING_DIMENSION)
+    vectors = rng.standard_normal((count, EMBEDDING_DIMENSION)).astype(np.float32)
+    db.add_vectors_array(vectors, [{"n": n, "group": n % 10} for n in range(count)])
+    return db, rng
+
+
+def _vectors_search():
+    db, rng = _vector_db(20000)
+    queries = rng.standard_normal((64, EMBEDDING_DIMENSION)).astype(np.float32)
+
+    def op(i):
+        return db.top_cosine_similarity(queries[i % len(queries)], top_n=10)
+
+    return op
+
+
+def _vectors_filtered_search():
+    db, rng = _vector_db(20000)
+    queries = rng.standard_normal((64, EMBEDDING_DIMENSION)).astype(np.float32)
+
+    def op(i):
+        return db.top_cosine_similarity(
+            queries[i % len(queries)], top_n=10, metadata_filter={"group": i % 10}
+        )
+
+    return op
+
+
+def _vectors_add():
+    from SimplerLLM.vectors.providers.local_provider import SimplerVectors
+
+    rng = np.random.default_rng(0)
+    db = SimplerVectors(tempfile.mkdtemp(prefix="simplerllm-bench-"), dimension=EMBEDDING_DIMENSION)
+    batch = rng.standard_normal((1000, EMBEDDING_DIMENSION)).astype(np.float32)
+    metadata = [{"n": n} for n in range(len(batch))]
+
+    def op(i):
+        # Keep the database bounded so long runs measure the same work
+        if db.get_vector_count() >= 50000:
+            db.clear_database()
+        return db.add_vectors_array(batch, metadata)
+
+    return op
+
+
+def _chunker(name: str):
+    def setup():
+        from SimplerLLM.tools import text_chunker
+
+        text = _sample_text()
+        chunk = {
+            "max_size": lambda: text_chunker.chunk_by_max_chunk_size(text, 500, True),
+            "sentences": lambda: text_chunker.chunk_by_sentences(text),
+            "paragraphs": lambda: text_chunker.chunk_by_paragraphs(text),
+        }[name]
+
+        def op(i):
+            return chunk()
+
+        return op
+
+    return setup
+
+
+SCENARIOS: List[Scenario] = [
+    Scenario("openai_chat", "LLM.create(OPENAI).generate_response", _chat("OPENAI", "gpt-4o-mini")),
+    Scenario("openai_chat_async", "LLM.create(OPENAI).generate_response_async",
+             _chat_async("OPENAI", "gpt-4o-mini"), is_async=True),
+    Scenario("openai_chat_single_flight", "generate_response_async with single_flight over 4 prompts",
+             _chat_single_flight, is_async=True),
+    Scenario("anthropic_chat", "LLM.create(ANTHROPIC).generate_response",
+             _chat("ANTHROPIC", "claude-3-5-haiku-latest")),
+    Scenario("anthropic_chat_async", "LLM.create(ANTHROPIC).generate_response_async",
+             _chat_async("ANTHROPIC", "claude-3-5-haiku-latest"), is_async=True),
+    Scenario("gemini_chat", "LLM.create(GEMINI).generate_response", _chat("GEMINI", "gemini-2.0-flash")),
+    Scenario("ollama_chat", "LLM.create(OLLAMA).generate_response", _chat("OLLAMA", "llama3.2")),
+    Scenario("reliable_llm_failover", "ReliableLLM with the primary failing 20% of requests",
+             _reliable_llm, mock_config={"provider_error_rates": {"openai": 0.2}, "error_status": 400}),
+    Scenario("pydantic_json", "generate_pydantic_json_model on OpenAI", _pydantic_json,
+             mock_config={"reply": _PRODUCT_JSON}),
+    Scenario("router_llm", "LLMRouter.route over 20 choices", _router,
+             mock_config={"reply": _ROUTER_JSON}),
+    Scenario("router_embedding", "LLMRouter.route_by_embedding over 500 choices", _router_embedding),
+    Scenario("embed_many", "EmbeddingsLLM.embed_many, 512 texts in batches of 64", _embed_many),
+    Scenario("vectors_search", "SimplerVectors.top_cosine_similarity, 20k x 256",
+             _vectors_search, uses_server=False),
+    Scenario("vectors_filtered_search", "top_cosine_similarity with a metadata filter, 20k x 256",
+             _vectors_filtered_search, uses_server=False),
+    Scenario("vectors_add", "SimplerVectors.add_vectors_array, 1000 x 256 per call",
+             _vectors_add, uses_server=False),
+    Scenario("chunk_max_size", "chunk_by_max_chunk_size on ~100 KB of text",
+             _chunker("max_size"), uses_server=False),
+    Scenario("chunk_sentences", "chunk_by_sentences on ~100 KB of text",
+             _chunker("sentences"), uses_server=False),
+    Scenario("chunk_paragraphs", "chunk_by_paragraphs on ~100 KB of text",
+             _chunker("paragraphs"), uses_server=False),
+]
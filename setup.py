@@ -18,6 +18,9 @@ extras_require = {
     "voyage": [
         "voyageai>=0.3.3",
     ],
+    "otel": [
+        "opentelemetry-api>=1.27.0",
+    ],
 }
 
 # Read the long description from the README file
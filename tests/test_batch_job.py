@@ -0,0 +1,141 @@
+"""
+Tests for BatchJob crash recovery against the mock provider server.
+"""
+
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from benchmarks.mock_server import MockProviderServer
+from SimplerLLM.language.llm_batch import BatchJob, BatchRequest
+from SimplerLLM.language.llm_batch.providers import AnthropicBatchProvider, OpenAIBatchProvider
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def server():
+    with MockProviderServer() as srv:
+        yield srv
+
+
+@pytest.fixture(params=["openai", "anthropic"])
+def make_job(request, server, tmp_path):
+    def make(name="job"):
+        if request.param == "openai":
+            provider = OpenAIBatchProvider(api_key="mock-key", base_url=f"{server.url}/v1")
+        else:
+            provider = AnthropicBatchProvider(api_key="mock-key", base_url=server.url)
+        llm = SimpleNamespace(model_name="mock-model", temperature=0.7, top_p=1.0)
+        return BatchJob(llm, str(tmp_path / name), provider=provider)
+
+    return make
+
+
+def _requests(count=3):
+    return [BatchRequest(custom_id=f"row-{n}", prompt=f"Say {n}") for n in range(count)]
+
+
+def _batch_count(server):
+    return len(server._server._batches)
+
+
+class _CrashAfterSubmit(Exception):
+    pass
+
+
+class TestPartialRecord:
+    def test_partial_last_line_is_dropped(self, make_job):
+        job = make_job()
+        first = list(job.run(_requests(), poll_interval=0))
+
+        # A crash in the middle of writing a record
+        results_path = os.path.join(job.checkpoint_dir, "results.jsonl")
+        with open(results_path, "rb") as f:
+            lines = f.readlines()
+        with open(results_path, "wb") as f:
+            f.writelines(lines[:-1])
+            f.write(lines[-1][:10])
+        job._state["batches"][0]["collected"] = False
+        job._save_state()
+
+        again = list(make_job().results(poll_interval=0))
+
+        assert sorted(r.custom_id for r in again) == sorted(r.custom_id for r in first)
+        with open(results_path, "rb") as f:
+            content = f.read()
+        assert content.endswith(b"\n")
+        assert len(content.splitlines()) == 3
+        for line in content.splitlines():
+            json.loads(line)
+
+    def test_file_with_only_a_partial_line_is_emptied(self, make_job):
+        job = make_job()
+        job.submit(_requests())
+        with open(os.path.join(job.checkpoint_dir, "results.jsonl"), "w") as f:
+            f.write('{"batch_id": ')
+
+        results = list(job.results(poll_interval=0))
+
+        assert len(results) == 3
+
+
+class TestInterruptedSubmit:
+    def test_batch_is_not_submitted_twice(self, server, make_job):
+        job = make_job()
+        submit = job.provider.submit
+
+        def submit_then_crash(*args, **kwargs):
+            submit(*args, **kwargs)
+            raise _CrashAfterSubmit()
+
+        job.provider.submit = submit_then_crash
+        with pytest.raises(_CrashAfterSubmit):
+            job.submit(_requests())
+        assert _batch_count(server) == 1
+
+        results = list(make_job().run(_requests(), poll_interval=0))
+
+        assert _batch_count(server) == 1
+        assert len(results) == 3
+        assert all(r.succeeded for r in results)
+
+    def test_batch_is_submitted_when_not_found(self, server, make_job):
+        job = make_job()
+
+        def crash_before_submit(*args, **kwargs):
+            raise _CrashAfterSubmit()
+
+        job.provider.submit = crash_before_submit
+        with pytest.raises(_CrashAfterSubmit):
+            job.submit(_requests())
+        assert _batch_count(server) == 0
+
+        results = list(make_job().run(_requests(), poll_interval=0))
+
+        assert _batch_count(server) == 1
+        assert len(results) == 3
+
+    def test_other_jobs_batches_are_not_adopted(self, server, make_job):
+        job = make_job()
+        submit = job.provider.submit
+
+        def submit_then_crash(*args, **kwargs):
+            submit(*args, **kwargs)
+            raise _CrashAfterSubmit()
+
+        job.provider.submit = submit_then_crash
+        with pytest.raises(_CrashAfterSubmit):
+            job.submit(_requests())
+
+        # Another job with the same shape submits in between
+        make_job("other").submit(_requests())
+
+        list(make_job().run(_requests(), poll_interval=0))
+
+        # Both candidates match on size for Anthropic, so it re-submits
+        # rather than guess; OpenAI matches on the job id
+        expected = 2 if isinstance(job.provider, OpenAIBatchProvider) else 3
+        assert _batch_count(server) == expected
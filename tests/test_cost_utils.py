@@ -0,0 +1,62 @@
+"""
+Tests for pricing lookups and token counting in cost_utils.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from SimplerLLM.language.llm_addons.cost_utils import get_model_pricing
+
+pytestmark = pytest.mark.unit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(code):
+    env = {**os.environ, "PYTHONPATH": ROOT}
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env, timeout=60, check=True
+    )
+    return result.stdout.strip()
+
+
+class TestLazyTokenizer:
+    def test_pricing_does_not_import_tiktoken(self):
+        output = _run(
+            "import sys\n"
+            "from SimplerLLM.language.llm_addons.cost_utils import estimate_cost\n"
+            "estimate_cost('gpt-4o', 1000, 1000)\n"
+            "print('tiktoken' in sys.modules)"
+        )
+
+        assert output == "False"
+
+    def test_counting_tokens_imports_tiktoken(self):
+        pytest.importorskip("tiktoken")
+        output = _run(
+            "import sys\n"
+            "from SimplerLLM.language.llm_addons.cost_utils import count_tokens\n"
+            "count_tokens('Hello there', model_name='gpt-4o')\n"
+            "print('tiktoken' in sys.modules)"
+        )
+
+        assert output == "True"
+
+
+class TestPricingLookup:
+    @pytest.mark.parametrize("model_name, expected", [
+        ("gpt-4o-2024-08-06", "gpt-4o"),
+        ("o1-mini", "o1-mini"),
+        ("o1-pro", "o1-pro"),
+        ("o3-pro", "o3-pro"),
+        ("gpt-5-pro", "gpt-5-pro"),
+    ])
+    def test_variants_resolve_to_their_own_entry(self, model_name, expected):
+        assert get_model_pricing(model_name) == get_model_pricing(expected)
+        assert get_model_pricing(model_name) is not None
+
+    def test_sibling_model_is_not_priced_as_base(self):
+        assert get_model_pricing("o1-mini") != get_model_pricing("o1")
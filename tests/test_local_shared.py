@@ -0,0 +1,128 @@
+"""
+Tests for switching generations of a shared local vector snapshot.
+"""
+
+import os
+import threading
+
+import numpy as np
+import pytest
+
+from SimplerLLM.vectors.providers.local_provider import SimplerVectors
+from SimplerLLM.vectors.providers.local_storage import LazyMetadata
+
+pytestmark = pytest.mark.unit
+
+
+def _publish(db, count, prefix="v"):
+    db.clear_database()
+    rng = np.random.default_rng(count)
+    for n in range(count):
+        db.add_vector(rng.random(8), {"n": n, "id": f"{prefix}{n}"}, id=f"{prefix}{n}")
+    return db.publish_shared("docs")
+
+
+def _open_fds():
+    return len(os.listdir("/proc/self/fd"))
+
+
+@pytest.fixture
+def publisher(tmp_path):
+    return SimplerVectors(db_folder=str(tmp_path))
+
+
+class TestGenerationSwitch:
+    def test_previous_metadata_is_closed_after_switch(self, publisher, tmp_path):
+        _publish(publisher, 3)
+        worker = SimplerVectors.attach_shared(str(tmp_path), "docs", refresh_interval=0)
+        first = worker.metadata
+        assert isinstance(first, LazyMetadata)
+
+        _publish(publisher, 4)
+        assert worker.get_vector_count() == 4
+
+        assert first._file.closed
+
+    @pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="needs /proc")
+    def test_switching_does_not_leak_file_descriptors(self, publisher, tmp_path):
+        _publish(publisher, 3)
+        worker = SimplerVectors.attach_shared(str(tmp_path), "docs", refresh_interval=0)
+        worker.get_vector_count()
+        baseline = _open_fds()
+
+        for count in range(4, 14):
+            _publish(publisher, count)
+            assert worker.get_vector_count() == count
+
+        assert _open_fds() <= baseline
+
+    def test_switch_waits_for_running_read(self, publisher, tmp_path):
+        _publish(publisher, 3)
+        worker = SimplerVectors.attach_shared(str(tmp_path), "docs", refresh_interval=0)
+        first = worker.metadata
+
+        # A read on the first generation is still running
+        assert worker._begin_shared_read()
+        _publish(publisher, 4)
+        switch = threading.Thread(target=worker.refresh_shared, kwargs={"force": True})
+        switch.start()
+        switch.join(0.2)
+
+        assert switch.is_alive()
+        assert worker.generation == 1
+        assert first[0] == {"n": 0, "id": "v0"}
+
+        worker._end_shared_read()
+        switch.join(5)
+        assert worker.generation == 2
+        assert first._file.closed
+
+    def test_refresh_between_scoring_and_results(self, publisher, tmp_path):
+        _publish(publisher, 3)
+        worker = SimplerVectors.attach_shared(str(tmp_path), "docs", refresh_interval=0)
+        get_matrix = worker._get_matrix
+        switches = []
+
+        def get_matrix_then_refresh():
+            # A new generation is published and another thread maps it in
+            # mid-search
+            matrix = get_matrix()
+            _publish(publisher, 1, prefix="w")
+            switch = threading.Thread(target=worker.refresh_shared, kwargs={"force": True})
+            switch.start()
+            switch.join(0.2)
+            switches.append(switch)
+            return matrix
+
+        worker._get_matrix = get_matrix_then_refresh
+        results = worker.top_cosine_similarity(np.ones(8), top_n=3)
+        del worker._get_matrix
+        switches[0].join(5)
+
+        assert sorted(vid for vid, _, _ in results) == ["v0", "v1", "v2"]
+        assert all(meta["id"] == vid for vid, meta, _ in results)
+        assert worker.generation == 2
+        assert worker.list_all_ids() == ["w0"]
+
+    def test_nested_read_does_not_wait_for_switch(self, publisher, tmp_path):
+        _publish(publisher, 3)
+        worker = SimplerVectors.attach_shared(str(tmp_path), "docs", refresh_interval=0)
+        _publish(publisher, 4)
+
+        # The filter reads again from inside the search; it must neither
+        # switch generations nor wait for a switch
+        results = worker.top_cosine_similarity(
+            np.ones(8), top_n=10, filter_func=lambda vid, meta: worker.get_vector_count() > 0
+        )
+
+        assert len(results) == 4
+
+    def test_search_sees_new_generation(self, publisher, tmp_path):
+        _publish(publisher, 3)
+        worker = SimplerVectors.attach_shared(str(tmp_path), "docs", refresh_interval=0)
+        _publish(publisher, 5)
+
+        results = worker.top_cosine_similarity(np.ones(8), top_n=10)
+
+        assert len(results) == 5
+        assert worker.generation == 2
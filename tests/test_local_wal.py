@@ -0,0 +1,72 @@
+"""
+Tests for the local vector provider's write-ahead log.
+"""
+
+import os
+import subprocess
+import sys
+import textwrap
+import time
+
+import pytest
+
+from SimplerLLM.vectors.providers.local_provider import SimplerVectors
+from SimplerLLM.vectors.providers.local_wal import WALSyncPolicy, WriteAheadLog
+
+pytestmark = pytest.mark.unit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _write_then_die(db_folder, sync_policy, sync_interval):
+    """Log three writes in a child process that exits without any cleanup."""
+    script = textwrap.dedent(f"""
+        import os
+        from SimplerLLM.vectors.providers.local_provider import SimplerVectors
+        from SimplerLLM.vectors.providers.local_wal import WALSyncPolicy
+
+        db = SimplerVectors(db_folder={db_folder!r})
+        db.enable_wal("c", sync_policy=WALSyncPolicy({sync_policy.value!r}),
+                      sync_interval={sync_interval})
+        for name in ("a", "b", "c"):
+            db.add_vector([1.0, 0.5, 0.25], {{"name": name}}, id=name)
+        os._exit(0)
+    """)
+    env = {**os.environ, "PYTHONPATH": ROOT}
+    subprocess.run([sys.executable, "-c", script], check=True, env=env, timeout=60)
+
+
+class TestCrashRecovery:
+    @pytest.mark.parametrize("sync_policy", list(WALSyncPolicy))
+    def test_writes_survive_process_exit(self, tmp_path, sync_policy):
+        _write_then_die(str(tmp_path), sync_policy, sync_interval=5)
+
+        db = SimplerVectors(db_folder=str(tmp_path))
+        db.load_from_disk("c")
+
+        assert sorted(db.list_all_ids()) == ["a", "b", "c"]
+
+
+class TestIntervalSync:
+    def test_idle_log_is_synced_within_interval(self, tmp_path):
+        wal = WriteAheadLog(str(tmp_path / "c"), WALSyncPolicy.INTERVAL, sync_interval=0.05)
+        wal.append(("delete", "a"))
+        wal.append(("delete", "b"))
+        assert wal._unsynced
+
+        deadline = time.monotonic() + 5
+        while wal._unsynced and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert not wal._unsynced
+        wal.close()
+        assert list(WriteAheadLog.read_records(str(tmp_path / "c"))) == [("delete", "a"), ("delete", "b")]
+
+    def test_close_cancels_pending_sync(self, tmp_path):
+        wal = WriteAheadLog(str(tmp_path / "c"), WALSyncPolicy.INTERVAL, sync_interval=60)
+        wal.append(("delete", "a"))
+
+        wal.close()
+
+        assert wal._sync_timer is None
+        assert not wal._unsynced
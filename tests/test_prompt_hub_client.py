@@ -0,0 +1,280 @@
+"""
+Tests for PromptHubClient against a local stand-in for the prompt hub.
+"""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from SimplerLLM.prompts.hub import (
+    NetworkError,
+    PromptHubClient,
+    PromptManagerError,
+    PromptNotFoundError,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _prompt(prompt_id, version, template):
+    return {
+        "id": prompt_id,
+        "name": prompt_id.replace("_", " ").title(),
+        "template": template,
+        "variables": [{"name": "name"}],
+        "version": version,
+        "createdAt": "2026-01-01T00:00:00Z",
+    }
+
+
+class StandInHub:
+    """Minimal prompt hub: latest and versioned prompts with ETags."""
+
+    def __init__(self):
+        # api key -> prompt id -> list of versions (index 0 is version 1)
+        self.prompts = {"key-a": {"welcome": [_prompt("welcome", 1, "Hello {name}")]}}
+        self.requests = []  # (path, status, If-None-Match)
+        self.fail_with = None  # Status code to answer every request with
+        self.malformed = False
+        self._lock = threading.Lock()
+
+        hub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                hub._handle(self)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/api/v1/prompts/"
+        self._thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+
+    def publish(self, api_key, prompt_id, template):
+        with self._lock:
+            versions = self.prompts.setdefault(api_key, {}).setdefault(prompt_id, [])
+            versions.append(_prompt(prompt_id, len(versions) + 1, template))
+
+    def count(self, status=None):
+        return sum(1 for _, code, _ in self.requests if status is None or code == status)
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _handle(self, handler):
+        api_key = handler.headers.get("Authorization", "").replace("Bearer ", "")
+        if_none_match = handler.headers.get("If-None-Match")
+        parts = handler.path.split("?")[0][len("/api/v1/prompts/"):].split("/")
+
+        def send(status, body=None, etag=None):
+            self.requests.append((handler.path, status, if_none_match))
+            payload = b"" if body is None else (
+                body if isinstance(body, bytes) else json.dumps(body).encode()
+            )
+            handler.send_response(status)
+            if etag:
+                handler.send_header("ETag", etag)
+            handler.send_header("Content-Type", "application/json")
+            handler.send_header("Content-Length", str(len(payload)))
+            handler.end_headers()
+            handler.wfile.write(payload)
+
+        if self.fail_with:
+            return send(self.fail_with, {"error": "unavailable"})
+
+        with self._lock:
+            versions = self.prompts.get(api_key, {}).get(parts[0])
+        if not versions:
+            return send(404, {"error": "not found"})
+        if len(parts) == 3 and parts[1] == "versions":
+            index = int(parts[2]) - 1
+            if not 0 <= index < len(versions):
+                return send(404, {"error": "not found"})
+            return send(200, versions[index])
+
+        latest = versions[-1]
+        etag = f'"{parts[0]}-v{latest["version"]}"'
+        if if_none_match == etag:
+            return send(304, etag=etag)
+        if self.malformed:
+            return send(200, {"id": parts[0]}, etag=etag)
+        send(200, latest, etag=etag)
+
+
+@pytest.fixture
+def hub():
+    stand_in = StandInHub()
+    yield stand_in
+    stand_in.stop()
+
+
+@pytest.fixture
+def make_client(hub, tmp_path):
+    clients = []
+
+    def make(**kwargs):
+        kwargs.setdefault("api_key", "key-a")
+        kwargs.setdefault("cache_dir", str(tmp_path / "cache"))
+        kwargs.setdefault("latest_max_age", 0)
+        kwargs.setdefault("timeout", 5)
+        client = PromptHubClient(base_url=hub.url, **kwargs)
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
+
+
+class TestRevalidation:
+    def test_unchanged_prompt_revalidates_with_304(self, hub, make_client):
+        client = make_client()
+
+        first = client.fetch_prompt("welcome")
+        second = client.fetch_prompt("welcome")
+
+        assert first.template == second.template == "Hello {name}"
+        assert hub.count(200) == 1
+        assert hub.count(304) == 1
+        assert hub.requests[1][2] == '"welcome-v1"'
+
+    def test_changed_prompt_is_downloaded(self, hub, make_client):
+        client = make_client()
+        client.fetch_prompt("welcome")
+
+        hub.publish("key-a", "welcome", "Hi {name}!")
+        prompt = client.fetch_prompt("welcome")
+
+        assert prompt.template == "Hi {name}!"
+        assert prompt.version == 2
+        assert hub.count(200) == 2
+
+    def test_fresh_latest_is_served_without_request(self, hub, make_client):
+        client = make_client(latest_max_age=60)
+
+        client.fetch_prompt("welcome")
+        client.fetch_prompt("welcome")
+
+        assert hub.count() == 1
+
+    def test_malformed_body_is_not_cached(self, hub, make_client):
+        client = make_client()
+
+        hub.malformed = True
+        with pytest.raises(PromptManagerError):
+            client.fetch_prompt("welcome")
+
+        hub.malformed = False
+        prompt = client.fetch_prompt("welcome")
+
+        assert prompt.template == "Hello {name}"
+        # The bad body was not kept, so no conditional request was made
+        assert hub.requests[-1][2] is None
+
+
+class TestVersionCache:
+    def test_version_is_fetched_once(self, hub, make_client):
+        client = make_client()
+
+        client.fetch_prompt_version("welcome", 1)
+        client.fetch_prompt_version("welcome", 1)
+
+        assert hub.count() == 1
+
+    def test_version_survives_restart(self, hub, make_client):
+        make_client().fetch_prompt_version("welcome", 1)
+
+        prompt = make_client().fetch_prompt_version("welcome", 1)
+
+        assert prompt.template == "Hello {name}"
+        assert hub.count() == 1
+
+    def test_latest_fetch_fills_version_cache(self, hub, make_client):
+        client = make_client()
+
+        client.fetch_prompt("welcome")
+        prompt = client.fetch_prompt_version("welcome", 1)
+
+        assert prompt.version == 1
+        assert hub.count() == 1
+
+    def test_cache_is_scoped_by_api_key(self, hub, make_client):
+        make_client(api_key="key-a").fetch_prompt_version("welcome", 1)
+
+        with pytest.raises(PromptNotFoundError):
+            make_client(api_key="key-b").fetch_prompt_version("welcome", 1)
+
+        assert hub.count() == 2
+
+
+class TestServeStale:
+    def test_network_error_serves_cached_copy(self, hub, make_client):
+        client = make_client()
+        client.fetch_prompt("welcome")
+
+        hub.stop()
+        prompt = client.fetch_prompt("welcome")
+
+        assert prompt.template == "Hello {name}"
+
+    def test_server_error_serves_cached_copy(self, hub, make_client):
+        client = make_client()
+        client.fetch_prompt("welcome")
+
+        hub.fail_with = 503
+        prompt = client.fetch_prompt("welcome")
+
+        assert prompt.template == "Hello {name}"
+
+    def test_network_error_raises_when_disabled(self, hub, make_client):
+        client = make_client(serve_stale_on_error=False)
+        client.fetch_prompt("welcome")
+
+        hub.stop()
+        with pytest.raises(NetworkError):
+            client.fetch_prompt("welcome")
+
+    def test_network_error_raises_without_cache(self, hub, make_client):
+        client = make_client()
+
+        hub.stop()
+        with pytest.raises(NetworkError):
+            client.fetch_prompt("welcome")
+
+
+class TestAsync:
+    def test_async_fetch_revalidates(self, hub, make_client):
+        client = make_client()
+
+        async def fetch_twice():
+            await client.fetch_prompt_async("welcome")
+            return await client.fetch_prompt_async("welcome")
+
+        prompt = asyncio.run(fetch_twice())
+
+        assert prompt.template == "Hello {name}"
+        assert hub.count(304) == 1
+
+    def test_sessions_of_closed_loops_are_closed(self, hub, make_client):
+        client = make_client()
+        sessions = []
+
+        async def fetch():
+            await client.fetch_prompt_async("welcome")
+            sessions.append(await client._get_async_session())
+
+        asyncio.run(fetch())
+        asyncio.run(fetch())
+
+        assert sessions[0] is not sessions[1]
+        assert sessions[0].closed
+        assert len(client._async_sessions) == 1
+
+        client.close()
+        assert sessions[1].closed
@@ -0,0 +1,79 @@
+"""
+Tests for the LLM Router's routing decision cache.
+"""
+
+import numpy as np
+import pytest
+
+from SimplerLLM.language.llm_router.cache import MISS, RoutingCache
+from SimplerLLM.language.llm_router.models import RouterResponse
+
+pytestmark = pytest.mark.unit
+
+
+def _response(index=0):
+    return RouterResponse(selected_index=index, confidence_score=0.9, reasoning="best match")
+
+
+class TestCopies:
+    def test_exact_hits_are_copies(self):
+        cache = RoutingCache()
+        cache.put("ctx", "hello", _response())
+
+        first = cache.get("ctx", "hello")
+        first.reasoning = "changed"
+        second = cache.get("ctx", "hello")
+
+        assert second is not first
+        assert second.reasoning == "best match"
+
+    def test_semantic_hits_are_copies(self):
+        cache = RoutingCache(similarity_threshold=0.9)
+        cache.put("ctx", "hello", [_response()], np.array([1.0, 0.0]))
+
+        first = cache.get_similar("ctx", np.array([1.0, 0.01]))
+        first[0].selected_index = 3
+        second = cache.get_similar("ctx", np.array([1.0, 0.01]))
+
+        assert second[0].selected_index == 0
+
+    def test_stored_value_is_a_copy(self):
+        cache = RoutingCache()
+        response = _response()
+        cache.put("ctx", "hello", response)
+
+        response.selected_index = 5
+
+        assert cache.get("ctx", "hello").selected_index == 0
+
+
+class TestStats:
+    def test_exact_misses_are_counted_with_semantic_lookups(self):
+        cache = RoutingCache(similarity_threshold=0.9)
+        cache.put("ctx", "hello", _response(), np.array([1.0, 0.0]))
+
+        assert cache.get("ctx", "hi there") is MISS
+        assert cache.get_similar("ctx", np.array([0.0, 1.0])) is MISS
+        assert cache.get("ctx", "hello there") is MISS
+        assert cache.get_similar("ctx", np.array([1.0, 0.01])) is not MISS
+        assert cache.get("ctx", "hello") is not MISS
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["semantic_hits"] == 1
+        assert stats["semantic_misses"] == 1
+
+    def test_misses_are_counted_without_semantic_lookups(self):
+        cache = RoutingCache()
+
+        assert cache.get("ctx", "hello") is MISS
+
+        assert cache.get_stats()["misses"] == 1
+
+    def test_zero_vector_counts_a_semantic_miss(self):
+        cache = RoutingCache(similarity_threshold=0.9)
+
+        assert cache.get_similar("ctx", np.zeros(2)) is MISS
+
+        assert cache.get_stats()["semantic_misses"] == 1
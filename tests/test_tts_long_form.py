@@ -0,0 +1,99 @@
+"""
+Tests for long-form speech synthesis on TTSBase.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from SimplerLLM.voice.tts.base import TTSBase
+from SimplerLLM.voice.tts.models import TTSProvider, TTSResponse
+
+pytestmark = pytest.mark.unit
+
+TEXT = " ".join(f"Sentence {n}." for n in range(10))
+
+
+class FakeTTS(TTSBase):
+    """Returns each chunk's text as pcm audio; chunk 0 is slow."""
+
+    def __init__(self, delay=0.3):
+        super().__init__(api_key="test")
+        self.delay = delay
+        self.started = []
+        self.started_when_first_done = None
+        self._lock = threading.Lock()
+
+    @property
+    def provider(self):
+        return TTSProvider.OPENAI
+
+    def _start(self, text):
+        with self._lock:
+            self.started.append(text)
+            return len(self.started) == 1
+
+    def _response(self, text):
+        return TTSResponse(
+            audio_data=text.encode(), model="fake", voice="fake", format="pcm", provider="fake"
+        )
+
+    def generate_speech(self, text, **kwargs):
+        if self._start(text):
+            time.sleep(self.delay)
+            self.started_when_first_done = len(self.started)
+        else:
+            time.sleep(0.01)
+        return self._response(text)
+
+    async def generate_speech_async(self, text, **kwargs):
+        if self._start(text):
+            await asyncio.sleep(self.delay)
+            self.started_when_first_done = len(self.started)
+        else:
+            await asyncio.sleep(0.01)
+        return self._response(text)
+
+    def list_voices(self):
+        return []
+
+    def get_voice(self, voice_id):
+        raise NotImplementedError
+
+
+class TestSlidingWindow:
+    def test_later_chunks_wait_for_earlier_ones(self):
+        tts = FakeTTS()
+
+        response = tts.generate_long_speech(
+            TEXT, max_concurrency=3, max_chunk_chars=12, output_format="pcm"
+        )
+
+        assert len(tts.started) == 10
+        assert tts.started_when_first_done == 3
+        assert response.audio_data == "".join(tts.started).encode()
+        assert [chunk.index for chunk in response.chunks] == list(range(10))
+
+    def test_async_later_chunks_wait_for_earlier_ones(self):
+        tts = FakeTTS()
+
+        response = asyncio.run(tts.generate_long_speech_async(
+            TEXT, max_concurrency=3, max_chunk_chars=12, output_format="pcm"
+        ))
+
+        assert len(tts.started) == 10
+        assert tts.started_when_first_done == 3
+        assert response.audio_data == "".join(tts.started).encode()
+
+    def test_output_file_is_stitched_in_order(self, tmp_path):
+        tts = FakeTTS(delay=0.05)
+        path = tmp_path / "long.pcm"
+
+        response = tts.generate_long_speech(
+            TEXT, max_concurrency=4, max_chunk_chars=12, output_format="pcm", output_path=str(path)
+        )
+
+        assert response.file_path == str(path)
+        assert path.read_bytes() == "".join(f"Sentence {n}." for n in range(10)).encode()